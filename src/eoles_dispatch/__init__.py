@@ -1,3 +1,7 @@
 """EOLES-Dispatch: Cost-minimization dispatch model for wholesale electricity price simulation."""
 
+from .run.results import LabeledArray, RunResult, load_run, stack_runs
+
 __version__ = "0.1.0"
+
+__all__ = ["LabeledArray", "RunResult", "load_run", "stack_runs"]
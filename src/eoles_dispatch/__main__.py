@@ -5,7 +5,11 @@ Usage:
     eoles-dispatch solve my_run
     eoles-dispatch solve my_run --solver gurobi
     eoles-dispatch list
+    eoles-dispatch compare run_a run_b --areas FR
+    eoles-dispatch ensemble co2_sweep --spec ensemble.yaml --jobs 4
+    eoles-dispatch weather-ensemble w2019 --scenario baseline --year 2019 --weather-years 1990-2019
     eoles-dispatch collect --start 2020 --end 2025
+    eoles-dispatch import-entsoe /mnt/entsoe_exports --start 2015 --end 2025
     eoles-dispatch convert-scenario Scenario_BASELINE.xlsx
 """
 
@@ -16,6 +20,31 @@ from pathlib import Path
 from . import __version__
 
 
+def _parse_month_range(parser, text):
+    """Parse --months: "3" → (3,3), "1-3" → (1,3), None → None."""
+    from .utils import parse_month_range
+
+    try:
+        return parse_month_range(text)
+    except ValueError:
+        parser.error(f"Invalid --months: {text} (expected 1-12 range)")
+
+
+def _parse_years(parser, items):
+    """Parse a list of years and inclusive ranges: ["1990-1995", "2003"] → [1990..1995, 2003]."""
+    years = []
+    for item in items:
+        try:
+            if "-" in item:
+                first, last = (int(x) for x in item.split("-", 1))
+                years.extend(range(first, last + 1))
+            else:
+                years.append(int(item))
+        except ValueError:
+            parser.error(f"Invalid year or year range: {item}")
+    return sorted(set(years))
+
+
 def main():
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
@@ -61,6 +90,12 @@ def main():
         metavar="M or M1-M2",
         help="Restrict to specific months (e.g. '1' for Jan, '8' for Aug, '1-3' for Jan-Mar)",
     )
+    create_parser.add_argument(
+        "--weather-year",
+        type=int,
+        default=None,
+        help="Read Renewables.ninja profiles from this weather year (default: --year)",
+    )
     create_parser.add_argument(
         "--no-download", action="store_true", help="Don't auto-download missing data"
     )
@@ -85,12 +120,115 @@ def main():
         action="store_true",
         help="Export exhaustive diagnostics (all variables and duals) to diagnostics/",
     )
+    solve_parser.add_argument(
+        "--diag-nonzero",
+        action="store_true",
+        help="With --fulldiag, store only the nonzero duals",
+    )
+    solve_parser.add_argument(
+        "--diag-families",
+        nargs="+",
+        default=None,
+        metavar="FAMILY",
+        help="With --fulldiag, export only these variables/constraints (e.g. gene adequacy)",
+    )
+    solve_parser.add_argument(
+        "--diag-areas",
+        nargs="+",
+        default=None,
+        metavar="AREA",
+        help="With --fulldiag, export only these areas",
+    )
+    solve_parser.add_argument(
+        "--diag-hours",
+        nargs=2,
+        default=None,
+        metavar=("START", "END"),
+        help="With --fulldiag, export only hours in [START, END) (POSIX hours or UTC dates)",
+    )
+    solve_parser.add_argument(
+        "--output-format",
+        default="csv",
+        choices=["csv", "parquet", "arrow"],
+        help="Format of the output and diagnostics tables (default: csv; parquet/arrow need pyarrow)",
+    )
     _add_project_dir(solve_parser)
 
+    # --- ensemble command ---
+    ens_parser = subparsers.add_parser(
+        "ensemble", help="Create and solve a parameter-space ensemble of runs"
+    )
+    ens_parser.add_argument("name", help="Ensemble name (prefix of the member run names)")
+    ens_parser.add_argument(
+        "--spec", type=Path, required=True, help="YAML spec (base scenario, parameters, sampling)"
+    )
+    ens_parser.add_argument(
+        "--jobs", type=int, default=1, help="Worker processes solving members (default: 1)"
+    )
+    ens_parser.add_argument("--solver", default="highs", help="Solver to use (default: highs)")
+    ens_parser.add_argument(
+        "--model-version", default="standard", help="Model version (default: standard)"
+    )
+    ens_parser.add_argument(
+        "--no-download", action="store_true", help="Don't auto-download missing data"
+    )
+    _add_project_dir(ens_parser)
+
+    # --- weather-ensemble command ---
+    wens_parser = subparsers.add_parser(
+        "weather-ensemble", help="Solve one system year against many weather years"
+    )
+    wens_parser.add_argument("name", help="Ensemble name (prefix of the member run names)")
+    wens_parser.add_argument("--scenario", required=True, help="Scenario name")
+    wens_parser.add_argument(
+        "--year", type=int, required=True, help="System year (demand, NMD, hydro, prices)"
+    )
+    wens_parser.add_argument(
+        "--weather-years",
+        nargs="+",
+        required=True,
+        metavar="Y or Y1-Y2",
+        help="Weather years for the VRE profiles (e.g. 1990-2019, or 1995 2003 2010)",
+    )
+    wens_parser.add_argument(
+        "--months",
+        type=str,
+        default=None,
+        metavar="M or M1-M2",
+        help="Restrict to specific months (e.g. '1' for Jan, '1-3' for Jan-Mar)",
+    )
+    wens_parser.add_argument(
+        "--rn-horizon",
+        default="current",
+        choices=["current", "future"],
+        help="Renewables.ninja wind fleet (default: current)",
+    )
+    wens_parser.add_argument(
+        "--jobs", type=int, default=1, help="Worker processes solving members (default: 1)"
+    )
+    wens_parser.add_argument("--solver", default="highs", help="Solver to use (default: highs)")
+    wens_parser.add_argument(
+        "--model-version", default="standard", help="Model version (default: standard)"
+    )
+    wens_parser.add_argument(
+        "--no-download", action="store_true", help="Don't auto-download missing data"
+    )
+    _add_project_dir(wens_parser)
+
     # --- list command ---
     list_parser = subparsers.add_parser("list", help="List all runs")
     _add_project_dir(list_parser)
 
+    # --- compare command ---
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare the KPIs of solved runs (totals, prices, energy mix)"
+    )
+    compare_parser.add_argument("names", nargs="+", help="Run names")
+    compare_parser.add_argument(
+        "--areas", nargs="+", default=None, help="Only show the KPIs of these areas"
+    )
+    _add_project_dir(compare_parser)
+
     # --- collect command ---
     collect_parser = subparsers.add_parser(
         "collect", help="Download data from ENTSO-E and/or Renewables.ninja"
@@ -113,8 +251,42 @@ def main():
     collect_parser.add_argument(
         "--force", action="store_true", help="Re-download even if year data already exists"
     )
+    collect_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Extend existing files with newly published hours (in-progress year)",
+    )
+    collect_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Replay cached API responses only (data/.http_cache/), no network access",
+    )
+    collect_parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the HTTP response cache"
+    )
     _add_project_dir(collect_parser)
 
+    # --- import-entsoe command ---
+    import_parser = subparsers.add_parser(
+        "import-entsoe", help="Build data/<year>/ from ENTSO-E File Library export files"
+    )
+    import_parser.add_argument(
+        "paths", nargs="+", type=Path, help="Export files, or directories containing them"
+    )
+    import_parser.add_argument(
+        "--start", type=int, default=None, help="First year to import (default: all in files)"
+    )
+    import_parser.add_argument(
+        "--end", type=int, default=None, help="Last year (exclusive, default: all in files)"
+    )
+    import_parser.add_argument(
+        "--output-dir", type=Path, default=None, help="Output directory (default: data/)"
+    )
+    import_parser.add_argument(
+        "--force", action="store_true", help="Overwrite files that already exist"
+    )
+    _add_project_dir(import_parser)
+
     # --- viz command ---
     viz_parser = subparsers.add_parser("viz", help="Generate an interactive HTML report for a run")
     viz_parser.add_argument("name", nargs="+", help="Run name(s)")
@@ -126,6 +298,12 @@ def main():
         action="store_true",
         help="Compare simulated prices against historical day-ahead prices",
     )
+    viz_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes rendering charts, or reports of several runs (default: 1)",
+    )
     _add_project_dir(viz_parser)
 
     # --- convert-scenario command ---
@@ -145,21 +323,10 @@ def main():
     if args.command == "create":
         from .run._main_run import create_run
 
-        # Parse --months: "3" → (3,3), "1-3" → (1,3), None → None
-        month_range = None
-        if args.months:
-            if "-" in args.months:
-                parts = args.months.split("-", 1)
-                month_range = (int(parts[0]), int(parts[1]))
-            else:
-                m = int(args.months)
-                month_range = (m, m)
-            if not (
-                1 <= month_range[0] <= 12
-                and 1 <= month_range[1] <= 12
-                and month_range[0] <= month_range[1]
-            ):
-                parser.error(f"Invalid --months: {args.months} (expected 1-12 range)")
+        if args.weather_year is not None and args.actual_cf:
+            parser.error(
+                "--weather-year only applies to Renewables.ninja profiles (not --actual-cf)"
+            )
 
         create_run(
             name=args.name,
@@ -169,7 +336,8 @@ def main():
             rn_horizon=args.rn_horizon,
             actCF=args.actual_cf,
             auto_download=not args.no_download,
-            months=month_range,
+            months=_parse_month_range(parser, args.months),
+            weather_year=args.weather_year,
         )
 
     elif args.command == "solve":
@@ -182,7 +350,48 @@ def main():
             version=args.model_version,
             reports=args.reports,
             full_diag=args.fulldiag,
+            output_format=args.output_format,
+            diag_nonzero=args.diag_nonzero,
+            diag_families=args.diag_families,
+            diag_areas=args.diag_areas,
+            diag_hours=args.diag_hours,
+        )
+
+    elif args.command == "ensemble":
+        from .run.ensemble import run_ensemble
+
+        results = run_ensemble(
+            name=args.name,
+            spec=args.spec,
+            project_dir=args.project_dir,
+            jobs=args.jobs,
+            solver=args.solver,
+            version=args.model_version,
+            auto_download=not args.no_download,
+        )
+        failed = results[results["status"] != "solved"]
+        print(f"Ensemble '{args.name}': {len(results) - len(failed)}/{len(results)} members solved")
+
+    elif args.command == "weather-ensemble":
+        from .run.ensemble import run_weather_ensemble
+
+        results, distribution = run_weather_ensemble(
+            name=args.name,
+            scenario=args.scenario,
+            year=args.year,
+            weather_years=_parse_years(parser, args.weather_years),
+            project_dir=args.project_dir,
+            months=_parse_month_range(parser, args.months),
+            rn_horizon=args.rn_horizon,
+            jobs=args.jobs,
+            solver=args.solver,
+            version=args.model_version,
+            auto_download=not args.no_download,
         )
+        solved = int((results["status"] == "solved").sum())
+        print(f"Weather ensemble '{args.name}': {solved}/{len(results)} members solved")
+        if not distribution.empty:
+            print(distribution.round(1).to_string())
 
     elif args.command == "list":
         from .run._main_run import list_runs
@@ -200,6 +409,15 @@ def main():
                     f"{r.get('created', '?'):<20}"
                 )
 
+    elif args.command == "compare":
+        from .run.warehouse import compare
+
+        try:
+            table = compare(args.names, project_dir=args.project_dir, areas=args.areas)
+        except FileNotFoundError as e:
+            parser.error(str(e))
+        print(table.T.to_string())
+
     elif args.command == "collect":
         if args.end <= args.start:
             parser.error(
@@ -210,18 +428,49 @@ def main():
 
         project_dir = args.project_dir or Path.cwd()
         output_dir = args.output_dir or project_dir / "data"
-        collect_all(output_dir, args.start, args.end, source=args.source, force=args.force)
+        if args.force and args.incremental:
+            parser.error("--incremental extends existing files and cannot be combined with --force")
+        if args.offline and args.no_cache:
+            parser.error("--offline replays the HTTP cache and cannot be combined with --no-cache")
+        collect_all(
+            output_dir,
+            args.start,
+            args.end,
+            source=args.source,
+            force=args.force,
+            offline=args.offline,
+            use_cache=not args.no_cache,
+            incremental=args.incremental,
+        )
+
+    elif args.command == "import-entsoe":
+        if (args.start is None) != (args.end is None):
+            parser.error("--start and --end must be given together")
+        if args.start is not None and args.end <= args.start:
+            parser.error(f"--end ({args.end}) must be greater than --start ({args.start})")
+        from .collect._main_collect import import_entsoe_files
+
+        project_dir = args.project_dir or Path.cwd()
+        output_dir = args.output_dir or project_dir / "data"
+        years = range(args.start, args.end) if args.start is not None else None
+        imported = import_entsoe_files(output_dir, args.paths, years=years, force=args.force)
+        print(f"Imported years: {', '.join(map(str, imported)) or 'none'}")
 
     elif args.command == "viz":
-        from .viz import generate_report
+        from .viz import generate_reports
 
         project_dir = args.project_dir or Path.cwd()
+        run_dirs = []
         for run_name in args.name:
             run_dir = project_dir / "runs" / run_name
             if not run_dir.exists():
                 print(f"Run '{run_name}' not found at {run_dir}")
                 continue
-            out = generate_report(run_dir, open_browser=not args.no_open, validate=args.validate)
+            run_dirs.append(run_dir)
+        reports = generate_reports(
+            run_dirs, open_browser=not args.no_open, validate=args.validate, jobs=args.jobs
+        )
+        for out in reports:
             print(f"Report: {out}")
 
     elif args.command == "convert-scenario":
@@ -13,7 +13,9 @@ run creation time by format_inputs.py.
 Delegates to:
     - entsoe.py         ENTSO-E API calls and format normalization.
     - elexon.py         Elexon BMRS API calls (UK fallback).
+    - entsoe_files.py   ENTSO-E File Library exports (offline bulk import).
     - gap_filling.py    Temporal interpolation of missing data.
+    - manifest.py       Per-year catalog of the saved files (checksums, ranges).
     - rninja.py         Renewables.ninja capacity-factor downloads.
     - config.py         Area lists, coverage thresholds.
     - utils.py          Timezone conversion (cet_year_bounds, expected_hours).
@@ -32,25 +34,53 @@ Data structure:
                                         modeled areas (validation only) collected on
                                         demand by viz --validate or eoles-dispatch collect
         _gap_fill_report.csv/txt      - gap-filling audit trail
+        _manifest.json                - rows, NaN count, hour range, sha256 and
+                                        source of each CSV (see manifest.py)
+        .staging/<type>_<area>/       - ENTSO-E chunks of an unfinished download
+                                        (<start>_<end>.pkl, removed once complete)
     data/renewable_ninja/
         solar.csv, onshore_current.csv, ...  - capacity factor profiles
+    data/.http_cache/                 - raw API responses (see http_cache.py)
 
 Functions:
     collect_all(output_dir, start_year, end_year, ...)
         Top-level orchestrator: loops over years, calls collect_history,
-        then sanitize_year. Called from __main__.py and run/_main_run.py.
-
-    collect_history(output_dir, client, year, areas, exo_areas)
-        Download all ENTSO-E data for a single year. Loops over demand,
-        production, and prices via a config-driven call to _collect_timeseries,
-        then handles installed_capacity separately. Skips areas that already
-        have files on disk.
+        then sanitize_year. All downloads go through the HTTP response
+        cache (offline=True replays it without network access).
+        Called from __main__.py and run/_main_run.py.
+
+    collect_history(output_dir, client, year, areas, exo_areas, incremental)
+        Download all ENTSO-E data for a single year. All missing (data type,
+        area) downloads are submitted at once to a thread pool (bounded by
+        ENTSOE_MAX_WORKERS, rate-limited in entsoe.py); results are then
+        gap-filled and saved in a fixed order via _collect_timeseries, so
+        output files do not depend on download order. Installed capacity is
+        handled separately. Skips areas that already have files on disk;
+        with incremental=True, existing files are instead extended from
+        their last complete hour up to the current hour.
         Called from collect_all.
 
-    sanitize_year(year_dir, year)
+    fetch_staged(fetch, area, start, end, staging_dir, months)
+        Download one area's time series in chunks of ENTSOE_CHUNK_MONTHS CET
+        months, staging each completed chunk on disk. Staged chunks are
+        reused by the next call, so an interrupted or partially failed
+        download resumes where it stopped. Called from collect_history.
+
+    import_entsoe_files(output_dir, paths, years, areas, exo_areas, force)
+        Offline alternative to collect_history: builds the same files from
+        ENTSO-E File Library exports (entsoe_files.py), read in chunks.
+        Called from __main__.py (eoles-dispatch import-entsoe).
+
+    sanitize_year(year_dir, year, partial)
         Check integrity of CSV files in a year directory. Renames corrupt
         files to *_corrupt so they are re-downloaded on next collection.
-        Area-agnostic.
+        Only files changed since they were recorded in the manifest are
+        parsed again. Area-agnostic. partial=True accepts files covering only the start
+        of the year (in-progress year collected incrementally).
+
+    year_in_progress(year)
+        True if the CET year has not ended yet, so its files may be partial.
+        Called from collect_all and run._main_run (sanitize_year's partial).
 
     collect_installed_capacity(client, areas, year)
         Download installed generation capacity (MW). Returns a dict of
@@ -63,18 +93,35 @@ Usage:
     eoles-dispatch collect --start 2023 --end 2024 --source entsoe
     eoles-dispatch collect --start 2020 --end 2024 --source ninja
     eoles-dispatch collect --start 2021 --end 2022 --force
+    eoles-dispatch collect --start 2026 --end 2027 --incremental
+    eoles-dispatch collect --start 2015 --end 2025 --force --offline
+    eoles-dispatch import-entsoe /mnt/entsoe_exports --start 2015 --end 2025
 """
 
 import logging
+import os
+import pickle
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
-
-from ..config import DEFAULT_AREAS, DEFAULT_EXO_AREAS, ENTSOE_MIN_COVERAGE
-from ..utils import canonical_index, cet_year_bounds, expected_hours
-from . import elexon, entsoe
-from .gap_filling import Report, interpolate_gaps
+from entsoe.exceptions import NoMatchingDataError
+
+from ..config import (
+    DEFAULT_AREAS,
+    DEFAULT_EXO_AREAS,
+    ENTSOE_CHUNK_MONTHS,
+    ENTSOE_MAX_WORKERS,
+    ENTSOE_MIN_COVERAGE,
+    HTTP_CACHE_DIR,
+)
+from ..utils import canonical_index, cet_month_chunks, cet_year_bounds, expected_hours
+from . import elexon, entsoe, http_cache, manifest
+from .entsoe_files import FileLibrary
+from .gap_filling import Report, interpolate_gaps_frame
+from .http_cache import HttpCache
 from .rninja import collect_ninja
 
 logger = logging.getLogger(__name__)
@@ -92,85 +139,105 @@ def collect_all(
     source="all",
     force=False,
     include_area_prices=True,
+    offline=False,
+    use_cache=True,
+    incremental=False,
 ):
+    """Collect ENTSO-E and/or Renewables.ninja data for [start_year, end_year).
+
+    Raw API responses go through the HTTP cache in <output_dir>/.http_cache/
+    (see http_cache.py): re-collections replay them instead of downloading
+    again. With offline=True nothing is downloaded; data missing from the
+    cache is reported as failed. use_cache=False bypasses the cache.
+
+    With incremental=True, existing ENTSO-E files are extended with the hours
+    published since they were written instead of being skipped, and the
+    in-progress year is kept as a partial year (see collect_history).
+    """
+    if force and incremental:
+        raise ValueError("force and incremental are mutually exclusive")
     if areas is None:
         areas = list(DEFAULT_AREAS)
     if exo_areas is None:
         exo_areas = list(DEFAULT_EXO_AREAS)
 
     output_dir = Path(output_dir)
-
-    if source in ("all", "entsoe"):
-        logger.info("=== STARTING DOWNLOADING HISTORY DATA ===")
-        # Validate API key upfront (fail fast before starting a long run)
-        try:
-            client = entsoe.set_client()
-        except (EnvironmentError, RuntimeError) as e:
-            raise SystemExit(f"Error: {e}") from None
-
-        for year in range(start_year, end_year):
-            year_dir = output_dir / str(year)
-
-            if force and year_dir.exists():
-                logger.info(f"Data for {year} present locally, force removing and redownloading...")
-                shutil.rmtree(year_dir)
-
-            year_dir.mkdir(parents=True, exist_ok=True)
-
-            # collect_history skips areas that already have files
-            collect_history(
-                output_dir=year_dir,
-                client=client,
-                year=year,
-                areas=areas,
-                exo_areas=exo_areas,
-                include_area_prices=include_area_prices,
-            )
-
-            # Sanitize: flag bad files so next collection re-downloads them
-            issues = sanitize_year(year_dir, year)
-            if issues:
-                logger.warning(f"{year}: validation issues:")
-                for issue in issues:
-                    logger.warning(f"    - {issue}")
+    cache = None
+    if use_cache or offline:
+        cache = HttpCache(output_dir / HTTP_CACHE_DIR, offline=offline)
+        logger.info(f"HTTP cache: {cache.cache_dir}{' (offline replay)' if offline else ''}")
+
+    with http_cache.activated(cache):
+        if source in ("all", "entsoe"):
+            logger.info("=== STARTING DOWNLOADING HISTORY DATA ===")
+            if offline:
+                client = None  # only used on cache misses, which fail offline
             else:
-                logger.info(f"{year}: all files validated")
-
-    if source in ("all", "ninja"):
-        ninja_dir = output_dir / "renewable_ninja"
-        ninja_files = [
-            "solar.csv",
-            "onshore_current.csv",
-            "onshore_future.csv",
-            "offshore_current.csv",
-            "offshore_future.csv",
-        ]
-        ninja_missing = not ninja_dir.exists() or not all(
-            (ninja_dir / f).exists() for f in ninja_files
-        )
-
-        logger.info("=== Collecting Renewables.ninja profiles ===")
+                # Validate API key upfront (fail fast before starting a long run)
+                try:
+                    client = entsoe.set_client()
+                except (EnvironmentError, RuntimeError) as e:
+                    raise SystemExit(f"Error: {e}") from None
+
+            for year in range(start_year, end_year):
+                year_dir = output_dir / str(year)
+
+                if force and year_dir.exists():
+                    logger.info(
+                        f"Data for {year} present locally, force removing and redownloading..."
+                    )
+                    shutil.rmtree(year_dir)
+
+                year_dir.mkdir(parents=True, exist_ok=True)
+
+                # collect_history skips areas that already have files
+                collect_history(
+                    output_dir=year_dir,
+                    client=client,
+                    year=year,
+                    areas=areas,
+                    exo_areas=exo_areas,
+                    include_area_prices=include_area_prices,
+                    incremental=incremental,
+                )
 
-        if ninja_missing:
-            logger.info(f"Renewable Ninja data not found in {ninja_dir}, downloading...")
-            collect_ninja(ninja_dir, areas=areas)
-        elif force:
-            logger.info(
-                "Renewable Ninja data already available locally, force remove and redownload..."
-            )
-            shutil.rmtree(ninja_dir)
+                # Sanitize: flag bad files so next collection re-downloads them
+                issues = sanitize_year(year_dir, year, partial=year_in_progress(year))
+                if issues:
+                    logger.warning(f"{year}: validation issues:")
+                    for issue in issues:
+                        logger.warning(f"    - {issue}")
+                else:
+                    logger.info(f"{year}: all files validated")
+
+        if source in ("all", "ninja"):
+            ninja_dir = output_dir / "renewable_ninja"
+            ninja_files = [
+                "solar.csv",
+                "onshore_current.csv",
+                "onshore_future.csv",
+                "offshore_current.csv",
+                "offshore_future.csv",
+            ]
+
+            logger.info("=== Collecting Renewables.ninja profiles ===")
+
+            if force and ninja_dir.exists():
+                logger.info(
+                    "Renewable Ninja data already available locally, force remove and redownload..."
+                )
+                shutil.rmtree(ninja_dir)
+            # Only the (profile, area) pairs not stored yet are downloaded
             collect_ninja(ninja_dir, areas=areas)
-        else:
-            logger.info("Renewable Ninja data already available locally, skipping download.")
-
-        # Verify download succeeded
-        still_missing = [f for f in ninja_files if not (ninja_dir / f).exists()]
-        if still_missing:
-            raise RuntimeError(
-                f"Failed to download Renewables.ninja data. "
-                f"Missing files: {still_missing}. "
-                f"Check your internet connection, or provide the data manually in {ninja_dir}/"
-            )
+
+            # Verify download succeeded
+            still_missing = [f for f in ninja_files if not (ninja_dir / f).exists()]
+            if still_missing:
+                raise RuntimeError(
+                    f"Failed to download Renewables.ninja data. "
+                    f"Missing files: {still_missing}. "
+                    f"Check your internet connection, or provide the data manually in {ninja_dir}/"
+                )
 
     logger.info("=== Collection complete ===")
     return output_dir
@@ -186,6 +253,7 @@ def collect_history(
     areas=None,
     exo_areas=None,
     include_area_prices=True,
+    incremental=False,
 ):
     """Download all time-varying ENTSO-E data for a single year and save to CSV.
 
@@ -193,7 +261,16 @@ def collect_history(
     capacity for all areas. Each data type is saved as one file per area:
     demand_<area>.csv, production_<area>.csv, prices_<area>.csv,
     installed_capacity_<area>.csv. Per-area file checks allow resuming
-    interrupted collections without re-downloading already-collected areas.
+    interrupted collections without re-downloading already-collected areas;
+    within an area, time series are downloaded month by month and staged
+    under <output_dir>/.staging/ (see fetch_staged).
+
+    Incremental mode keeps each time-series file up to date instead of
+    skipping it: the file's last complete hour is read, only the hours after
+    it are downloaded, gap filling is re-run on that tail (with two weeks of
+    stored context for weekly analogues) and the new rows are appended. An
+    in-progress year is collected up to the current hour, and trailing hours
+    not yet published for every column are left out until the next run.
 
     Args:
         output_dir: Directory to write CSV files into (e.g. data/<year>/).
@@ -205,6 +282,8 @@ def collect_history(
             modeled areas. Set to False during ``create`` to skip validation-only
             data; prices for modeled areas are then fetched on demand by
             ``viz --validate``.
+        incremental: If True, extend existing time-series files up to the
+            current hour (see above) instead of skipping them.
     """
     if areas is None:
         areas = list(DEFAULT_AREAS)
@@ -217,8 +296,54 @@ def collect_history(
         else Report(output_dir)
     )
     start, end = cet_year_bounds(year)
+    staging = output_dir / STAGING_DIR
+
+    # Incremental mode collects an in-progress year up to the current hour
+    horizon = min(end, _current_hour()) if incremental else end
     canon_idx = canonical_index(year)
-    n_exp = expected_hours(year)
+    canon_idx = canon_idx[canon_idx < horizon]
+    n_exp = len(canon_idx)
+    stored = {}  # (ts_type, area) -> complete rows already on disk (incremental)
+
+    def window(ts_type, area):
+        """(start, end) still to download for one time-series file."""
+        rows = stored.get((ts_type, area))
+        if rows is None or rows.empty:
+            return start, horizon
+        return rows["hour"].iloc[-1] + pd.Timedelta(hours=1), horizon
+
+    def staged(fetch, ts_type):
+        """ENTSO-E fetch for one area, downloaded chunk by chunk (resumable)."""
+        return lambda area: fetch_staged(
+            lambda a, s, e: fetch(client, a, s, e),
+            area,
+            *window(ts_type, area),
+            staging / f"{ts_type}_{area}",
+        )
+
+    def usable(check, ts_type):
+        """Coverage check for a new file; any data extends an existing one."""
+
+        def usable_fn(raw, area):
+            if (ts_type, area) in stored:
+                return raw is not None and len(raw) > 0
+            return check(raw, n_exp)
+
+        return usable_fn
+
+    def pending(ts_type, area_list):
+        """Areas whose file is missing or, in incremental mode, ends early."""
+        todo = []
+        for area in area_list:
+            path = output_dir / f"{ts_type}_{area}.csv"
+            if not path.exists():
+                todo.append(area)
+            elif incremental:
+                rows = _read_complete_rows(path)
+                if rows.empty or rows["hour"].iloc[-1] + pd.Timedelta(hours=1) < horizon:
+                    stored[(ts_type, area)] = rows
+                    todo.append(area)
+        return todo
 
     # Time series: config-driven loop over demand, production, prices
     ts_configs = [
@@ -226,76 +351,362 @@ def collect_history(
             "demand",
             areas,
             dict(
-                entsoe_fetch=lambda area: entsoe.fetch_demand(client, area, start, end),
-                elexon_fetch=lambda: elexon.fetch_demand(start, end),
-                usable_fn=lambda raw: entsoe.is_usable(raw, n_exp),
+                entsoe_fetch=staged(entsoe.fetch_demand, "demand"),
+                elexon_fetch=lambda: elexon.fetch_demand(*window("demand", "UK")),
+                usable_fn=usable(entsoe.is_usable, "demand"),
             ),
         ),
         (
             "production",
             areas,
             dict(
-                entsoe_fetch=lambda area: entsoe.fetch_generation(client, area, start, end),
-                elexon_fetch=lambda: elexon.fetch_generation(start, end),
-                usable_fn=lambda raw: _is_production_usable(raw, n_exp),
+                entsoe_fetch=staged(entsoe.fetch_generation, "production"),
+                elexon_fetch=lambda: elexon.fetch_generation(*window("production", "UK")),
+                usable_fn=usable(_is_production_usable, "production"),
             ),
         ),
         (
             "prices",
             list(exo_areas) + (list(areas) if include_area_prices else []),
             dict(
-                entsoe_fetch=lambda area: entsoe.fetch_day_ahead_prices(client, area, start, end),
-                elexon_fetch=lambda: elexon.fetch_day_ahead_prices(start, end),
-                usable_fn=lambda raw: entsoe.is_usable(raw, n_exp),
+                entsoe_fetch=staged(entsoe.fetch_day_ahead_prices, "prices"),
+                elexon_fetch=lambda: elexon.fetch_day_ahead_prices(*window("prices", "UK")),
+                usable_fn=usable(entsoe.is_usable, "prices"),
             ),
         ),
     ]
 
-    for ts_type, area_list, config in ts_configs:
-        logger.info(f"=== {ts_type.capitalize()} (year: {year}) ===")
-        missing = [a for a in area_list if not (output_dir / f"{ts_type}_{a}.csv").exists()]
-        if not missing:
-            logger.info(f"  → all {ts_type} files already exist, skipping")
-            continue
-        existing = [a for a in area_list if a not in missing]
-        if existing:
-            logger.info(
-                f"  → {ts_type} already available for {existing}, downloading missing: {missing}"
-            )
-
-        _collect_timeseries(
-            ts_type=ts_type,
-            areas=missing,
-            canon_idx=canon_idx,
-            gap_report=gap_report,
-            output_dir=output_dir,
-            **config,
-        )
-
-    # Installed capacity (not a time series — separate handling)
-    logger.info("=== Installed capacity ===")
+    missing_by_type = {ts_type: pending(ts_type, area_list) for ts_type, area_list, _ in ts_configs}
+    for (ts_type, area), rows in stored.items():
+        logger.info(f"  {ts_type}_{area}.csv: extending from {window(ts_type, area)[0]}")
     areas_ic_missing = [
         a for a in areas if not (output_dir / f"installed_capacity_{a}.csv").exists()
     ]
-    if not areas_ic_missing:
-        logger.info("  → all installed_capacity files already exist, skipping")
-    else:
-        existing_ic = [a for a in areas if a not in areas_ic_missing]
-        if existing_ic:
-            logger.info(
-                f"  → installed_capacity already available for {existing_ic}, downloading missing: {areas_ic_missing}"
+
+    # Start every ENTSO-E download up front; the rate limiter in entsoe.py
+    # keeps the request rate within the API budget. Results are consumed
+    # below in a fixed order.
+    # The report flushes its buffered entries on exit, even if a download fails
+    with gap_report, ThreadPoolExecutor(max_workers=ENTSOE_MAX_WORKERS) as pool:
+        prefetched = {
+            ts_type: {
+                area: pool.submit(config["entsoe_fetch"], area) for area in missing_by_type[ts_type]
+            }
+            for ts_type, _, config in ts_configs
+        }
+        ic_prefetched = {
+            area: pool.submit(entsoe.fetch_installed_capacity, client, area, year)
+            for area in areas_ic_missing
+        }
+
+        for ts_type, area_list, config in ts_configs:
+            logger.info(f"=== {ts_type.capitalize()} (year: {year}) ===")
+            missing = missing_by_type[ts_type]
+            if not missing:
+                state = "exist and are up to date" if incremental else "already exist"
+                logger.info(f"  → all {ts_type} files {state}, skipping")
+                continue
+            existing = [a for a in area_list if a not in missing]
+            if existing:
+                logger.info(
+                    f"  → {ts_type} already available for {existing}, downloading missing: {missing}"
+                )
+
+            _collect_timeseries(
+                ts_type=ts_type,
+                areas=missing,
+                canon_idx=canon_idx,
+                gap_report=gap_report,
+                output_dir=output_dir,
+                prefetched=prefetched[ts_type],
+                existing={a: rows for (t, a), rows in stored.items() if t == ts_type},
+                trim_tail=horizon < end,
+                **config,
             )
-        installed = collect_installed_capacity(client, areas_ic_missing, year)
-        for area, df in installed.items():
-            path = output_dir / f"installed_capacity_{area}.csv"
-            df.to_csv(path, index=False)
-            logger.info(f"  → installed_capacity_{area}.csv ({len(df)} technologies)")
+
+        # Installed capacity (not a time series — separate handling)
+        logger.info("=== Installed capacity ===")
+        if not areas_ic_missing:
+            logger.info("  → all installed_capacity files already exist, skipping")
+        else:
+            existing_ic = [a for a in areas if a not in areas_ic_missing]
+            if existing_ic:
+                logger.info(
+                    f"  → installed_capacity already available for {existing_ic}, downloading missing: {areas_ic_missing}"
+                )
+            installed = collect_installed_capacity(
+                client, areas_ic_missing, year, prefetched=ic_prefetched
+            )
+            for area, df in installed.items():
+                path = output_dir / f"installed_capacity_{area}.csv"
+                df.to_csv(path, index=False)
+                manifest.record(output_dir, path, df.attrs.get("source"))
+                logger.info(f"  → installed_capacity_{area}.csv ({len(df)} technologies)")
 
     gap_report.save()
+    if staging.exists() and not any(staging.iterdir()):
+        staging.rmdir()
+
+
+# ── Import from ENTSO-E File Library exports ──
+
+# File names recognised when a directory of exports is given
+_EXPORT_SUFFIXES = (".csv", ".csv.gz", ".tsv")
+
+
+def import_entsoe_files(output_dir, paths, years=None, areas=None, exo_areas=None, force=False):
+    """Populate data/<year>/ from ENTSO-E File Library exports, without network.
+
+    Reads the export files (entsoe_files.FileLibrary), then writes the same
+    per-area files as collect_history: each time series is reindexed onto the
+    canonical hourly index, gap-filled and checked for coverage through
+    _collect_timeseries, and each year is sanitized afterwards. Prices are
+    imported for exo areas and modeled areas. Existing files are kept unless
+    force=True.
+
+    Args:
+        output_dir: Root data directory (data/).
+        paths: Export files, or directories searched recursively for them.
+        years: Years to write (default: every CET year found in the files).
+        areas: Modeled country codes (default: DEFAULT_AREAS).
+        exo_areas: Non-modeled country codes (default: DEFAULT_EXO_AREAS).
+        force: Overwrite files that already exist.
+
+    Returns:
+        List of the years written.
+    """
+    if areas is None:
+        areas = list(DEFAULT_AREAS)
+    if exo_areas is None:
+        exo_areas = list(DEFAULT_EXO_AREAS)
+    price_areas = list(dict.fromkeys([*exo_areas, *areas]))
+
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(
+                sorted(p for p in path.rglob("*") if p.name.lower().endswith(_EXPORT_SUFFIXES))
+            )
+        else:
+            files.append(path)
+    if not files:
+        raise FileNotFoundError(f"No ENTSO-E export files found in {[str(p) for p in paths]}")
+
+    logger.info(f"=== Reading {len(files)} ENTSO-E File Library exports ===")
+    library = FileLibrary(areas, price_areas)
+    for path in files:
+        library.add(path)
+    years = library.years() if years is None else list(years)
+
+    output_dir = Path(output_dir)
+    for year in years:
+        year_dir = output_dir / str(year)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        start, end = cet_year_bounds(year)
+        canon_idx = canonical_index(year)
+        n_exp = len(canon_idx)
+        gap_report = (
+            Report.load(year_dir / "_gap_fill_report.csv")
+            if (year_dir / "_gap_fill_report.csv").exists()
+            else Report(year_dir)
+        )
+        ts_configs = [
+            ("demand", areas, library.fetch_demand, entsoe.is_usable),
+            ("production", areas, library.fetch_generation, _is_production_usable),
+            ("prices", price_areas, library.fetch_day_ahead_prices, entsoe.is_usable),
+        ]
+
+        with gap_report:
+            for ts_type, area_list, fetch, check in ts_configs:
+                todo = [
+                    a for a in area_list if force or not (year_dir / f"{ts_type}_{a}.csv").exists()
+                ]
+                if not todo:
+                    logger.info(f"  → all {ts_type} files for {year} already exist, skipping")
+                    continue
+                logger.info(f"=== {ts_type.capitalize()} (year: {year}, from files) ===")
+                _collect_timeseries(
+                    ts_type=ts_type,
+                    areas=todo,
+                    canon_idx=canon_idx,
+                    gap_report=gap_report,
+                    output_dir=year_dir,
+                    entsoe_fetch=lambda area, fetch=fetch: fetch(area, start, end),
+                    usable_fn=lambda raw, area, check=check: check(raw, n_exp),
+                    source="entsoe_files",
+                )
+
+            logger.info(f"=== Installed capacity (year: {year}, from files) ===")
+            for area in areas:
+                path = year_dir / f"installed_capacity_{area}.csv"
+                if path.exists() and not force:
+                    continue
+                capa = library.fetch_installed_capacity(area, year)
+                if not capa:
+                    logger.info(f"  installed_capacity_{area}: no data in the files")
+                    continue
+                df = pd.DataFrame([{"tec": tec, "value": gw} for tec, gw in capa.items()])
+                df.to_csv(path, index=False)
+                manifest.record(year_dir, path, "entsoe_files")
+                logger.info(f"  → installed_capacity_{area}.csv ({len(df)} technologies)")
+
+        gap_report.save()
+        issues = sanitize_year(year_dir, year, partial=year_in_progress(year))
+        if issues:
+            logger.warning(f"{year}: validation issues:")
+            for issue in issues:
+                logger.warning(f"    - {issue}")
+        else:
+            logger.info(f"{year}: all files validated")
+
+    logger.info("=== Import complete ===")
+    return years
+
+
+# ── Staged (chunked, resumable) downloads ──
+
+STAGING_DIR = ".staging"
+
+
+def fetch_staged(fetch, area, start, end, staging_dir, months=ENTSOE_CHUNK_MONTHS):
+    """Download [start, end) for one area in chunks, staging each chunk on disk.
+
+    The period is split at CET month starts (utils.cet_month_chunks). Each
+    chunk is fetched on its own (so API retries only repeat that chunk) and
+    pickled to <staging_dir>/<start>_<end>.pkl (UTC window, e.g.
+    20201231T23_20210131T23) as soon as it completes. Chunks staged for the
+    same window by an earlier call are loaded instead of downloaded; naming
+    by window means a chunk truncated by ``end`` (incremental tail) is never
+    reused for a longer one. A chunk for which ENTSO-E has no data is staged
+    as empty.
+
+    The chunks are assembled only once all of them are present. If any chunk
+    fails, the others stay staged and a RuntimeError is raised, so the next
+    collection only downloads the missing ones. On success the staging
+    directory is removed.
+
+    Args:
+        fetch: Callable[(area, start, end)] -> pd.Series|pd.DataFrame|None,
+            e.g. a wrapper around entsoe.fetch_demand.
+        area: Our area code.
+        start, end: Period bounds (naive UTC from cet_year_bounds).
+        staging_dir: Directory for this (data type, area)'s chunks.
+        months: Chunk length in CET months (default ENTSOE_CHUNK_MONTHS).
+
+    Returns:
+        Same type as ``fetch`` over the whole period (rows sorted by time and
+        clipped to [start, end)), or None if no chunk returned data.
+    """
+    staging_dir = Path(staging_dir)
+    chunks = cet_month_chunks(start, end, months)
+    parts, failed, reused = [], [], 0
+    for label, chunk_start, chunk_end in chunks:
+        path = staging_dir / f"{chunk_start:%Y%m%dT%H}_{chunk_end:%Y%m%dT%H}.pkl"
+        if path.exists():
+            parts.append(pd.read_pickle(path))
+            reused += 1
+            continue
+        try:
+            part = fetch(area, chunk_start, chunk_end)
+        except NoMatchingDataError:
+            part = None
+        except Exception as e:
+            failed.append((label, e))
+            logger.debug("Chunk %s of %s failed: %s", label, staging_dir.name, e)
+            continue
+        part = _clip(part, chunk_start, chunk_end)
+        _stage(path, part)
+        parts.append(part)
+
+    if reused:
+        logger.info(f"  {staging_dir.name}: resumed with {reused}/{len(chunks)} chunks staged")
+    if failed:
+        labels = ", ".join(label for label, _ in failed)
+        raise RuntimeError(
+            f"{len(failed)}/{len(chunks)} chunks failed ({labels}); "
+            f"completed chunks are kept in {staging_dir} for the next collection"
+        ) from failed[0][1]
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    return _assemble(parts)
+
+
+def _clip(part, start, end):
+    """Rows of a fetch result with timestamps in [start, end) (None if empty)."""
+    if part is None or len(part) == 0:
+        return None
+    times = part["hour"] if isinstance(part, pd.DataFrame) and "hour" in part else part.index
+    mask = (times >= start) & (times < end)
+    part = part[mask]
+    return part if len(part) else None
+
+
+def _assemble(parts):
+    """Concatenate chunk results in time order (None if all chunks are empty)."""
+    parts = [p for p in parts if p is not None]
+    if not parts:
+        return None
+    if isinstance(parts[0], pd.DataFrame):
+        # A production type absent from a month produced nothing that month:
+        # zero, as in a single full-period download.
+        columns = list(dict.fromkeys(c for p in parts for c in p.columns))
+        parts = [p.reindex(columns=columns, fill_value=0.0) for p in parts]
+        result = pd.concat(parts)
+        return result.reset_index(drop=True) if "hour" in result else result
+    return pd.concat(parts)
+
+
+def _stage(path, part):
+    """Pickle a chunk result atomically, so a crash never leaves a partial chunk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(part, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 # ── Time series collection helper ──
 
+# Stored hours kept before an incremental tail when re-running gap filling:
+# weekly analogues look up to 2 weeks back, plus 24h of scaling context.
+_GAP_FILL_CONTEXT = pd.Timedelta(hours=2 * 7 * 24 + 24)
+
+
+def _current_hour():
+    """Start of the current hour, naive UTC (collection horizon in incremental mode)."""
+    return pd.Timestamp.now(tz="UTC").floor("h").tz_localize(None)
+
+
+def year_in_progress(year):
+    """True if the CET year has not ended yet (its files can only be partial)."""
+    return cet_year_bounds(year)[1] > _current_hour()
+
+
+def _read_complete_rows(path):
+    """Rows of a time-series CSV up to its first hour with a missing value.
+
+    The number of rows in the file is kept in ``attrs["rows_on_disk"]`` so the
+    caller can tell whether new rows can simply be appended.
+    """
+    df = pd.read_csv(path, parse_dates=["hour"])
+    complete = df.drop(columns=["hour"]).notna().all(axis=1).to_numpy()
+    n_complete = len(df) if complete.all() else int(complete.argmin())
+    rows = df.iloc[:n_complete]
+    rows.attrs["rows_on_disk"] = len(df)
+    return rows
+
+
+def _trim_incomplete_tail(indexed):
+    """Drop trailing hours where any column is missing (not yet published)."""
+    complete = indexed.notna().all(axis=1).to_numpy()
+    if not complete.any():
+        return indexed.iloc[:0]
+    return indexed.iloc[: complete.nonzero()[0][-1] + 1]
+
 
 def _is_production_usable(raw, n_expected):
     """Check whether raw production data has sufficient non-NaN coverage."""
@@ -317,6 +728,10 @@ def _collect_timeseries(
     elexon_fetch=None,
     usable_fn=None,
     transform=None,
+    prefetched=None,
+    existing=None,
+    trim_tail=False,
+    source="entsoe",
 ):
     """Fetch, gap-fill, and return time series data for a list of areas.
 
@@ -338,11 +753,21 @@ def _collect_timeseries(
         elexon_fetch: Callable[()] -> pd.Series|pd.DataFrame|None.
             Called only for UK when ENTSO-E data is not usable. None means
             no Elexon fallback.
-        usable_fn: Callable[(raw)] -> bool. Returns True when ENTSO-E data
-            is sufficient without a fallback. None means any non-empty
+        usable_fn: Callable[(raw, area)] -> bool. Returns True when ENTSO-E
+            data is sufficient without a fallback. None means any non-empty
             result is considered usable.
         transform: Callable applied to the filled series/DataFrame before
             saving (e.g. unit conversion). None means no transform.
+        prefetched: Optional {area: Future} of ENTSO-E downloads already
+            started by the caller; used instead of calling entsoe_fetch.
+        existing: Optional {area: DataFrame} of complete rows already stored
+            (incremental mode). Fetched data is placed after them, gap filling
+            only covers the new hours (plus context), and the new rows are
+            appended to the file when its layout is unchanged.
+        trim_tail: If True (in-progress year), drop trailing hours that are
+            not yet available for every column instead of gap-filling them.
+        source: Name of the primary source recorded in the manifest
+            ("entsoe", or "entsoe_files" for File Library imports).
 
     Returns:
         dict {area: pd.DataFrame} with an 'hour' column.
@@ -350,20 +775,25 @@ def _collect_timeseries(
     """
     if usable_fn is None:
 
-        def usable_fn(raw):
+        def usable_fn(raw, area):
             return raw is not None and (not hasattr(raw, "__len__") or len(raw) > 0)
 
+    existing = existing or {}
+
     result = {}
     for area in areas:
-        data = None
+        data = data_source = None
         print(f"{ts_type.capitalize()} {area}... ", end="", flush=True)
 
         # Try ENTSO-E
         try:
-            raw = entsoe_fetch(area)
+            if prefetched is not None and area in prefetched:
+                raw = prefetched[area].result()
+            else:
+                raw = entsoe_fetch(area)
             is_empty = raw is None or (hasattr(raw, "__len__") and len(raw) == 0)
             if not is_empty:
-                data = raw
+                data, data_source = raw, source
         except Exception as e:
             if area == "UK":
                 print("no data at ENTSO-E, try Elexon...", end="", flush=True)
@@ -373,7 +803,7 @@ def _collect_timeseries(
                 continue
 
         # Elexon fallback for UK when ENTSO-E data is absent or insufficient
-        if elexon_fetch is not None and area == "UK" and not usable_fn(data):
+        if elexon_fetch is not None and area == "UK" and not usable_fn(data, area):
             if data is not None:
                 print(" partial ENTSO-E, filling gaps with Elexon...", end="", flush=True)
             try:
@@ -394,8 +824,9 @@ def _collect_timeseries(
                             data = ep.combine_first(el)
                         else:
                             data = data.combine_first(elexon_data)
+                        data_source = f"{source}+elexon"
                     else:
-                        data = elexon_data
+                        data, data_source = elexon_data, "elexon"
             except Exception as e:
                 print(f" Elexon fallback FAILED ({type(e).__name__})", end="", flush=True)
                 logger.warning("%s %s Elexon fallback error: %s", ts_type.capitalize(), area, e)
@@ -403,38 +834,45 @@ def _collect_timeseries(
         if data is None or (hasattr(data, "__len__") and len(data) == 0):
             print("no data available (KO)")
             continue
-        if not usable_fn(data):
+        if not usable_fn(data, area):
             print("insufficient data (KO)")
             continue
 
         print("OK", end="", flush=True)
 
-        # Reindex onto canonical index and gap-fill
-        gaps_filled = 0
-        gaps_not_filled = 0
-        if isinstance(data, pd.DataFrame):
-            if "hour" in data.columns:
-                data = data.set_index("hour")
-            indexed = data.reindex(canon_idx)
-            for col in indexed.columns:
-                indexed[col], col_filled, col_not_filled = interpolate_gaps(
-                    indexed[col], report=gap_report, variable=col, area=area
-                )
-                gaps_filled += col_filled
-                gaps_not_filled += col_not_filled
-            if transform is not None:
-                indexed = transform(indexed)
-            indexed.index.name = "hour"
-            result[area] = indexed.reset_index()
+        # Reindex onto canonical index, after the rows already stored
+        is_frame = isinstance(data, pd.DataFrame)
+        if is_frame:
+            frame = data.set_index("hour") if "hour" in data.columns else data
         else:
-            # Series (demand, prices)
-            series = data.reindex(canon_idx)
-            series, gaps_filled, gaps_not_filled = interpolate_gaps(
-                series, report=gap_report, variable=ts_type, area=area
-            )
-            if transform is not None:
-                series = transform(series)
-            result[area] = series.to_frame(name=ts_type).rename_axis("hour").reset_index()
+            frame = data.to_frame(name=ts_type)
+        rows = existing.get(area)
+        resume = canon_idx[0]
+        if rows is not None:
+            rows = rows.set_index("hour")
+            columns = list(dict.fromkeys([*rows.columns, *frame.columns]))
+            # A column absent from one side had no production there
+            frame = frame.reindex(columns=columns, fill_value=0.0)
+            rows = rows.reindex(columns=columns, fill_value=0.0)
+        indexed = frame.reindex(canon_idx)
+        if rows is not None and not rows.empty:
+            indexed.loc[rows.index, :] = rows.to_numpy()
+            resume = rows.index[-1] + pd.Timedelta(hours=1)
+        if trim_tail:
+            indexed = _trim_incomplete_tail(indexed)
+            if indexed.empty or indexed.index[-1] < resume:
+                print(" no new complete hours yet")
+                continue
+
+        # Gap-fill the new hours, with enough stored context for weekly analogues
+        fill_from = max(canon_idx[0], resume - _GAP_FILL_CONTEXT)
+        indexed.loc[fill_from:], gaps_filled, gaps_not_filled = interpolate_gaps_frame(
+            indexed.loc[fill_from:], report=gap_report, area=area
+        )
+        if transform is not None:
+            indexed = transform(indexed) if is_frame else transform(indexed[ts_type]).to_frame()
+        indexed.index.name = "hour"
+        result[area] = indexed.reset_index()
 
         if gaps_filled > 0:
             print(f" [Gaps in data: {gaps_filled} data points filled]", end="", flush=True)
@@ -446,8 +884,22 @@ def _collect_timeseries(
             )
 
         path = output_dir / f"{ts_type}_{area}.csv"
-        result[area].to_csv(path, index=False)
-        print(f" → {ts_type}_{area}.csv ({len(result[area])} rows)")
+        original = existing.get(area)
+        appendable = (
+            original is not None
+            and original.attrs.get("rows_on_disk") == len(original)
+            and list(original.columns) == list(result[area].columns)
+        )
+        if appendable:
+            new_rows = result[area][result[area]["hour"] >= resume]
+            new_rows.to_csv(
+                path, mode="a", header=False, index=False, date_format="%Y-%m-%d %H:%M:%S"
+            )
+            print(f" → {ts_type}_{area}.csv (+{len(new_rows)} rows)")
+        else:
+            result[area].to_csv(path, index=False)
+            print(f" → {ts_type}_{area}.csv ({len(result[area])} rows)")
+        manifest.record(output_dir, path, data_source)
 
     return result
 
@@ -455,7 +907,7 @@ def _collect_timeseries(
 # ── Installed capacity ──
 
 
-def collect_installed_capacity(client, areas, year):
+def collect_installed_capacity(client, areas, year, prefetched=None):
     """Collect installed generation capacity per production type for each area.
 
     ENTSO-E primary, Elexon fallback for UK.
@@ -464,6 +916,8 @@ def collect_installed_capacity(client, areas, year):
         client: EntsoePandasClient.
         areas: List of area codes.
         year: Calendar year.
+        prefetched: Optional {area: Future} of ENTSO-E downloads already
+            started by the caller.
 
     Returns:
         dict {area: pd.DataFrame} with columns ['tec', 'value'] (GW).
@@ -472,11 +926,15 @@ def collect_installed_capacity(client, areas, year):
     result = {}
     for area in areas:
         capa = None
+        source = "entsoe"
         print(f"Installed capacity {area}... ", end="", flush=True)
 
         # Try ENTSO-E
         try:
-            capa = entsoe.fetch_installed_capacity(client, area, year)
+            if prefetched is not None and area in prefetched:
+                capa = prefetched[area].result()
+            else:
+                capa = entsoe.fetch_installed_capacity(client, area, year)
         except Exception as e:
             if area != "UK":
                 print(f"FAILED ({type(e).__name__})")
@@ -487,12 +945,14 @@ def collect_installed_capacity(client, areas, year):
             try:
                 print(" try Elexon...", end="", flush=True)
                 capa = elexon.fetch_installed_capacity(year)
+                source = "elexon"
             except Exception as e:
                 print(f" Elexon fallback FAILED ({type(e).__name__})", end="", flush=True)
                 logger.warning("Installed capacity %s Elexon fallback error: %s", area, e)
 
         if capa:
             result[area] = pd.DataFrame([{"tec": tec, "value": gw} for tec, gw in capa.items()])
+            result[area].attrs["source"] = source
             print(f"OK ({len(capa)} types)")
         else:
             print("no data available (KO)")
@@ -503,7 +963,7 @@ def collect_installed_capacity(client, areas, year):
 # ── Sanitization ──
 
 
-def sanitize_year(year_dir, year):
+def sanitize_year(year_dir, year, partial=False):
     """Check integrity of CSV files in a year directory, rename corrupt ones.
 
     Scans all *.csv files (excluding _gap_fill_report and already-flagged
@@ -512,11 +972,19 @@ def sanitize_year(year_dir, year):
     *_corrupt so they are ignored by collect_history's skip logic and
     re-downloaded on next collection.
 
+    The checks use the summaries of the year's manifest (manifest.py): a
+    file whose size and mtime match its entry is not read at all, so
+    re-checking an unchanged year only costs one stat per file. New or
+    modified files are parsed once and their entries updated.
+
     Area-agnostic: validates whatever files exist, does not check completeness.
 
     Args:
         year_dir: Path to data/<year>/ directory.
         year: Calendar year (for computing expected row count).
+        partial: If True (in-progress year, see year_in_progress), accept
+            timeseries files covering only the first hours of the year, as
+            long as they follow the canonical hourly index.
 
     Returns:
         List of issue strings (empty if all files OK).
@@ -524,29 +992,43 @@ def sanitize_year(year_dir, year):
     if not year_dir.exists():
         return []
 
-    issues = []
-    n_expected = expected_hours(year)
-
-    for path in sorted(year_dir.glob("*.csv")):
-        if path.name.startswith("_gap_fill_report") or "_corrupt" in path.name:
-            continue
-
-        df = pd.read_csv(path)
-
-        # Only validate timeseries files (have an 'hour' column)
-        if "hour" not in df.columns:
-            continue
+    paths = [
+        path
+        for path in sorted(year_dir.glob("*.csv"))
+        if not path.name.startswith("_gap_fill_report") and "_corrupt" not in path.name
+    ]
+    entries = manifest.refresh(year_dir, paths)
+    first_hour = str(canonical_index(year)[0]) if partial else None
 
-        if len(df) != n_expected:
-            issue = f"{path.name}: {len(df)} rows, expected {n_expected}"
-            issues.append(issue)
-            logger.warning(issue)
-            path.rename(path.with_stem(path.stem + "_corrupt"))
-        elif df.drop(columns=["hour"]).isna().any().any():
-            n_nan = int(df.drop(columns=["hour"]).isna().sum().sum())
-            issue = f"{path.name}: {n_nan} NaN values remain"
+    issues, renamed = [], []
+    for path in paths:
+        issue = _file_issue(path.name, entries[path.name], year, first_hour)
+        if issue:
             issues.append(issue)
             logger.warning(issue)
             path.rename(path.with_stem(path.stem + "_corrupt"))
+            renamed.append(path.name)
 
+    if renamed:
+        manifest.forget(year_dir, renamed)
     return issues
+
+
+def _file_issue(name, entry, year, first_hour=None):
+    """Integrity problem of a time-series file from its manifest entry, or None.
+
+    Files without an 'hour' column (installed capacity) are not checked. With
+    ``first_hour`` (partial year), the file must be a contiguous run of hours
+    starting there, no longer than the year; otherwise it must cover the year.
+    """
+    if entry["contiguous"] is None:
+        return None
+    rows, n_expected = entry["rows"], expected_hours(year)
+    if first_hour is not None:
+        if rows > n_expected or not entry["contiguous"] or entry["hour_min"] != first_hour:
+            return f"{name}: {rows} rows, not a contiguous start of {year}"
+    elif rows != n_expected:
+        return f"{name}: {rows} rows, expected {n_expected}"
+    if entry["nan"]:
+        return f"{name}: {entry['nan']} NaN values remain"
+    return None
@@ -8,10 +8,11 @@ The Insights API is free, public, and requires no API key or registration.
 All returned DataFrames follow the project convention: hourly naive UTC.
 
 API documentation: https://bmrs.elexon.co.uk/api-documentation
-Base URL: https://data.elexon.co.uk/bmrs/api/v1
+Base URL: https://data.elexon.co.uk/bmrs/api/v1 (config.ELEXON_BASE_URL)
 
 Delegates to:
     - utils.py      resample_to_hourly (tz normalization + resample).
+    - http_cache.py Raw-response cache (replay / offline mode).
 
 Called from:
     - main_collect.py   fetch_demand (from collect_demand, UK fallback),
@@ -36,30 +37,53 @@ Functions:
         TODO: fetch live GBP/EUR rate instead of hardcoded value.
 
 Internal helpers:
-    _fetch_json(endpoint, params)   - Raw API call.
+    _fetch_json(endpoint, params)   - API call (HTTP cache, retry on transient errors).
+    _fetch_chunks(endpoint, ...)    - Concurrent 7-day chunk fetch, records in order.
+    _download(url)                  - Uncached HTTP GET on the pooled session.
     _date_chunks(start, end)        - Split range into 7-day chunks.
-    _settlement_period_to_time()    - Settlement period -> UTC timestamp.
+    _settlement_times(dates, periods) - Settlement periods -> UTC timestamps (vectorized).
     _to_hourly_utc(df, value_col)   - Extract column + resample_to_hourly.
+
+Transport:
+    All requests share one requests.Session (keep-alive connection pool).
+    Chunks of a range are fetched concurrently by up to ELEXON_MAX_WORKERS
+    threads and parsed in bulk into DataFrames. A chunk failing with a
+    transient error is retried on its own; if it still fails, the fetch
+    raises instead of returning data with a silent gap.
 """
 
 import json
 import logging
-import urllib.request
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
+from ..config import ELEXON_BASE_URL, ELEXON_MAX_WORKERS
 from ..utils import resample_to_hourly
+from . import http_cache
 
 logger = logging.getLogger(__name__)
 
-BASE_URL = "https://data.elexon.co.uk/bmrs/api/v1"
+BASE_URL = ELEXON_BASE_URL
 
 # Maximum date range per request. The API does not document an explicit limit,
 # but empirically large ranges may time out. 7 days is safe and fast.
 _CHUNK_DAYS = 7
 
+_MAX_RETRIES = 4
+_RETRY_DELAYS = [2, 5, 15, 30]  # seconds before retry 1, 2, ...
+
+# Shared keep-alive session (created on first use, see _session)
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
 # Elexon psrType → our internal production type category mapping.
 # Used to extract the right generation columns for NMD, VRE capacity factors, etc.
 PSR_MAP = {
@@ -78,25 +102,102 @@ PSR_MAP = {
 
 
 def _fetch_json(endpoint, params):
-    """Fetch JSON from the Elexon Insights API.
+    """Fetch JSON from the Elexon Insights API, retrying transient failures.
+
+    Responses are replayed from the HTTP cache when available (http_cache.py).
+    Transient errors (429, 5xx, connection errors, timeouts) are retried up to
+    _MAX_RETRIES times with increasing delays (Retry-After honoured).
 
     Args:
         endpoint: API path after the base URL (e.g. "/demand/actual/total").
         params: Dict of query parameters.
 
     Returns:
-        Parsed JSON response, or None on failure.
+        Parsed JSON response.
+
+    Raises:
+        RuntimeError: if the request still fails after all retries.
     """
-    params["format"] = "json"
+    params = {**params, "format": "json"}
     query = "&".join(f"{k}={v}" for k, v in params.items())
     url = f"{BASE_URL}{endpoint}?{query}"
 
+    last_exc = None
+    for attempt in range(_MAX_RETRIES + 1):
+        if attempt > 0:
+            delay = _RETRY_DELAYS[attempt - 1] * (1 + 0.2 * random.random())
+            retry_after = _retry_after(last_exc)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            logger.info(
+                f"  Elexon {endpoint}: {last_exc} -> retry {attempt}/{_MAX_RETRIES} in {delay:.0f}s"
+            )
+            time.sleep(delay)
+        try:
+            raw = http_cache.fetch("elexon", url, lambda: _download(url))
+            return json.loads(raw.decode("utf-8"))
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            last_exc = e
+    raise RuntimeError(
+        f"Elexon API request failed after {_MAX_RETRIES} retries: {url}"
+    ) from last_exc
+
+
+def _fetch_chunks(endpoint, start, end, chunk_params):
+    """Fetch [start, end) in _CHUNK_DAYS chunks concurrently, return all records.
+
+    Chunks are fetched by up to ELEXON_MAX_WORKERS threads sharing one pooled
+    session. Records are returned in chunk order; a chunk failing after its
+    retries raises instead of leaving a silent gap.
+
+    Args:
+        chunk_params: Callable[(chunk_start, chunk_end)] -> query params dict.
+    """
+    chunks = list(_date_chunks(start, end))
+    if not chunks:
+        return []
+    with ThreadPoolExecutor(max_workers=min(ELEXON_MAX_WORKERS, len(chunks))) as pool:
+        pages = list(pool.map(lambda c: _fetch_json(endpoint, chunk_params(*c)), chunks))
+    return [rec for page in pages for rec in (page or {}).get("data", [])]
+
+
+def _download(url):
+    """Raw response body for an Elexon API URL (pooled keep-alive connection)."""
+    resp = _session().get(url, timeout=60)
+    resp.raise_for_status()
+    return resp.content
+
+
+def _session():
+    """Process-wide requests.Session with a connection pool per worker thread."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=ELEXON_MAX_WORKERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept"] = "application/json"
+            _SESSION = session
+    return _SESSION
+
+
+def _is_transient(e):
+    """Return True for errors worth retrying (server-side or network)."""
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return e.response.status_code in (429, 500, 502, 503, 504)
+    return isinstance(e, (requests.ConnectionError, requests.Timeout))
+
+
+def _retry_after(e):
+    """Retry-After header of an HTTP error, in seconds (None if absent/unparsable)."""
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None) or {}
     try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except Exception as e:
-        logger.warning(f"  Elexon API request failed: {url} — {e}")
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
         return None
 
 
@@ -109,13 +210,26 @@ def _date_chunks(start, end, chunk_days=_CHUNK_DAYS):
         current = chunk_end
 
 
-def _settlement_period_to_time(date_str, period):
-    """Convert a settlement date + period (1–48) to a UTC timestamp.
+def _settlement_times(dates, periods):
+    """Convert settlement dates + periods (1–48) to UTC timestamps (vectorized).
 
     Each settlement period is 30 minutes. Period 1 starts at 00:00 UTC.
     """
-    base = pd.Timestamp(date_str, tz="UTC")
-    return base + pd.Timedelta(minutes=30 * (period - 1))
+    base = pd.to_datetime(pd.Series(dates), utc=True)
+    offset = pd.to_timedelta((pd.Series(periods).astype(int) - 1) * 30, unit="min")
+    return (base + offset).to_numpy()
+
+
+def _numeric(df, name):
+    """Numeric column of a parsed response (NaN where absent or null)."""
+    if name not in df.columns:
+        return pd.Series(np.nan, index=df.index)
+    return pd.to_numeric(df[name], errors="coerce")
+
+
+def _text(df, name):
+    """String column of a parsed response ("" where absent or null)."""
+    return df.get(name, pd.Series("", index=df.index)).fillna("")
 
 
 def _to_hourly_utc(df, value_col="value"):
@@ -145,33 +259,26 @@ def fetch_demand(start, end):
     Returns:
         pd.Series indexed by hourly UTC timestamps, values in GW.
     """
-    records = []
-
-    for chunk_start, chunk_end in _date_chunks(start, end):
-        data = _fetch_json(
-            "/demand/outturn",
-            {
-                "settlementDateFrom": chunk_start.strftime("%Y-%m-%d"),
-                "settlementDateTo": chunk_end.strftime("%Y-%m-%d"),
-            },
-        )
-        if data is None or "data" not in data:
-            continue
-
-        for rec in data["data"]:
-            ts = _settlement_period_to_time(rec["settlementDate"], rec["settlementPeriod"])
-            records.append(
-                {
-                    "timestamp": ts,
-                    "value": rec.get("initialDemandOutturn", 0) or 0,
-                }
-            )
-
+    records = _fetch_chunks(
+        "/demand/outturn",
+        start,
+        end,
+        lambda s, e: {
+            "settlementDateFrom": s.strftime("%Y-%m-%d"),
+            "settlementDateTo": e.strftime("%Y-%m-%d"),
+        },
+    )
     if not records:
         logger.warning("  No demand data returned from Elexon")
         return pd.Series(dtype=float)
 
-    df = pd.DataFrame(records)
+    raw = pd.DataFrame.from_records(records)
+    df = pd.DataFrame(
+        {
+            "timestamp": _settlement_times(raw["settlementDate"], raw["settlementPeriod"]),
+            "value": _numeric(raw, "initialDemandOutturn").fillna(0),
+        }
+    )
     series = _to_hourly_utc(df)
     return series / 1000  # MW -> GW
 
@@ -194,40 +301,33 @@ def fetch_generation(start, end):
         production type. Values in GW. Returns None if no data.
     """
 
-    records = []
-
-    for chunk_start, chunk_end in _date_chunks(start, end):
-        data = _fetch_json(
-            "/generation/actual/per-type",
-            {
-                "from": chunk_start.strftime("%Y-%m-%dT%H:%MZ"),
-                "to": chunk_end.strftime("%Y-%m-%dT%H:%MZ"),
-            },
-        )
-        if data is None or "data" not in data:
-            continue
-
-        for period_block in data["data"]:
-            ts = pd.Timestamp(period_block["startTime"])
-            for gen in period_block.get("data", []):
-                psr_type = gen.get("psrType", "")
-                our_name = PSR_MAP.get(psr_type)
-                if our_name is None:
-                    logger.debug(f"  Unmapped Elexon psrType: {psr_type!r}")
-                    continue
-                records.append(
-                    {
-                        "timestamp": ts,
-                        "prodtype": our_name,
-                        "value": gen.get("quantity", 0) or 0,
-                    }
-                )
-
-    if not records:
+    blocks = _fetch_chunks(
+        "/generation/actual/per-type",
+        start,
+        end,
+        lambda s, e: {"from": s.strftime("%Y-%m-%dT%H:%MZ"), "to": e.strftime("%Y-%m-%dT%H:%MZ")},
+    )
+    blocks = [b for b in blocks if b.get("data")]
+    if not blocks:
         logger.warning("  No generation data returned from Elexon")
         return None
 
-    df = pd.DataFrame(records)
+    raw = pd.json_normalize(blocks, record_path="data", meta="startTime")
+    psr_types = _text(raw, "psrType")
+    prodtype = psr_types.map(PSR_MAP)
+    for psr_type in psr_types[prodtype.isna()].unique():
+        logger.debug(f"  Unmapped Elexon psrType: {psr_type!r}")
+    mapped = prodtype.notna()
+    if not mapped.any():
+        logger.warning("  No generation data returned from Elexon")
+        return None
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(raw.loc[mapped, "startTime"], utc=True),
+            "prodtype": prodtype[mapped],
+            "value": _numeric(raw, "quantity")[mapped].fillna(0),
+        }
+    )
     # Pivot to wide format: one column per production type
     pivot = df.pivot_table(index="timestamp", columns="prodtype", values="value", aggfunc="mean")
     # Normalize each column to hourly naive UTC via shared helper
@@ -274,35 +374,24 @@ def fetch_day_ahead_prices(start, end, gbp_to_eur=1.18):
         pd.Series indexed by hourly UTC timestamps, values in EUR/MWh.
     """
     logger.info("  Fetching GB day-ahead prices from Elexon BMRS")
-    records = []
-
-    for chunk_start, chunk_end in _date_chunks(start, end):
-        data = _fetch_json(
-            "/balancing/pricing/market-index",
-            {
-                "from": chunk_start.strftime("%Y-%m-%d"),
-                "to": chunk_end.strftime("%Y-%m-%d"),
-            },
-        )
-        if data is None or "data" not in data:
-            continue
-
-        for rec in data["data"]:
-            records.append(
-                {
-                    "timestamp": _settlement_period_to_time(
-                        rec["settlementDate"], rec["settlementPeriod"]
-                    ),
-                    "provider": rec.get("dataProvider", ""),
-                    "price": rec.get("price", np.nan),
-                }
-            )
-
+    records = _fetch_chunks(
+        "/balancing/pricing/market-index",
+        start,
+        end,
+        lambda s, e: {"from": s.strftime("%Y-%m-%d"), "to": e.strftime("%Y-%m-%d")},
+    )
     if not records:
         logger.warning("  No price data returned from Elexon")
         return pd.Series(dtype=float)
 
-    df = pd.DataFrame(records)
+    raw = pd.DataFrame.from_records(records)
+    df = pd.DataFrame(
+        {
+            "timestamp": _settlement_times(raw["settlementDate"], raw["settlementPeriod"]),
+            "provider": _text(raw, "dataProvider"),
+            "price": _numeric(raw, "price"),
+        }
+    )
 
     # Prefer N2EX prices, fall back to APX
     n2ex = df[df["provider"] == "N2EXMIDP"]
@@ -339,18 +428,16 @@ def fetch_installed_capacity(year):
             "publishDateTimeTo": f"{year + 1}-01-01T00:00:00Z",
         },
     )
-    if data is None or "data" not in data or not data["data"]:
+    if not data.get("data"):
         logger.warning("Elexon installed capacity unavailable for year %d", year)
         return None
 
     # Sum installedCapacity by psrType, map to our internal names
-    capa_by_prodtype = {}
-    for rec in data["data"]:
-        our_name = PSR_MAP.get(rec.get("psrType", ""))
-        if our_name is None:
-            continue
-        mw = rec.get("installedCapacity") or 0
-        if mw > 0:
-            capa_by_prodtype[our_name] = capa_by_prodtype.get(our_name, 0) + mw / 1000  # MW -> GW
+    raw = pd.DataFrame.from_records(data["data"])
+    units = pd.DataFrame(
+        {"prodtype": _text(raw, "psrType").map(PSR_MAP), "mw": _numeric(raw, "installedCapacity")}
+    )
+    units = units[units["prodtype"].notna() & (units["mw"] > 0)]
+    capa_by_prodtype = (units.groupby("prodtype")["mw"].sum() / 1000).to_dict()  # MW -> GW
 
     return capa_by_prodtype if capa_by_prodtype else None
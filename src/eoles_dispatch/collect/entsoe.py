@@ -10,7 +10,8 @@ All public fetch_* functions handle the normalization pipeline:
 Clipping to the year range is done by the caller via .reindex(canonical_index(year)).
 
 Delegates to:
-    - config.py     ENTSOE_API_KEY, AREA_CODES, AREA_CODES_PRICE, ENTSOE_MIN_COVERAGE.
+    - config.py     ENTSOE_API_KEY, ENTSOE_ENDPOINT_URL, AREA_CODES, AREA_CODES_PRICE,
+                    ENTSOE_MIN_COVERAGE.
     - utils.py      resample_to_hourly (tz + resample).
 
 Called from:
@@ -40,6 +41,11 @@ Functions:
         Called from main_collect.collect_production.
 
 Internal helpers:
+    _query(client, method, *args, **kwargs)
+        client.<method>(...) through the HTTP response cache (http_cache.py),
+        so re-collections and offline mode replay recorded results.
+    _call_with_retry(fn, *args, **kwargs)
+        Rate-limited API call with adaptive retry on transient errors.
     _to_api_timestamps(start, end)
         Convert naive UTC to tz-aware CET for entsoe-py.
     col_matches(col, prodtype)
@@ -52,16 +58,42 @@ Internal helpers:
 Constants:
     ENTSOE_COL_NAMES    Human-readable column name mapping.
     PRODUCTION_TYPES    List of production types to extract (excl. PHS).
+
+Rate limiting:
+    All fetch_* functions are thread-safe and may be called concurrently
+    (collect_history downloads several areas/data types at once). Every API
+    call first takes a token from a process-wide token bucket
+    (ENTSOE_RATE_LIMIT requests/s, bursts of ENTSOE_RATE_BURST). A 429
+    response pauses the whole bucket for the server's Retry-After delay, so
+    all threads back off together.
+
+Caching:
+    Query results are cached by http_cache.py, keyed by entsoe-py method
+    and arguments. Cache hits skip the rate limiter entirely; in offline
+    mode ``client`` may be None since it is only used on a cache miss.
 """
 
 import logging
+import random
+import threading
 import time
 
 import pandas as pd
 from entsoe import EntsoePandasClient
-
-from ..config import AREA_CODES, AREA_CODES_PRICE, ENTSOE_API_KEY, ENTSOE_MIN_COVERAGE, RAW_TO_AGG
+from entsoe import entsoe as entsoe_py
+
+from ..config import (
+    AREA_CODES,
+    AREA_CODES_PRICE,
+    ENTSOE_API_KEY,
+    ENTSOE_ENDPOINT_URL,
+    ENTSOE_MIN_COVERAGE,
+    ENTSOE_RATE_BURST,
+    ENTSOE_RATE_LIMIT,
+    RAW_TO_AGG,
+)
 from ..utils import resample_to_hourly
+from . import http_cache
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +127,8 @@ def set_client():
             "Check your .env file or environment variable."
         )
 
-    # Set the entsoe client
+    # Set the entsoe client (entsoe-py reads its endpoint from a module global)
+    entsoe_py.URL = ENTSOE_ENDPOINT_URL
     client = EntsoePandasClient(api_key=ENTSOE_API_KEY)
 
     # Quick smoke test: query 1 hour of FR load
@@ -143,7 +176,7 @@ def fetch_demand(client, area, start, end):
     parts = []
     for code, p_start, p_end in periods:
         api_start, api_end = _to_api_timestamps(p_start, p_end)
-        raw = _call_with_retry(client.query_load, code, start=api_start, end=api_end)
+        raw = _query(client, "query_load", code, start=api_start, end=api_end)
         if raw is not None and (not hasattr(raw, "__len__") or len(raw) > 0):
             if isinstance(raw, pd.DataFrame):
                 raw = raw.iloc[:, 0]
@@ -177,7 +210,7 @@ def fetch_day_ahead_prices(client, area, start, end):
     parts = []
     for code, p_start, p_end in periods:
         api_start, api_end = _to_api_timestamps(p_start, p_end)
-        prices = _call_with_retry(client.query_day_ahead_prices, code, start=api_start, end=api_end)
+        prices = _query(client, "query_day_ahead_prices", code, start=api_start, end=api_end)
         if prices is not None and (not hasattr(prices, "__len__") or len(prices) > 0):
             if isinstance(prices, pd.DataFrame):
                 prices = prices.iloc[:, 0]
@@ -217,9 +250,7 @@ def fetch_generation(client, area, start, end):
     raw_parts = []
     for code, p_start, p_end in periods:
         api_start, api_end = _to_api_timestamps(p_start, p_end)
-        part = _call_with_retry(
-            client.query_generation, code, start=api_start, end=api_end, psr_type=None
-        )
+        part = _query(client, "query_generation", code, start=api_start, end=api_end, psr_type=None)
         if isinstance(part, pd.DataFrame) and not part.empty:
             raw_parts.append(part)
     if not raw_parts:
@@ -293,8 +324,8 @@ def fetch_installed_capacity(client, area, year):
     for code, p_start, p_end in periods:
         api_start, api_end = _to_api_timestamps(p_start, p_end)
         try:
-            raw = _call_with_retry(
-                client.query_installed_generation_capacity, code, start=api_start, end=api_end
+            raw = _query(
+                client, "query_installed_generation_capacity", code, start=api_start, end=api_end
             )
         except Exception as e:
             logger.warning("Installed capacity unavailable for %s: %s", area, e)
@@ -339,30 +370,74 @@ def is_usable(series, n_expected):
     return (valid_count / n_expected) >= ENTSOE_MIN_COVERAGE
 
 
-# ── Retry on transient failure
+# ── Rate limiting and retry on transient failure
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens/s, at most ``capacity`` stored.
+
+    acquire() blocks until a token is available. pause(seconds) empties the
+    bucket and blocks every caller until the pause is over (used on HTTP 429).
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._paused_until:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                    self._last = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._paused_until - now
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._last = self._paused_until
+
+
+_RATE_LIMITER = _TokenBucket(ENTSOE_RATE_LIMIT, ENTSOE_RATE_BURST)
 
 _MAX_RETRIES = 5
-_RETRY_DELAYS = [5, 10, 30, 60, 120, 300]  # seconds between consecutive calls
+_RETRY_DELAYS = [5, 10, 30, 60, 120]  # seconds before retry 1, 2, ...
 
 
 def _call_with_retry(fn, *args, **kwargs):
     """Call an ENTSO-E API function, retrying on transient errors.
 
-    A rate-limiting delay is applied before each call (including the first)
-    to avoid overwhelming the ENTSO-E API. On transient errors (5xx,
-    connection/timeout), retries with increasing delays. Other exceptions
-    are re-raised immediately.
+    Each attempt (including the first) takes a token from the shared rate
+    limiter instead of sleeping a fixed delay. On transient errors (429,
+    5xx, connection/timeout), retries after an increasing, jittered delay;
+    when the server sends Retry-After, that delay is honoured (and, for
+    429, applied to every thread through the rate limiter). Other
+    exceptions are re-raised immediately.
     """
     last_exc = None
     for attempt in range(_MAX_RETRIES + 1):
-        delay = _RETRY_DELAYS[attempt]
         if attempt > 0:
-            print(
-                f"{_error_label(last_exc)} -> Retry {attempt}/{_MAX_RETRIES}... ",
-                end="",
-                flush=True,
+            delay = _retry_delay(last_exc, attempt)
+            logger.info(
+                f"  {_error_label(last_exc)} -> retry {attempt}/{_MAX_RETRIES} in {delay:.0f}s"
             )
-        time.sleep(delay)
+            if _status_code(last_exc) == 429:
+                _RATE_LIMITER.pause(delay)
+            else:
+                time.sleep(delay)
+        _RATE_LIMITER.acquire()
         try:
             return fn(*args, **kwargs)
         except Exception as e:
@@ -374,6 +449,37 @@ def _call_with_retry(fn, *args, **kwargs):
     raise last_exc
 
 
+def _query(client, method, *args, **kwargs):
+    """Call ``client.<method>`` with retry, replaying the result from the HTTP cache."""
+    request = {"endpoint": ENTSOE_ENDPOINT_URL, "method": method, "args": args, "kwargs": kwargs}
+    return http_cache.fetch_object(
+        "entsoe", request, lambda: _call_with_retry(getattr(client, method), *args, **kwargs)
+    )
+
+
+def _retry_delay(e, attempt):
+    """Delay before retry ``attempt`` (1-based): Retry-After if sent, else backoff."""
+    backoff = _RETRY_DELAYS[min(attempt, len(_RETRY_DELAYS)) - 1]
+    backoff *= 1 + 0.2 * random.random()  # de-synchronise concurrent retries
+    retry_after = _retry_after(e)
+    return max(backoff, retry_after) if retry_after is not None else backoff
+
+
+def _retry_after(e):
+    """Retry-After header of an HTTP error, in seconds (None if absent/unparsable)."""
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _status_code(e):
+    response = getattr(e, "response", None)
+    return getattr(response, "status_code", None)
+
+
 def _error_label(e):
     """Short label for display, e.g. 'Error 503' or 'ConnectionError'."""
     if hasattr(e, "response") and e.response is not None:
@@ -0,0 +1,259 @@
+"""Reader for ENTSO-E File Library exports (bulk files, no API access).
+
+The Transparency Platform's File Library publishes each dataset as one
+tab-separated file per month (e.g. 2021_01_ActualTotalLoad_6.1.A.csv),
+covering every area. Supported datasets, recognised from their columns:
+
+    ActualTotalLoad_6.1.A                   TotalLoadValue (MW)
+    AggregatedGenerationPerType_16.1.B_C    ProductionType, ActualGenerationOutput,
+                                            ActualConsumption (MW)
+    DayAheadPrices_12.1.D                   Price (EUR/MWh when Currency is EUR)
+    InstalledGenerationCapacityAggregated_14.1.A
+                                            ProductionType,
+                                            AggregatedInstalledCapacity (MW)
+
+Every dataset has a DateTime column (UTC; "DateTime (UTC)" in recent exports)
+and an AreaCode column (EIC). Files are read in chunks of
+ENTSOE_FILES_CHUNK_ROWS rows and only the rows of the requested areas are
+kept, so multi-GB exports never sit in memory. Areas are matched by EIC
+through the same time-dependent resolution as the API (entsoe._resolve_area,
+e.g. DE_AT_LU before Oct 2018). An area published as bidding zone, control
+area and country appears once per type with the same values; duplicates are
+dropped.
+
+The accessors return the same formats as the entsoe.py fetch_* functions
+(hourly naive UTC, GW), so the files go through the same reindexing, gap
+filling and validation as API downloads (_main_collect.import_entsoe_files).
+
+Delegates to:
+    - entsoe.py     _resolve_area / _resolve_area_price, ENTSOE_COL_NAMES,
+                    PRODUCTION_TYPES.
+    - utils.py      resample_to_hourly.
+
+Called from:
+    - _main_collect.py  import_entsoe_files.
+
+Classes:
+    FileLibrary(areas, price_areas)
+        add(path)                           Ingest one export file, returns its dataset.
+        years()                             CET years with a month of data.
+        fetch_demand(area, start, end)      pd.Series (GW), like entsoe.fetch_demand.
+        fetch_day_ahead_prices(area, start, end)
+        fetch_generation(area, start, end)  DataFrame with 'hour' + production types.
+        fetch_installed_capacity(area, year)
+                                            dict {prodtype: GW}.
+"""
+
+import logging
+from pathlib import Path
+
+import pandas as pd
+from entsoe.mappings import lookup_area
+
+from ..config import ENTSOE_FILES_CHUNK_ROWS, ENTSOE_MIN_COVERAGE
+from ..utils import cet_year_bounds, resample_to_hourly
+from .entsoe import ENTSOE_COL_NAMES, PRODUCTION_TYPES, _resolve_area, _resolve_area_price
+
+logger = logging.getLogger(__name__)
+
+# Value column identifying each dataset, and the columns kept from it
+_DATASETS = {
+    "demand": ("TotalLoadValue", ["TotalLoadValue"]),
+    "production": (
+        "ActualGenerationOutput",
+        ["ProductionType", "ActualGenerationOutput", "ActualConsumption"],
+    ),
+    "prices": ("Price", ["Currency", "Price"]),
+    "installed_capacity": (
+        "AggregatedInstalledCapacity",
+        ["ProductionType", "AggregatedInstalledCapacity"],
+    ),
+}
+
+# ENTSO-E production type name → our raw production type
+_PRODUCTION_TYPE = {name: key for key, names in ENTSOE_COL_NAMES.items() for name in names}
+
+# Whole span of the platform, to list every EIC an area may have used
+_ALL_TIME = (pd.Timestamp("2014-01-01"), pd.Timestamp("2100-01-01"))
+
+
+def _column_key(name):
+    """Header name without spaces or UTC suffix ("DateTime (UTC)" → "DateTime")."""
+    return name.replace(" ", "").replace("(UTC)", "")
+
+
+class FileLibrary:
+    """Rows of File Library exports for a set of areas, by dataset.
+
+    Args:
+        areas: Area codes (ours) whose demand, production and installed
+            capacity are kept.
+        price_areas: Area codes whose day-ahead prices are kept.
+    """
+
+    def __init__(self, areas, price_areas):
+        self.areas = list(areas)
+        self.price_areas = list(price_areas)
+        self._eics = {
+            dataset: {
+                lookup_area(code).code
+                for area in (price_areas if dataset == "prices" else areas)
+                for code, _, _ in (
+                    _resolve_area_price(area, *_ALL_TIME)
+                    if dataset == "prices"
+                    else _resolve_area(area, *_ALL_TIME)
+                )
+            }
+            for dataset in _DATASETS
+        }
+        self._parts = {dataset: [] for dataset in _DATASETS}
+        self._rows = {}
+
+    # ── Ingestion ──
+
+    def add(self, path):
+        """Read one export file, keeping the rows of the requested areas.
+
+        Returns:
+            Dataset name ("demand", "production", "prices",
+            "installed_capacity"), or None if the file is not a supported
+            export (it is then skipped).
+        """
+        path = Path(path)
+        header = pd.read_csv(path, sep="\t", nrows=0).columns
+        keys = {_column_key(c): c for c in header}
+        dataset = next((d for d, (col, _) in _DATASETS.items() if col in keys), None)
+        if dataset is None or "DateTime" not in keys or "AreaCode" not in keys:
+            logger.warning(f"  {path.name}: not a supported ENTSO-E export, skipped")
+            return None
+
+        wanted = ["DateTime", "AreaCode"] + [c for c in _DATASETS[dataset][1] if c in keys]
+        columns = {keys[k]: k for k in wanted}
+        eics = self._eics[dataset]
+        n_kept = 0
+        reader = pd.read_csv(
+            path, sep="\t", usecols=list(columns), chunksize=ENTSOE_FILES_CHUNK_ROWS
+        )
+        for chunk in reader:
+            chunk = chunk.rename(columns=columns)
+            chunk = chunk[chunk["AreaCode"].isin(eics)]
+            if chunk.empty:
+                continue
+            chunk["DateTime"] = pd.to_datetime(chunk["DateTime"])
+            self._parts[dataset].append(chunk)
+            n_kept += len(chunk)
+        self._rows.pop(dataset, None)
+        logger.info(f"  {path.name}: {dataset}, {n_kept} rows kept")
+        return dataset
+
+    def years(self):
+        """CET calendar years with at least one month of time-series data.
+
+        A month counts when its hours are covered at ENTSOE_MIN_COVERAGE, so
+        the first hour of the next CET year found at the end of a December
+        export (31 Dec 23:00 UTC = 1 Jan 00:00 CET) does not add that year.
+        """
+        years = set()
+        for dataset in ("demand", "production", "prices"):
+            rows = self._frame(dataset)
+            if rows.empty:
+                continue
+            hours = pd.DatetimeIndex(rows["DateTime"].dt.floor("h").unique())
+            cet = hours.tz_localize("UTC").tz_convert("Europe/Brussels")
+            covered = pd.Series(1, index=cet).groupby([cet.year, cet.month]).sum()
+            for (year, month), n_hours in covered.items():
+                month_hours = pd.Period(year=year, month=month, freq="M").days_in_month * 24
+                if n_hours >= month_hours * ENTSOE_MIN_COVERAGE:
+                    years.add(int(year))
+        return sorted(years)
+
+    # ── Accessors (same output as entsoe.fetch_*) ──
+
+    def fetch_demand(self, area, start, end):
+        """Hourly actual load (GW), pd.Series indexed by naive UTC; None if absent."""
+        series = self._series("demand", "TotalLoadValue", _resolve_area(area, start, end))
+        return None if series is None else series / 1000  # MW -> GW
+
+    def fetch_day_ahead_prices(self, area, start, end):
+        """Hourly day-ahead prices (EUR/MWh), pd.Series; None if absent."""
+        return self._series("prices", "Price", _resolve_area_price(area, start, end))
+
+    def fetch_generation(self, area, start, end):
+        """Hourly generation by production type (GW), with 'hour' column; None if absent.
+
+        As with the API, missing values count as zero production and pumped
+        storage is split into 'phs' (generation) and 'phs_in' (consumption,
+        negative).
+        """
+        rows = self._select("production", _resolve_area(area, start, end), ["ProductionType"])
+        if rows.empty:
+            return None
+        rows = rows.assign(ProductionType=rows["ProductionType"].map(_PRODUCTION_TYPE))
+        rows = rows.dropna(subset=["ProductionType"])
+        generation = rows.pivot(
+            index="DateTime", columns="ProductionType", values="ActualGenerationOutput"
+        )
+        generation = generation.reindex(columns=[t for t in PRODUCTION_TYPES if t in generation])
+
+        result = {t: resample_to_hourly(generation[t].fillna(0.0)) for t in generation.columns}
+        phs = rows[rows["ProductionType"] == "phs"].set_index("DateTime")
+        phs = phs.reindex(generation.index)
+        result["phs"] = resample_to_hourly(phs["ActualGenerationOutput"].fillna(0.0))
+        consumption = phs.get("ActualConsumption", pd.Series(0.0, index=phs.index))
+        result["phs_in"] = resample_to_hourly(-consumption.abs().fillna(0.0))
+
+        df = pd.DataFrame(result).astype(float) / 1000  # MW -> GW
+        df.index.name = "hour"
+        return df.reset_index()
+
+    def fetch_installed_capacity(self, area, year):
+        """Installed capacity per production type (GW) for a year; None if absent.
+
+        Takes the maximum over the year's records, like the API path.
+        """
+        start, end = cet_year_bounds(year)
+        periods = _resolve_area(area, start, end)
+        rows = self._select("installed_capacity", periods, ["ProductionType"])
+        if rows.empty:
+            return None
+        types = rows["ProductionType"].map(_PRODUCTION_TYPE)
+        peak = rows.groupby(types)["AggregatedInstalledCapacity"].max()
+        result = {tec: gw / 1000 for tec, gw in peak.items() if gw > 0}  # MW -> GW
+        return result or None
+
+    # ── Helpers ──
+
+    def _frame(self, dataset):
+        """All kept rows of a dataset, concatenated once and cached."""
+        if dataset not in self._rows:
+            parts = self._parts[dataset]
+            self._rows[dataset] = (
+                pd.concat(parts, ignore_index=True)
+                if parts
+                else pd.DataFrame(columns=["DateTime", "AreaCode"])
+            )
+            self._parts[dataset] = [self._rows[dataset]] if parts else []
+        return self._rows[dataset]
+
+    def _select(self, dataset, periods, keys=()):
+        """Rows of the (code, start, end) periods, one per timestamp (and key)."""
+        rows = self._frame(dataset)
+        if rows.empty:
+            return rows
+        if dataset == "prices" and "Currency" in rows:
+            rows = rows[rows["Currency"].isna() | (rows["Currency"] == "EUR")]
+        mask = pd.Series(False, index=rows.index)
+        for code, p_start, p_end in periods:
+            mask |= (
+                (rows["AreaCode"] == lookup_area(code).code)
+                & (rows["DateTime"] >= p_start)
+                & (rows["DateTime"] < p_end)
+            )
+        rows = rows[mask].drop_duplicates(subset=["DateTime", *keys])
+        return rows.sort_values("DateTime")
+
+    def _series(self, dataset, column, periods):
+        rows = self._select(dataset, periods)
+        if rows.empty:
+            return None
+        return resample_to_hourly(rows.set_index("DateTime")[column].astype(float))
@@ -24,22 +24,35 @@ Functions:
         Called from main_collect (collect_demand, collect_production,
         collect_exo_prices).
 
+    interpolate_gaps_frame(frame, report, area="", max_interpol=2, max_weeklyAnalog=120)
+        Same as interpolate_gaps on every column of a DataFrame (variable =
+        column name), with gaps located and filled on a NumPy matrix for all
+        columns at once. Called from _main_collect._collect_timeseries.
+
 Classes:
     Report
         Accumulates gap-filling operations and writes a summary
-        CSV + human-readable text report.
-        Instantiated in main_collect.collect_all, passed to collect_*
-        functions, saved via Report.save(output_dir).
+        CSV + human-readable text report. Entries are buffered and appended
+        to the CSV in fsync'ed batches (thread-safe; use as a context
+        manager to flush on exit).
+        Instantiated in main_collect.collect_history, passed to
+        _collect_timeseries, saved via Report.save().
 
 Internal helpers:
     _find_gaps(series)                              - Identify contiguous NaN runs.
-    _fill_from_analogue(series, gap_start, len, offset) - Fill from a time-shifted period.
+    _nan_runs(mask)                                 - NumPy run-length encoding of a 2-D NaN mask.
+    _fill_matrix(values, index, variables, ...)     - Fill all columns of an (hours x columns) array.
+    _fill_from_analogue(values, gap_start, len, offset) - Fill from a time-shifted period.
 """
 
 import logging
+import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -53,30 +66,34 @@ def _find_gaps(series):
 
     Returns a list of (start_idx, length) tuples for each gap.
     """
-    is_nan = series.isna()
-    gaps = []
-    i = 0
-    while i < len(is_nan):
-        if is_nan.iloc[i]:
-            start = i
-            while i < len(is_nan) and is_nan.iloc[i]:
-                i += 1
-            gaps.append((start, i - start))
-        else:
-            i += 1
-    return gaps
+    _, starts, lengths = _nan_runs(np.isnan(series.to_numpy(dtype=float))[:, None])
+    return list(zip(starts.tolist(), lengths.tolist()))
+
+
+def _nan_runs(mask):
+    """Run-length encode the True runs of each column of a 2-D mask.
+
+    Returns (cols, starts, lengths) arrays, ordered by column then start.
+    """
+    n_rows, n_cols = mask.shape
+    padded = np.zeros((n_cols, n_rows + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask.T
+    edges = np.diff(padded, axis=1)
+    cols, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return cols, starts, ends - starts
 
 
-def _fill_from_analogue(series, gap_start, gap_length, offset):
+def _fill_from_analogue(values, gap_start, gap_length, offset):
     """Try to fill a gap using data from a time offset (e.g. ±1 week, ±1 year).
 
-    Looks at the analogue period at `gap_start + offset` for `gap_length` hours.
-    If the analogue period has enough valid data (>80%), uses it scaled to match
-    the level of observed data around the gap.
+    Looks at the analogue period at `gap_start + offset` for `gap_length` hours
+    of the 1-D array `values`. If the analogue period has enough valid data
+    (>80%), uses it scaled to match the level of observed data around the gap.
 
-    Returns the filled values as a Series, or None if the analogue is unsuitable.
+    Returns the filled values as an array, or None if the analogue is unsuitable.
     """
-    idx = series.index
+    n = len(values)
     gap_end = gap_start + gap_length
 
     # Analogue period indices
@@ -84,43 +101,41 @@ def _fill_from_analogue(series, gap_start, gap_length, offset):
     analogue_end = gap_end + offset
 
     # Check bounds
-    if analogue_start < 0 or analogue_end > len(series):
+    if analogue_start < 0 or analogue_end > n:
         return None
 
-    analogue = series.iloc[analogue_start:analogue_end]
-    valid_ratio = analogue.notna().mean()
-    if valid_ratio < 0.8:
+    analogue = values[analogue_start:analogue_end]
+    valid = ~np.isnan(analogue)
+    if valid.mean() < 0.8:
         return None
 
     # Compute scaling ratio from context around the gap (±24h)
-    ctx_start = max(0, gap_start - 24)
-    ctx_end = min(len(series), gap_end + 24)
-    ctx_observed = series.iloc[ctx_start:gap_start].dropna()
-    ctx_after = series.iloc[gap_end:ctx_end].dropna()
-    ctx_all = pd.concat([ctx_observed, ctx_after])
-
-    ana_ctx_start = max(0, analogue_start - 24)
-    ana_ctx_end = min(len(series), analogue_end + 24)
-    ana_ctx = series.iloc[ana_ctx_start:analogue_start].dropna()
-    ana_ctx_after = series.iloc[analogue_end:ana_ctx_end].dropna()
-    ana_ctx_all = pd.concat([ana_ctx, ana_ctx_after])
+    ctx_all = _valid(values[max(0, gap_start - 24) : gap_start], values[gap_end : gap_end + 24])
+    ana_ctx_all = _valid(
+        values[max(0, analogue_start - 24) : analogue_start],
+        values[analogue_end : min(n, analogue_end + 24)],
+    )
 
     # Scale if we have enough context on both sides
+    ratio = 1.0
     if len(ctx_all) > 6 and len(ana_ctx_all) > 6:
-        ctx_mean = ctx_all.mean()
         ana_ctx_mean = ana_ctx_all.mean()
         if ana_ctx_mean > 0:
-            ratio = ctx_mean / ana_ctx_mean
-        else:
-            ratio = 1.0
-    else:
-        ratio = 1.0
+            ratio = ctx_all.mean() / ana_ctx_mean
+
+    filled = analogue * ratio
+    # Interpolate any remaining NaNs within the analogue itself (leading NaNs stay)
+    if not valid.all():
+        positions = np.flatnonzero(valid)
+        todo = np.flatnonzero(~valid)
+        todo = todo[todo > positions[0]]
+        filled[todo] = np.interp(todo, positions, filled[positions])
+    return filled
 
-    filled = analogue.values * ratio
-    # Interpolate any remaining NaNs within the analogue itself
-    filled_series = pd.Series(filled, index=idx[gap_start:gap_end])
-    filled_series = filled_series.interpolate(method="linear")
-    return filled_series
+
+def _valid(*parts):
+    values = np.concatenate(parts)
+    return values[~np.isnan(values)]
 
 
 def interpolate_gaps(series, report, variable="", area="", max_interpol=2, max_weeklyAnalog=120):
@@ -132,6 +147,7 @@ def interpolate_gaps(series, report, variable="", area="", max_interpol=2, max_w
       - > max_weeklyAnalaog: no gap filling and alert to user.
 
     If a GapFillReport is active, each operation is recorded in it.
+    Single-series form of interpolate_gaps_frame.
 
     Args:
         series: Time series with potential NaN gaps.
@@ -141,45 +157,83 @@ def interpolate_gaps(series, report, variable="", area="", max_interpol=2, max_w
         max_interpol: Maximum gap size (hours) for linear interpolation.
         max_weeklyAnalog: Maximum gap size (hours) for using same weekday ±1-2 weeks
     """
-        
-    total_filled = 0
-    total_not_filled = 0
-    
     if series.isna().sum() == 0:
-        return series, total_filled, total_not_filled
+        return series, 0, 0
 
+    values = series.to_numpy(dtype=float, copy=True)[:, None]
+    total_filled, total_not_filled = _fill_matrix(
+        values, series.index, [variable], report, area, max_interpol, max_weeklyAnalog
+    )
     result = series.copy()
-    gaps = _find_gaps(result)
+    result.iloc[:] = values[:, 0]
+    return result, total_filled, total_not_filled
+
+
+def interpolate_gaps_frame(frame, report, area="", max_interpol=2, max_weeklyAnalog=120):
+    """Fill NaN gaps in every column of a DataFrame (e.g. a production matrix).
+
+    Same strategies and Report entries as calling interpolate_gaps on each
+    column in turn (variable = column name), but gaps are located for all
+    columns at once and filled on a NumPy matrix, so a full year-area
+    production matrix is filled in milliseconds.
+
+    Returns:
+        (filled DataFrame, hours filled, hours not filled).
+    """
+    values = frame.to_numpy(dtype=float, copy=True)
+    if not np.isnan(values).any():
+        return frame, 0, 0
+    total_filled, total_not_filled = _fill_matrix(
+        values, frame.index, list(frame.columns), report, area, max_interpol, max_weeklyAnalog
+    )
+    return (
+        pd.DataFrame(values, index=frame.index, columns=frame.columns),
+        total_filled,
+        total_not_filled,
+    )
+
+
+def _fill_matrix(values, index, variables, report, area, max_interpol, max_weeklyAnalog):
+    """Fill the NaN gaps of each column of ``values`` (hours x columns) in place.
+
+    Gaps are processed column by column in time order, as the weekly analogue
+    of a gap may read values filled for an earlier one. Linear fills only
+    depend on the valid neighbours of their gap and are computed in batch.
+    """
+    n = len(values)
+    cols, starts, lengths = _nan_runs(np.isnan(values))
+    ends = starts + lengths
     hours_per_week = 7 * 24
 
-    for gap_start, gap_length in gaps:
-        gap_time = series.index[gap_start]
-        gap_end = gap_start + gap_length
+    # Strategy 1 (batch): linear interpolation between the neighbours of small gaps
+    linear = (lengths <= max_interpol) & (starts > 0) & (ends < n)
+    left = values[np.maximum(starts - 1, 0), cols]
+    right = values[np.minimum(ends, n - 1), cols]
+    slope = (right - left) / (lengths + 1)
 
+    total_filled = 0
+    total_not_filled = 0
+    for col, gap_start, gap_length, is_linear, lo, step in zip(
+        cols.tolist(), starts.tolist(), lengths.tolist(), linear, left, slope
+    ):
+        gap_time = index[gap_start]
+        gap_end = gap_start + gap_length
         filled = False
         method = ""
 
-        # Strategy 1: linear interpolation for small gaps
-        if gap_length <= max_interpol and gap_start>0 and gap_end <len(series):
-            lo = max(0, gap_start - 1)
-            hi = min(len(result), gap_start + gap_length + 1)
-            chunk = result.iloc[lo:hi].copy()
-            chunk = chunk.interpolate(method="linear")
-            offset_in_chunk = gap_start - lo
-            result.iloc[gap_start : gap_start + gap_length] = chunk.iloc[
-                offset_in_chunk : offset_in_chunk + gap_length
-            ].values
+        if is_linear:
+            values[gap_start:gap_end, col] = step * np.arange(1, gap_length + 1) + lo
             filled = True
-            method =  "linear_interpolation"
+            method = "linear_interpolation"
             total_filled += gap_length
 
         # Strategy 2: same weekday ±1-2 weeks
         elif gap_length <= max_weeklyAnalog:
+            series = values[:, col]
             for week_offset in [1, -1, 2, -2]:
-                offset = week_offset * hours_per_week
-                fill = _fill_from_analogue(result, gap_start, gap_length, offset)
+                fill = _fill_from_analogue(series, gap_start, gap_length, week_offset * hours_per_week)
                 if fill is not None:
-                    result.iloc[gap_start : gap_start + gap_length] = fill.values
+                    series[gap_start:gap_end] = fill
                     filled = True
                     direction = "next" if week_offset > 0 else "previous"
                     method = f"weekly_analogue_{direction}_±{abs(week_offset)}"
@@ -201,9 +255,9 @@ def interpolate_gaps(series, report, variable="", area="", max_interpol=2, max_w
             f"!!  Gap too long for gap filling ({gap_length}h) at {gap_time}."
             )
 
-        report.add(variable, area, gap_time, gap_length, method)
+        report.add(variables[col], area, gap_time, gap_length, method)
 
-    return result, total_filled, total_not_filled
+    return total_filled, total_not_filled
 
 
 # ── Gap-fill report class ──
@@ -211,13 +265,30 @@ def interpolate_gaps(series, report, variable="", area="", max_interpol=2, max_w
 class Report:
     """Accumulates gap-filling operations and writes CSV + text report to output_dir.
 
-    Each entry is written to CSV immediately by add() for resumable collection.
+    Entries are buffered in memory and appended to the CSV in batches: every
+    FLUSH_ENTRIES entries or FLUSH_SECONDS seconds, and on flush(), save()
+    or exit of a ``with report:`` block. Each batch is a single O_APPEND
+    write followed by fsync, so an interrupted collection loses at most the
+    last unflushed batch and load() resumes from what reached the disk.
+    add() and flush() are thread-safe (parallel collectors share one report).
     The TXT summary is generated by save().
     """
 
+    FLUSH_ENTRIES = 500
+    FLUSH_SECONDS = 5.0
+
     def __init__(self, output_dir):
         self.entries = []  # list of dicts
         self.output_dir = Path(output_dir)
+        self._pending = []  # entries not yet written to the CSV
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
 
     @classmethod
     def load(cls, csv_path):
@@ -243,20 +314,39 @@ class Report:
             "method": method,
             "scaling_ratio": round(scaling_ratio, 4) if scaling_ratio is not None else "",
         }
-        self.entries.append(entry)
-
-        # Write to CSV immediately
-        csv_path = self.output_dir / "_gap_fill_report.csv"
-        df = pd.DataFrame([entry])
-        df.to_csv(
-            csv_path,
-            mode="a",
-            header=not csv_path.exists(),
-            index=False,
-        )
+        with self._lock:
+            self.entries.append(entry)
+            self._pending.append(entry)
+            due = (
+                len(self._pending) >= self.FLUSH_ENTRIES
+                or time.monotonic() - self._last_flush >= self.FLUSH_SECONDS
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Append buffered entries to the CSV, then fsync."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            csv_path = self.output_dir / "_gap_fill_report.csv"
+            header = not csv_path.exists() or csv_path.stat().st_size == 0
+            data = pd.DataFrame(self._pending).to_csv(header=header, index=False).encode("utf-8")
+            fd = os.open(csv_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                # os.write may write fewer bytes than asked: write the rest
+                remaining = memoryview(data)
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._pending = []
 
     def save(self):
-        """Write the TXT summary (CSV already written incrementally by add())."""
+        """Flush the CSV and write the TXT summary."""
+        self.flush()
         csv_path = self.output_dir / "_gap_fill_report.csv"
 
         # Handle empty entries
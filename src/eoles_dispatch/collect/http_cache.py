@@ -0,0 +1,217 @@
+"""On-disk cache of raw API responses, shared by all collectors.
+
+Re-collecting data (``--force``, files flagged ``_corrupt`` by sanitize_year,
+changes to gap filling or resampling) used to re-download every response.
+This module stores the raw payloads under ``data/.http_cache/`` so that
+repeated collections replay them from disk, and an offline mode replays
+them without any network access at all.
+
+Entries are keyed by a hash of (namespace, request), where the request is
+anything JSON-serialisable describing the call (URL, or ENTSO-E method +
+arguments). Each entry is two files:
+
+    data/.http_cache/<namespace>/<key>.bin    raw payload (bytes)
+    data/.http_cache/<namespace>/<key>.json   request description + stored_at
+
+Freshness: an entry older than the TTL (HTTP_CACHE_TTL_DAYS) is downloaded
+again, since recent ENTSO-E data is still revised. In offline mode the TTL
+is ignored and a missing entry raises OfflineCacheMiss.
+
+Size: when the cache exceeds HTTP_CACHE_MAX_MB, least-recently-used entries
+are evicted (a hit refreshes the payload's mtime).
+
+Called from:
+    - entsoe.py         _query (pickled entsoe-py results).
+    - elexon.py         _fetch_json (raw JSON bytes).
+    - rninja.py         _download_ninja_csv (raw CSV bytes).
+    - main_collect.py   collect_all activates a cache for the collection.
+
+Functions:
+    activated(cache)
+        Context manager making ``cache`` the process-wide active cache
+        (None disables caching). Restores the previous one on exit.
+
+    fetch(namespace, request, download)
+        Return cached bytes for the request, or call download() and store
+        the result. Without an active cache, simply calls download().
+
+    fetch_object(namespace, request, download)
+        Same as fetch for picklable Python objects (e.g. DataFrames).
+
+Classes:
+    HttpCache(cache_dir, ttl_days, max_mb, offline)
+        get / put / fetch / evict on one cache directory. Thread-safe
+        (collect_history downloads concurrently).
+
+    OfflineCacheMiss
+        Raised in offline mode when a response was never recorded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from ..config import HTTP_CACHE_MAX_MB, HTTP_CACHE_TTL_DAYS
+
+logger = logging.getLogger(__name__)
+
+
+class OfflineCacheMiss(RuntimeError):
+    """A response needed in offline mode is not in the cache."""
+
+
+class HttpCache:
+    """Raw-response cache rooted at ``cache_dir`` (created on first write)."""
+
+    def __init__(
+        self, cache_dir, ttl_days=HTTP_CACHE_TTL_DAYS, max_mb=HTTP_CACHE_MAX_MB, offline=False
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl_days * 86400 if ttl_days is not None else None
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._size = None  # computed lazily on first write
+
+    # ── Entries ──
+
+    def get(self, namespace, request):
+        """Return the cached payload (bytes), or None if missing or expired."""
+        payload_path, meta_path = self._paths(namespace, request)
+        try:
+            meta = json.loads(meta_path.read_text())
+            payload = payload_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if not self.offline and self.ttl is not None:
+            if time.time() - meta.get("stored_at", 0) > self.ttl:
+                return None
+        try:
+            os.utime(payload_path)  # mark as recently used for LRU eviction
+        except OSError:
+            pass
+        return payload
+
+    def put(self, namespace, request, payload):
+        """Store ``payload`` (bytes) for the request, then evict if over budget."""
+        payload_path, meta_path = self._paths(namespace, request)
+        payload_path.parent.mkdir(parents=True, exist_ok=True)
+        old_size = payload_path.stat().st_size if payload_path.exists() else 0
+        meta = {"namespace": namespace, "request": request, "stored_at": time.time()}
+        _atomic_write(payload_path, payload)
+        _atomic_write(meta_path, json.dumps(meta, default=str).encode("utf-8"))
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(payload) - old_size
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def fetch(self, namespace, request, download):
+        """Cached payload for the request, downloading (and storing) on a miss."""
+        payload = self.get(namespace, request)
+        if payload is not None:
+            return payload
+        if self.offline:
+            raise OfflineCacheMiss(
+                f"Offline mode: no cached {namespace} response for {_describe(request)}. "
+                f"Run the collection once online to record it (cache: {self.cache_dir})."
+            )
+        payload = download()
+        if payload is not None:
+            self.put(namespace, request, payload)
+        return payload
+
+    def evict(self):
+        """Remove least-recently-used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = sorted(
+                ((p.stat().st_mtime, p.stat().st_size, p) for p in self.cache_dir.rglob("*.bin")),
+                key=lambda e: e[0],
+            )
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                path.with_suffix(".json").unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            self._size = total
+        if removed:
+            logger.info(f"  HTTP cache: evicted {removed} entries ({total / 1e6:.0f} MB kept)")
+
+    # ── Helpers ──
+
+    def _paths(self, namespace, request):
+        key = hashlib.sha256(
+            json.dumps([namespace, request], sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        base = self.cache_dir / namespace / key
+        return base.with_suffix(".bin"), base.with_suffix(".json")
+
+    def _scan_size(self):
+        return sum(p.stat().st_size for p in self.cache_dir.rglob("*.bin"))
+
+
+# ── Process-wide active cache ──
+
+_ACTIVE = None
+
+
+@contextmanager
+def activated(cache):
+    """Make ``cache`` the active cache for fetch/fetch_object within the block."""
+    global _ACTIVE
+    previous, _ACTIVE = _ACTIVE, cache
+    try:
+        yield cache
+    finally:
+        _ACTIVE = previous
+
+
+def fetch(namespace, request, download):
+    """Bytes for the request: from the active cache, else from download()."""
+    if _ACTIVE is None:
+        return download()
+    return _ACTIVE.fetch(namespace, request, download)
+
+
+def fetch_object(namespace, request, download):
+    """Like fetch for picklable objects. None results are returned but not cached."""
+    if _ACTIVE is None:
+        return download()
+
+    def _download_pickled():
+        obj = download()
+        return None if obj is None else pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    payload = _ACTIVE.fetch(namespace, request, _download_pickled)
+    return None if payload is None else pickle.loads(payload)
+
+
+def _atomic_write(path, data):
+    """Write via a temp file + rename so concurrent readers never see partial files."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _describe(request):
+    text = json.dumps(request, sort_keys=True, default=str)
+    return text if len(text) <= 200 else text[:197] + "..."
@@ -0,0 +1,199 @@
+"""Per-year data catalog: checksums and summaries of the collected CSV files.
+
+Every data/<year>/ directory holds a _manifest.json describing its CSV files:
+
+    {"version": 1,
+     "files": {"demand_FR.csv": {
+         "size": 215004, "mtime_ns": ...,       stat signature when described
+         "rows": 8760, "nan": 0,                row count, NaN values (excl. 'hour')
+         "hour_min": "2020-12-31 23:00:00",     time range (None if no 'hour' column)
+         "hour_max": "2021-12-31 22:00:00",
+         "contiguous": true,                    hours exactly 1h apart
+         "sha256": "...",                       hash of the file content
+         "source": "entsoe",                    who wrote it (None if unknown)
+         "collected_at": "2026-10-19T12:00:00"}}}
+
+Collectors record each file they write. sanitize_year reads the summaries
+instead of parsing the files: a file whose size and mtime still match its
+entry is trusted as is, so validating a year costs one stat per file, and
+only new or modified files are parsed again. The content hashes identify
+the exact data a run was built from and can key downstream caches.
+
+Called from:
+    - _main_collect.py      record (after writing a file), sanitize_year via
+                            refresh and forget.
+    - run/_main_run.py      fingerprint, stored in run.yaml at creation.
+
+Functions:
+    load(year_dir) / save(year_dir, manifest)
+        Read / atomically write <year_dir>/_manifest.json.
+
+    describe(path, source=None, collected_at=None)
+        Parse one CSV and return its manifest entry.
+
+    record(year_dir, path, source)
+        Describe a freshly written file and store its entry.
+
+    refresh(year_dir, paths)
+        Entries for the given files, re-describing those whose size or mtime
+        changed since they were recorded. Entries of deleted files are dropped.
+        On a read-only data directory, the entries are returned unsaved.
+
+    forget(year_dir, names)
+        Remove entries (e.g. files renamed to *_corrupt).
+
+    fingerprint(year_dir, names=None)
+        Single hash over the content hashes of the given (or all) CSV files.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_manifest.json"
+_VERSION = 1
+_LOCK = threading.Lock()  # read-modify-write of a manifest
+
+
+def load(year_dir):
+    """Manifest of a year directory (empty if missing or unreadable)."""
+    try:
+        manifest = json.loads((Path(year_dir) / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {"version": _VERSION, "files": {}}
+    if manifest.get("version") != _VERSION or not isinstance(manifest.get("files"), dict):
+        return {"version": _VERSION, "files": {}}
+    return manifest
+
+
+def save(year_dir, manifest):
+    """Write the manifest atomically (temp file + rename)."""
+    path = Path(year_dir) / MANIFEST_NAME
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def describe(path, source=None, collected_at=None):
+    """Parse a CSV file and return its manifest entry."""
+    path = Path(path)
+    data = path.read_bytes()
+    stat = path.stat()
+    df = pd.read_csv(io.BytesIO(data))
+    entry = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "rows": len(df),
+        "nan": int(df.drop(columns=["hour"], errors="ignore").isna().sum().sum()),
+        "hour_min": None,
+        "hour_max": None,
+        "contiguous": None,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "source": source,
+        "collected_at": collected_at,
+    }
+    if "hour" in df.columns and len(df):
+        hours = pd.to_datetime(df["hour"], errors="coerce")
+        entry["hour_min"] = str(hours.iloc[0])
+        entry["hour_max"] = str(hours.iloc[-1])
+        entry["contiguous"] = bool(hours.diff().iloc[1:].eq(pd.Timedelta(hours=1)).all())
+    elif "hour" in df.columns:
+        entry["contiguous"] = True
+    return entry
+
+
+def record(year_dir, path, source):
+    """Describe a file just written by a collector and store its entry."""
+    entry = describe(path, source=source, collected_at=datetime.now().isoformat(timespec="seconds"))
+    with _LOCK:
+        manifest = load(year_dir)
+        manifest["files"][Path(path).name] = entry
+        save(year_dir, manifest)
+    return entry
+
+
+def refresh(year_dir, paths):
+    """Entries for ``paths``, re-describing files changed since they were recorded.
+
+    A file is considered unchanged when its size and mtime match its entry;
+    otherwise (or without an entry) it is parsed again, keeping the recorded
+    source. Entries of files that no longer exist are dropped. If the
+    manifest cannot be written (read-only or shared data directory), the
+    entries are still returned; the files are parsed again next time.
+
+    Returns:
+        dict {file name: entry}.
+    """
+    year_dir = Path(year_dir)
+    with _LOCK:
+        manifest = load(year_dir)
+        files = manifest["files"]
+        changed = False
+        entries = {}
+        for path in map(Path, paths):
+            stat = path.stat()
+            entry = files.get(path.name)
+            if (
+                entry is None
+                or entry.get("size") != stat.st_size
+                or entry.get("mtime_ns") != stat.st_mtime_ns
+            ):
+                previous = entry or {}
+                entry = describe(path, previous.get("source"), previous.get("collected_at"))
+                files[path.name] = entry
+                changed = True
+            entries[path.name] = entry
+        for name in [n for n in files if not (year_dir / n).exists()]:
+            del files[name]
+            changed = True
+        if changed and year_dir.exists():
+            try:
+                save(year_dir, manifest)
+            except OSError as e:
+                logger.warning(f"Could not update {year_dir / MANIFEST_NAME}: {e}")
+    return entries
+
+
+def forget(year_dir, names):
+    """Remove the entries of ``names`` from the manifest."""
+    with _LOCK:
+        manifest = load(year_dir)
+        removed = [manifest["files"].pop(name, None) for name in names]
+        if any(e is not None for e in removed):
+            save(year_dir, manifest)
+
+
+def fingerprint(year_dir, names=None):
+    """Hash identifying the content of a set of files in a year directory.
+
+    Combines the manifest content hashes (refreshed for changed files) of
+    ``names``, or of every CSV file when None. Missing files are skipped.
+    Returns None if none of the files exist.
+    """
+    year_dir = Path(year_dir)
+    if names is None:
+        paths = sorted(year_dir.glob("*.csv"))
+    else:
+        paths = [year_dir / name for name in sorted(names) if (year_dir / name).exists()]
+    if not paths:
+        return None
+    entries = refresh(year_dir, paths)
+    digest = hashlib.sha256()
+    for name in sorted(entries):
+        digest.update(f"{name}:{entries[name]['sha256']}\n".encode("utf-8"))
+    return digest.hexdigest()
@@ -8,24 +8,53 @@ reanalysis) and are saved once in data/renewable_ninja/.
 Unlike ENTSO-E/Elexon data, Ninja profiles do not need gap-filling or
 yearly updates — they are downloaded once and reused across all years.
 
+Per-area storage:
+    Each (profile, area) series is downloaded on its own, concurrently, and
+    stored in data/renewable_ninja/.areas/<variable>/<area>.csv. The combined
+    <variable>.csv read by the model is assembled from these files, so
+    adding an area downloads only that area's profiles.
+
+Indexed store:
+    The CSVs span decades of hourly data, but a run only needs a few months
+    of it. Each CSV is therefore mirrored in a year-partitioned binary store
+    (data/renewable_ninja/.store/<variable>/): per UTC year, a sorted
+    POSIX-hour array and a (hours x areas) float array as .npy files, plus an
+    index.json with the hour range of every partition and the size/mtime of
+    the source CSV. Readers memory-map only the partitions overlapping the
+    requested hour range and slice them with a binary search. The store is
+    rebuilt automatically whenever the CSV changes.
+
 Delegates to:
-    - config.py     DEFAULT_AREAS (default country list).
+    - config.py     DEFAULT_AREAS (default country list), NINJA_MAX_WORKERS.
+    - http_cache.py Raw-response cache (replay / offline mode).
 
 Called from:
     - main_collect.py   collect_ninja is called from collect_all
                         (when source="all" or source="ninja").
-    - run.py            collect_ninja is called from _ensure_data_available
+    - run.py            collect_ninja is called from ensure_data_available
                         when Ninja files are missing at run creation time.
 
 Functions:
-    collect_ninja(output_dir, areas=None)
-        Download all Ninja profiles for the given areas, save as CSVs
-        with columns ['hour', area1, area2, ...].
-        Called from main_collect.collect_all, run._ensure_data_available.
+    collect_ninja(output_dir, areas=None, max_workers=NINJA_MAX_WORKERS)
+        Download the Ninja profiles not stored yet for the given areas (in
+        parallel), then rebuild the CSVs with columns ['hour', area1, area2, ...].
+        Called from main_collect.collect_all, run.ensure_data_available.
+
+    build_ninja_store(ninja_dir, variable)
+        (Re)build the indexed binary store of <variable>.csv.
+        Called from collect_ninja, read_ninja_store.
+
+    read_ninja_store(ninja_dir, variable, start_hour=None, end_hour=None)
+        Read an hour range of a variable from the store, as a DataFrame
+        indexed by POSIX hour with one column per area.
+        Called from run.format_inputs.
 
 Internal helpers:
     _download_ninja_csv(iso2, filename)
-        Download a single CSV and extract the NATIONAL column.
+        Download a single CSV and extract the NATIONAL column (_parse_national).
+    _split_combined / _assemble_variable
+        Per-area files from / to the combined <variable>.csv
+        (rebuilt when a profile was downloaded or an area is missing).
 
 Constants:
     NINJA_BASE_URL      URL template for country downloads.
@@ -35,19 +64,25 @@ Constants:
 """
 
 import io
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from ..config import DEFAULT_AREAS
+from .. import config
+from ..config import DEFAULT_AREAS, NINJA_MAX_WORKERS
+from . import http_cache
 
 logger = logging.getLogger(__name__)
 
 
-# URL template for Renewables.ninja public country downloads.
+# URL template for Renewables.ninja public country downloads (config.NINJA_BASE_URL).
 # Format: ninja-{type}-country-{ISO2}-{variant}-merra2.csv
-NINJA_BASE_URL = "https://www.renewables.ninja/country_downloads/{iso2}"
+NINJA_BASE_URL = config.NINJA_BASE_URL
 
 # Maps our area codes to Renewables.ninja ISO2 codes.
 # Perimeter consistency with ENTSO-E:
@@ -84,12 +119,16 @@ NO_OFFSHORE = {"CH", "LU"}
 
 
 def _download_ninja_csv(iso2, filename):
-    """Download a single CSV from Renewables.ninja and return the NATIONAL column as a Series."""
+    """Download a single CSV from Renewables.ninja and return the NATIONAL column as a Series.
+
+    The raw file is replayed from the HTTP cache when available (http_cache.py).
+    """
     import urllib.request
 
     url = f"{NINJA_BASE_URL.format(iso2=iso2)}/{filename.format(iso2=iso2)}"
-    logger.info(f"  Downloading {url}")
-    try:
+
+    def download():
+        logger.info(f"  Downloading {url}")
         req = urllib.request.Request(
             url,
             headers={
@@ -97,86 +136,306 @@ def _download_ninja_csv(iso2, filename):
             },
         )
         with urllib.request.urlopen(req, timeout=60) as resp:
-            raw = resp.read().decode("utf-8")
+            return resp.read()
+
+    try:
+        raw = http_cache.fetch("ninja", url, download)
     except Exception as e:
         logger.warning(f"  Failed to download {url}: {e}")
         return None
 
-    # Skip comment lines (start with #)
-    lines = raw.split("\n")
-    data_lines = [line for line in lines if not line.startswith('"#') and not line.startswith("#")]
-    csv_text = "\n".join(data_lines)
+    series = _parse_national(raw)
+    if series is None:
+        logger.warning(f"  No NATIONAL column in {filename} for {iso2}")
+    return series
 
-    df = pd.read_csv(io.StringIO(csv_text), parse_dates=["time"])
-    df = df.set_index("time")
 
-    if "NATIONAL" not in df.columns:
-        logger.warning(f"  No NATIONAL column in {filename} for {iso2}")
-        return None
+def _parse_national(raw):
+    """NATIONAL column of a Ninja CSV payload (bytes), indexed by time; None if absent.
 
-    return df["NATIONAL"]
+    The comment header (lines starting with # or "#) is skipped by offset and
+    only the 'time' and 'NATIONAL' columns are parsed, straight from the
+    payload buffer without decoding or copying it.
+    """
+    start = 0
+    while raw.startswith((b"#", b'"#'), start):
+        newline = raw.find(b"\n", start)
+        if newline < 0:
+            return None
+        start = newline + 1
+    buffer = io.BytesIO(raw)
+    buffer.seek(start)
+    df = pd.read_csv(buffer, usecols=lambda c: c in ("time", "NATIONAL"), parse_dates=["time"])
+    if "NATIONAL" not in df.columns or "time" not in df.columns:
+        return None
+    return df.set_index("time")["NATIONAL"]
 
 
-def collect_ninja(output_dir, areas=None):
+def collect_ninja(output_dir, areas=None, max_workers=NINJA_MAX_WORKERS):
     """Download Renewables.ninja capacity factor profiles for all areas.
 
     Downloads solar, onshore (current/future), and offshore (current/future)
-    from the public country downloads. Produces CSVs in the same format as
-    the existing renewable_ninja/ directory: columns ['hour', area1, area2, ...].
+    from the public country downloads. Each (profile, area) series is stored
+    on its own in .areas/<variable>/<area>.csv, and only the pairs not stored
+    yet are downloaded, concurrently (max_workers threads). The combined CSVs
+    are then rebuilt locally for the profiles that changed, in the same format
+    as the existing renewable_ninja/ directory: columns ['hour', area1, area2, ...].
+    Adding an area therefore only downloads that area's profiles.
 
     Args:
         output_dir: Path to data/renewable_ninja/ directory.
         areas: List of area codes (default: DEFAULT_AREAS).
+        max_workers: Concurrent downloads (default: NINJA_MAX_WORKERS).
     """
     if areas is None:
         areas = list(DEFAULT_AREAS)
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    for variable in NINJA_FILES:
+        _split_combined(output_dir, variable)
+
+    for area in areas:
+        if area not in NINJA_ISO2:
+            logger.warning(f"  No Renewables.ninja ISO2 mapping for {area}, skipping")
+    todo = [
+        (variable, area)
+        for variable in NINJA_FILES
+        for area in areas
+        if area in NINJA_ISO2
+        and not ("offshore" in variable and area in NO_OFFSHORE)
+        and not _area_path(output_dir, variable, area).exists()
+    ]
+    logger.info(f"=== Collecting Renewables.ninja profiles ({len(todo)} to download) ===")
+
+    updated = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_download_ninja_csv, NINJA_ISO2[area], NINJA_FILES[variable]): (
+                variable,
+                area,
+            )
+            for variable, area in todo
+        }
+        for future in as_completed(futures):
+            variable, area = futures[future]
+            series = future.result()
+            if series is not None:
+                _save_area_series(_area_path(output_dir, variable, area), area, series)
+                updated.add(variable)
+
+    for variable in NINJA_FILES:
+        if variable in updated or _lacks_areas(output_dir, variable, areas):
+            _assemble_variable(output_dir, variable, areas)
+
+    logger.info("=== Ninja collection complete ===")
+    return output_dir
+
+
+# ── Per-area profiles ──
+
+# Per-area series, relative to data/renewable_ninja/: the unit of download,
+# from which the combined <variable>.csv files are assembled.
+AREAS_DIR = ".areas"
+
+
+def _area_path(ninja_dir, variable, area):
+    return Path(ninja_dir) / AREAS_DIR / variable / f"{area}.csv"
+
+
+def _save_area_series(path, area, series):
+    """Write one area's series as ['hour', area] (naive UTC), atomically."""
+    hours = pd.to_datetime(series.index)
+    if hours.tz is not None:
+        hours = hours.tz_convert("UTC").tz_localize(None)
+    df = pd.DataFrame({"hour": hours, area: series.to_numpy()})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".csv.tmp")
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
 
-    for file_key, filename_template in NINJA_FILES.items():
-        logger.info(f"=== Collecting {file_key} ===")
-        is_offshore = "offshore" in file_key
-        series_dict = {}
 
+def _split_combined(ninja_dir, variable):
+    """Seed the per-area files of a variable from a combined CSV without them.
+
+    Combined CSVs collected before per-area storage existed are split once,
+    so that existing areas are not downloaded again. Zero-filled offshore
+    columns of landlocked areas are not real profiles and are left out.
+    """
+    csv_path = Path(ninja_dir) / f"{variable}.csv"
+    area_dir = Path(ninja_dir) / AREAS_DIR / variable
+    if area_dir.exists() or not csv_path.exists():
+        return
+    df = pd.read_csv(csv_path, parse_dates=["hour"]).set_index("hour")
+    for area in df.columns:
+        if "offshore" in variable and area in NO_OFFSHORE:
+            continue
+        _save_area_series(area_dir / f"{area}.csv", area, df[area])
+    area_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _lacks_areas(ninja_dir, variable, areas):
+    """True if <variable>.csv is missing, or lacks a requested area that has a profile."""
+    csv_path = Path(ninja_dir) / f"{variable}.csv"
+    if not csv_path.exists():
+        return True
+    columns = set(pd.read_csv(csv_path, nrows=0).columns)
+    return any(
+        area not in columns
+        and (
+            _area_path(ninja_dir, variable, area).exists()
+            or ("offshore" in variable and area in NO_OFFSHORE)
+        )
+        for area in areas
+    )
+
+
+def _assemble_variable(ninja_dir, variable, areas):
+    """Rebuild <variable>.csv (and its store) from the per-area files.
+
+    Contains every stored area, requested areas first. For offshore profiles,
+    requested landlocked areas get a column of zeros.
+    """
+    area_dir = Path(ninja_dir) / AREAS_DIR / variable
+    stored = {p.stem: p for p in sorted(area_dir.glob("*.csv"))} if area_dir.exists() else {}
+    if not stored:
+        logger.warning(f"  No data collected for {variable}")
+        return
+    series = {
+        area: pd.read_csv(path, parse_dates=["hour"], index_col="hour")[area]
+        for area, path in stored.items()
+    }
+    # Align all countries on the same time index
+    df = pd.DataFrame(series)
+    df.index.name = "hour"
+
+    if "offshore" in variable:
         for area in areas:
-            iso2 = NINJA_ISO2.get(area)
-            if iso2 is None:
-                logger.warning(f"  No Renewables.ninja ISO2 mapping for {area}, skipping")
-                continue
-            if is_offshore and area in NO_OFFSHORE:
-                logger.info(f"  Skipping offshore for {area} (landlocked)")
-                continue
-
-            series = _download_ninja_csv(iso2, filename_template)
-            if series is not None:
-                series_dict[area] = series
+            if area in NO_OFFSHORE and area not in df.columns:
+                df[area] = 0.0
+    order = [a for a in areas if a in df.columns] + [a for a in df.columns if a not in areas]
+    df = df[order].reset_index()
+
+    out_path = Path(ninja_dir) / f"{variable}.csv"
+    df.to_csv(out_path, index=False)
+    build_ninja_store(ninja_dir, variable)
+    logger.info(f"  → {variable}.csv ({len(df)} rows, {len(df.columns) - 1} areas)")
+
+
+# ── Indexed store ──
+
+# Store directory, relative to data/renewable_ninja/.
+STORE_DIR = ".store"
+_STORE_VERSION = 1
 
-        if not series_dict:
-            logger.warning(f"  No data collected for {file_key}")
+
+def build_ninja_store(ninja_dir, variable):
+    """(Re)build the year-partitioned binary store of a Ninja CSV.
+
+    Args:
+        ninja_dir: Path to data/renewable_ninja/.
+        variable: Ninja variable name (e.g. "solar", "onshore_current").
+
+    Returns:
+        Path to the store directory of the variable.
+    """
+    csv_path = Path(ninja_dir) / f"{variable}.csv"
+    store_dir = Path(ninja_dir) / STORE_DIR / variable
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    df = pd.read_csv(csv_path)
+    hours = (
+        (pd.to_datetime(df.pop("hour")) - pd.Timestamp("1970-01-01")) // pd.Timedelta(hours=1)
+    ).to_numpy(dtype=np.int64)
+    order = np.argsort(hours, kind="stable")
+    hours = hours[order]
+    values = df.to_numpy(dtype=np.float64)[order]
+    years = hours.astype("datetime64[h]").astype("datetime64[Y]").astype(np.int64) + 1970
+
+    partitions = {}
+    for year in np.unique(years):
+        lo, hi = np.searchsorted(years, [year, year + 1])
+        np.save(store_dir / f"{year}.hours.npy", hours[lo:hi])
+        np.save(store_dir / f"{year}.values.npy", values[lo:hi])
+        partitions[str(year)] = {
+            "first": int(hours[lo]),
+            "last": int(hours[hi - 1]),
+            "rows": int(hi - lo),
+        }
+
+    stat = csv_path.stat()
+    index = {
+        "version": _STORE_VERSION,
+        "source": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+        "areas": list(df.columns),
+        "partitions": partitions,
+    }
+    # Write the index last (atomically): a store without a valid index is
+    # never read.
+    tmp_path = store_dir / "index.json.tmp"
+    tmp_path.write_text(json.dumps(index, indent=1))
+    os.replace(tmp_path, store_dir / "index.json")
+    return store_dir
+
+
+def read_ninja_store(ninja_dir, variable, start_hour=None, end_hour=None):
+    """Read an hour range of a Ninja variable through the indexed store.
+
+    Builds the store on first use, and rebuilds it if the source CSV changed.
+    If the CSV is gone but a store exists, the store is used as is.
+
+    Args:
+        ninja_dir: Path to data/renewable_ninja/.
+        variable: Ninja variable name.
+        start_hour: First POSIX hour to read (inclusive). None = from the start.
+        end_hour: Last POSIX hour to read (inclusive). None = to the end.
+
+    Returns:
+        DataFrame indexed by POSIX hour ('hour'), one column per area.
+    """
+    ninja_dir = Path(ninja_dir)
+    csv_path = ninja_dir / f"{variable}.csv"
+    store_dir = ninja_dir / STORE_DIR / variable
+
+    index = _load_store_index(store_dir)
+    if csv_path.exists() and not _store_matches(index, csv_path):
+        logger.info(f"  Indexing {csv_path.name}...")
+        build_ninja_store(ninja_dir, variable)
+        index = _load_store_index(store_dir)
+    if index is None:
+        raise FileNotFoundError(f"Renewable Ninja data not found at {csv_path}")
+
+    lo_bound = -np.inf if start_hour is None else start_hour
+    hi_bound = np.inf if end_hour is None else end_hour
+    hour_chunks, value_chunks = [], []
+    for year, part in sorted(index["partitions"].items()):
+        if part["last"] < lo_bound or part["first"] > hi_bound:
             continue
+        hours = np.load(store_dir / f"{year}.hours.npy", mmap_mode="r")
+        values = np.load(store_dir / f"{year}.values.npy", mmap_mode="r")
+        lo = 0 if start_hour is None else np.searchsorted(hours, start_hour, side="left")
+        hi = len(hours) if end_hour is None else np.searchsorted(hours, end_hour, side="right")
+        hour_chunks.append(np.array(hours[lo:hi]))
+        value_chunks.append(np.array(values[lo:hi]))
 
-        # Align all countries on the same time index (intersection)
-        df = pd.DataFrame(series_dict)
-        df.index.name = "hour"
+    n_areas = len(index["areas"])
+    hours = np.concatenate(hour_chunks) if hour_chunks else np.empty(0, dtype=np.int64)
+    values = np.concatenate(value_chunks) if value_chunks else np.empty((0, n_areas))
+    return pd.DataFrame(values, index=pd.Index(hours, name="hour"), columns=index["areas"])
 
-        # Fill missing offshore countries with 0
-        if is_offshore:
-            for area in areas:
-                if area not in df.columns:
-                    df[area] = 0.0
-            df = df[areas]  # reorder columns
 
-        df = df.reset_index()
-        # Normalize to UTC tz-naive
-        hour_col = pd.to_datetime(df["hour"])
-        if hour_col.dt.tz is not None:
-            hour_col = hour_col.dt.tz_convert("UTC").dt.tz_localize(None)
-        df["hour"] = hour_col
+def _load_store_index(store_dir):
+    """Return the parsed index.json of a store, or None if absent/unreadable."""
+    try:
+        index = json.loads((Path(store_dir) / "index.json").read_text())
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == _STORE_VERSION else None
 
-        out_path = output_dir / f"{file_key}.csv"
-        df.to_csv(out_path, index=False)
-        logger.info(f"  → {file_key}.csv ({len(df)} rows, {len(df.columns) - 1} areas)")
 
-    logger.info("=== Ninja collection complete ===")
-    return output_dir
+def _store_matches(index, csv_path):
+    """True if the store index was built from the current version of csv_path."""
+    if index is None:
+        return False
+    stat = Path(csv_path).stat()
+    return index["source"] == {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
@@ -0,0 +1,657 @@
+"""Local stand-in server for the ENTSO-E, Elexon and Renewables.ninja APIs.
+
+Serves synthetic but realistically shaped responses so that the collection
+pipeline can be benchmarked and load-tested without touching the real APIs:
+
+    ENTSO-E     <url>/entsoe/api                    GL/Publication_MarketDocument XML
+                (A65 load, A75 generation per PSR type, A44 day-ahead prices,
+                A68 installed capacity), parsed by the real entsoe-py client.
+    Elexon      <url>/elexon/<endpoint>             BMRS Insights JSON (demand
+                outturn, generation per type, market index, IGCPU).
+    Ninja       <url>/ninja/country_downloads/...   country CSVs with comment header.
+
+Profiles (demand, solar, wind, prices, ...) are deterministic functions of
+the area/series code and the timestamp, so repeated requests return the same
+data. Server behaviour is configurable: per-request latency, a fraction of
+503 and 429 (with Retry-After) responses, the ENTSO-E time resolution
+(PT15M/PT30M/PT60M, or "native": 15 min for the zones that publish it),
+and a fraction of missing data points to exercise gap filling. Like the real
+platform since Brexit, ENTSO-E has no GB data, so the Elexon fallback runs.
+
+Usage:
+    # Serve, then point `eoles-dispatch collect` at it via the printed env vars
+    python -m eoles_dispatch.collect.standin serve --port 8765 --latency 0.05
+
+    # Benchmark collect_all end-to-end against an in-process server
+    python -m eoles_dispatch.collect.standin bench --year 2021 --areas FR DE UK \\
+        --error-rate 0.05 --throttle-rate 0.02
+
+Called from:
+    - tests/test_collect_standin.py
+
+Classes:
+    StandinServer(host, port, latency, error_rate, throttle_rate, retry_after,
+                  resolution, gap_rate, ninja_years)
+        Threaded HTTP server (start/stop, context manager). ``stats`` counts
+        requests per source, injected errors and bytes served.
+
+Functions:
+    redirect_collectors(server)
+        Context manager pointing entsoe.py, elexon.py and rninja.py at the
+        server (and providing a dummy API key if none is set).
+
+    run_benchmark(year, areas, exo_areas, source, fast_retry, **server_options)
+        Run collect_all against a fresh server in a temporary directory and
+        return throughput and retry statistics.
+"""
+
+import argparse
+import io
+import json
+import logging
+import random
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+from entsoe.mappings import Area
+
+from . import elexon, entsoe, rninja
+
+logger = logging.getLogger(__name__)
+
+ENTSOE_PATH = "/entsoe/api"
+ELEXON_PATH = "/elexon"
+NINJA_PATH = "/ninja/country_downloads"
+
+# Bidding zones publishing quarter-hourly load/generation (resolution="native").
+_QUARTER_HOURLY = {Area[a].code for a in ("DE_LU", "DE_AT_LU", "AT", "NL", "BE", "HU")}
+_NO_ENTSOE_DATA = {Area.GB.code}  # post-Brexit: GB only available from Elexon
+
+# ENTSO-E PSR type → (profile kind, capacity in MW before area scaling)
+_PSR_PROFILES = {
+    "B01": ("flat", 2000),  # Biomass
+    "B04": ("thermal", 12000),  # Fossil Gas
+    "B05": ("thermal", 5000),  # Fossil Hard coal
+    "B10": ("phs", 4000),  # Hydro Pumped Storage (generation + consumption)
+    "B11": ("flat", 5000),  # Hydro Run-of-river
+    "B12": ("thermal", 8000),  # Hydro Water Reservoir
+    "B14": ("flat", 40000),  # Nuclear
+    "B16": ("solar", 15000),  # Solar
+    "B18": ("wind", 4000),  # Wind Offshore
+    "B19": ("wind", 20000),  # Wind Onshore
+}
+
+_ELEXON_PSR = {
+    "Biomass": ("flat", 3000),
+    "Fossil Gas": ("thermal", 15000),
+    "Hydro Pumped Storage": ("phs", 2000),
+    "Nuclear": ("flat", 5000),
+    "Solar": ("solar", 8000),
+    "Wind Offshore": ("wind", 14000),
+    "Wind Onshore": ("wind", 12000),
+}
+
+_NO_DATA_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n<Acknowledgement_MarketDocument>'
+    "<Reason><code>999</code><text>No matching data found for Data item</text></Reason>"
+    "</Acknowledgement_MarketDocument>"
+)
+
+
+# ── Server ──
+
+
+class StandinServer:
+    """Threaded local HTTP server imitating the three upstream APIs."""
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        error_rate=0.0,
+        throttle_rate=0.0,
+        retry_after=1,
+        resolution="native",
+        gap_rate=0.0,
+        ninja_years=(2015, 2019),
+        seed=0,
+    ):
+        if resolution not in ("native", "PT15M", "PT30M", "PT60M"):
+            raise ValueError(f"Unknown resolution: {resolution!r}")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.resolution = resolution
+        self.gap_rate = gap_rate
+        self.ninja_years = ninja_years
+        self.seed = seed
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def endpoints(self):
+        """Endpoint settings (config.py names) pointing at this server."""
+        return {
+            "ENTSOE_ENDPOINT_URL": self.url + ENTSOE_PATH,
+            "ELEXON_BASE_URL": self.url + ELEXON_PATH,
+            "NINJA_BASE_URL": self.url + NINJA_PATH + "/{iso2}",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ── Request handling ──
+
+    def handle(self, path, query):
+        """Return (status, headers, body bytes) for a request."""
+        source = _source(path)
+        with self._lock:
+            self.stats[f"requests_{source}"] += 1
+            draw = self._rng.random()
+            delay = self.latency * (0.5 + self._rng.random()) if self.latency else 0.0
+        if delay:
+            time.sleep(delay)
+
+        if draw < self.error_rate:
+            self._count("injected_503")
+            return 503, {"Content-Type": "text/plain"}, b"Service Unavailable"
+        if draw < self.error_rate + self.throttle_rate:
+            self._count("injected_429")
+            headers = {"Content-Type": "text/plain", "Retry-After": str(self.retry_after)}
+            return 429, headers, b"Too Many Requests"
+
+        try:
+            if source == "entsoe":
+                status, ctype, body = 200, "text/xml", self._entsoe(query)
+            elif source == "elexon":
+                status, ctype, body = 200, "application/json", self._elexon(path, query)
+            elif source == "ninja":
+                status, ctype, body = 200, "text/csv", self._ninja(path)
+            else:
+                status, ctype, body = 404, "text/plain", "Not found"
+        except (KeyError, ValueError) as e:
+            status, ctype, body = 400, "text/plain", f"Bad request: {e}"
+        body = body.encode("utf-8")
+        self._count("bytes_served", len(body))
+        return status, {"Content-Type": ctype}, body
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    # ── ENTSO-E ──
+
+    def _entsoe(self, query):
+        doc_type = query["documentType"]
+        start = pd.Timestamp(query["periodStart"], tz="UTC")
+        end = pd.Timestamp(query["periodEnd"], tz="UTC")
+        domain = query.get("outBiddingZone_Domain") or query.get("in_Domain") or query["out_Domain"]
+        if domain in _NO_ENTSOE_DATA or int(query.get("offset", 0)) > 0:
+            return _NO_DATA_XML
+        scale = _area_scale(domain)
+
+        if doc_type == "A65":
+            res = self._resolution(domain)
+            times = _times(start, end, res)
+            values = _profile("load", domain, times, 50000 * scale)
+            series = [self._series_xml(times, values, res, "outBiddingZone_Domain.mRID", domain)]
+            return _document("GL_MarketDocument", "A65", series)
+
+        if doc_type == "A75":
+            res = self._resolution(domain)
+            times = _times(start, end, res)
+            series = []
+            for psr, (kind, cap) in _PSR_PROFILES.items():
+                key = f"{domain}/{psr}"
+                if kind == "phs":
+                    # Generation and pumping are separate series (in/out domain)
+                    for tag, sign, suffix in (
+                        ("inBiddingZone", 1, ""),
+                        ("outBiddingZone", -1, "/in"),
+                    ):
+                        values = _profile("phs", key + suffix, times, sign * cap * scale)
+                        series.append(
+                            self._series_xml(times, values, res, f"{tag}_Domain.mRID", domain, psr)
+                        )
+                else:
+                    values = _profile(kind, key, times, cap * scale)
+                    series.append(
+                        self._series_xml(
+                            times, values, res, "inBiddingZone_Domain.mRID", domain, psr
+                        )
+                    )
+            return _document("GL_MarketDocument", "A75", series)
+
+        if doc_type == "A44":
+            res = "PT15M" if start >= pd.Timestamp("2025-10-01", tz="UTC") else "PT60M"
+            times = _times(start, end, res)
+            values = _profile("price", domain, times, 1.0)
+            series = [self._series_xml(times, values, res, None, domain, label="price.amount")]
+            return _document("Publication_MarketDocument", "A44", series)
+
+        if doc_type == "A68":
+            year_start = pd.Timestamp(f"{start.year}-01-01", tz="UTC")
+            times = pd.DatetimeIndex([year_start])
+            series = [
+                self._series_xml(
+                    times,
+                    np.array([cap * scale]),
+                    "P1Y",
+                    "inBiddingZone_Domain.mRID",
+                    domain,
+                    psr,
+                    end=year_start + pd.DateOffset(years=1),
+                )
+                for psr, (_, cap) in _PSR_PROFILES.items()
+            ]
+            return _document("GL_MarketDocument", "A68", series)
+
+        raise ValueError(f"unsupported documentType {doc_type}")
+
+    def _resolution(self, domain):
+        if self.resolution == "native":
+            return "PT15M" if domain in _QUARTER_HOURLY else "PT60M"
+        return self.resolution
+
+    def _series_xml(
+        self, times, values, resolution, domain_tag, domain, psr=None, label="quantity", end=None
+    ):
+        """One <TimeSeries> element, with a fraction of points dropped (gaps)."""
+        if end is None:
+            end = times[-1] + pd.Timedelta(_FREQ[resolution])
+        keep = np.ones(len(values), dtype=bool)
+        if self.gap_rate and len(values) > 1:
+            rng = np.random.default_rng(_seed(f"gaps/{domain}/{psr}/{times[0]}", self.seed))
+            keep = rng.random(len(values)) >= self.gap_rate
+            keep[0] = True  # entsoe-py needs at least one point per period
+        points = "".join(
+            f"<Point><position>{i + 1}</position><{label}>{v:.2f}</{label}></Point>"
+            for i, v in enumerate(values)
+            if keep[i]
+        )
+        domain_xml = (
+            f'<{domain_tag} codingScheme="A01">{domain}</{domain_tag}>' if domain_tag else ""
+        )
+        psr_xml = f"<MktPSRType><psrType>{psr}</psrType></MktPSRType>" if psr else ""
+        return (
+            "<TimeSeries><mRID>1</mRID><businessType>A04</businessType>"
+            f"{domain_xml}{psr_xml}<curveType>A01</curveType>"
+            f"<Period><timeInterval><start>{_iso(times[0])}</start><end>{_iso(end)}</end>"
+            f"</timeInterval><resolution>{resolution}</resolution>{points}</Period></TimeSeries>"
+        )
+
+    # ── Elexon ──
+
+    def _elexon(self, path, query):
+        endpoint = path[len(ELEXON_PATH) :]
+        if endpoint == "/demand/outturn":
+            times = _settlement_times(query["settlementDateFrom"], query["settlementDateTo"])
+            values = _profile("load", "elexon/demand", times, 35000)
+            data = [
+                {
+                    "settlementDate": t.strftime("%Y-%m-%d"),
+                    "settlementPeriod": _settlement_period(t),
+                    "initialDemandOutturn": round(float(v), 1),
+                }
+                for t, v in zip(times, values)
+            ]
+        elif endpoint == "/generation/actual/per-type":
+            start = pd.Timestamp(query["from"]).tz_convert("UTC")
+            end = pd.Timestamp(query["to"]).tz_convert("UTC")
+            times = pd.date_range(start, end, freq="30min", inclusive="left")
+            profiles = {
+                psr: _profile(kind, f"elexon/{psr}", times, cap)
+                for psr, (kind, cap) in _ELEXON_PSR.items()
+            }
+            data = [
+                {
+                    "startTime": _iso(t),
+                    "settlementPeriod": _settlement_period(t),
+                    "data": [
+                        {"psrType": psr, "quantity": round(float(v[i]), 1)}
+                        for psr, v in profiles.items()
+                    ],
+                }
+                for i, t in enumerate(times)
+            ]
+        elif endpoint == "/balancing/pricing/market-index":
+            times = _settlement_times(query["from"], query["to"])
+            prices = _profile("price", "elexon/price", times, 0.85)  # GBP
+            data = [
+                {
+                    "settlementDate": t.strftime("%Y-%m-%d"),
+                    "settlementPeriod": _settlement_period(t),
+                    "dataProvider": provider,
+                    "price": round(float(p) * factor, 2),
+                }
+                for t, p in zip(times, prices)
+                for provider, factor in (("N2EXMIDP", 1.0), ("APXMIDP", 1.02))
+            ]
+        elif endpoint == "/datasets/IGCPU":
+            data = [
+                {"psrType": psr, "installedCapacity": cap / 4}
+                for psr, (_, cap) in _ELEXON_PSR.items()
+                for _ in range(4)  # four units per type
+            ]
+        else:
+            raise ValueError(f"unsupported endpoint {endpoint}")
+        return json.dumps({"data": data})
+
+    # ── Renewables.ninja ──
+
+    def _ninja(self, path):
+        iso2, filename = path[len(NINJA_PATH) + 1 :].split("/", 1)
+        kind = "solar" if "-pv-" in filename else "wind"
+        first, last = self.ninja_years
+        times = pd.date_range(f"{first}-01-01", f"{last + 1}-01-01", freq="h", inclusive="left")
+        values = _profile(kind, f"ninja/{iso2}/{filename}", times.tz_localize("UTC"), 1.0)
+        out = io.StringIO()
+        out.write(f"# Renewables.ninja stand-in - {filename}\n# Units: capacity factor\n")
+        out.write("time,NATIONAL\n")
+        np.savetxt(
+            out,
+            np.column_stack([times.strftime("%Y-%m-%d %H:%M:%S"), np.round(values, 4)]),
+            fmt="%s",
+            delimiter=",",
+        )
+        return out.getvalue()
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+            status, headers, body = server.handle(parsed.path, query)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            logger.debug("standin: " + fmt, *args)
+
+    return Handler
+
+
+# ── Synthetic profiles ──
+
+_FREQ = {"PT15M": "15min", "PT30M": "30min", "PT60M": "60min"}
+
+
+def _times(start, end, resolution):
+    return pd.date_range(start, end, freq=_FREQ[resolution], inclusive="left")
+
+
+_EPOCH = pd.Timestamp("1970-01-01", tz="UTC")
+
+
+def _seed(key, base=0):
+    return zlib.crc32(key.encode("utf-8")) ^ base
+
+
+def _area_scale(code):
+    """Deterministic size factor of an area (0.2 - 1.5)."""
+    return 0.2 + 1.3 * (_seed(code) % 1000) / 1000
+
+
+def _profile(kind, key, times, scale):
+    """Deterministic synthetic profile over tz-aware UTC ``times``."""
+    n = len(times)
+    if n == 0:
+        return np.zeros(0)
+    hour = times.hour.to_numpy() + times.minute.to_numpy() / 60
+    doy = times.dayofyear.to_numpy()
+    daily = np.sin(2 * np.pi * (hour - 9) / 24)  # peak mid-afternoon UTC
+    seasonal = np.cos(2 * np.pi * (doy - 15) / 365.25)  # peak mid-January
+    # Noise is a function of the absolute time, so that overlapping requests agree
+    epoch_hours = np.asarray((times - _EPOCH) // pd.Timedelta(hours=1), dtype=np.int64)
+    noise = np.sin(epoch_hours * 12.9898 + _seed(key) % 997) * 0.5
+
+    if kind == "load":
+        return scale * (1 + 0.12 * daily + 0.15 * seasonal + 0.03 * noise)
+    if kind == "flat":
+        return scale * (0.75 + 0.05 * seasonal + 0.02 * noise)
+    if kind == "thermal":
+        return scale * np.clip(0.35 + 0.2 * daily + 0.25 * seasonal + 0.1 * noise, 0, 1)
+    if kind == "solar":
+        sun = np.clip(np.sin(np.pi * (hour - 5) / 14), 0, None)
+        return scale * sun * (0.75 - 0.25 * seasonal) * (0.9 + 0.2 * noise)
+    if kind == "wind":
+        days = epoch_hours / 24
+        weather = 0.5 + 0.3 * np.sin(days / 3.1 + _seed(key) % 11) * np.cos(days / 7.3)
+        return scale * np.clip(weather + 0.1 * seasonal + 0.05 * noise, 0.02, 0.98)
+    if kind == "phs":
+        return scale * np.clip(daily if scale > 0 else -daily, 0, None) * 0.6
+    if kind == "price":
+        return scale * (55 + 25 * daily + 20 * seasonal + 8 * noise)
+    raise ValueError(f"Unknown profile kind: {kind}")
+
+
+def _document(root, doc_type, series):
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<{root}><mRID>standin</mRID>'
+        f"<type>{doc_type}</type>{''.join(series)}</{root}>"
+    )
+
+
+def _iso(ts):
+    return pd.Timestamp(ts).tz_convert("UTC").strftime("%Y-%m-%dT%H:%MZ")
+
+
+def _settlement_times(date_from, date_to):
+    """Half-hourly UTC timestamps from date_from to date_to (inclusive days)."""
+    start = pd.Timestamp(date_from[:10], tz="UTC")
+    end = pd.Timestamp(date_to[:10], tz="UTC") + pd.Timedelta(days=1)
+    return pd.date_range(start, end, freq="30min", inclusive="left")
+
+
+def _settlement_period(ts):
+    return ts.hour * 2 + ts.minute // 30 + 1
+
+
+def _source(path):
+    for source, prefix in (("entsoe", ENTSOE_PATH), ("elexon", ELEXON_PATH), ("ninja", NINJA_PATH)):
+        if path.startswith(prefix):
+            return source
+    return "unknown"
+
+
+# ── Pointing the collectors at the server ──
+
+
+@contextmanager
+def redirect_collectors(server):
+    """Point entsoe.py, elexon.py and rninja.py at ``server`` within the block."""
+    urls = server.endpoints()
+    saved = (
+        entsoe.ENTSOE_ENDPOINT_URL,
+        entsoe.ENTSOE_API_KEY,
+        elexon.BASE_URL,
+        rninja.NINJA_BASE_URL,
+    )
+    entsoe.ENTSOE_ENDPOINT_URL = urls["ENTSOE_ENDPOINT_URL"]
+    entsoe.ENTSOE_API_KEY = entsoe.ENTSOE_API_KEY or "standin-api-key"
+    elexon.BASE_URL = urls["ELEXON_BASE_URL"]
+    rninja.NINJA_BASE_URL = urls["NINJA_BASE_URL"]
+    try:
+        yield server
+    finally:
+        (
+            entsoe.ENTSOE_ENDPOINT_URL,
+            entsoe.ENTSOE_API_KEY,
+            elexon.BASE_URL,
+            rninja.NINJA_BASE_URL,
+        ) = saved
+        entsoe.entsoe_py.URL = entsoe.ENTSOE_ENDPOINT_URL
+
+
+# ── Benchmark ──
+
+
+def run_benchmark(
+    year=2021,
+    areas=("FR", "DE", "UK"),
+    exo_areas=("NL",),
+    source="entsoe",
+    fast_retry=True,
+    **server_options,
+):
+    """Run collect_all against a fresh stand-in server and measure it.
+
+    Args:
+        year: Year to collect.
+        areas, exo_areas: Areas to collect.
+        source: "entsoe" (ENTSO-E + Elexon fallback), "ninja" or "all".
+        fast_retry: Divide ENTSO-E/Elexon retry delays by 100 so that injected errors
+            do not dominate the wall time (retry counts are unchanged).
+        **server_options: Passed to StandinServer (latency, error_rate, ...).
+
+    Returns:
+        dict of measurements (wall time, requests and bytes per source,
+        injected errors, requests/s, files written).
+    """
+    from ._main_collect import collect_all
+
+    out_dir = Path(tempfile.mkdtemp(prefix="eoles-standin-"))
+    saved_delays = [list(m._RETRY_DELAYS) for m in (entsoe, elexon)]
+    if fast_retry:
+        for module, delays in zip((entsoe, elexon), saved_delays):
+            module._RETRY_DELAYS[:] = [d / 100 for d in delays]
+    try:
+        with StandinServer(**server_options) as server, redirect_collectors(server):
+            t0 = time.perf_counter()
+            collect_all(
+                out_dir,
+                year,
+                year + 1,
+                areas=list(areas),
+                exo_areas=list(exo_areas),
+                source=source,
+                use_cache=False,
+            )
+            wall = time.perf_counter() - t0
+            stats = dict(server.stats)
+        files = [p for p in out_dir.rglob("*.csv") if not p.name.startswith("_")]
+    finally:
+        for module, delays in zip((entsoe, elexon), saved_delays):
+            module._RETRY_DELAYS[:] = delays
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    requests = sum(v for k, v in stats.items() if k.startswith("requests_"))
+    return {
+        "wall_s": round(wall, 2),
+        "requests": requests,
+        "requests_per_s": round(requests / wall, 1) if wall else None,
+        "mb_served": round(stats.get("bytes_served", 0) / 1e6, 2),
+        "mb_per_s": round(stats.get("bytes_served", 0) / 1e6 / wall, 2) if wall else None,
+        "injected_503": stats.get("injected_503", 0),
+        "injected_429": stats.get("injected_429", 0),
+        "files_written": len(files),
+        **{k: v for k, v in sorted(stats.items()) if k.startswith("requests_")},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m eoles_dispatch.collect.standin",
+        description="Local stand-in for the ENTSO-E, Elexon and Renewables.ninja APIs",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_p = sub.add_parser("serve", help="Serve until interrupted")
+    serve_p.add_argument("--host", default="127.0.0.1")
+    serve_p.add_argument("--port", type=int, default=8765)
+    bench_p = sub.add_parser("bench", help="Benchmark collect_all against a local server")
+    bench_p.add_argument("--year", type=int, default=2021)
+    bench_p.add_argument("--areas", nargs="+", default=["FR", "DE", "UK"])
+    bench_p.add_argument("--exo-areas", nargs="+", default=["NL"])
+    bench_p.add_argument("--source", default="entsoe", choices=["all", "entsoe", "ninja"])
+    bench_p.add_argument(
+        "--real-retry-delays", action="store_true", help="Keep the production retry delays"
+    )
+    for p in (serve_p, bench_p):
+        p.add_argument("--latency", type=float, default=0.0, help="Mean latency per request (s)")
+        p.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 responses")
+        p.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429s")
+        p.add_argument("--retry-after", type=int, default=1, help="Retry-After sent with 429 (s)")
+        p.add_argument(
+            "--resolution", default="native", choices=["native", "PT15M", "PT30M", "PT60M"]
+        )
+        p.add_argument("--gap-rate", type=float, default=0.0, help="Fraction of missing points")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    options = dict(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        resolution=args.resolution,
+        gap_rate=args.gap_rate,
+    )
+
+    if args.command == "serve":
+        server = StandinServer(host=args.host, port=args.port, **options)
+        print(f"Stand-in APIs listening on {server.url}. Point the collectors at it with:")
+        for name, value in server.endpoints().items():
+            print(f"  export {name}={value}")
+        print("  export ENTSOE_API_KEY=standin-api-key")
+        try:
+            server._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server._httpd.server_close()
+        return
+
+    result = run_benchmark(
+        year=args.year,
+        areas=args.areas,
+        exo_areas=args.exo_areas,
+        source=args.source,
+        fast_retry=not args.real_retry_delays,
+        **options,
+    )
+    print("\n=== Collection benchmark ===")
+    for key, value in result.items():
+        print(f"  {key:<18} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -73,11 +73,76 @@ GJ_MWH = 3.6  # Conversion factor from GJ to MWh
 
 ENTSOE_API_KEY = os.environ.get("ENTSOE_API_KEY")
 
+# API endpoints. Override through the environment to point collection at
+# another server, e.g. the local stand-in (python -m eoles_dispatch.collect.standin).
+ENTSOE_ENDPOINT_URL = os.environ.get("ENTSOE_ENDPOINT_URL") or "https://web-api.tp.entsoe.eu/api"
+ELEXON_BASE_URL = os.environ.get("ELEXON_BASE_URL") or "https://data.elexon.co.uk/bmrs/api/v1"
+NINJA_BASE_URL = (
+    os.environ.get("NINJA_BASE_URL") or "https://www.renewables.ninja/country_downloads/{iso2}"
+)
+
 # Minimum valid-data ratio to accept an ENTSO-E series before falling back to
 # an alternative source. Below this threshold, the series is considered too
 # sparse and the Elexon fallback is triggered for GB.
 ENTSOE_MIN_COVERAGE = 0.5
 
+# Client-side request budget shared by all download threads. The platform
+# allows 400 requests/min per user; we stay well below to leave room for
+# retries and other clients using the same key.
+ENTSOE_RATE_LIMIT = 4.0  # requests per second (sustained)
+ENTSOE_RATE_BURST = 4  # requests allowed back-to-back before throttling
+ENTSOE_MAX_WORKERS = 4  # concurrent download threads
+
+# ENTSO-E time series are downloaded in chunks of this many CET months. Each
+# completed chunk is staged under data/<year>/.staging/ so that an interrupted
+# or partially failed collection resumes from the chunks already downloaded.
+ENTSOE_CHUNK_MONTHS = 1
+
+# Concurrent 7-day chunk requests per Elexon fetch (public API, no key).
+ELEXON_MAX_WORKERS = 4
+
+# Concurrent Renewables.ninja downloads (one per profile and area).
+NINJA_MAX_WORKERS = 4
+
+# Rows read at a time from ENTSO-E File Library exports (eoles-dispatch
+# import-entsoe). Only the rows of the requested areas are kept, so memory
+# use does not grow with the size of the export files.
+ENTSOE_FILES_CHUNK_ROWS = 500_000
+
+# Raw API responses (ENTSO-E, Elexon, Renewables.ninja) are cached under
+# data/.http_cache/ so that re-collecting replays them instead of downloading
+# again. Entries older than the TTL are refreshed (recent data gets revised);
+# beyond the size budget, least-recently-used entries are evicted.
+HTTP_CACHE_DIR = ".http_cache"
+HTTP_CACHE_TTL_DAYS = 30
+HTTP_CACHE_MAX_MB = 2048
+
+
+# -------------
+## Run Outputs
+# -------------
+
+# Threads writing diagnostics tables (solve --fulldiag) while the next
+# variable or constraint is extracted from the solved model.
+DIAG_MAX_WORKERS = 4
+
+# Rows read at a time when querying CSV diagnostics tables
+# (eoles_dispatch.diagnostics.query); only the matching rows are kept.
+DIAG_QUERY_CHUNK_ROWS = 1_000_000
+
+# Peak hours of the peak/off-peak splits of run results (run/results.py):
+# weekdays from PEAK_HOURS[0] to PEAK_HOURS[1] CET, as the EPEX peak product.
+PEAK_HOURS = (8, 20)
+
+# Per-run directory holding the memory-mapped arrays of run/results.py,
+# rebuilt when the output or input table they come from changes.
+RESULTS_CACHE_DIR = ".cache"
+
+# Project-level results warehouse (run/warehouse.py), a SQLite file under
+# runs/ holding the metadata, KPIs, hourly prices and production totals of
+# every run, ingested once per solve.
+WAREHOUSE_FILE = ".warehouse.sqlite"
+
 
 # --------------------
 ## Perimeter Settings
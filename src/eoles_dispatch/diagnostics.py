@@ -0,0 +1,176 @@
+"""On-demand queries of a solved run's diagnostics.
+
+Reads the tables written by solve --fulldiag (run/export_diagnostics.py)
+without loading them whole: Parquet and Arrow tables are scanned with
+pyarrow.dataset, pushing the area / hour / nonzero filters down to the
+scan (only the partitions of the requested areas are read); CSV tables are read in chunks of DIAG_QUERY_CHUNK_ROWS rows, keeping
+only the matching rows.
+
+Example:
+    from eoles_dispatch import diagnostics
+
+    diagnostics.families("my_run")
+    duals = diagnostics.query(
+        "my_run", "adequacy", area="FR", hours=("2021-01-04", "2021-01-11")
+    )
+
+Delegates to:
+    - utils.py      posix_hour_range.
+
+Functions:
+    families(run, project_dir=None)
+        Table names available in a run's diagnostics.
+
+    query(run, family, area=None, hours=None, nonzero=False, columns=None,
+          project_dir=None)
+        Rows of one family matching the filters, as a DataFrame.
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from .config import DIAG_QUERY_CHUNK_ROWS
+from .utils import posix_hour_range
+
+
+def families(run, project_dir=None):
+    """Table names available in a run's diagnostics (e.g. ["gene", ..., "adequacy"])."""
+    return sorted(_tables(_diag_dir(run, project_dir)))
+
+
+def query(run, family, area=None, hours=None, nonzero=False, columns=None, project_dir=None):
+    """Rows of a diagnostics table matching the filters.
+
+    Args:
+        run: Run name (under <project_dir>/runs/) or path to a run directory.
+        family: Table name, e.g. "gene" or "adequacy" (see families()).
+        area: Area code or list of codes, matched on the table's area index
+            position.
+        hours: (start, end) range, [start, end), as POSIX hours or dates
+            (naive = UTC), matched on the table's hour index position.
+        nonzero: Keep only the rows with a nonzero value / dual.
+        columns: Columns to return (all if None).
+        project_dir: Root project directory. Defaults to cwd.
+
+    Returns:
+        DataFrame with columns idx0[, idx1, ...] and 'value' or 'dual'.
+
+    Raises:
+        FileNotFoundError: If the run has no diagnostics or no such table.
+        ValueError: If a filter targets an index the table does not have.
+    """
+    diag_dir = _diag_dir(run, project_dir)
+    tables = _tables(diag_dir)
+    if family not in tables:
+        raise FileNotFoundError(
+            f"No diagnostics table '{family}' in {diag_dir}. Available: {sorted(tables)}"
+        )
+    table = tables[family]
+    path = diag_dir / table["path"]
+
+    conditions = []  # (column, op, value)
+    if area is not None:
+        if table.get("area_column") is None:
+            raise ValueError(f"Diagnostics table '{family}' has no area index")
+        areas = [area] if isinstance(area, str) else list(area)
+        conditions.append((table["area_column"], "in", areas))
+    if hours is not None:
+        if table.get("hour_column") is None:
+            raise ValueError(f"Diagnostics table '{family}' has no hour index")
+        start, end = posix_hour_range(*hours)
+        conditions += [(table["hour_column"], ">=", start), (table["hour_column"], "<", end)]
+    if nonzero:
+        conditions.append((table["value_column"], "!=", 0))
+
+    if path.suffix == ".csv":
+        df = _scan_csv(path, conditions, columns)
+    else:
+        df = _scan_columnar(path, conditions, columns)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(str)
+    return df
+
+
+# ── Helpers ──
+
+
+def _diag_dir(run, project_dir):
+    run_dir = Path(run)
+    if not (run_dir / "diagnostics").is_dir():
+        run_dir = (Path(project_dir) if project_dir else Path.cwd()) / "runs" / str(run)
+    diag_dir = run_dir / "diagnostics"
+    if not diag_dir.is_dir():
+        raise FileNotFoundError(f"No diagnostics for run '{run}'. Solve it with --fulldiag.")
+    return diag_dir
+
+
+def _tables(diag_dir):
+    """Table entries recorded in _summary.json, or found on disk for older exports."""
+    try:
+        tables = json.loads((diag_dir / "_summary.json").read_text()).get("tables")
+    except (OSError, ValueError):
+        tables = None
+    if tables:
+        return tables
+    # Exports without a table list: files only, index positions unknown
+    tables = {}
+    for sub, value_column in (("vars", "value"), ("duals", "dual")):
+        for path in sorted((diag_dir / sub).glob("*.*")):
+            tables[path.stem] = {
+                "path": f"{sub}/{path.name}",
+                "value_column": value_column,
+                "area_column": None,
+                "hour_column": None,
+            }
+    return tables
+
+
+# Filter operators, valid on pandas Series and pyarrow dataset fields alike
+_OPS = {
+    "in": lambda s, v: s.isin(v),
+    ">=": lambda s, v: s >= v,
+    "<": lambda s, v: s < v,
+    "!=": lambda s, v: s != v,
+}
+
+
+def _scan_csv(path, conditions, columns):
+    """Matching rows of a CSV table, read in chunks."""
+    parts = []
+    for chunk in pd.read_csv(path, chunksize=DIAG_QUERY_CHUNK_ROWS):
+        mask = pd.Series(True, index=chunk.index)
+        for col, op, value in conditions:
+            mask &= _OPS[op](chunk[col], value)
+        chunk = chunk[mask]
+        parts.append(chunk if columns is None else chunk[columns])
+    if not parts:
+        return pd.read_csv(path, nrows=0, usecols=columns)
+    return pd.concat(parts, ignore_index=True)
+
+
+def _scan_columnar(path, conditions, columns):
+    """Matching rows of a Parquet/Arrow table, filtered during the scan."""
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError(
+            f"Reading {path.name} requires pyarrow: pip install 'eoles-dispatch[parquet]'"
+        ) from None
+
+    if path.suffix == ".parquet":
+        # Tables partitioned on their area column are directories idxN=XX/
+        dataset = ds.dataset(path, format="parquet", partitioning="hive" if path.is_dir() else None)
+    else:
+        dataset = ds.dataset(path, format="ipc")
+    expression = None
+    for col, op, value in conditions:
+        condition = _OPS[op](ds.field(col), value)
+        expression = condition if expression is None else expression & condition
+    df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+    if columns is None:
+        # The partition column comes last: restore the idx0, idx1, ... order
+        df = df[sorted(df.columns, key=lambda c: int(c[3:]) if c.startswith("idx") else 1 << 30)]
+    return df
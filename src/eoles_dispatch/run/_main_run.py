@@ -7,7 +7,7 @@ Directory structure:
     runs/<name>/
         run.yaml          - metadata (scenario, year, parameters, timestamps)
         inputs/           - formatted model inputs (CSVs)
-        outputs/          - model results (CSVs)
+        outputs/          - model results (CSV, Parquet or Arrow tables)
         scenario/         - copy of the scenario used
 """
 
@@ -19,7 +19,8 @@ from pathlib import Path
 
 import yaml
 
-from ..collect._main_collect import collect_all, sanitize_year
+from ..collect import manifest
+from ..collect._main_collect import collect_all, sanitize_year, year_in_progress
 from ..config import DEFAULT_AREAS, DEFAULT_EXO_AREAS
 
 logger = logging.getLogger(__name__)
@@ -39,12 +40,16 @@ def create_run(
     rn_horizon="current",
     auto_download=True,
     months=None,
+    weather_year=None,
+    tv_data=None,
+    scenario_patches=None,
 ):
     """Create a new run: fetch data if needed, format inputs, copy scenario.
 
     Args:
         name: Run name (determines directory name).
         scenario: Scenario name (looks for scenarios/<name>/ dir, then .xlsx).
+            May be a delta layer on another scenario (see run/scenario.py).
         year: Simulation year.
         project_dir: Root project directory. Defaults to cwd.
         areas: List of modeled country codes.
@@ -52,6 +57,14 @@ def create_run(
         actCF: Use actual historical capacity factors.
         rn_horizon: Renewables.ninja wind fleet ("current" or "future").
         auto_download: Automatically download missing data.
+        months: Optional (first, last) calendar month range to simulate.
+        weather_year: Read Renewables.ninja profiles from this weather year
+            (demand, NMD and hydro still come from ``year``).
+        tv_data: Pre-loaded time-varying inputs (output of load_tv_inputs for
+            the same year, months and areas). Lets batches of runs that only
+            differ in scenario parameters load the historical data once.
+        scenario_patches: Optional {table name: delta DataFrame} applied on top
+            of the scenario (see scenario.apply_delta).
 
     Returns:
         Path to the created run directory.
@@ -71,22 +84,15 @@ def create_run(
 
     data_dir = project_dir / "data"
 
-    # Resolve scenario
-    scenario_dir = project_dir / "scenarios" / scenario
-    scenario_xlsx = project_dir / "scenarios" / f"{scenario}.xlsx"
-    if scenario_dir.is_dir():
-        scenario_path = scenario_dir
-    elif scenario_xlsx.exists():
-        scenario_path = scenario_xlsx
-    else:
-        raise FileNotFoundError(
-            f"Scenario '{scenario}' not found. Expected either "
-            f"{scenario_dir}/ (CSV directory) or {scenario_xlsx}"
-        )
+    # Resolve scenario (a delta scenario resolves to its whole layer chain)
+    from .scenario import resolve_scenario_path, scenario_layers
+
+    scenario_path = resolve_scenario_path(project_dir / "scenarios", scenario)
+    layers = scenario_layers(scenario_path)
 
     # Auto-download data if needed
-    if auto_download:
-        _ensure_data_available(data_dir, year, areas, exo_areas, actCF=actCF, rn_horizon=rn_horizon)
+    if auto_download and tv_data is None:
+        ensure_data_available(data_dir, year, areas, exo_areas, actCF=actCF, rn_horizon=rn_horizon)
 
     # Create run directory
     run_dir.mkdir(parents=True)
@@ -95,33 +101,40 @@ def create_run(
     # Format and save inputs
     from ..utils import compute_hour_mappings
     from .format_inputs import load_tv_inputs, save_inputs
-    from .scenario import extract_scenario
+    from .scenario import export_resolved_scenario, extract_scenario, layer_name
 
     logger.info("  Computing time mappings...")
     hour_month, hour_week = compute_hour_mappings(year, months=months)
 
     logger.info("  Loading scenario parameters...")
-    scenario_data = extract_scenario(scenario_path, areas, exo_areas, hour_month)
-
-    logger.info("  Loading time-varying data and computing derived variables...")
-    tv_data = load_tv_inputs(
-        data_dir,
-        year,
-        areas,
-        exo_areas,
-        hour_month,
-        hour_week,
-        actCF=actCF,
-        rn_horizon=rn_horizon,
+    scenario_data = extract_scenario(
+        scenario_path, areas, exo_areas, hour_month, patches=scenario_patches
     )
 
+    if tv_data is None:
+        logger.info("  Loading time-varying data and computing derived variables...")
+        tv_data = load_tv_inputs(
+            data_dir,
+            year,
+            areas,
+            exo_areas,
+            hour_month,
+            hour_week,
+            actCF=actCF,
+            rn_horizon=rn_horizon,
+            weather_year=weather_year,
+        )
+
     logger.info("  Saving formatted inputs...")
     save_inputs(run_dir, tv_data, scenario_data, areas, exo_areas)
 
-    # Copy scenario into run directory for reproducibility
+    # Copy scenario into run directory for reproducibility. Layered scenarios
+    # are stored resolved so the copy stands on its own.
     scenario_copy_dir = run_dir / "scenario"
     scenario_copy_dir.mkdir()
-    if scenario_path.is_dir():
+    if len(layers) > 1 or scenario_patches:
+        export_resolved_scenario(scenario_path, scenario_copy_dir, scenario_patches)
+    elif scenario_path.is_dir():
         for csv_file in scenario_path.glob("*.csv"):
             shutil.copy2(csv_file, scenario_copy_dir / csv_file.name)
     else:
@@ -131,16 +144,22 @@ def create_run(
     metadata = {
         "name": name,
         "scenario": scenario,
+        "scenario_layers": [layer_name(p) for p in layers],
         "year": year,
         "areas": areas,
         "exo_areas": exo_areas,
         "actCF": actCF,
         "rn_horizon": rn_horizon,
+        "weather_year": weather_year,
         "months": f"{months[0]}-{months[1]}"
         if months and months[0] != months[1]
         else str(months[0])
         if months
         else None,
+        # Content hash of the historical files used (see collect/manifest.py)
+        "data_fingerprint": manifest.fingerprint(
+            data_dir / str(year), _history_files(areas, exo_areas)
+        ),
         "created": datetime.now().isoformat(timespec="seconds"),
         "status": "created",
     }
@@ -158,6 +177,12 @@ def solve_run(
     version="standard",
     reports=None,
     full_diag=False,
+    tee=True,
+    output_format="csv",
+    diag_nonzero=False,
+    diag_families=None,
+    diag_areas=None,
+    diag_hours=None,
 ):
     """Solve an existing run.
 
@@ -169,6 +194,15 @@ def solve_run(
         reports: List of reports to generate.
         full_diag: If True, export exhaustive diagnostics (all variables and
             duals) to runs/<name>/diagnostics/.
+        tee: Stream the solver log to stdout.
+        output_format: Format of the output tables: "csv", "parquet" or
+            "arrow" (see run/output_io.py). Also used for the diagnostics.
+        diag_nonzero: With full_diag, store only the nonzero duals.
+        diag_families: With full_diag, tables to export (e.g. ["gene",
+            "adequacy"]); all if None.
+        diag_areas: With full_diag, areas to export; all if None.
+        diag_hours: With full_diag, (start, end) hour range to export, as
+            POSIX hours or dates; all if None.
 
     Returns:
         Solver results object.
@@ -184,11 +218,16 @@ def solve_run(
         report_FRtrade,
         report_prices,
         report_production,
+        run_totals,
         write_log,
     )
+    from .output_io import check_output_format
+    from .rollups import ROLLUP_TABLES, write_rollups
+    from .solution import SolutionView
 
     if reports is None:
         reports = ["prices", "production"]
+    check_output_format(output_format)
 
     if project_dir is None:
         project_dir = Path.cwd()
@@ -228,7 +267,7 @@ def solve_run(
         opt.highs_options["solver"] = "ipm"  # Interior point method (faster on large LPs)
         opt.highs_options["run_crossover"] = "on"  # Get a basic feasible solution for duals
 
-    results = opt.solve(model, tee=True)
+    results = opt.solve(model, tee=tee)
 
     # Check solver status
     from pyomo.opt import TerminationCondition
@@ -245,8 +284,9 @@ def solve_run(
     # Create outputs directory
     (run_dir / "outputs").mkdir(exist_ok=True)
 
-    # Generate reports
+    # Generate reports, all reading the solution through one shared view
     logger.info("  Generating reports...")
+    solution = SolutionView(model)
     report_map = {
         "prices": report_prices,
         "production": report_production,
@@ -255,12 +295,23 @@ def solve_run(
     }
     for report_name in reports:
         if report_name in report_map:
-            report_map[report_name](model, run_dir)
+            report_map[report_name](solution, run_dir, output_format)
+
+    # Daily to annual rollups of the hourly tables, read by the report charts
+    write_rollups(run_dir, output_format, [r for r in reports if r in ROLLUP_TABLES])
 
     if full_diag:
         from .export_diagnostics import export_all_diagnostics
 
-        export_all_diagnostics(model, run_dir)
+        export_all_diagnostics(
+            solution,
+            run_dir,
+            output_format=output_format,
+            nonzero_duals=diag_nonzero,
+            families=diag_families,
+            areas=diag_areas,
+            hours=diag_hours,
+        )
 
     elapsed_seconds = int(time.monotonic() - start_monotonic)
     hours, remainder = divmod(elapsed_seconds, 3600)
@@ -274,13 +325,15 @@ def solve_run(
     metadata["solver"] = solver
     metadata["model_version"] = version
     metadata["reports"] = reports
+    metadata["output_format"] = output_format
     metadata["exec_time"] = exec_str
+    metadata["total_cost"], metadata["total_co2"] = run_totals(solution)
     with open(meta_path, "w") as f:
         yaml.dump(metadata, f, default_flow_style=False, sort_keys=False)
 
-    write_log(run_dir, model, name, metadata["scenario"], metadata["year"], start_time, exec_str)
+    write_log(run_dir, solution, name, metadata["scenario"], metadata["year"], start_time, exec_str)
 
-    del model, opt
+    del solution, model, opt
     gc.collect()
 
     return results
@@ -304,24 +357,13 @@ def load_run_metadata(name, project_dir=None):
 def list_runs(project_dir=None):
     """List all runs and their status.
 
-    Returns a list of dicts with run metadata.
+    Returns a list of dicts with run metadata, read from the results
+    warehouse (run/warehouse.py), which re-reads only the runs changed
+    since the last listing.
     """
-    if project_dir is None:
-        project_dir = Path.cwd()
-    else:
-        project_dir = Path(project_dir)
+    from .warehouse import list_runs as warehouse_runs
 
-    runs_dir = project_dir / "runs"
-    if not runs_dir.exists():
-        return []
-
-    runs = []
-    for run_dir in sorted(runs_dir.iterdir()):
-        meta_path = run_dir / "run.yaml"
-        if meta_path.exists():
-            with open(meta_path) as f:
-                runs.append(yaml.safe_load(f))
-    return runs
+    return warehouse_runs(project_dir)
 
 
 # ── Helpers ──
@@ -351,16 +393,9 @@ def check_requirements(data_dir, year, areas, exo_areas, actCF=False, rn_horizon
     ninja_dir = data_dir / "renewable_ninja"
 
     # History files (ENTSO-E)
-    history_missing = []
-    for area in areas:
-        for label in ("demand", "production", "installed_capacity"):
-            path = year_dir / f"{label}_{area}.csv"
-            if not path.exists():
-                history_missing.append(path.name)
-    for area in exo_areas:
-        path = year_dir / f"prices_{area}.csv"
-        if not path.exists():
-            history_missing.append(path.name)
+    history_missing = [
+        name for name in _history_files(areas, exo_areas) if not (year_dir / name).exists()
+    ]
 
     # Ninja files (only if actCF=False)
     ninja_missing = []
@@ -386,7 +421,17 @@ def check_requirements(data_dir, year, areas, exo_areas, actCF=False, rn_horizon
     return source, history_missing + ninja_missing
 
 
-def _ensure_data_available(data_dir, year, areas, exo_areas, actCF=False, rn_horizon="current"):
+def _history_files(areas, exo_areas):
+    """Names of the data/<year>/ files a run reads for these areas."""
+    names = [
+        f"{label}_{area}.csv"
+        for area in areas
+        for label in ("demand", "production", "installed_capacity")
+    ]
+    return names + [f"prices_{area}.csv" for area in exo_areas]
+
+
+def ensure_data_available(data_dir, year, areas, exo_areas, actCF=False, rn_horizon="current"):
     """Check if data for the given year is available, download if not.
 
     Runs sanitize_year on existing data to flag corrupt files, then
@@ -408,9 +453,10 @@ def _ensure_data_available(data_dir, year, areas, exo_areas, actCF=False, rn_hor
     """
     year_dir = data_dir / str(year)
 
-    # Sanitize existing files (flag corrupt ones)
+    # Sanitize existing files (flag corrupt ones). Files of the year in
+    # progress (collect --incremental) only cover its first hours.
     if year_dir.exists():
-        sanitize_year(year_dir, year)
+        sanitize_year(year_dir, year, partial=year_in_progress(year))
 
     # Check what's missing
     source, missing_files = check_requirements(
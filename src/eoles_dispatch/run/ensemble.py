@@ -0,0 +1,539 @@
+"""Parameter-space ensembles for EOLES-Dispatch.
+
+An ensemble runs one base scenario many times with a few scenario parameters
+varied over a range (CO2 price, gas price multiplier, nuclear fleet, an
+interconnector...). It is described by a YAML spec:
+
+    scenario: baseline
+    year: 2019
+    months: 1-3           # optional, same syntax as `create --months`
+    samples: 20           # members (random/lhs) or levels per parameter (grid)
+    method: lhs           # grid | random | lhs
+    seed: 0
+    parameters:
+      co2_price:          # all thermal rows of thr_specs.co2_price
+        table: thr_specs
+        column: co2_price
+        range: [20, 150]
+      gas_factor:         # multiplier on the GAS seasonal weights
+        table: fuel_timeFactor
+        column: GAS
+        scale: [0.7, 1.5]
+      fr_nuclear:
+        table: capa
+        row: nuclear
+        column: FR
+        range: [40, 63]
+
+Each parameter targets one column of a scenario table, optionally restricted
+to one row (key of the table's first column). ``range`` sets the cells to the
+sampled value, ``scale`` multiplies their base value by it.
+
+Members are regular runs named ``<ensemble>_<NNN>`` (so `viz`, `list`...
+work on them). The historical time-varying inputs are loaded once and shared
+by every member; members are then solved in parallel worker processes, and
+the per-member KPIs are read from the results warehouse (warehouse.py) into
+one table:
+
+    ensembles/<name>/
+        ensemble.yaml     - spec + creation metadata
+        samples.csv       - member, run, one column per parameter
+        results.csv       - samples + total_cost, total_co2 and per-area
+                            price_mean/p05/p50/p95_<area> columns
+
+Weather-year ensembles (run_weather_ensemble) instead keep the scenario and
+the historical system year fixed (demand, NMD, hydro) and vary the weather:
+one member per weather year, with Renewables.ninja profiles read from that
+year. The ninja tables are read once and sliced per member. On top of
+results.csv, they write distribution.csv: per area, the distribution of
+hourly prices pooled over all members (mean, std, percentiles) and the
+spread of the member means.
+"""
+
+import itertools
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ..config import DEFAULT_AREAS, DEFAULT_EXO_AREAS
+from ..utils import parse_month_range
+from . import warehouse
+from .output_io import read_output
+
+logger = logging.getLogger(__name__)
+
+SAMPLING_METHODS = ("grid", "random", "lhs")
+
+# Percentiles of the pooled hourly price distribution of weather ensembles.
+DISTRIBUTION_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+# ── High-level entry points ──
+
+
+def run_ensemble(
+    name,
+    spec,
+    project_dir=None,
+    jobs=1,
+    solver="highs",
+    version="standard",
+    auto_download=True,
+):
+    """Create and solve every member of a parameter-space ensemble.
+
+    Args:
+        name: Ensemble name (prefix of the member run names).
+        spec: Spec dict or path to a YAML spec (see module docstring).
+        project_dir: Root project directory. Defaults to cwd.
+        jobs: Number of worker processes solving members in parallel.
+        solver: Solver name passed to solve_run.
+        version: Model version passed to solve_run.
+        auto_download: Automatically download missing data.
+
+    Returns:
+        DataFrame of results, one row per member.
+    """
+    from ..utils import compute_hour_mappings
+    from ._main_run import create_run, ensure_data_available
+    from .format_inputs import load_tv_inputs
+    from .scenario import resolve_scenario_path
+
+    spec = load_ensemble_spec(spec)
+    project_dir = Path.cwd() if project_dir is None else Path(project_dir)
+    ens_dir = project_dir / "ensembles" / name
+    if ens_dir.exists():
+        raise FileExistsError(f"Ensemble '{name}' already exists at {ens_dir}")
+
+    areas, exo_areas = spec["areas"], spec["exo_areas"]
+    year, months = spec["year"], spec["months"]
+    data_dir = project_dir / "data"
+    scenario_path = resolve_scenario_path(project_dir / "scenarios", spec["scenario"])
+
+    samples = sample_parameters(spec["parameters"], spec["samples"], spec["method"], spec["seed"])
+    samples.insert(0, "run", [f"{name}_{i:03d}" for i in range(len(samples))])
+    samples.insert(0, "member", range(len(samples)))
+    logger.info(f"Ensemble '{name}': {len(samples)} members ({spec['method']} sampling)")
+
+    # Time-varying inputs only depend on year/months/areas: load them once.
+    if auto_download:
+        ensure_data_available(
+            data_dir, year, areas, exo_areas, actCF=spec["actCF"], rn_horizon=spec["rn_horizon"]
+        )
+    hour_month, hour_week = compute_hour_mappings(year, months=months)
+    logger.info("  Loading time-varying data and computing derived variables...")
+    tv_data = load_tv_inputs(
+        data_dir,
+        year,
+        areas,
+        exo_areas,
+        hour_month,
+        hour_week,
+        actCF=spec["actCF"],
+        rn_horizon=spec["rn_horizon"],
+    )
+
+    ens_dir.mkdir(parents=True)
+    with open(ens_dir / "ensemble.yaml", "w") as f:
+        yaml.dump(
+            {
+                **spec,
+                "months": list(months) if months else None,
+                "name": name,
+                "created": datetime.now().isoformat(timespec="seconds"),
+            },
+            f,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+    samples.to_csv(ens_dir / "samples.csv", index=False)
+
+    param_names = list(spec["parameters"])
+    for member, run, values in zip(
+        samples["member"], samples["run"], samples[param_names].to_dict("records")
+    ):
+        patches = build_patches(scenario_path, spec["parameters"], values)
+        create_run(
+            run,
+            spec["scenario"],
+            year,
+            project_dir=project_dir,
+            areas=areas,
+            exo_areas=exo_areas,
+            actCF=spec["actCF"],
+            rn_horizon=spec["rn_horizon"],
+            auto_download=False,
+            months=months,
+            tv_data=tv_data,
+            scenario_patches=patches,
+        )
+        _tag_member(project_dir, run, name, member, values)
+
+    logger.info(f"  Solving {len(samples)} members with {jobs} worker(s)...")
+    summaries = solve_members(
+        samples["run"].tolist(), project_dir, jobs=jobs, solver=solver, version=version
+    )
+
+    results = samples.merge(pd.DataFrame(summaries), on="run", how="left")
+    results.to_csv(ens_dir / "results.csv", index=False)
+    logger.info(f"  Results written to {ens_dir / 'results.csv'}")
+    return results
+
+
+def run_weather_ensemble(
+    name,
+    scenario,
+    year,
+    weather_years,
+    project_dir=None,
+    areas=None,
+    exo_areas=None,
+    months=None,
+    rn_horizon="current",
+    jobs=1,
+    solver="highs",
+    version="standard",
+    auto_download=True,
+):
+    """Solve one system year against many weather years.
+
+    Args:
+        name: Ensemble name (members are runs named <name>_w<weather year>).
+        scenario: Scenario name.
+        year: Historical system year (demand, NMD, hydro, exogenous prices).
+        weather_years: Years to read Renewables.ninja profiles from.
+        project_dir: Root project directory. Defaults to cwd.
+        areas: List of modeled country codes.
+        exo_areas: List of non-modeled country codes.
+        months: Optional (first, last) calendar month range to simulate.
+        rn_horizon: Renewables.ninja wind fleet ("current" or "future").
+        jobs: Number of worker processes solving members in parallel.
+        solver: Solver name passed to solve_run.
+        version: Model version passed to solve_run.
+        auto_download: Automatically download missing data.
+
+    Returns:
+        (results, distribution) DataFrames: one row per member, and the
+        pooled price distribution per area.
+    """
+    from ..utils import compute_hour_mappings
+    from ._main_run import create_run, ensure_data_available
+    from .format_inputs import load_ninja_frames, load_tv_inputs, with_weather_year
+
+    if areas is None:
+        areas = list(DEFAULT_AREAS)
+    if exo_areas is None:
+        exo_areas = list(DEFAULT_EXO_AREAS)
+    project_dir = Path.cwd() if project_dir is None else Path(project_dir)
+    ens_dir = project_dir / "ensembles" / name
+    if ens_dir.exists():
+        raise FileExistsError(f"Ensemble '{name}' already exists at {ens_dir}")
+    weather_years = sorted(set(int(w) for w in weather_years))
+    data_dir = project_dir / "data"
+
+    if auto_download:
+        ensure_data_available(data_dir, year, areas, exo_areas, rn_horizon=rn_horizon)
+    logger.info(f"Weather ensemble '{name}': year {year} x {len(weather_years)} weather years")
+
+    # History-based inputs are computed once, ninja tables are read once;
+    # each member then only re-slices the VRE profiles.
+    hour_month, hour_week = compute_hour_mappings(year, months=months)
+    ninja = load_ninja_frames(data_dir, rn_horizon)
+    logger.info("  Loading time-varying data and computing derived variables...")
+    base_tv = load_tv_inputs(
+        data_dir,
+        year,
+        areas,
+        exo_areas,
+        hour_month,
+        hour_week,
+        rn_horizon=rn_horizon,
+        ninja=ninja,
+    )
+
+    ens_dir.mkdir(parents=True)
+    with open(ens_dir / "ensemble.yaml", "w") as f:
+        yaml.dump(
+            {
+                "name": name,
+                "kind": "weather",
+                "scenario": scenario,
+                "year": year,
+                "weather_years": weather_years,
+                "months": list(months) if months else None,
+                "areas": areas,
+                "exo_areas": exo_areas,
+                "rn_horizon": rn_horizon,
+                "created": datetime.now().isoformat(timespec="seconds"),
+            },
+            f,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+    members = pd.DataFrame(
+        {
+            "member": range(len(weather_years)),
+            "run": [f"{name}_w{w}" for w in weather_years],
+            "weather_year": weather_years,
+        }
+    )
+    for member, (run, weather_year) in enumerate(zip(members["run"], weather_years)):
+        tv_data = with_weather_year(
+            base_tv, data_dir, areas, year, weather_year, rn_horizon, ninja=ninja
+        )
+        create_run(
+            run,
+            scenario,
+            year,
+            project_dir=project_dir,
+            areas=areas,
+            exo_areas=exo_areas,
+            rn_horizon=rn_horizon,
+            auto_download=False,
+            months=months,
+            weather_year=weather_year,
+            tv_data=tv_data,
+        )
+        _tag_member(project_dir, run, name, member, {})
+
+    logger.info(f"  Solving {len(members)} members with {jobs} worker(s)...")
+    summaries = solve_members(
+        members["run"].tolist(), project_dir, jobs=jobs, solver=solver, version=version
+    )
+    results = members.merge(pd.DataFrame(summaries), on="run", how="left")
+    results.to_csv(ens_dir / "results.csv", index=False)
+
+    solved = results.loc[results["status"] == "solved", "run"]
+    distribution = price_distribution([project_dir / "runs" / r for r in solved])
+    distribution.to_csv(ens_dir / "distribution.csv")
+    logger.info(f"  Results written to {ens_dir}")
+    return results, distribution
+
+
+def solve_members(run_names, project_dir, jobs=1, solver="highs", version="standard"):
+    """Solve a batch of existing runs, in parallel worker processes if jobs > 1.
+
+    Returns a list of summary dicts (see summarize_run), in the order of
+    ``run_names``. A member whose solve fails gets a row with its error
+    instead of aborting the whole batch.
+    """
+    tasks = [(run, str(project_dir), solver, version) for run in run_names]
+    if jobs <= 1 or len(tasks) <= 1:
+        outcomes = [_solve_member(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(_solve_member, tasks))
+
+    # Solved members are ingested into the warehouse once, here, and their
+    # KPIs read back from it.
+    solved = [o["run"] for o in outcomes if o["status"] == "solved"]
+    kpis = dict(zip(solved, warehouse.summaries(solved, project_dir))) if solved else {}
+    return [kpis.get(o["run"], o) for o in outcomes]
+
+
+def summarize_run(run_dir):
+    """Return the KPIs of a solved run as a flat dict.
+
+    Totals recorded in run.yaml, price mean and percentiles per area. Runs
+    in a project (runs/<name>/) are read from the results warehouse (see
+    warehouse.summaries); other run directories are read directly.
+    """
+    run_dir = Path(run_dir)
+    if run_dir.parent.name == "runs":
+        return warehouse.summaries([run_dir.name], run_dir.parent.parent)[0]
+
+    with open(run_dir / "run.yaml") as f:
+        metadata = yaml.safe_load(f)
+    summary = {
+        "run": metadata.get("name", run_dir.name),
+        "status": metadata.get("status"),
+        "total_cost": metadata.get("total_cost"),
+        "total_co2": metadata.get("total_co2"),
+    }
+    prices = read_output(run_dir, "prices").set_index("hour")
+    for area in prices.columns:
+        values = prices[area].to_numpy()
+        summary[f"price_mean_{area}"] = float(np.mean(values))
+        percentiles = warehouse.PRICE_PERCENTILES
+        for q, v in zip(percentiles, np.percentile(values, percentiles)):
+            summary[f"price_p{q:02d}_{area}"] = float(v)
+    return summary
+
+
+def price_distribution(run_dirs):
+    """Pool the hourly prices of several solved runs into a per-area distribution.
+
+    Prices of runs in a project (runs/<name>/) come from the results
+    warehouse; other run directories are read directly.
+
+    Returns:
+        DataFrame indexed by area with columns members, mean, std, p01..p99
+        (over all member-hours) and member_mean_min/max (spread of the
+        per-member mean prices).
+    """
+    prices = _member_prices([Path(d) for d in run_dirs])
+    if not prices:
+        return pd.DataFrame()
+
+    rows = {}
+    for area in prices[0].columns:
+        pooled = np.concatenate([p[area].to_numpy() for p in prices])
+        member_means = [p[area].mean() for p in prices]
+        row = {"members": len(prices), "mean": pooled.mean(), "std": pooled.std()}
+        for q, v in zip(DISTRIBUTION_PERCENTILES, np.percentile(pooled, DISTRIBUTION_PERCENTILES)):
+            row[f"p{q:02d}"] = v
+        row["member_mean_min"] = min(member_means)
+        row["member_mean_max"] = max(member_means)
+        rows[area] = row
+    return pd.DataFrame.from_dict(rows, orient="index").rename_axis("area")
+
+
+# ── Spec & sampling ──
+
+
+def load_ensemble_spec(spec):
+    """Load (if a path) and validate an ensemble spec, filling in defaults."""
+    if not isinstance(spec, dict):
+        with open(spec) as f:
+            spec = yaml.safe_load(f)
+    spec = dict(spec)
+
+    for key in ("scenario", "year", "parameters"):
+        if key not in spec:
+            raise ValueError(f"Ensemble spec is missing '{key}'")
+    spec.setdefault("samples", 10)
+    spec.setdefault("method", "lhs")
+    spec.setdefault("seed", 0)
+    spec.setdefault("areas", list(DEFAULT_AREAS))
+    spec.setdefault("exo_areas", list(DEFAULT_EXO_AREAS))
+    spec.setdefault("actCF", False)
+    spec.setdefault("rn_horizon", "current")
+    spec["months"] = parse_month_range(spec.get("months"))
+
+    if spec["method"] not in SAMPLING_METHODS:
+        raise ValueError(
+            f"Unknown sampling method '{spec['method']}'. Choose from: {list(SAMPLING_METHODS)}"
+        )
+    for pname, param in spec["parameters"].items():
+        if "table" not in param or "column" not in param:
+            raise ValueError(f"Parameter '{pname}' needs a 'table' and a 'column'")
+        if ("range" in param) == ("scale" in param):
+            raise ValueError(f"Parameter '{pname}' needs exactly one of 'range' or 'scale'")
+        bounds = param.get("range", param.get("scale"))
+        if not isinstance(bounds, (list, tuple)) or len(bounds) != 2 or bounds[0] > bounds[1]:
+            raise ValueError(f"Parameter '{pname}': bounds must be [low, high], got {bounds}")
+    return spec
+
+
+def sample_parameters(parameters, n, method="lhs", seed=0):
+    """Draw parameter values over the bounds of each parameter.
+
+    Args:
+        parameters: {name: parameter spec} with 'range' or 'scale' bounds.
+        n: Number of samples (random, lhs) or levels per parameter (grid).
+        method: "grid" (full factorial, n ** len(parameters) members),
+            "random" (uniform) or "lhs" (Latin hypercube: each parameter's
+            range is split into n strata, each sampled exactly once).
+        seed: Random seed (random and lhs).
+
+    Returns:
+        DataFrame with one column per parameter.
+    """
+    names = list(parameters)
+    bounds = np.array([parameters[p].get("range", parameters[p].get("scale")) for p in names])
+    low, high = bounds[:, 0], bounds[:, 1]
+    rng = np.random.default_rng(seed)
+
+    if method == "grid":
+        levels = [np.linspace(lo, hi, n) for lo, hi in zip(low, high)]
+        values = np.array(list(itertools.product(*levels))).reshape(-1, len(names))
+    elif method == "random":
+        values = low + rng.random((n, len(names))) * (high - low)
+    elif method == "lhs":
+        strata = np.array([rng.permutation(n) for _ in names]).T
+        values = low + (strata + rng.random((n, len(names)))) / n * (high - low)
+    else:
+        raise ValueError(f"Unknown sampling method '{method}'")
+    return pd.DataFrame(values, columns=names)
+
+
+def build_patches(scenario_path, parameters, values):
+    """Turn one sample into scenario patches ({table: delta DataFrame}).
+
+    ``range`` parameters set the targeted cells to the sampled value;
+    ``scale`` parameters multiply the (resolved) base value.
+    """
+    from .scenario import apply_delta, read_scenario_table
+
+    patches = {}
+    for pname, param in parameters.items():
+        table, column = param["table"], param["column"]
+        base = read_scenario_table(scenario_path, table, patches)
+        key = base.columns[0]
+        if column not in base.columns:
+            raise ValueError(f"Parameter '{pname}': column '{column}' not in {table}")
+        rows = base[key] == param["row"] if "row" in param else pd.Series(True, index=base.index)
+        if not rows.any():
+            raise ValueError(f"Parameter '{pname}': row '{param['row']}' not in {table}")
+
+        cells = base.loc[rows, [key, column]].copy()
+        if "scale" in param:
+            cells[column] = cells[column] * values[pname]
+        else:
+            cells[column] = values[pname]
+        patches[table] = apply_delta(patches[table], cells) if table in patches else cells
+    return patches
+
+
+# ── Helpers ──
+
+
+def _tag_member(project_dir, run, ensemble, member, values):
+    """Record ensemble membership and sampled values in a member's run.yaml."""
+    meta_path = Path(project_dir) / "runs" / run / "run.yaml"
+    with open(meta_path) as f:
+        metadata = yaml.safe_load(f)
+    metadata["ensemble"] = ensemble
+    metadata["member"] = int(member)
+    if values:
+        metadata["parameters"] = {k: float(v) for k, v in values.items()}
+    with open(meta_path, "w") as f:
+        yaml.dump(metadata, f, default_flow_style=False, sort_keys=False)
+
+
+def _solve_member(task):
+    """Worker: solve one member run and return its summary (picklable in/out)."""
+    from ._main_run import solve_run
+
+    run, project_dir, solver, version = task
+    try:
+        solve_run(run, project_dir=project_dir, solver=solver, version=version, tee=False)
+        return {"run": run, "status": "solved"}
+    except Exception as e:
+        logger.error(f"  Member {run} failed: {e}")
+        return {"run": run, "status": "failed", "error": str(e)}
+
+
+def _member_prices(run_dirs):
+    """Hourly prices (indexed by hour) of each run, in order."""
+    by_project = {}
+    for d in run_dirs:
+        if d.parent.name == "runs" and (d / "run.yaml").exists():
+            by_project.setdefault(d.parent.parent, []).append(d.name)
+    stored = {
+        (project_dir, name): frame
+        for project_dir, names in by_project.items()
+        for name, frame in warehouse.price_series(names, project_dir).items()
+    }
+    return [
+        stored[(d.parent.parent, d.name)]
+        if (d.parent.parent, d.name) in stored
+        else read_output(d, "prices").set_index("hour")
+        for d in run_dirs
+    ]
@@ -1,125 +1,203 @@
 """Export exhaustive model diagnostics for post-solve analysis.
 
-Writes all Pyomo variable values and constraint duals to CSV files under
-runs/<name>/diagnostics/, plus a JSON summary. Intended as input to an AI
-diagnostic tool, not for human visualization.
+Writes all Pyomo variable values and constraint duals under
+runs/<name>/diagnostics/, one table per family (variable or constraint),
+plus a JSON summary. Intended as input to an AI diagnostic tool, not for
+human visualization.
 
-Output structure:
+Values are read through the SolutionView shared with the reports
+(solution.py): variables already extracted for a report are not read again,
+and all duals come from one map built once for the model. Families read
+only for the diagnostics are not kept in the view: each is extracted as a
+frame and handed to a writer thread, and extraction waits for the oldest
+write once max_workers tables are in flight, so only a few families are in
+memory at a time. Tables are written in the
+run's output format (output_io.py): CSV, or zstd-compressed Parquet / Arrow
+with categorical index columns. Parquet tables with an area index are
+partitioned on it (e.g. vars/gene.parquet/idx0=FR/), so queries on some
+areas read only their partitions. With nonzero_duals=True, only the nonzero
+duals are stored (the summary statistics still cover all of them).
+
+The export can be restricted to some families (table names below), areas
+and an hour range (solve --diag-families / --diag-areas / --diag-hours).
+Area and hour filters apply to the index position holding areas / model
+hours, found from the model sets; families without one are kept whole.
+_summary.json lists the tables written ("tables": path, value column, area
+and hour columns, rows), which eoles_dispatch.diagnostics.query reads.
+
+Output structure (.csv, .parquet or .arrow):
     diagnostics/
         vars/
-            gene.csv, on.csv, startup.csv, turnoff.csv, ramp_up.csv,
-            storage.csv, stored.csv, rsv.csv, hll.csv,
-            im.csv, ex.csv, exo_im.csv, exo_ex.csv,
-            hcost.csv, hcarb.csv
+            gene, on, startup, turnoff, ramp_up,
+            storage, stored, rsv, hll,
+            im, ex, exo_im, exo_ex,
+            hcost, hcarb
         duals/
-            adequacy.csv, gene_vre.csv, gene_nmd.csv, on_capa.csv,
-            gene_on_hmax.csv, gene_on_hmin.csv, yearly_maxON.csv,
-            nuc_maxON.csv, on_off.csv, ramping_up.csv,
-            stored_cap.csv, stor_in.csv, stor_out.csv, storing.csv,
-            lake_res.csv, reserves.csv, trade_bal.csv, icIM.csv,
-            exoIM.csv, exoEX.csv
+            adequacy, gene_vre, gene_nmd, on_capa,
+            gene_on_hmax, gene_on_hmin, yearly_maxON,
+            nuc_maxON, on_off, ramping_up,
+            stored_cap, stor_in, stor_out, storing,
+            lake_res, reserves, trade_bal, icIM,
+            exoIM, exoEX
         _summary.json
+
+Tables have columns idx0[, idx1, ...] (index positions, e.g. area / tec /
+hour) and 'value' (variables) or 'dual' (constraints).
 """
 
 import json
 import logging
+import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
-import pyomo.environ as pyo
+
+from ..config import DIAG_MAX_WORKERS
+from ..utils import posix_hour_range
+from .output_io import write_output
+from .solution import SolutionView
 
 logger = logging.getLogger(__name__)
 
+# Variable families, exported to vars/<name>
+_VARS = [
+    "gene",
+    "on",
+    "startup",
+    "turnoff",
+    "ramp_up",
+    "storage",
+    "stored",
+    "rsv",
+    "hll",
+    "im",
+    "ex",
+    "exo_im",
+    "exo_ex",
+    "hcost",
+    "hcarb",
+]
+
+# Constraint families, exported (duals) to duals/<name without _constraint>
+_CONSTRAINTS = [
+    "adequacy_constraint",
+    "gene_vre_constraint",
+    "gene_nmd_constraint",
+    "on_capa_constraint",
+    "gene_on_hmax_constraint",
+    "gene_on_hmin_constraint",
+    "yearly_maxON_constraint",
+    "nuc_maxON_constraint",
+    "on_off_constraint",
+    "cons_startup_constraint",
+    "cons_turnoff_constraint",
+    "ramping_up_constraint",
+    "stored_cap_constraint",
+    "stor_in_constraint",
+    "stor_out_constraint",
+    "storing_constraint",
+    "lake_res_constraint",
+    "reserves_constraint",
+    "no_FRR_contrib_constraint",
+    "trade_bal_constraint",
+    "icIM_constraint",
+    "exoIM_constraint",
+    "exoEX_constraint",
+]
+
 
 # ── High-level entry point ──
 
 
-def export_all_diagnostics(model, run_dir):
-    """Export all variables and duals from a solved Pyomo model to diagnostics/.
+def export_all_diagnostics(
+    solution,
+    run_dir,
+    output_format="csv",
+    nonzero_duals=False,
+    families=None,
+    areas=None,
+    hours=None,
+    max_workers=DIAG_MAX_WORKERS,
+):
+    """Export variables and duals from a solved Pyomo model to diagnostics/.
 
     Args:
-        model: Solved Pyomo ConcreteModel (with dual suffix populated).
+        solution: SolutionView of the solved model, or the solved Pyomo
+            ConcreteModel itself (with dual suffix populated).
         run_dir: Path to the run directory.
+        output_format: "csv", "parquet" or "arrow" (see output_io.py).
+        nonzero_duals: Store only the nonzero duals of each constraint.
+        families: Families to export, by table name (e.g. ["gene",
+            "adequacy"]); all if None.
+        areas: Keep only the rows of these areas (on the family's area index
+            position); families without an area index are kept whole.
+        hours: (start, end) range to keep, [start, end), as POSIX hours or
+            dates (see utils.posix_hour_range); families without an hour
+            index are kept whole.
+        max_workers: Threads writing tables concurrently.
     """
+    solution = SolutionView.of(solution)
+    selected = _select_families(families)
+    hour_range = posix_hour_range(*hours) if hours is not None else None
+
     diag_dir = Path(run_dir) / "diagnostics"
     vars_dir = diag_dir / "vars"
     duals_dir = diag_dir / "duals"
-    vars_dir.mkdir(parents=True, exist_ok=True)
-    duals_dir.mkdir(parents=True, exist_ok=True)
+    for out_dir in (vars_dir, duals_dir):
+        shutil.rmtree(out_dir, ignore_errors=True)  # no tables left from a previous export
+        out_dir.mkdir(parents=True)
 
     logger.info("  Exporting full diagnostics...")
 
-    # ── Variables ──
-    _VARS = [
-        "gene",
-        "on",
-        "startup",
-        "turnoff",
-        "ramp_up",
-        "storage",
-        "stored",
-        "rsv",
-        "hll",
-        "im",
-        "ex",
-        "exo_im",
-        "exo_ex",
-        "hcost",
-        "hcarb",
-    ]
-    var_stats = {}
-    for name in _VARS:
-        if not hasattr(model, name):
-            logger.debug(f"    Variable '{name}' not in model, skipping.")
-            continue
-        df = _var_to_df(getattr(model, name))
-        if df.empty:
-            continue
-        df.to_csv(vars_dir / f"{name}.csv", index=False)
-        var_stats[name] = _numeric_stats(df["value"])
-        logger.info(f"    vars/{name}.csv ({len(df)} rows)")
-
-    # ── Duals ──
-    _CONSTRAINTS = [
-        "adequacy_constraint",
-        "gene_vre_constraint",
-        "gene_nmd_constraint",
-        "on_capa_constraint",
-        "gene_on_hmax_constraint",
-        "gene_on_hmin_constraint",
-        "yearly_maxON_constraint",
-        "nuc_maxON_constraint",
-        "on_off_constraint",
-        "cons_startup_constraint",
-        "cons_turnoff_constraint",
-        "ramping_up_constraint",
-        "stored_cap_constraint",
-        "stor_in_constraint",
-        "stor_out_constraint",
-        "storing_constraint",
-        "lake_res_constraint",
-        "reserves_constraint",
-        "no_FRR_contrib_constraint",
-        "trade_bal_constraint",
-        "icIM_constraint",
-        "exoIM_constraint",
-        "exoEX_constraint",
-    ]
-    dual_stats = {}
-    for name in _CONSTRAINTS:
-        if not hasattr(model, name):
-            logger.debug(f"    Constraint '{name}' not in model, skipping.")
-            continue
-        df = _dual_to_df(model, getattr(model, name))
-        if df.empty:
-            continue
-        short = name.replace("_constraint", "")
-        df.to_csv(duals_dir / f"{short}.csv", index=False)
-        dual_stats[name] = _numeric_stats(df["dual"])
-        logger.info(f"    duals/{short}.csv ({len(df)} rows)")
+    # Extraction (Pyomo, GIL-bound) stays in this thread; writing and
+    # compression run in the pool while the next family is extracted.
+    var_stats, dual_stats, tables = {}, {}, {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+        for name, table in selected:
+            if not solution.has(name):
+                logger.debug(f"    '{name}' not in model, skipping.")
+                continue
+            # Bound the frames in flight when writing is slower than extraction
+            if len(pending) >= max_workers:
+                _record_written(*pending.popleft(), tables, diag_dir)
+            df = solution.frame(name, keep=False)
+            if df.empty:
+                continue
+            column = "dual" if solution.is_dual(name) else "value"
+            area_col, hour_col = _axis_columns(solution.model, df)
+            df = _filter_rows(df, area_col, hour_col, areas, hour_range)
+            stats = dual_stats if column == "dual" else var_stats
+            stats[name] = _numeric_stats(df[column])
+            if column == "dual" and nonzero_duals:
+                df = df[df["dual"] != 0]
+            out_dir = duals_dir if column == "dual" else vars_dir
+            job = pool.submit(
+                write_output, df, out_dir, table, output_format, index=False, partition_col=area_col
+            )
+            tables[table] = {
+                "family": name,
+                "value_column": column,
+                "area_column": area_col,
+                "hour_column": hour_col,
+                "rows": len(df),
+            }
+            pending.append((job, table))
+        while pending:
+            _record_written(*pending.popleft(), tables, diag_dir)
 
     # ── Summary JSON ──
-    summary = _build_summary(model, var_stats, dual_stats)
+    summary = _build_summary(solution, var_stats, dual_stats)
+    summary["format"] = output_format
+    summary["nonzero_duals_only"] = nonzero_duals
+    summary["filters"] = {
+        "families": None if families is None else [table for _, table in selected],
+        "areas": None if areas is None else list(areas),
+        "hours": None if hour_range is None else list(hour_range),
+    }
+    summary["tables"] = tables
     with open(diag_dir / "_summary.json", "w") as f:
         json.dump(summary, f, indent=2)
     logger.info("    _summary.json")
@@ -129,40 +207,69 @@ def export_all_diagnostics(model, run_dir):
 # ── Helpers ──
 
 
-def _var_to_df(var) -> pd.DataFrame:
-    """Flatten a Pyomo Var to a DataFrame.
+def _record_written(job, table, tables, diag_dir):
+    """Wait for a table's write and record its path in ``tables``."""
+    path = job.result()
+    tables[table]["path"] = path.relative_to(diag_dir).as_posix()
+    logger.info(f"    {tables[table]['path']} ({tables[table]['rows']} rows)")
+
 
-    Columns: idx0[, idx1, idx2, ...], value.
-    Scalar keys are wrapped in a tuple for uniform handling.
-    None values (fixed or inactive variables) are kept as NaN.
+def _table_name(family):
+    """Table name of a family: the variable name, or the constraint name without _constraint."""
+    return family.replace("_constraint", "")
+
+
+def _select_families(families):
+    """(family, table name) pairs to export, in export order.
+
+    Raises:
+        ValueError: If a requested name is not a known variable or constraint.
     """
-    rows = []
-    for k, v in var.items():
-        key = k if isinstance(k, tuple) else (k,)
-        rows.append((*key, v.value))
-    if not rows:
-        return pd.DataFrame()
-    n_idx = len(rows[0]) - 1
-    idx_cols = [f"idx{i}" for i in range(n_idx)]
-    return pd.DataFrame(rows, columns=idx_cols + ["value"])
-
-
-def _dual_to_df(model, constraint) -> pd.DataFrame:
-    """Flatten constraint duals to a DataFrame.
-
-    Columns: idx0[, idx1, idx2, ...], dual.
-    Missing duals (non-active constraints) default to 0.0.
+    known = [(name, _table_name(name)) for name in _VARS + _CONSTRAINTS]
+    if families is None:
+        return known
+    wanted = set(families)
+    unknown = wanted - {name for pair in known for name in pair}
+    if unknown:
+        raise ValueError(
+            f"Unknown diagnostics families: {sorted(unknown)}. "
+            f"Choose from {[table for _, table in known]}"
+        )
+    return [(name, table) for name, table in known if name in wanted or table in wanted]
+
+
+def _axis_columns(model, df):
+    """(area column, hour column) of a family's table, None where absent.
+
+    The area column is the first index column whose labels are all areas
+    (modeled or exogenous); the hour column the first integer column whose
+    labels are all model hours.
     """
-    dual_dict = dict(model.dual)
-    rows = []
-    for k, c in constraint.items():
-        key = k if isinstance(k, tuple) else (k,)
-        rows.append((*key, dual_dict.get(c, 0.0)))
-    if not rows:
-        return pd.DataFrame()
-    n_idx = len(rows[0]) - 1
-    idx_cols = [f"idx{i}" for i in range(n_idx)]
-    return pd.DataFrame(rows, columns=idx_cols + ["dual"])
+    area_labels = set(getattr(model, "a", ())) | set(getattr(model, "exo_a", ()))
+    hour_labels = set(getattr(model, "h", ()))
+    area_col = hour_col = None
+    for col in [c for c in df.columns if c.startswith("idx")]:
+        level = pd.Index(df[col].unique())
+        if area_col is None and area_labels and level.isin(area_labels).all():
+            area_col = col
+        elif (
+            hour_col is None
+            and hour_labels
+            and pd.api.types.is_integer_dtype(level)
+            and level.isin(hour_labels).all()
+        ):
+            hour_col = col
+    return area_col, hour_col
+
+
+def _filter_rows(df, area_col, hour_col, areas, hour_range):
+    """Rows of the requested areas and hours (filters without a column are ignored)."""
+    mask = pd.Series(True, index=df.index)
+    if areas is not None and area_col is not None:
+        mask &= df[area_col].isin(list(areas))
+    if hour_range is not None and hour_col is not None:
+        mask &= df[hour_col].between(hour_range[0], hour_range[1] - 1)
+    return df if mask.all() else df[mask].reset_index(drop=True)
 
 
 def _numeric_stats(series: pd.Series) -> dict:
@@ -181,14 +288,13 @@ def _numeric_stats(series: pd.Series) -> dict:
     }
 
 
-def _build_summary(model, var_stats: dict, dual_stats: dict) -> dict:
+def _build_summary(solution, var_stats: dict, dual_stats: dict) -> dict:
     """Build a JSON-serialisable summary dict for the solved model."""
-    total_cost = pyo.value(model.objective)
+    model = solution.model
+    total_cost = solution.objective
 
     # CO2: sum hcarb if present
-    total_co2 = None
-    if hasattr(model, "hcarb"):
-        total_co2 = float(sum(v.value for v in model.hcarb.values() if v.value is not None))
+    total_co2 = solution.total("hcarb") if solution.has("hcarb") else None
 
     # Sets info
     sets_info = {}
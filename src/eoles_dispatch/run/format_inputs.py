@@ -7,9 +7,10 @@ and formats everything for the Pyomo model.
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from ..utils import to_posix_hours
+from ..utils import shift_hours_to_year, to_posix_hours
 from .compute import (
     compute_hydro_limits,
     compute_lake_inflows,
@@ -22,7 +23,16 @@ from .compute import (
 
 
 def load_tv_inputs(
-    data_dir, simul_year, areas, exo_areas, hour_month, hour_week, actCF=False, rn_horizon="current"
+    data_dir,
+    simul_year,
+    areas,
+    exo_areas,
+    hour_month,
+    hour_week,
+    actCF=False,
+    rn_horizon="current",
+    weather_year=None,
+    ninja=None,
 ):
     """Load all time-varying inputs from year-based data and compute derived variables.
 
@@ -39,6 +49,11 @@ def load_tv_inputs(
         hour_week: DataFrame with columns ['hour', 'week'] (POSIX hours).
         actCF: Use actual historical capacity factors instead of Renewable Ninja.
         rn_horizon: Renewables.ninja wind fleet ("current" or "future").
+        weather_year: Read Renewables.ninja profiles from this weather year
+            instead of the simulation year (demand, NMD and hydro still come
+            from simul_year). Ignored with actCF.
+        ninja: Optional pre-loaded ninja tables (see load_ninja_frames), to
+            avoid re-reading them when building many runs.
 
     Returns:
         Dict with keys: demand, nmd, exoPrices, vre_profiles, hour_month,
@@ -90,18 +105,14 @@ def load_tv_inputs(
             technologies=["offshore", "onshore", "solar"],
         )
     else:
-        offshore = _load_ninja_var(data_dir, f"offshore_{rn_horizon}", areas, valid_hours)
-        onshore = _load_ninja_var(data_dir, f"onshore_{rn_horizon}", areas, valid_hours)
-        solar = _load_ninja_var(data_dir, "solar", areas, valid_hours)
-        offshore["tec"] = "offshore"
-        onshore["tec"] = "onshore"
-        solar["tec"] = "solar"
-        vre_profiles = pd.concat(
-            [
-                offshore[["area", "tec", "hour", "value"]],
-                onshore[["area", "tec", "hour", "value"]],
-                solar[["area", "tec", "hour", "value"]],
-            ]
+        vre_profiles = load_ninja_profiles(
+            data_dir,
+            areas,
+            valid_hours,
+            rn_horizon=rn_horizon,
+            simul_year=simul_year,
+            weather_year=weather_year,
+            ninja=ninja,
         )
 
     # River CF: always from production, installed_capa used if available
@@ -149,6 +160,81 @@ def load_tv_inputs(
     }
 
 
+def load_ninja_profiles(
+    data_dir,
+    areas,
+    valid_hours,
+    rn_horizon="current",
+    simul_year=None,
+    weather_year=None,
+    ninja=None,
+):
+    """Load Renewables.ninja offshore/onshore/solar profiles for the simulation hours.
+
+    Args:
+        data_dir: Path to the data/ directory.
+        areas: List of area codes.
+        valid_hours: Set of POSIX hours of the simulation period.
+        rn_horizon: Renewables.ninja wind fleet ("current" or "future").
+        simul_year: Simulation year (required with weather_year).
+        weather_year: If set, profiles are read from the same calendar hours
+            of this year and relabelled onto the simulation hours.
+        ninja: Optional pre-loaded ninja tables (see load_ninja_frames).
+
+    Returns:
+        DataFrame with columns ['area', 'tec', 'hour', 'value'].
+    """
+    frames = []
+    for tec, variable in [
+        ("offshore", f"offshore_{rn_horizon}"),
+        ("onshore", f"onshore_{rn_horizon}"),
+        ("solar", "solar"),
+    ]:
+        df = _load_ninja_var(
+            data_dir,
+            variable,
+            areas,
+            valid_hours,
+            simul_year=simul_year,
+            weather_year=weather_year,
+            ninja=ninja,
+        )
+        df["tec"] = tec
+        frames.append(df[["area", "tec", "hour", "value"]])
+    return pd.concat(frames)
+
+
+def load_ninja_frames(data_dir, rn_horizon="current"):
+    """Read the Renewables.ninja tables used by a run once, indexed by POSIX hour.
+
+    The result can be passed as ``ninja`` to load_tv_inputs/load_ninja_profiles
+    to slice many periods or weather years without re-reading the CSVs.
+    """
+    variables = [f"offshore_{rn_horizon}", f"onshore_{rn_horizon}", "solar"]
+    return {v: _read_ninja_table(data_dir, v) for v in variables}
+
+
+def with_weather_year(tv_data, data_dir, areas, simul_year, weather_year, rn_horizon, ninja=None):
+    """Return a copy of tv_data whose Renewables.ninja profiles come from weather_year.
+
+    Everything else (demand, NMD, hydro, river profiles...) is shared with
+    the original dict, so building one run per weather year only costs the
+    VRE slice.
+    """
+    vre = tv_data["vre_profiles"]
+    ninja_vre = load_ninja_profiles(
+        data_dir,
+        areas,
+        set(tv_data["hours"]),
+        rn_horizon=rn_horizon,
+        simul_year=simul_year,
+        weather_year=weather_year,
+        ninja=ninja,
+    )
+    other = vre[~vre["tec"].isin(["offshore", "onshore", "solar"])]
+    return {**tv_data, "vre_profiles": pd.concat([ninja_vre, other])}
+
+
 def save_inputs(run_dir, tv_data, scenario_data, areas, exo_areas):
     """Save all formatted inputs as CSVs to the run's input directory."""
     input_dir = Path(run_dir) / "inputs"
@@ -212,39 +298,82 @@ def _load_year_timeseries(label, data_dir, year, areas):
     return result
 
 
-def _load_ninja_var(data_dir, variable, areas, valid_hours):
+def _load_ninja_var(
+    data_dir, variable, areas, valid_hours, simul_year=None, weather_year=None, ninja=None
+):
     """Load a Renewable Ninja capacity factor variable.
 
-    Reads from data/renewable_ninja/<variable>.csv and filters to the
-    requested hours.
+    Reads from data/renewable_ninja/<variable>.csv (or the pre-loaded
+    ``ninja`` tables) and filters to the requested hours. With a
+    weather_year, the same calendar hours of that year are read instead and
+    relabelled onto valid_hours.
 
     Args:
         data_dir: Path to the data/ directory.
         variable: Ninja variable name (e.g. "offshore_current").
         areas: List of area codes.
         valid_hours: Set or array of POSIX hours to keep.
+        simul_year: Simulation year (required with weather_year).
+        weather_year: Optional weather year to read the profiles from.
+        ninja: Optional {variable: DataFrame indexed by POSIX hour}.
 
     Returns:
         DataFrame with columns ['area', 'hour', 'value'] (POSIX hours).
     """
-    csv_path = Path(data_dir) / "renewable_ninja" / f"{variable}.csv"
-    if not csv_path.exists():
-        raise FileNotFoundError(
-            f"Renewable Ninja data not found at {csv_path}. "
-            f"Run 'eoles-dispatch collect --source ninja' to download."
-        )
-    df = pd.read_csv(csv_path)
-    df["hour"] = to_posix_hours(pd.to_datetime(df["hour"]))
-    df = df[df["hour"].isin(valid_hours)]
+    table = ninja.get(variable) if ninja is not None else None
+
+    if weather_year is None or weather_year == simul_year:
+        if table is None:
+            table = _read_ninja_table(data_dir, variable, min(valid_hours), max(valid_hours))
+        df = table[table.index.isin(valid_hours)]
+    else:
+        if simul_year is None:
+            raise ValueError("simul_year is required to read profiles from a weather year")
+        target = np.sort(np.fromiter(valid_hours, dtype=np.int64))
+        source = shift_hours_to_year(target, simul_year, weather_year)
+        if table is None:
+            table = _read_ninja_table(data_dir, variable, source.min(), source.max())
+        df = table.reindex(source)
+        df = df[df[areas].notna().any(axis=1).to_numpy()] if len(df) else df
+        if len(df) < len(target):
+            raise ValueError(
+                f"Weather year {weather_year} is not fully covered by '{variable}' "
+                f"({len(target) - len(df)} hours missing)."
+            )
+        df.index = target
     if df.empty:
         raise ValueError(
             f"No data for '{variable}' in the requested period. "
             f"Run 'eoles-dispatch collect --source ninja' to download data."
         )
-    melted = pd.melt(df, id_vars=["hour"], value_vars=areas, var_name="area", value_name="value")
+    melted = pd.melt(
+        df.rename_axis("hour").reset_index(),
+        id_vars=["hour"],
+        value_vars=areas,
+        var_name="area",
+        value_name="value",
+    )
     return melted[["area", "hour", "value"]]
 
 
+def _read_ninja_table(data_dir, variable, start_hour=None, end_hour=None):
+    """Read an hour range of data/renewable_ninja/<variable> indexed by POSIX hour.
+
+    Goes through the indexed binary store (see collect/rninja.py), so only
+    the years overlapping [start_hour, end_hour] are read.
+    """
+    from ..collect.rninja import read_ninja_store
+
+    ninja_dir = Path(data_dir) / "renewable_ninja"
+    try:
+        return read_ninja_store(ninja_dir, variable, start_hour, end_hour)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Renewable Ninja data not found at {ninja_dir / f'{variable}.csv'}. "
+            f"Run 'eoles-dispatch collect --source ninja' to download."
+        ) from None
+
+
 # ── Filtering helper ──
 
 
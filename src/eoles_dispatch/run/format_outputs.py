@@ -1,4 +1,12 @@
-"""Extract and format model results into CSV files."""
+"""Extract and format model results into output tables (CSV, Parquet or Arrow).
+
+Reports take the SolutionView built once after the solve (solution.py), or a
+solved model, which is then wrapped in a view. They read the variables they
+need as dense NumPy arrays shaped by their index sets (area × tec × hour,
+...) and compute their columns by slicing and summing those arrays; a
+variable used by several reports (im, ex, hcarb) is read from Pyomo once.
+Tables are written by output_io.write_output in the run's output format.
+"""
 
 import datetime
 import logging
@@ -9,9 +17,10 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import pyomo.environ as pyo
 
 from ..config import DEFAULT_AREAS, MODEL_TO_AGG, TRLOSS
+from .output_io import write_output
+from .solution import SolutionView
 
 logger = logging.getLogger(__name__)
 
@@ -19,80 +28,64 @@ logger = logging.getLogger(__name__)
 # ── Report generators ──
 
 
-def report_prices(model, run_dir):
+def report_prices(solution, run_dir, output_format="csv"):
     """Extract hourly marginal prices (dual of adequacy constraint) for each area."""
+    solution = SolutionView.of(solution)
+    model = solution.model
     output_dir = _ensure_output_dir(run_dir)
 
     areas = [a for a in DEFAULT_AREAS if a in model.a]
     hours = sorted(model.h)
+    duals = solution.array("adequacy_constraint", areas, hours)
 
-    # Build all (area, hour) keys and extract duals in bulk
-    keys = [(a, h) for a in areas for h in hours]
-    duals = _extract_duals_bulk(model, model.adequacy_constraint, keys)
-
-    # Reshape into DataFrame: rows=hours, columns=areas
-    n_hours = len(hours)
-    data = {}
-    for i, a in enumerate(areas):
-        data[a] = duals[i * n_hours : (i + 1) * n_hours]
-
-    prices = pd.DataFrame(data, index=hours)
+    # Rows=hours, columns=areas
+    prices = pd.DataFrame(duals.T, index=hours, columns=areas)
     prices.index.name = "hour"
-    prices.to_csv(output_dir / "prices.csv", index=True)
+    write_output(prices, output_dir, "prices", output_format)
 
 
-def report_production(model, run_dir):
+def report_production(solution, run_dir, output_format="csv"):
     """Extract hourly production by technology and area."""
+    solution = SolutionView.of(solution)
+    model = solution.model
     output_dir = _ensure_output_dir(run_dir)
-    n_rows = len(model.a) * len(model.h)
-
-    gene_vals = _extract_var_values_bulk(model.gene)
-    stor_vals = _extract_var_values_bulk(model.storage)
-    im_vals = _extract_var_values_bulk(model.im)
-    ex_vals = _extract_var_values_bulk(model.ex)
-    exo_im_vals = _extract_var_values_bulk(model.exo_im)
-    exo_ex_vals = _extract_var_values_bulk(model.exo_ex)
 
     areas = [a for a in DEFAULT_AREAS if a in model.a]
+    exo_areas = list(model.exo_a)
     hours = sorted(model.h)
+    model_tecs = list(MODEL_TO_AGG)
+
+    # Dense (area, tec|trader, hour) arrays, one pass per variable
+    gene = solution.array("gene", areas, model_tecs, hours)
+    storage = solution.array("storage", areas, ["lake_phs", "battery"], hours)
+    im = solution.array("im", areas, areas, hours)
+    ex = solution.array("ex", areas, areas, hours)
+    exo_im = solution.array("exo_im", areas, exo_areas, hours)
+    exo_ex = solution.array("exo_ex", areas, exo_areas, hours)
 
     production = pd.DataFrame(
         {"area": np.repeat(areas, len(hours), axis=0), "hour": hours * len(areas)}
     )
 
     # Aggregate generation using MODEL_TO_AGG: group model techs by agg name and sum
-    agg_groups = defaultdict(lambda: np.zeros(n_rows))
-    for model_tec, agg_name in MODEL_TO_AGG.items():
-        agg_groups[agg_name] += _safe_gene_values(gene_vals, model_tec, n_rows, areas, hours)
-    for agg_name, values in agg_groups.items():
-        production[agg_name] = values.tolist()
+    agg_groups = defaultdict(list)
+    for i, agg_name in enumerate(MODEL_TO_AGG.values()):
+        agg_groups[agg_name].append(i)
+    for agg_name, tec_idx in agg_groups.items():
+        production[agg_name] = gene[:, tec_idx, :].sum(axis=1).ravel()
 
     # Storage charging (negative = consumption)
-    production["phs_in"] = (-_safe_var_values(stor_vals, "lake_phs", n_rows, areas, hours)).tolist()
-    production["battery_in"] = (
-        -_safe_var_values(stor_vals, "battery", n_rows, areas, hours)
-    ).tolist()
-
-    # Net imports per area: sum over all trading partners
-    exo_areas = list(model.exo_a)
-    n_hours = len(hours)
-    net_imports_list = []
-    for a in areas:
-        area_net = np.zeros(n_hours)
-        # Imports from other modeled areas
-        for trader in areas:
-            if trader == a:
-                continue
-            area_net += np.array([im_vals.get((a, trader, h), 0) or 0.0 for h in hours])
-            area_net -= np.array([ex_vals.get((a, trader, h), 0) or 0.0 for h in hours])
-        # Imports from exogenous areas
-        for trader in exo_areas:
-            area_net += np.array([exo_im_vals.get((a, trader, h), 0) or 0.0 for h in hours])
-            area_net -= np.array([exo_ex_vals.get((a, trader, h), 0) or 0.0 for h in hours])
-        net_imports_list.append(area_net)
-    net_imports_arr = np.concatenate(net_imports_list)
-    production["net_imports"] = np.maximum(net_imports_arr, 0).tolist()
-    production["net_exports"] = np.minimum(net_imports_arr, 0).tolist()
+    production["phs_in"] = -storage[:, 0, :].ravel()
+    production["battery_in"] = -storage[:, 1, :].ravel()
+
+    # Net imports per area: sum over all trading partners (no trade with itself)
+    diagonal = np.arange(len(areas))
+    im[diagonal, diagonal] = 0.0
+    ex[diagonal, diagonal] = 0.0
+    net_imports = im.sum(axis=1) - ex.sum(axis=1) + exo_im.sum(axis=1) - exo_ex.sum(axis=1)
+    net_imports = net_imports.ravel()
+    production["net_imports"] = np.maximum(net_imports, 0)
+    production["net_exports"] = np.minimum(net_imports, 0)
 
     production = production.set_index(["area", "hour"])
 
@@ -107,58 +100,63 @@ def report_production(model, run_dir):
         .squeeze(axis=1)
     )
     production = production.join(demand)
-    production.to_csv(output_dir / "production.csv", index=True)
+    write_output(production, output_dir, "production", output_format)
 
 
-def report_capa_on(model, run_dir):
+def report_capa_on(solution, run_dir, output_format="csv"):
     """Extract hourly online thermal capacity by technology and area."""
-    if not hasattr(model, "on"):
+    solution = SolutionView.of(solution)
+    model = solution.model
+    if not solution.has("on"):
         logger.warning("report_capa_on skipped: model has no 'on' variable (static_thermal model)")
         return
 
     output_dir = _ensure_output_dir(run_dir)
-    n_rows = len(model.a) * len(model.h)
-    on_vals = _extract_var_values_bulk(model.on)
     thr_tecs = list(model.thr)
-
-    capa_on = pd.DataFrame(index=range(n_rows))
     areas = [a for a in DEFAULT_AREAS if a in model.a]
     hours = sorted(model.h)
-    capa_on["area"] = np.repeat(areas, len(hours), axis=0)
-    capa_on["hour"] = hours * len(areas)
-    for thr in thr_tecs:
-        capa_on[thr] = _safe_var_values(on_vals, thr, n_rows, areas, hours).tolist()
+    on = solution.array("on", areas, thr_tecs, hours)
+
+    capa_on = pd.DataFrame(
+        {"area": np.repeat(areas, len(hours), axis=0), "hour": hours * len(areas)}
+    )
+    for i, thr in enumerate(thr_tecs):
+        capa_on[thr] = on[:, i, :].ravel()
     capa_on = capa_on.set_index(["area", "hour"])
-    capa_on.to_csv(output_dir / "capa_on.csv", index=True)
+    write_output(capa_on, output_dir, "capa_on", output_format)
 
 
-def report_FRtrade(model, run_dir):
+def report_FRtrade(solution, run_dir, output_format="csv"):
     """Extract France's hourly net imports from each trading partner."""
+    solution = SolutionView.of(solution)
+    model = solution.model
     output_dir = _ensure_output_dir(run_dir)
     hours = sorted(model.h)
     partners = sorted(a for a in model.a if a != "FR")
-    im_vals = _extract_var_values_bulk(model.im)
-    ex_vals = _extract_var_values_bulk(model.ex)
+    im = solution.array("im", ["FR"], partners, hours)[0]
+    ex = solution.array("ex", ["FR"], partners, hours)[0]
+
+    FRtrade = pd.DataFrame((im * (1 - TRLOSS) - ex).T, index=hours, columns=partners)
+    FRtrade.index.name = "hour"
+    write_output(FRtrade, output_dir, "FRtrade", output_format)
 
-    FRtrade = pd.DataFrame({"hour": hours})
-    for a in partners:
-        im_arr = np.array([im_vals.get(("FR", a, h), 0) or 0.0 for h in hours])
-        ex_arr = np.array([ex_vals.get(("FR", a, h), 0) or 0.0 for h in hours])
-        FRtrade[a] = (im_arr * (1 - TRLOSS) - ex_arr).tolist()
-    FRtrade = FRtrade.set_index("hour")
-    FRtrade.to_csv(output_dir / "FRtrade.csv", index=True)
 
+def run_totals(solution):
+    """Return (total dispatch cost in bEUR, total CO2 emissions in MtCO2)."""
+    solution = SolutionView.of(solution)
+    # Cost unit: hcost is in kEUR/h (EUR/MWh × GW), summed over all hours → kEUR total.
+    total_cost = solution.objective
+    total_co2 = solution.total("hcarb")
+
+    return round(total_cost / 1e6, 6), round(total_co2 / 1e6, 6)
 
-def write_log(run_dir, model, run_name, scenario, year, start_time, exec_str, **params):
+
+def write_log(run_dir, solution, run_name, scenario, year, start_time, exec_str, **params):
     """Write a log file summarizing the run parameters and results."""
     run_path = Path(run_dir)
     run_path.mkdir(parents=True, exist_ok=True)
 
-    total_cost = pyo.value(model.objective)
-
-    # Extract CO2 in bulk instead of looping through 61k pyo.value() calls
-    hcarb_values = _extract_var_values_bulk(model.hcarb)
-    total_co2 = sum(v for v in hcarb_values.values() if v is not None)
+    total_cost_beur, total_co2_mt = run_totals(solution)
 
     # Scenario file last modification date
     scenario_date = ""
@@ -167,10 +165,6 @@ def write_log(run_dir, model, run_name, scenario, year, start_time, exec_str, **
         mod_time = os.path.getmtime(scenario_file)
         scenario_date = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
 
-    # Cost unit: hcost is in kEUR/h (EUR/MWh × GW), summed over all hours → kEUR total.
-    # Convert to billion EUR for display.
-    total_cost_beur = total_cost / 1e6
-
     with open(run_path / f"_log_{run_name}.txt", "w") as f:
         f.write(f"RUN NAME = {run_name}\n")
         f.write(f"Scenario file: {scenario}\n")
@@ -178,7 +172,7 @@ def write_log(run_dir, model, run_name, scenario, year, start_time, exec_str, **
             f.write(f"\t last modified on {scenario_date}\n")
         f.write(f"Year simulated: {year}\n\n")
         f.write(f"Total dispatch cost: {total_cost_beur:.2f} bEUR\n")
-        f.write(f"Total CO2 emissions: {total_co2 / 1e6:.2f} MtCO2\n\n")
+        f.write(f"Total CO2 emissions: {total_co2_mt:.2f} MtCO2\n\n")
         f.write(f"Started running at: {time.asctime(start_time)}\n")
         f.write(f"Execution time: {exec_str}\n")
 
@@ -190,54 +184,3 @@ def _ensure_output_dir(run_dir):
     output_dir = Path(run_dir) / "outputs"
     output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir
-
-
-def _extract_duals_bulk(model, constraint, keys):
-    """Extract dual values for a constraint in bulk.
-
-    Uses Pyomo's internal suffix dict to read all duals at once instead of
-    looping through Python one-by-one, which is orders of magnitude faster
-    on large models.
-
-    Args:
-        model: Solved Pyomo model with dual suffix.
-        constraint: Indexed constraint component (e.g. model.adequacy_constraint).
-        keys: Iterable of index tuples to extract.
-
-    Returns:
-        List of dual values in the same order as keys.
-    """
-    dual_dict = dict(model.dual)
-    return [dual_dict.get(constraint[k], 0.0) for k in keys]
-
-
-def _extract_var_values_bulk(var):
-    """Extract all values from a Pyomo Var as a dict, in bulk.
-
-    Much faster than repeated pyo.value() calls.
-    """
-    return {k: v.value for k, v in var.items()}
-
-
-def _safe_gene_values(gene_vals, tec, n_rows, areas, hours):
-    """Extract generation values for a technology, returning zeros if it doesn't exist.
-
-    Values are returned in the order defined by areas × hours to ensure
-    consistency with the DataFrame labels.
-    """
-    keys = {k for k in gene_vals if k[1] == tec}
-    if not keys:
-        return np.zeros(n_rows)
-    return np.array([gene_vals.get((a, tec, h), 0) or 0.0 for a in areas for h in hours])
-
-
-def _safe_var_values(var_vals, tec, n_rows, areas, hours):
-    """Extract variable values for a technology, returning zeros if it doesn't exist.
-
-    Values are returned in the order defined by areas × hours to ensure
-    consistency with the DataFrame labels.
-    """
-    keys = {k for k in var_vals if k[1] == tec}
-    if not keys:
-        return np.zeros(n_rows)
-    return np.array([var_vals.get((a, tec, h), 0) or 0.0 for a in areas for h in hours])
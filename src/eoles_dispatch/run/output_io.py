@@ -0,0 +1,178 @@
+"""Read and write run output tables in CSV, Parquet or Arrow format.
+
+Reports (format_outputs.py) write each table through write_output, in the
+format chosen at solve time (solve --output-format):
+
+    csv       outputs/<name>.csv        text, as before (default)
+    parquet   outputs/<name>.parquet    zstd-compressed Parquet; tables with
+                                        an 'area' column (production, capa_on)
+                                        are partitioned by area, as a
+                                        directory <name>.parquet/area=XX/
+                                        (diagnostics: by their area index
+                                        column, e.g. idx0=XX/)
+    arrow     outputs/<name>.arrow      zstd-compressed Arrow IPC (Feather v2)
+
+Columnar tables keep 'hour' as int64 and text columns ('area', and the
+technology/area labels of diagnostics) as categorical columns.
+Writing a table removes the copies of it in the other formats, so a run has
+a single version of each output.
+
+Readers (viz charts, ensemble summaries) call read_output, which finds
+whichever format exists and returns the same DataFrame as pd.read_csv on the
+CSV file ('area' and 'hour' as plain columns; rows of partitioned Parquet
+come grouped by area). For partitioned Parquet, only the requested areas
+are read.
+
+The columnar formats need pyarrow (pip install "eoles-dispatch[parquet]").
+
+Called from:
+    - format_outputs.py             report_* (write_output).
+    - export_diagnostics.py         export_all_diagnostics (write_output).
+    - warehouse.py                  ingestion of prices and production.
+    - ensemble.py                   price_distribution (runs outside a project).
+    - results.py                    RunResult tables.
+    - viz/charts_outputs.py         price and production charts.
+
+Functions:
+    write_output(df, output_dir, name, output_format="csv", index=True, partition_col="area")
+        Write a table (indexed as in the CSV, or flat) in the given format.
+
+    output_path(run_dir, name)
+        Path of the existing output file/directory, or None.
+
+    check_output_format(output_format)
+        Validate a format name and its dependencies (before solving).
+
+    read_output(run_dir, name, areas=None, columns=None)
+        Load an output table from whichever format exists (None if absent).
+"""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+OUTPUT_FORMATS = ("csv", "parquet", "arrow")
+
+# File suffix per format, in the order read_output looks for them
+_SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+
+_COMPRESSION = "zstd"
+
+
+def check_output_format(output_format):
+    """Raise if ``output_format`` is unknown or its dependencies are missing."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output_format}'. Choose from {OUTPUT_FORMATS}")
+    if output_format != "csv":
+        _require_pyarrow(output_format)
+
+
+def write_output(df, output_dir, name, output_format="csv", index=True, partition_col="area"):
+    """Write a report table as <output_dir>/<name>.<format>.
+
+    Args:
+        df: Table indexed as in the CSV output (e.g. area × hour, or hour).
+        output_dir: Destination directory (the run's outputs/, or a
+            diagnostics/ subdirectory).
+        name: Table name ("prices", "production", ...).
+        output_format: "csv", "parquet" or "arrow".
+        index: Whether the index holds columns of the table (False for flat
+            tables such as the diagnostics).
+        partition_col: Column partitioning Parquet tables that have it (the
+            area index column of diagnostics tables); None for a single file.
+
+    Returns:
+        Path written.
+    """
+    check_output_format(output_format)
+    output_dir = Path(output_dir)
+    path = output_dir / f"{name}{_SUFFIXES[output_format]}"
+    for suffix in _SUFFIXES.values():
+        _remove(output_dir / f"{name}{suffix}")
+
+    if output_format == "csv":
+        df.to_csv(path, index=index)
+        return path
+
+    table = df.reset_index() if index else df.reset_index(drop=True)
+    if "hour" in table.columns:
+        table["hour"] = table["hour"].astype("int64")
+    for col in table.columns:
+        if pd.api.types.is_string_dtype(table[col]):
+            table[col] = table[col].astype("category")
+    if output_format == "arrow":
+        table.to_feather(path, compression=_COMPRESSION)
+    elif partition_col is not None and partition_col in table.columns:
+        table.to_parquet(
+            path, compression=_COMPRESSION, index=False, partition_cols=[partition_col]
+        )
+    else:
+        table.to_parquet(path, compression=_COMPRESSION, index=False)
+    return path
+
+
+def output_path(run_dir, name):
+    """Path of outputs/<name> in the first format found, or None."""
+    for suffix in _SUFFIXES.values():
+        path = Path(run_dir) / "outputs" / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def read_output(run_dir, name, areas=None, columns=None):
+    """Load an output table, whatever format it was written in.
+
+    Args:
+        run_dir: Run directory.
+        name: Table name ("prices", "production", ...).
+        areas: For tables with an 'area' column, keep only these areas (only
+            their partitions are read from partitioned Parquet).
+        columns: Columns to load (all if None).
+
+    Returns:
+        DataFrame as pd.read_csv would return it for the CSV output, or None
+        if the table does not exist in any format.
+    """
+    path = output_path(run_dir, name)
+    if path is None:
+        return None
+
+    if path.suffix == ".csv":
+        df = pd.read_csv(path, usecols=columns)
+    else:
+        _require_pyarrow(path.suffix[1:])
+        if path.suffix == ".arrow":
+            df = pd.read_feather(path, columns=columns)
+        else:
+            filters = [("area", "in", list(areas))] if areas is not None and path.is_dir() else None
+            df = pd.read_parquet(path, columns=columns, filters=filters)
+        if "area" in df.columns:
+            # Partition columns come last: restore the CSV column order
+            df["area"] = df["area"].astype(str)
+            df = df[["area"] + [c for c in df.columns if c != "area"]]
+
+    if areas is not None and "area" in df.columns:
+        df = df[df["area"].isin(areas)].reset_index(drop=True)
+    return df
+
+
+# ── Helpers ──
+
+
+def _remove(path):
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def _require_pyarrow(output_format):
+    """Raise an ImportError naming the extra to install if pyarrow is missing."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            f"{output_format} outputs require pyarrow: pip install 'eoles-dispatch[parquet]'"
+        ) from None
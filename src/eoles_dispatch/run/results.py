@@ -0,0 +1,512 @@
+"""Programmatic access to a run's results as labeled, memory-mapped arrays.
+
+load_run returns a RunResult whose tables (prices, production, capa_on,
+trade, hourly inputs) are read on first access only, as LabeledArrays:
+dense NumPy arrays with named dimensions and their labels, hour last
+(area × hour, area × tec × hour, ...).
+
+The first access parses the table (output_io.read_output for outputs, in
+any format; the headerless CSV for inputs) and stores the dense array as
+<run>/.cache/<table>.npy with its labels; later accesses, from any process,
+memory-map that file instead of parsing again. A cached array is rebuilt
+when the table it comes from changes (modification time or size). Arrays
+are area-major, so selecting one area is a view of the mapped file:
+stacking one area's prices over hundreds of runs costs one copy into the
+result, without parsing anything.
+
+Time aggregations are vectorized over the hour axis, on the CET calendar
+used across the project: daily / monthly means or sums (np.*.reduceat over
+contiguous days or months), and peak / off-peak selections (weekdays,
+PEAK_HOURS CET), which compose, e.g. result.prices.peak().monthly().
+
+Example:
+    import eoles_dispatch
+
+    run = eoles_dispatch.load_run("my_run")
+    fr = run.prices.sel(area="FR")              # hourly FR prices (mapped view)
+    run.production.sel(area="FR", tec="nuclear").daily(how="sum")
+    eoles_dispatch.stack_runs(["run_a", "run_b"], "prices", area="FR")
+
+Called from:
+    - eoles_dispatch/__init__.py    (load_run, stack_runs, RunResult re-exported).
+
+Delegates to:
+    - output_io.py      read_output, output_path.
+    - utils.py          posix_hours_to_dt, CET.
+
+Classes:
+    LabeledArray(values, dims, coords)
+        sel(**labels)               Select labels along dimensions (views when possible).
+        peak() / offpeak()          Keep the peak / off-peak hours.
+        daily(how) / monthly(how)   Aggregate hours per CET day / month.
+        datetime                    UTC timestamps of the hour labels.
+        to_pandas()                 Series / DataFrame in the layout of the output CSVs.
+
+    RunResult(run_dir)
+        metadata                    run.yaml contents.
+        prices / production / capa_on / trade
+                                    Output tables (None if not generated).
+        output(name)                Any output table.
+        inputs(name, dims=None)     An input table (demand, nmd, vre_profiles, ...).
+
+Functions:
+    load_run(run, project_dir=None)
+        RunResult of a run, by name or directory.
+
+    stack_runs(runs, table="prices", project_dir=None, **labels)
+        One table selection over many runs, as a run × ... array.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ..config import PEAK_HOURS, RESULTS_CACHE_DIR
+from ..utils import CET, posix_hours_to_dt
+from .output_io import output_path, read_output
+
+logger = logging.getLogger(__name__)
+
+# Dimensions of each output table, hour last. Dimensions that are not columns
+# of the table are spread across its value columns (areas of prices.csv,
+# technologies of production.csv, ...).
+_OUTPUT_DIMS = {
+    "prices": ("area", "hour"),
+    "production": ("area", "tec", "hour"),
+    "capa_on": ("area", "tec", "hour"),
+    "FRtrade": ("partner", "hour"),
+}
+
+# Dimensions of the headerless input tables, in file column order (the last
+# column holds the values).
+_INPUT_DIMS = {
+    "demand": ("area", "hour"),
+    "nmd": ("area", "hour"),
+    "exoPrices": ("area", "hour"),
+    "vre_profiles": ("area", "tec", "hour"),
+    "lake_inflows": ("area", "month"),
+}
+
+_REDUCERS = {"mean": np.add, "sum": np.add, "min": np.minimum, "max": np.maximum}
+
+
+# ── Labeled arrays ──
+
+
+class LabeledArray:
+    """Dense array with named dimensions and the labels along each of them.
+
+    Args:
+        values: NumPy array (possibly memory-mapped), one axis per dimension.
+        dims: Dimension names, e.g. ("area", "tec", "hour").
+        coords: {dimension: labels}, one label per position along it.
+    """
+
+    def __init__(self, values, dims, coords):
+        self.values = values
+        self.dims = tuple(dims)
+        self.coords = {dim: np.asarray(coords[dim]) for dim in self.dims}
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.values, dtype=dtype)
+
+    def __repr__(self):
+        sizes = ", ".join(f"{dim}: {len(self.coords[dim])}" for dim in self.dims)
+        return f"LabeledArray({sizes})"
+
+    def sel(self, **labels):
+        """Select labels along dimensions, e.g. sel(area="FR", tec=["gas", "coal"]).
+
+        A single label drops the dimension; a list keeps it. Single labels
+        are applied first and return views (of the mapped file for cached
+        arrays); lists copy the selected positions.
+
+        Raises:
+            KeyError: If a dimension or label is unknown.
+        """
+        unknown = set(labels) - set(self.dims)
+        if unknown:
+            raise KeyError(f"Unknown dimensions {sorted(unknown)}; array has {self.dims}")
+
+        index, dims, lists = [], [], []
+        for dim in self.dims:
+            if dim not in labels:
+                index.append(slice(None))
+                dims.append(dim)
+            elif np.ndim(labels[dim]) == 0:
+                index.append(int(self._positions(dim, [labels[dim]])[0]))
+            else:
+                index.append(slice(None))
+                dims.append(dim)
+                lists.append(dim)
+        values = self.values[tuple(index)]
+        coords = {dim: self.coords[dim] for dim in dims}
+        for dim in lists:
+            positions = self._positions(dim, labels[dim])
+            values = np.take(values, positions, axis=dims.index(dim))
+            coords[dim] = self.coords[dim][positions]
+        return LabeledArray(values, dims, coords)
+
+    @property
+    def datetime(self):
+        """UTC timestamps of the hour labels."""
+        return posix_hours_to_dt(self.coords[self._hour_dim()])
+
+    def peak(self):
+        """Hours of the peak product: weekdays, PEAK_HOURS CET."""
+        return self._select_hours(self._peak_mask())
+
+    def offpeak(self):
+        """Hours outside the peak product."""
+        return self._select_hours(~self._peak_mask())
+
+    def daily(self, how="mean"):
+        """Aggregate the hours of each CET day ("mean", "sum", "min" or "max")."""
+        days = self._local_times().tz_localize(None).values.astype("datetime64[D]")
+        return self._aggregate(days, "day", how)
+
+    def monthly(self, how="mean"):
+        """Aggregate the hours of each CET month ("mean", "sum", "min" or "max")."""
+        months = self._local_times().tz_localize(None).values.astype("datetime64[M]")
+        return self._aggregate(months, "month", how)
+
+    def to_pandas(self):
+        """Series or DataFrame laid out as the output CSVs.
+
+        1 dimension: Series indexed by it. 2 dimensions: rows = last dimension
+        (hour), columns = first (e.g. areas, as prices.csv). 3 dimensions:
+        rows = (first, last), columns = second (as production.csv).
+        """
+        values = np.asarray(self.values)
+        if values.ndim == 1:
+            return pd.Series(values, index=pd.Index(self.coords[self.dims[0]], name=self.dims[0]))
+        if values.ndim == 2:
+            rows, cols = self.dims[1], self.dims[0]
+            return pd.DataFrame(
+                values.T,
+                index=pd.Index(self.coords[rows], name=rows),
+                columns=pd.Index(self.coords[cols], name=cols),
+            )
+        if values.ndim == 3:
+            outer, cols, rows = self.dims
+            index = pd.MultiIndex.from_product(
+                [self.coords[outer], self.coords[rows]], names=[outer, rows]
+            )
+            return pd.DataFrame(
+                values.transpose(0, 2, 1).reshape(len(index), -1),
+                index=index,
+                columns=pd.Index(self.coords[cols], name=cols),
+            )
+        raise ValueError(f"to_pandas supports 1 to 3 dimensions, not {values.ndim}")
+
+    # ── Helpers ──
+
+    def _positions(self, dim, labels):
+        labels = list(labels)
+        if len(labels) == 1:
+            positions = np.flatnonzero(self.coords[dim] == labels[0])[:1]
+            if len(positions):
+                return positions
+        positions = pd.Index(self.coords[dim]).get_indexer(labels)
+        if (positions < 0).any():
+            missing = [label for label, pos in zip(labels, positions) if pos < 0]
+            raise KeyError(f"Labels {missing} not in dimension '{dim}'")
+        return positions
+
+    def _hour_dim(self):
+        if "hour" not in self.dims:
+            raise ValueError(f"Time selection needs an hour dimension; array has {self.dims}")
+        return "hour"
+
+    def _local_times(self):
+        return self.datetime.tz_convert(CET)
+
+    def _peak_mask(self):
+        local = self._local_times()
+        first, last = PEAK_HOURS
+        return np.asarray((local.weekday < 5) & (local.hour >= first) & (local.hour < last))
+
+    def _select_hours(self, mask):
+        axis = self.dims.index(self._hour_dim())
+        coords = dict(self.coords)
+        coords["hour"] = self.coords["hour"][mask]
+        return LabeledArray(np.compress(mask, self.values, axis=axis), self.dims, coords)
+
+    def _aggregate(self, periods, dim, how):
+        """Reduce the hour axis over runs of equal ``periods`` (hours are sorted)."""
+        if how not in _REDUCERS:
+            raise ValueError(f"Unknown aggregation '{how}'. Choose from {list(_REDUCERS)}")
+        axis = self.dims.index(self._hour_dim())
+        dims = self.dims[:axis] + (dim,) + self.dims[axis + 1 :]
+        coords = dict(self.coords)
+        if len(periods) == 0:
+            raise ValueError("No hours to aggregate")
+        starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+        values = _REDUCERS[how].reduceat(np.asarray(self.values), starts, axis=axis)
+        if how == "mean":
+            counts = np.diff(np.r_[starts, len(periods)])
+            shape = [1] * values.ndim
+            shape[axis] = len(counts)
+            values = values / counts.reshape(shape)
+        coords[dim] = periods[starts]
+        return LabeledArray(values, dims, {d: coords[d] for d in dims})
+
+
+# ── Run results ──
+
+
+class RunResult:
+    """Results of a run, loaded table by table on first access.
+
+    Args:
+        run_dir: Run directory (runs/<name>/).
+
+    Raises:
+        FileNotFoundError: If run_dir has no run.yaml.
+    """
+
+    def __init__(self, run_dir):
+        self.run_dir = Path(run_dir)
+        if not (self.run_dir / "run.yaml").exists():
+            raise FileNotFoundError(
+                f"run.yaml not found in {self.run_dir}. Is this a run directory?"
+            )
+        self._metadata = None
+        self._arrays = {}
+
+    def __repr__(self):
+        return f"RunResult('{self.name}')"
+
+    @property
+    def name(self):
+        return self.run_dir.name
+
+    @property
+    def metadata(self):
+        """run.yaml contents (scenario, year, status, totals, ...)."""
+        if self._metadata is None:
+            with open(self.run_dir / "run.yaml") as f:
+                self._metadata = yaml.safe_load(f)
+        return self._metadata
+
+    @property
+    def prices(self):
+        """Hourly prices, area × hour (EUR/MWh)."""
+        return self.output("prices")
+
+    @property
+    def production(self):
+        """Hourly production by aggregated technology, area × tec × hour (GW)."""
+        return self.output("production")
+
+    @property
+    def capa_on(self):
+        """Hourly online thermal capacity, area × tec × hour (GW)."""
+        return self.output("capa_on")
+
+    @property
+    def trade(self):
+        """France's hourly net imports per partner, partner × hour (GW)."""
+        return self.output("FRtrade")
+
+    def output(self, name):
+        """Output table ``name`` as a LabeledArray, or None if it was not generated."""
+        path = output_path(self.run_dir, name)
+        if path is None:
+            return None
+        dims = _OUTPUT_DIMS.get(name)
+        if dims is None:
+            raise ValueError(f"Unknown output table '{name}'. Choose from {list(_OUTPUT_DIMS)}")
+        return self._load(name, path, lambda: _dense(read_output(self.run_dir, name), dims))
+
+    def inputs(self, name, dims=None):
+        """Input table ``name`` (inputs/<name>.csv) as a LabeledArray, or None if absent.
+
+        Args:
+            name: Table name, e.g. "demand", "nmd", "exoPrices", "vre_profiles".
+            dims: Dimension names of its key columns, in file order; known
+                for the tables above.
+        """
+        path = self.run_dir / "inputs" / f"{name}.csv"
+        if not path.exists():
+            return None
+        dims = dims or _INPUT_DIMS.get(name)
+        if dims is None:
+            raise ValueError(f"Dimensions of input '{name}' unknown; pass dims=(...)")
+        dims = tuple(dims)
+
+        def build():
+            df = pd.read_csv(path, header=None, names=[*dims, "value"])
+            return _dense(df, dims)
+
+        return self._load(f"inputs.{name}", path, build)
+
+    # ── Helpers ──
+
+    def _load(self, key, source, build):
+        """Array ``key``: from memory, from the cache file if up to date, else built."""
+        stamp = _stamp(source)
+        cached = self._arrays.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        cache_dir = self.run_dir / RESULTS_CACHE_DIR
+        npy_path, meta_path = cache_dir / f"{key}.npy", cache_dir / f"{key}.json"
+        array = None
+        try:
+            meta = json.loads(meta_path.read_text())
+            if meta["source"] == stamp:
+                values = np.load(npy_path, mmap_mode="r")
+                coords = {dim: _decode_labels(meta["coords"][dim]) for dim in meta["dims"]}
+                array = LabeledArray(values, meta["dims"], coords)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if array is None:
+            array = build()
+            try:
+                _write_cache(array, stamp, npy_path, meta_path)
+                array = LabeledArray(np.load(npy_path, mmap_mode="r"), array.dims, array.coords)
+            except OSError as e:
+                logger.warning(f"  Could not cache {key} under {cache_dir}: {e}")
+        self._arrays[key] = (stamp, array)
+        return array
+
+
+def load_run(run, project_dir=None):
+    """Results of a run.
+
+    Args:
+        run: Run name (under <project_dir>/runs/) or path to a run directory.
+        project_dir: Root project directory. Defaults to cwd.
+
+    Raises:
+        FileNotFoundError: If the run does not exist.
+    """
+    run_dir = Path(run)
+    if not (run_dir / "run.yaml").exists():
+        run_dir = (Path(project_dir) if project_dir else Path.cwd()) / "runs" / str(run)
+    if not (run_dir / "run.yaml").exists():
+        raise FileNotFoundError(f"Run '{run}' not found at {run_dir}")
+    return RunResult(run_dir)
+
+
+def stack_runs(runs, table="prices", project_dir=None, **labels):
+    """One selection of a table over many runs, as a LabeledArray run × ...
+
+    Example: stack_runs(names, "prices", area="FR") → run × hour. Each run's
+    selection is read from its mapped cache and copied once into the result.
+
+    Args:
+        runs: Run names or directories.
+        table: Output table name.
+        project_dir: Root project directory. Defaults to cwd.
+        **labels: Selection applied to each run's table (see LabeledArray.sel).
+
+    Raises:
+        FileNotFoundError: If a run lacks the table.
+        ValueError: If the runs' selections do not share the same labels
+            (e.g. different years).
+    """
+    results = [load_run(run, project_dir) for run in runs]
+    out = first = None
+    for i, result in enumerate(results):
+        array = result.output(table)
+        if array is None:
+            raise FileNotFoundError(f"Run '{result.name}' has no '{table}' output")
+        array = array.sel(**labels)
+        if first is None:
+            first = array
+            out = np.empty((len(results),) + array.shape)
+        elif array.dims != first.dims or any(
+            not np.array_equal(array.coords[d], first.coords[d]) for d in first.dims
+        ):
+            raise ValueError(f"Run '{result.name}' has different {table} labels than the others")
+        out[i] = array.values
+    if first is None:
+        raise ValueError("stack_runs needs at least one run")
+    coords = {"run": np.array([result.name for result in results]), **first.coords}
+    return LabeledArray(out, ("run",) + first.dims, coords)
+
+
+# ── Helpers ──
+
+
+def _dense(df, dims):
+    """Dense LabeledArray from a table.
+
+    Dimensions found among the columns key the rows; at most one other
+    dimension spans the remaining (value) columns. Hours are sorted; other
+    labels keep their order of appearance. Missing cells are 0.
+    """
+    key_dims = [dim for dim in dims if dim in df.columns]
+    column_dims = [dim for dim in dims if dim not in df.columns]
+    value_columns = [c for c in df.columns if c not in key_dims]
+    if len(column_dims) > 1 or (not column_dims and value_columns != ["value"]):
+        raise ValueError(f"Cannot lay out columns {list(df.columns)} as {dims}")
+
+    coords, positions = {}, {}
+    for dim in key_dims:
+        if dim == "hour":
+            labels = np.unique(df[dim].to_numpy())
+            codes = np.searchsorted(labels, df[dim].to_numpy())
+        else:
+            codes, labels = pd.factorize(df[dim].astype(str))
+            labels = np.asarray(labels)
+        coords[dim], positions[dim] = labels, codes[:, None]
+    for dim in column_dims:
+        coords[dim] = np.asarray([str(c) for c in value_columns])
+        positions[dim] = np.arange(len(value_columns))[None, :]
+
+    out = np.zeros(tuple(len(coords[dim]) for dim in dims))
+    out[tuple(positions[dim] for dim in dims)] = df[value_columns].to_numpy(dtype=float)
+    return LabeledArray(out, dims, coords)
+
+
+def _encode_labels(labels):
+    """JSON form of a dimension's labels: a {"range": [start, stop]} for consecutive hours."""
+    if len(labels) > 1 and np.issubdtype(labels.dtype, np.integer) and (np.diff(labels) == 1).all():
+        return {"range": [int(labels[0]), int(labels[-1]) + 1]}
+    return labels.tolist()
+
+
+def _decode_labels(encoded):
+    if isinstance(encoded, dict):
+        return np.arange(*encoded["range"])
+    return np.asarray(encoded)
+
+
+def _stamp(path):
+    """[mtime_ns, size] of a file, or of the latest file / total size of a directory."""
+    path = Path(path)
+    if path.is_dir():
+        stats = [p.stat() for p in path.rglob("*") if p.is_file()]
+        return [max((s.st_mtime_ns for s in stats), default=0), sum(s.st_size for s in stats)]
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _write_cache(array, stamp, npy_path, meta_path):
+    """Write the array and its labels, each through a temporary file."""
+    npy_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = npy_path.with_name(f"{npy_path.stem}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, np.ascontiguousarray(array.values, dtype=float))
+    os.replace(tmp, npy_path)
+    meta = {
+        "dims": list(array.dims),
+        "coords": {dim: _encode_labels(array.coords[dim]) for dim in array.dims},
+        "source": stamp,
+    }
+    tmp = meta_path.with_name(f"{meta_path.stem}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, meta_path)
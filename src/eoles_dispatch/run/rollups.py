@@ -0,0 +1,179 @@
+"""Precomputed daily, weekly, monthly and annual rollups of run outputs.
+
+solve_run writes, next to each hourly table (prices, production), one
+rollup table per resolution in the run's output format:
+
+    outputs/prices_<resolution>        mean price per area (EUR/MWh)
+    outputs/production_<resolution>    energy per technology and area (GWh)
+
+with <resolution> in daily, weekly, monthly, annual. Periods follow the CET
+calendar and are labelled as text: "YYYY-MM-DD" (daily), "YYYYWW" (weekly,
+as hour_to_cet_week), "YYYYMM" (monthly, as hour_to_cet_month) and "YYYY"
+(annual). Each period has three rows, one per block: "base" (all hours),
+"peak" (weekdays, PEAK_HOURS CET) and "offpeak"; the 'hours' column counts
+the hours aggregated in each row.
+
+Readers that need no hourly detail (the energy mix charts) call
+read_rollup, which falls back to computing the rollup from the hourly table
+for runs solved before rollups existed.
+
+Called from:
+    - _main_run.py              solve_run (write_rollups).
+    - viz/charts_outputs.py     energy mix charts (read_rollup).
+
+Delegates to:
+    - output_io.py              read_output, write_output.
+
+Functions:
+    compute_rollup(df, table, resolution)
+        Rollup of an hourly prices or production table.
+
+    write_rollups(run_dir, output_format="csv", tables=ROLLUP_TABLES)
+        Write every resolution of the given tables under outputs/.
+
+    read_rollup(run_dir, table, resolution, areas=None, block="base")
+        Load a rollup table, computing it from the hourly table if absent.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..config import PEAK_HOURS
+from ..utils import CET, posix_hours_to_dt
+from .output_io import read_output, write_output
+
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS = ("daily", "weekly", "monthly", "annual")
+BLOCKS = ("base", "peak", "offpeak")
+
+# Hourly table → how its values are aggregated (prices in EUR/MWh are
+# averaged; production in GW summed over hours gives GWh)
+ROLLUP_TABLES = {"prices": "mean", "production": "sum"}
+
+# CET period label of each resolution
+_PERIOD_FORMATS = {
+    "daily": "%Y-%m-%d",
+    "weekly": "%Y%W",
+    "monthly": "%Y%m",
+    "annual": "%Y",
+}
+
+
+def compute_rollup(df, table, resolution):
+    """Aggregate an hourly output table over the periods of a resolution.
+
+    Args:
+        df: Hourly table as returned by read_output (prices: hour + one
+            column per area; production: area, hour + one column per
+            technology), or indexed as written by the reports.
+        table: "prices" or "production" (sets the aggregation).
+        resolution: "daily", "weekly", "monthly" or "annual".
+
+    Returns:
+        DataFrame indexed by [area,] period, block with an 'hours' column
+        followed by the aggregated value columns.
+    """
+    if table not in ROLLUP_TABLES:
+        raise ValueError(f"No rollup for table '{table}'. Choose from {list(ROLLUP_TABLES)}")
+    if resolution not in _PERIOD_FORMATS:
+        raise ValueError(f"Unknown resolution '{resolution}'. Choose from {list(RESOLUTIONS)}")
+    if "hour" not in df.columns:
+        df = df.reset_index()
+    keys = ["area"] if "area" in df.columns else []
+    values = [c for c in df.columns if c not in keys and c != "hour"]
+
+    # Labels are computed once per distinct hour, then mapped to the rows
+    hours, inverse = np.unique(df["hour"].to_numpy(), return_inverse=True)
+    local = posix_hours_to_dt(pd.Series(hours)).dt.tz_convert(CET)
+    labels = local.dt.strftime(_PERIOD_FORMATS[resolution]).to_numpy()
+    first, last = PEAK_HOURS
+    peak_hours = (
+        (local.dt.weekday < 5) & (local.dt.hour >= first) & (local.dt.hour < last)
+    ).to_numpy()
+    period = pd.Series(labels[inverse], index=df.index, name="period")
+    peak = peak_hours[inverse]
+
+    parts = []
+    for block, mask in (("base", None), ("peak", peak), ("offpeak", ~peak)):
+        rows = df if mask is None else df[mask]
+        grouped = rows.groupby(
+            [rows[k] for k in keys] + [period if mask is None else period[mask]], sort=False
+        )
+        part = grouped[values].agg(ROLLUP_TABLES[table])
+        part.insert(0, "hours", grouped.size())
+        part["block"] = block
+        parts.append(part)
+
+    rollup = pd.concat(parts).reset_index()
+    order = keys + ["period", "block"]
+    if keys:
+        # Keep areas in table order (as the hourly outputs), periods in time order
+        rollup["area"] = pd.Categorical(rollup["area"], categories=pd.unique(df["area"]))
+    rollup = rollup.sort_values(order, kind="stable")
+    if keys:
+        rollup["area"] = rollup["area"].astype(str)
+    return rollup.set_index(order)[["hours"] + values]
+
+
+def write_rollups(run_dir, output_format="csv", tables=tuple(ROLLUP_TABLES)):
+    """Write the rollups of each hourly table present in outputs/.
+
+    Args:
+        run_dir: Run directory.
+        output_format: "csv", "parquet" or "arrow" (as the hourly tables).
+        tables: Hourly tables to roll up; absent ones are skipped.
+
+    Returns:
+        Names of the rollup tables written.
+    """
+    output_dir = Path(run_dir) / "outputs"
+    written = []
+    for table in tables:
+        df = read_output(run_dir, table)
+        if df is None:
+            continue
+        for resolution in RESOLUTIONS:
+            name = f"{table}_{resolution}"
+            write_output(compute_rollup(df, table, resolution), output_dir, name, output_format)
+            written.append(name)
+    if written:
+        logger.info(f"  Rollups written: {', '.join(written)}")
+    return written
+
+
+def read_rollup(run_dir, table, resolution, areas=None, block="base"):
+    """Load a rollup table (flat, period as text).
+
+    Runs solved before rollups were written have only the hourly table; the
+    rollup is then computed from it (not saved).
+
+    Args:
+        run_dir: Run directory.
+        table: "prices" or "production".
+        resolution: "daily", "weekly", "monthly" or "annual".
+        areas: For production, keep only these areas.
+        block: "base", "peak" or "offpeak"; None keeps all blocks (and the
+            'block' column).
+
+    Returns:
+        DataFrame with columns [area,] period, [block,] hours, values..., or
+        None if neither the rollup nor the hourly table exists.
+    """
+    if block is not None and block not in BLOCKS:
+        raise ValueError(f"Unknown block '{block}'. Choose from {list(BLOCKS)}")
+    df = read_output(run_dir, f"{table}_{resolution}", areas=areas)
+    if df is None:
+        hourly = read_output(run_dir, table, areas=areas)
+        if hourly is None:
+            return None
+        df = compute_rollup(hourly, table, resolution).reset_index()
+    df["period"] = df["period"].astype(str)
+    if "area" in df.columns:
+        df["area"] = df["area"].astype(str)
+    if block is not None:
+        df = df[df["block"] == block].drop(columns="block")
+    return df.reset_index(drop=True)
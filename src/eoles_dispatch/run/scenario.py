@@ -3,49 +3,236 @@
 Reads scenario parameters from CSV directories or Excel files and formats
 them for the Pyomo model. Also provides xlsx_to_scenario for converting
 Excel scenario files to CSV directories.
+
+Layered scenarios:
+    A scenario directory containing a ``scenario.yaml`` file is a *delta*
+    layer on top of another scenario::
+
+        # scenarios/high_co2/scenario.yaml
+        base: baseline
+
+    Its CSVs use the same layout as the base tables (first column is the row
+    key: tec, exporter, importer, month or area) but only need to list the
+    rows and columns being changed. Non-empty cells override the base value,
+    unknown rows/columns are appended, and tables absent from the delta are
+    inherited unchanged. Deltas can be stacked (a delta's base may itself be
+    a delta). Layers are resolved in memory; base tables are read once per
+    process and cached.
+
+Functions:
+    resolve_scenario_path(scenarios_dir, scenario)
+        Locate a scenario by name: scenarios/<name>/ first, then <name>.xlsx.
+
+    scenario_layers(scenario_path)
+        Layer chain of a scenario, root scenario first.
+
+    layer_name(scenario_path)
+        Display name of a layer (recorded in run.yaml's scenario_layers).
+
+    read_scenario_table(scenario_path, name, patches=None)
+        One table of a scenario, resolved through its layers and patches.
+
+    apply_delta(base, delta)
+        Patch a scenario table with a delta table.
+
+    export_resolved_scenario(scenario_path, output_dir, patches=None)
+        Write the fully resolved tables of a scenario as CSVs.
+
+    extract_scenario(scenario_path, areas, exo_areas, hour_month, patches=None)
+        Extract and format scenario parameters for the model.
+
+    xlsx_to_scenario(xlsx_path, output_dir=None)
+        Convert an Excel scenario file to a CSV directory.
 """
 
+import functools
 from pathlib import Path
 
 import pandas as pd
+import yaml
+
+# Tables making up a scenario (one CSV per table, or one sheet per table).
+SCENARIO_TABLES = [
+    "thr_specs",
+    "rsv_req",
+    "str_vOM",
+    "capa",
+    "maxAF",
+    "yEAF",
+    "capa_in",
+    "stockMax",
+    "links",
+    "exo_IM",
+    "exo_EX",
+    "fuel_timeFactor",
+    "fuel_areaFactor",
+]
+
+# Layer descriptor marking a scenario directory as a delta on a base scenario.
+LAYER_FILE = "scenario.yaml"
+
 
 # ── Helpers ──
 
 
-def _read_scenario_table(scenario_path, name, **kwargs):
-    """Read a scenario table from either a CSV directory or an Excel file."""
+def read_scenario_table(scenario_path, name, patches=None):
+    """Read a scenario table from a CSV directory, an Excel file, or a layer chain.
+
+    For a delta scenario, the table is read from the root scenario of the
+    chain and every layer's delta CSV (if any) is applied on top, in order.
+    ``patches`` ({table name: delta DataFrame}) are in-memory deltas applied
+    last, on top of all layers.
+    """
+    layers = scenario_layers(scenario_path)
+    df = _read_full_table(layers[0], name)
+    for layer in layers[1:]:
+        delta_path = layer / f"{name}.csv"
+        if delta_path.exists():
+            df = apply_delta(df, pd.read_csv(delta_path))
+    if patches and name in patches:
+        df = apply_delta(df, patches[name])
+    return df
+
+
+def _read_full_table(scenario_path, name):
+    """Read a table from a full (non-delta) scenario, through the table cache."""
     scenario_path = Path(scenario_path)
     if scenario_path.is_dir():
-        return pd.read_csv(scenario_path / f"{name}.csv", **kwargs)
+        source = scenario_path / f"{name}.csv"
     else:
-        return pd.read_excel(scenario_path, sheet_name=name, **kwargs)
+        source = scenario_path
+    # The mtime is part of the cache key so edited scenarios are re-read.
+    mtime = source.stat().st_mtime_ns if source.exists() else None
+    return _cached_table(str(scenario_path), name, mtime).copy()
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_table(scenario_path, name, mtime):
+    scenario_path = Path(scenario_path)
+    if scenario_path.is_dir():
+        return pd.read_csv(scenario_path / f"{name}.csv")
+    else:
+        return pd.read_excel(scenario_path, sheet_name=name)
+
+
+def apply_delta(base, delta):
+    """Patch a scenario table with a delta table.
+
+    Both tables are keyed by their first column. Non-NaN cells of ``delta``
+    override the matching cells of ``base``; rows and columns missing from
+    ``base`` are appended. Base row/column order and dtypes are preserved.
+
+    Args:
+        base: Full scenario table.
+        delta: Partial table with the same key column.
+
+    Returns:
+        New patched DataFrame.
+    """
+    key = base.columns[0]
+    if delta.columns[0] != key:
+        raise ValueError(
+            f"Delta table is keyed by '{delta.columns[0]}' but base table is keyed by '{key}'"
+        )
+    base_i = base.set_index(key)
+    delta_i = delta.set_index(key)
+    # Delta keys are read as strings/ints independently of the base: align types
+    # so that e.g. month 1 in the delta matches month 1 in the base.
+    delta_i.index = delta_i.index.astype(base_i.index.dtype)
+
+    rows = list(base_i.index) + [k for k in delta_i.index if k not in base_i.index]
+    cols = list(base_i.columns) + [c for c in delta_i.columns if c not in base_i.columns]
+    patched = delta_i.combine_first(base_i).reindex(index=rows, columns=cols)
+
+    for col in base_i.columns:
+        if patched[col].dtype != base_i[col].dtype and patched[col].notna().all():
+            try:
+                patched[col] = patched[col].astype(base_i[col].dtype)
+            except (TypeError, ValueError):
+                pass
+    return patched.rename_axis(key).reset_index()
+
+
+def resolve_scenario_path(scenarios_dir, scenario):
+    """Locate a scenario by name: scenarios/<name>/ dir first, then <name>.xlsx."""
+    scenarios_dir = Path(scenarios_dir)
+    scenario_dir = scenarios_dir / scenario
+    scenario_xlsx = scenarios_dir / f"{scenario}.xlsx"
+    if scenario_dir.is_dir():
+        return scenario_dir
+    if scenario_xlsx.exists():
+        return scenario_xlsx
+    raise FileNotFoundError(
+        f"Scenario '{scenario}' not found. Expected either "
+        f"{scenario_dir}/ (CSV directory) or {scenario_xlsx}"
+    )
+
+
+def scenario_layers(scenario_path):
+    """Return the layer chain of a scenario, root scenario first.
+
+    A plain CSV directory or xlsx file is a single-layer chain. A directory
+    with a ``scenario.yaml`` names its base scenario, looked up next to it.
+    """
+    chain = [Path(scenario_path)]
+    while chain[0].is_dir() and (chain[0] / LAYER_FILE).exists():
+        with open(chain[0] / LAYER_FILE) as f:
+            spec = yaml.safe_load(f) or {}
+        base = spec.get("base")
+        if not base:
+            raise ValueError(f"{chain[0] / LAYER_FILE} does not define a 'base' scenario")
+        base_path = resolve_scenario_path(chain[0].parent, base)
+        if any(base_path.resolve() == p.resolve() for p in chain):
+            names = " -> ".join(layer_name(p) for p in chain)
+            raise ValueError(f"Circular scenario layers: {names} -> {base}")
+        chain.insert(0, base_path)
+    return chain
+
+
+def layer_name(scenario_path):
+    """Display name of a scenario layer (directory name or xlsx stem)."""
+    scenario_path = Path(scenario_path)
+    return scenario_path.name if scenario_path.is_dir() else scenario_path.stem
+
+
+def export_resolved_scenario(scenario_path, output_dir, patches=None):
+    """Write the fully resolved tables of a (possibly layered) scenario as CSVs."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name in SCENARIO_TABLES:
+        df = read_scenario_table(scenario_path, name, patches)
+        df.to_csv(output_dir / f"{name}.csv", index=False)
+    return output_dir
 
 
 # ── High-level entry points ──
 
 
-def extract_scenario(scenario_path, areas, exo_areas, hour_month):
+def extract_scenario(scenario_path, areas, exo_areas, hour_month, patches=None):
     """Extract and format scenario parameters.
 
     Args:
-        scenario_path: Path to a scenario directory (containing CSVs) or an Excel file.
+        scenario_path: Path to a scenario directory (containing CSVs or a delta
+            layer, see module docstring) or an Excel file.
         areas: List of modeled country codes.
         exo_areas: List of non-modeled country codes.
         hour_month: DataFrame with hour-month mapping.
+        patches: Optional {table name: delta DataFrame} applied on top of the
+            scenario (same semantics as a delta layer, see apply_delta).
 
     Returns a dict with all scenario DataFrames and technology sets.
     """
     scenario_path = Path(scenario_path)
 
-    thr_specs = _read_scenario_table(scenario_path, "thr_specs")
+    thr_specs = read_scenario_table(scenario_path, "thr_specs", patches)
 
     # Extract individual columns from thr_specs as separate DataFrames
     thr_params = {}
     for col in thr_specs.columns[1:]:
         thr_params[col] = thr_specs[["tec", col]]
 
-    rsv_req = _read_scenario_table(scenario_path, "rsv_req")
-    str_vOM = _read_scenario_table(scenario_path, "str_vOM")
+    rsv_req = read_scenario_table(scenario_path, "rsv_req", patches)
+    str_vOM = read_scenario_table(scenario_path, "str_vOM", patches)
 
     # Technology sets
     thr = thr_specs["tec"].tolist()
@@ -59,7 +246,9 @@ def extract_scenario(scenario_path, areas, exo_areas, hour_month):
 
     # Installed capacity data
     def _read_melt(name, id_col, filter_areas):
-        df = pd.melt(_read_scenario_table(scenario_path, name), id_vars=id_col, var_name="area")
+        df = pd.melt(
+            read_scenario_table(scenario_path, name, patches), id_vars=id_col, var_name="area"
+        )
         return (
             df[df["area"].isin(filter_areas)][["area", id_col, "value"]]
             if id_col != "area"
@@ -74,7 +263,9 @@ def extract_scenario(scenario_path, areas, exo_areas, hour_month):
 
     # Interconnections
     links = pd.melt(
-        _read_scenario_table(scenario_path, "links"), id_vars="exporter", var_name="importer"
+        read_scenario_table(scenario_path, "links", patches),
+        id_vars="exporter",
+        var_name="importer",
     )
     links = links[
         (links["importer"].isin(areas))
@@ -83,19 +274,23 @@ def extract_scenario(scenario_path, areas, exo_areas, hour_month):
     ][["importer", "exporter", "value"]]
 
     exo_EX = pd.melt(
-        _read_scenario_table(scenario_path, "exo_EX"), id_vars="exporter", var_name="importer"
+        read_scenario_table(scenario_path, "exo_EX", patches),
+        id_vars="exporter",
+        var_name="importer",
     )
     exo_EX = exo_EX[(exo_EX["exporter"].isin(areas)) & (exo_EX["importer"].isin(exo_areas))]
 
     exo_IM = pd.melt(
-        _read_scenario_table(scenario_path, "exo_IM"), id_vars="importer", var_name="exporter"
+        read_scenario_table(scenario_path, "exo_IM", patches),
+        id_vars="importer",
+        var_name="exporter",
     )
     exo_IM = exo_IM[(exo_IM["importer"].isin(areas)) & (exo_IM["exporter"].isin(exo_areas))]
 
     # Fuel price seasonal weights (calendar months 1-12, mean=1 per fuel).
     # Expand to YYYYMM strings matching the simulation period.
     fuel_timeFactor_raw = pd.melt(
-        _read_scenario_table(scenario_path, "fuel_timeFactor"),
+        read_scenario_table(scenario_path, "fuel_timeFactor", patches),
         id_vars="month",
         var_name="fuel",
     )
@@ -112,7 +307,7 @@ def extract_scenario(scenario_path, areas, exo_areas, hour_month):
     )
 
     fuel_areaFactor = pd.melt(
-        _read_scenario_table(scenario_path, "fuel_areaFactor"),
+        read_scenario_table(scenario_path, "fuel_areaFactor", patches),
         id_vars="area",
         var_name="fuel",
     )
@@ -159,22 +354,7 @@ def xlsx_to_scenario(xlsx_path, output_dir=None):
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    sheets = [
-        "thr_specs",
-        "rsv_req",
-        "str_vOM",
-        "capa",
-        "maxAF",
-        "yEAF",
-        "capa_in",
-        "stockMax",
-        "links",
-        "exo_IM",
-        "exo_EX",
-        "fuel_timeFactor",
-        "fuel_areaFactor",
-    ]
-    for sheet in sheets:
+    for sheet in SCENARIO_TABLES:
         df = pd.read_excel(xlsx_path, sheet_name=sheet)
         df.to_csv(output_dir / f"{sheet}.csv", index=False)
 
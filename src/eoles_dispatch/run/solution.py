@@ -0,0 +1,146 @@
+"""One-pass view of a solved model's variables and duals.
+
+A SolutionView is built once after the solve and shared by every consumer
+(reports, run totals, log, diagnostics). Each variable or constraint is read
+from Pyomo the first time it is asked for, then kept as:
+
+    index   pd.MultiIndex of the component keys (one level per index
+            position, e.g. area / tec / hour), factorized once
+    values  float array aligned with the index: variable values (NaN when
+            unset) or constraint duals (0.0 when absent)
+
+All duals come from a single {ConstraintData: dual} map, built on first use,
+instead of one dict(model.dual) per constraint. Consumers slice arrays rather
+than query Pyomo, so adding a report costs almost nothing once the variables
+it needs have been read.
+
+Called from:
+    - _main_run.py              solve_run (built after the solve).
+    - format_outputs.py         report_*, run_totals, write_log.
+    - export_diagnostics.py     export_all_diagnostics.
+
+Classes:
+    SolutionView(model)
+        of(source)                  View of a model, or the view itself.
+        objective                   Objective value.
+        has(name)                   Whether the model has this variable/constraint.
+        is_dual(name)               Whether it is a constraint (values are duals).
+        index(name) / values(name)  Keys (MultiIndex) and values of a component.
+        array(name, *axes)          Dense array shaped by the given label axes.
+        frame(name, keep=True)      DataFrame idx0[, idx1, ...], value|dual
+                                    (keep=False: not kept in the view).
+        total(name)                 Sum of the values (unset values ignored).
+"""
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+
+
+class SolutionView:
+    """Variable values and constraint duals of a solved Pyomo model, read once.
+
+    Args:
+        model: Solved Pyomo ConcreteModel (duals read from model.dual if present).
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._entries = {}
+        self._dual_map = None
+
+    @classmethod
+    def of(cls, source):
+        """Return ``source`` if it is already a view, else a new view of the model."""
+        return source if isinstance(source, cls) else cls(source)
+
+    @property
+    def objective(self):
+        """Objective value of the solved model."""
+        return pyo.value(self.model.objective)
+
+    def has(self, name):
+        """True if the model has a variable or constraint called ``name``."""
+        component = getattr(self.model, name, None)
+        return getattr(component, "ctype", None) in (pyo.Var, pyo.Constraint)
+
+    def is_dual(self, name):
+        """True if ``name`` is a constraint (its values are duals)."""
+        return getattr(self.model, name).ctype is pyo.Constraint
+
+    def index(self, name):
+        """Keys of a component as a MultiIndex (None if it has no keys)."""
+        return self._entry(name)[0]
+
+    def values(self, name):
+        """Values of a component, aligned with index(name)."""
+        return self._entry(name)[1]
+
+    def array(self, name, *axes):
+        """Values as a dense array of shape (len(axes[0]), len(axes[1]), ...).
+
+        ``axes`` lists the labels along each index position (e.g. areas,
+        techs, hours). Cells absent from the component (e.g. a tech not in
+        the model) or without a value are 0; keys with labels outside
+        ``axes`` are ignored.
+        """
+        out = np.zeros(tuple(len(axis) for axis in axes))
+        index, values = self._entry(name)
+        if index is None:
+            return out
+        positions = [
+            pd.Index(axis).get_indexer(level)[codes]
+            for axis, level, codes in zip(axes, index.levels, index.codes)
+        ]
+        found = np.logical_and.reduce([pos >= 0 for pos in positions])
+        out[tuple(pos[found] for pos in positions)] = np.nan_to_num(values[found], nan=0.0)
+        return out
+
+    def frame(self, name, keep=True):
+        """Flat DataFrame: idx0[, idx1, ...] then 'value' (variables) or 'dual'.
+
+        With keep=False, a component not read yet is read for this frame only
+        and not kept in the view (one-off consumers such as the diagnostics,
+        which would otherwise keep every family in memory).
+        """
+        index, values = self._entry(name, keep)
+        if index is None:
+            return pd.DataFrame()
+        df = index.to_frame(index=False, name=[f"idx{i}" for i in range(index.nlevels)])
+        df["dual" if self.is_dual(name) else "value"] = values
+        return df
+
+    def total(self, name):
+        """Sum of a component's values, unset values ignored."""
+        return float(np.nansum(self.values(name)))
+
+    # ── Helpers ──
+
+    def _entry(self, name, keep=True):
+        """(index, values) of a component, read from the model on first access."""
+        if name not in self._entries:
+            component = getattr(self.model, name)
+            if component.ctype is pyo.Constraint:
+                duals = self._duals()
+                keys = list(component.keys())
+                values = [duals.get(c, 0.0) for c in component.values()]
+            else:
+                extracted = component.extract_values()
+                keys = list(extracted)
+                values = list(extracted.values())
+            index = None
+            if keys:
+                if not isinstance(keys[0], tuple):
+                    keys = [(k,) for k in keys]
+                index = pd.MultiIndex.from_tuples(keys)
+            entry = (index, np.array(values, dtype=float))
+            if not keep:
+                return entry
+            self._entries[name] = entry
+        return self._entries[name]
+
+    def _duals(self):
+        """{ConstraintData: dual} of the whole model, built once."""
+        if self._dual_map is None:
+            self._dual_map = dict(self.model.dual) if hasattr(self.model, "dual") else {}
+        return self._dual_map
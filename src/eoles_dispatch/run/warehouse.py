@@ -0,0 +1,392 @@
+"""Project-level results warehouse: one SQLite file indexing every run.
+
+Listing runs, comparing them and summarizing ensembles used to open every
+run.yaml and output file. The warehouse (runs/.warehouse.sqlite) keeps, per
+run:
+
+    runs        metadata (run.yaml text, plus scenario, year, status,
+                created / solved timestamps, total cost and CO2), the input
+                hash and the run.yaml signature it was read from
+    prices      hourly prices of each area (int64 hours and float64 prices
+                as BLOBs) with their mean and PRICE_PERCENTILES
+    production  energy per area and technology over the run (GWh)
+
+Ingestion is incremental (sync): a run whose run.yaml has the same mtime as
+when it was ingested is not read again; otherwise its metadata is refreshed,
+and its outputs are ingested again only if its ``solved`` timestamp or its
+input hash changed. The input hash combines the data fingerprint of
+run.yaml, the run parameters (year, months, areas, weather year...) and
+the content of the run's scenario copy. Runs deleted from runs/ are
+dropped. Every query syncs the runs it needs first, so the warehouse never
+has to be rebuilt by hand; deleting the file only costs one full
+ingestion. Listing runs falls back to reading each run.yaml when the
+warehouse cannot be opened or written (e.g. a read-only project).
+
+Called from:
+    - _main_run.py      list_runs.
+    - ensemble.py       solve_members, summarize_run, price_distribution.
+    - __main__.py       compare.
+
+Delegates to:
+    - output_io.py      read_output (ingestion).
+
+Functions:
+    sync(project_dir=None, runs=None)
+        Ingest new or changed runs; returns the number of runs (re)ingested.
+
+    list_runs(project_dir=None)
+        Metadata of all runs, by name.
+
+    summaries(runs, project_dir=None)
+        KPI dicts (totals, price mean and percentiles per area).
+
+    price_series(runs, project_dir=None)
+        Hourly prices of each run, as {run: DataFrame indexed by hour}.
+
+    compare(runs, project_dir=None, areas=None)
+        KPI table of several runs, with their energy mix.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ..config import WAREHOUSE_FILE
+from .output_io import read_output
+
+logger = logging.getLogger(__name__)
+
+# Price percentiles reported for every run and area.
+PRICE_PERCENTILES = (5, 50, 95)
+
+# Bumped when the schema changes: older warehouses are rebuilt from the runs.
+_SCHEMA_VERSION = 2
+
+_PERCENTILE_COLUMNS = [f"p{q:02d}" for q in PRICE_PERCENTILES]
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    name TEXT PRIMARY KEY,
+    input_hash TEXT,
+    status TEXT,
+    scenario TEXT,
+    year INTEGER,
+    created TEXT,
+    solved TEXT,
+    total_cost REAL,
+    total_co2 REAL,
+    meta_mtime_ns INTEGER,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS prices (
+    run TEXT,
+    area TEXT,
+    position INTEGER,
+    hours BLOB,
+    price BLOB,
+    mean REAL,
+    {", ".join(f"{c} REAL" for c in _PERCENTILE_COLUMNS)},
+    PRIMARY KEY (run, area)
+);
+CREATE TABLE IF NOT EXISTS production (
+    run TEXT,
+    area TEXT,
+    tec TEXT,
+    energy REAL,
+    PRIMARY KEY (run, area, tec)
+);
+"""
+
+# run.yaml fields that, with the scenario copy, determine a run's inputs.
+_INPUT_KEYS = (
+    "data_fingerprint",
+    "year",
+    "months",
+    "areas",
+    "exo_areas",
+    "actCF",
+    "rn_horizon",
+    "weather_year",
+)
+
+
+# ── Ingestion ──
+
+
+def sync(project_dir=None, runs=None):
+    """Bring the warehouse up to date with runs/.
+
+    Args:
+        project_dir: Root project directory. Defaults to cwd.
+        runs: Run names to check (all runs if None; only then are deleted
+            runs dropped).
+
+    Returns:
+        Number of runs whose metadata or outputs were (re)ingested.
+    """
+    runs_dir = _runs_dir(project_dir)
+    if not runs_dir.is_dir():
+        return 0
+    if runs is None:
+        run_dirs = sorted(d for d in runs_dir.iterdir() if (d / "run.yaml").is_file())
+    else:
+        run_dirs = [runs_dir / str(r) for r in runs if (runs_dir / str(r) / "run.yaml").is_file()]
+
+    ingested = 0
+    with closing(_connect(runs_dir)) as db:
+        known = {
+            row[0]: row[1:]
+            for row in db.execute("SELECT name, meta_mtime_ns, solved, input_hash FROM runs")
+        }
+        for run_dir in run_dirs:
+            mtime_ns = (run_dir / "run.yaml").stat().st_mtime_ns
+            previous = known.get(run_dir.name)
+            if previous is not None and previous[0] == mtime_ns:
+                continue
+            _ingest(db, run_dir, mtime_ns, previous)
+            ingested += 1
+        if runs is None:
+            gone = set(known) - {d.name for d in run_dirs}
+            with db:
+                for name in gone:
+                    _delete(db, name, "runs", "prices", "production")
+    if ingested:
+        logger.info(f"  Warehouse: {ingested} run(s) ingested")
+    return ingested
+
+
+# ── Queries ──
+
+
+def list_runs(project_dir=None):
+    """Metadata (run.yaml contents) of every run, sorted by name.
+
+    Read from run.yaml directly if the warehouse cannot be opened or
+    written (e.g. a read-only project).
+    """
+    runs_dir = _runs_dir(project_dir)
+    if not runs_dir.is_dir():
+        return []
+    try:
+        sync(project_dir)
+        with closing(_connect(runs_dir)) as db:
+            texts = [m for (m,) in db.execute("SELECT metadata FROM runs ORDER BY name")]
+    except sqlite3.Error as e:
+        logger.warning(f"  Warehouse unavailable ({e}), reading run.yaml files")
+        texts = [
+            (d / "run.yaml").read_text()
+            for d in sorted(runs_dir.iterdir())
+            if (d / "run.yaml").is_file()
+        ]
+    return [yaml.safe_load(text) for text in texts]
+
+
+def summaries(runs, project_dir=None):
+    """KPIs of runs as flat dicts, in the order of ``runs``.
+
+    Each dict has run, status, total_cost, total_co2 and, for solved runs,
+    price_mean_<area> and price_p05/p50/p95_<area> (PRICE_PERCENTILES).
+
+    Raises:
+        FileNotFoundError: If a run does not exist.
+    """
+    runs = [str(r) for r in runs]
+    runs_dir = _runs_dir(project_dir)
+    sync(project_dir, runs)
+    with closing(_connect(runs_dir)) as db:
+        rows = {
+            row[0]: {"run": row[0], "status": row[1], "total_cost": row[2], "total_co2": row[3]}
+            for row in _select_in(
+                db, "SELECT name, status, total_cost, total_co2 FROM runs", "name", runs
+            )
+        }
+        columns = ", ".join(["mean"] + _PERCENTILE_COLUMNS)
+        query = f"SELECT run, area, {columns} FROM prices"
+        for run, area, mean, *percentiles in _select_in(db, query, "run", runs, "run, position"):
+            rows[run][f"price_mean_{area}"] = mean
+            for column, value in zip(_PERCENTILE_COLUMNS, percentiles):
+                rows[run][f"price_{column}_{area}"] = value
+    missing = [r for r in runs if r not in rows]
+    if missing:
+        raise FileNotFoundError(f"Runs not found in {runs_dir}: {missing}")
+    return [rows[r] for r in runs]
+
+
+def price_series(runs, project_dir=None):
+    """Hourly prices of runs: {run: DataFrame indexed by hour, one column per area}.
+
+    Runs without prices (not solved) are left out.
+    """
+    runs = [str(r) for r in runs]
+    sync(project_dir, runs)
+    series = {}
+    with closing(_connect(_runs_dir(project_dir))) as db:
+        query = "SELECT run, area, hours, price FROM prices"
+        for run, area, hours, price in _select_in(db, query, "run", runs, "run, position"):
+            series.setdefault(run, {})[area] = pd.Series(
+                np.frombuffer(price, dtype="<f8"), index=np.frombuffer(hours, dtype="<i8")
+            )
+    frames = {}
+    for run, columns in series.items():
+        frames[run] = pd.DataFrame(columns)
+        frames[run].index.name = "hour"
+    return frames
+
+
+def compare(runs, project_dir=None, areas=None):
+    """KPI table of several runs: one row per run.
+
+    Columns: scenario, year, status, total_cost, total_co2, the price KPIs of
+    summaries() and energy_<tec>_<area> (GWh over the run). With ``areas``,
+    only the price and energy columns of these areas are kept.
+    """
+    runs = [str(r) for r in runs]
+    table = pd.DataFrame(summaries(runs, project_dir)).set_index("run")
+    with closing(_connect(_runs_dir(project_dir))) as db:
+        meta = pd.DataFrame(
+            list(_select_in(db, "SELECT name, scenario, year FROM runs", "name", runs)),
+            columns=["run", "scenario", "year"],
+        ).set_index("run")
+        energy = pd.DataFrame(
+            list(_select_in(db, "SELECT run, area, tec, energy FROM production", "run", runs)),
+            columns=["run", "area", "tec", "energy"],
+        )
+    table = meta.join(table)
+    if not energy.empty:
+        energy["column"] = "energy_" + energy["tec"] + "_" + energy["area"]
+        wide = energy.pivot(index="run", columns="column", values="energy")
+        table = table.join(wide[sorted(wide.columns)])
+    if areas is not None:
+        per_area = [c for c in table.columns if c.startswith(("price_", "energy_"))]
+        table = table.drop(columns=[c for c in per_area if c.rsplit("_", 1)[1] not in areas])
+    return table.loc[runs]
+
+
+# ── Helpers ──
+
+
+def _runs_dir(project_dir):
+    return (Path(project_dir) if project_dir else Path.cwd()) / "runs"
+
+
+def _connect(runs_dir):
+    """Open the warehouse, creating (or rebuilding, on a schema change) its tables."""
+    if not runs_dir.is_dir():
+        raise FileNotFoundError(f"No runs directory at {runs_dir}")
+    db = sqlite3.connect(runs_dir / WAREHOUSE_FILE, timeout=60)
+    db.execute("PRAGMA journal_mode=WAL")
+    if db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+        with db:
+            for table in ("runs", "prices", "production"):
+                db.execute(f"DROP TABLE IF EXISTS {table}")
+            db.executescript(_SCHEMA)
+            db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    return db
+
+
+def _select_in(db, query, column, values, order=None):
+    """Rows of ``query`` whose ``column`` is in ``values`` (batched under SQLite's limit)."""
+    for start in range(0, len(values), 500):
+        batch = values[start : start + 500]
+        sql = f"{query} WHERE {column} IN ({', '.join('?' * len(batch))})"
+        if order:
+            sql += f" ORDER BY {order}"
+        yield from db.execute(sql, batch)
+
+
+def _delete(db, name, *tables):
+    for table in tables:
+        db.execute(f"DELETE FROM {table} WHERE {'name' if table == 'runs' else 'run'} = ?", (name,))
+
+
+def _ingest(db, run_dir, mtime_ns, previous):
+    """(Re)ingest one run: metadata always, outputs if solved anew or inputs changed."""
+    text = (run_dir / "run.yaml").read_text()
+    metadata = yaml.safe_load(text) or {}
+    name = run_dir.name
+    input_hash = _input_hash(run_dir, metadata)
+    solved = metadata.get("status") == "solved"
+    solved_at = str(metadata["solved"]) if metadata.get("solved") else None
+    stale = solved and (previous is None or previous[1:] != (solved_at, input_hash))
+
+    prices = production = None
+    if stale:
+        prices = read_output(run_dir, "prices")
+        production = read_output(run_dir, "production")
+
+    with db:
+        db.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                name,
+                input_hash,
+                metadata.get("status"),
+                metadata.get("scenario"),
+                metadata.get("year"),
+                str(metadata["created"]) if metadata.get("created") else None,
+                solved_at,
+                metadata.get("total_cost"),
+                metadata.get("total_co2"),
+                mtime_ns,
+                text,
+            ),
+        )
+        if not solved or stale:
+            _delete(db, name, "prices", "production")
+        if prices is not None:
+            db.executemany(
+                f"INSERT INTO prices VALUES ({', '.join('?' * (6 + len(PRICE_PERCENTILES)))})",
+                _price_rows(name, prices),
+            )
+        if production is not None:
+            db.executemany(
+                "INSERT INTO production VALUES (?, ?, ?, ?)", _production_rows(name, production)
+            )
+
+
+def _price_rows(name, prices):
+    prices = prices.set_index("hour")
+    hours = np.ascontiguousarray(prices.index.to_numpy(), dtype="<i8").tobytes()
+    for position, area in enumerate(prices.columns):
+        values = np.ascontiguousarray(prices[area].to_numpy(), dtype="<f8")
+        if len(values):
+            percentiles = np.percentile(values, PRICE_PERCENTILES)
+        else:
+            percentiles = [np.nan] * len(PRICE_PERCENTILES)
+        yield (
+            name,
+            str(area),
+            position,
+            hours,
+            values.tobytes(),
+            float(values.mean()) if len(values) else None,
+            *(float(v) for v in percentiles),
+        )
+
+
+def _production_rows(name, production):
+    # Hourly GW summed over the run's hours = GWh
+    energy = production.drop(columns="hour").groupby("area", sort=False).sum()
+    for area, row in energy.iterrows():
+        for tec, value in row.items():
+            yield (name, str(area), str(tec), float(value))
+
+
+def _input_hash(run_dir, metadata):
+    """Hash of what determines a run's inputs: data, parameters and scenario copy."""
+    digest = hashlib.sha256()
+    params = {key: metadata.get(key) for key in _INPUT_KEYS}
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    scenario_dir = run_dir / "scenario"
+    if scenario_dir.is_dir():
+        for path in sorted(p for p in scenario_dir.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(scenario_dir).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
@@ -29,20 +29,29 @@ Functions:
     cet_year_bounds(year)                   - UTC bounds of a CET calendar year.
                                               Called from _main_collect, format_inputs.
     cet_week_bounds(year, week)             - UTC bounds of an ISO week in CET.
+    cet_month_chunks(start, end, months)    - Split a UTC range at CET month starts.
+                                              Called from _main_collect (staged downloads).
     expected_hours(year)                    - Number of hours in a CET year.
                                               Called from _main_collect (collect_production, _validate_year).
     hour_to_cet_month(utc_posix_hours)      - Map POSIX hours to CET month strings.
                                               Called from format_inputs.
     hour_to_cet_week(utc_posix_hours)       - Map POSIX hours to CET week strings.
                                               Called from format_inputs.
+    parse_month_range(months)               - "3", "1-3" or (1, 3) → validated (first, last).
+                                              Called from __main__ (--months), run.ensemble.
     cet_period_bounds(year, months)         - UTC bounds of a year or sub-period in CET.
                                               Called from run._main_run, compute_hour_mappings.
     posix_hours_to_dt(hours_series)         - POSIX hours (int) → UTC-aware Timestamps.
                                               Called from viz/loaders, viz/charts_outputs.
+    posix_hour_range(start, end)            - [start, end) as POSIX hours, from hours or dates.
+                                              Called from export_diagnostics, diagnostics.
+    shift_hours_to_year(hours, from, to)    - Same calendar hour in another year.
+                                              Called from format_inputs (weather years).
     compute_hour_mappings(simul_year, ...)   - Compute hour-month and hour-week DataFrames.
                                               Called from run.create_run, format_inputs.
 """
 
+import numbers
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -123,6 +132,35 @@ def cet_week_bounds(year, week):
     return start, end
 
 
+def cet_month_chunks(start, end, months=1):
+    """Split [start, end) (naive UTC) into chunks of ``months`` CET months.
+
+    Chunk boundaries fall on CET month starts, counted from the month that
+    contains ``start``; the last chunk is truncated to ``end``.
+
+    Returns:
+        List of (label, chunk_start, chunk_end): label is the CET month
+        (YYYYMM) in which the chunk starts, bounds are naive UTC.
+
+    Example:
+        cet_month_chunks(*cet_year_bounds(2021), months=6)
+        → [("202101", 2020-12-31 23:00, 2021-06-30 22:00),
+           ("202107", 2021-06-30 22:00, 2021-12-31 23:00)]
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    local = start.tz_localize("UTC").tz_convert(CET)
+    year, month = local.year, local.month
+    chunks = []
+    chunk_start = start
+    while chunk_start < end:
+        label = f"{year}{month:02d}"
+        year, month = year + (month - 1 + months) // 12, (month - 1 + months) % 12 + 1
+        chunk_end = min(pd.Timestamp(cet_to_utc(datetime(year, month, 1))), end)
+        chunks.append((label, chunk_start, chunk_end))
+        chunk_start = chunk_end
+    return chunks
+
+
 # Conversions
 
 
@@ -136,6 +174,53 @@ def posix_hours_to_dt(hours_series):
     return pd.to_datetime(hours_series * 3600, unit="s", origin="unix", utc=True)
 
 
+def posix_hour_range(start, end):
+    """Return a [start, end) hour range as POSIX hours.
+
+    Each bound is either a POSIX hour (int, or a string of digits) or a
+    date/datetime (string or Timestamp, naive = UTC; aware = converted to UTC).
+
+    Example:
+        posix_hour_range("2021-01-04", "2021-01-11") → (447144, 447312)
+
+    Raises:
+        ValueError: If start is after end.
+    """
+
+    def _hour(value):
+        if isinstance(value, numbers.Integral) or (isinstance(value, str) and value.isdigit()):
+            return int(value)
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        return int((ts - pd.Timestamp("1970-01-01")) // pd.Timedelta(hours=1))
+
+    start, end = _hour(start), _hour(end)
+    if start > end:
+        raise ValueError(f"Hour range starts after it ends: [{start}, {end})")
+    return start, end
+
+
+def shift_hours_to_year(utc_posix_hours, from_year, to_year):
+    """Map POSIX hours onto the same UTC calendar hour of another year.
+
+    Used to read weather-dependent data (Renewables.ninja profiles) from a
+    weather year for a different simulation year. Feb 29 maps to Feb 28 when
+    the target year is not a leap year.
+
+    Args:
+        utc_posix_hours: Array-like of int POSIX hours.
+        from_year: Year the hours belong to.
+        to_year: Year to map them onto.
+
+    Returns:
+        np.ndarray of int POSIX hours, aligned with the input.
+    """
+    ts = pd.to_datetime(pd.Series(utc_posix_hours) * 3600, unit="s")
+    shifted = ts + pd.DateOffset(years=to_year - from_year)
+    return to_posix_hours(shifted).to_numpy()
+
+
 # Mappings
 
 
@@ -190,6 +275,27 @@ def hour_to_cet_week(utc_posix_hours):
     return ts.dt.tz_convert(CET).dt.strftime("%Y%W")
 
 
+def parse_month_range(months):
+    """Parse a month range: "3" or 3 → (3, 3), "1-3" or (1, 3) → (1, 3), None → None.
+
+    Raises:
+        ValueError: If the range is malformed or not 1 <= first <= last <= 12.
+    """
+    if months is None or months == "":
+        return None
+    try:
+        if isinstance(months, (list, tuple)):
+            first, last = (int(m) for m in months)
+        else:
+            first, _, last = str(months).partition("-")
+            first, last = int(first), int(last or first)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid month range: {months!r} (expected e.g. 3 or 1-3)") from None
+    if not 1 <= first <= last <= 12:
+        raise ValueError(f"Invalid month range: {months!r} (expected 1 <= first <= last <= 12)")
+    return first, last
+
+
 def cet_period_bounds(year, months=None):
     """Return (utc_start, utc_end) for a year or sub-period in CET.
 
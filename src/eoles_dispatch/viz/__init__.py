@@ -6,8 +6,9 @@ Generates an interactive HTML report with Plotly charts for run inputs
 Usage:
     eoles-dispatch viz my_run
     eoles-dispatch viz run1 run2  # compare two runs
+    eoles-dispatch viz run1 run2 --jobs 4  # render in 4 worker processes
 """
 
-from .report import generate_report
+from .report import generate_report, generate_reports
 
-__all__ = ["generate_report"]
+__all__ = ["generate_report", "generate_reports"]
@@ -1,15 +1,19 @@
-"""Input chart builders (pre-solve data from inputs/ folder)."""
+"""Input chart builders (pre-solve data from inputs/ folder).
+
+Builders take (run, areas): run is the report's RunData context
+(loaders.py), or a run directory for a standalone call.
+"""
 
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from .loaders import load_inputs
+from .loaders import RunData
 from .theme import AGG_COLORS, AGG_ORDER, TEC_AGGREGATION, apply_theme, country_color
 
 
-def chart_demand(run_dir, areas):
-    df = load_inputs(run_dir, areas, "demand.csv", ["area", "hour", "value"])
+def chart_demand(run, areas):
+    df = RunData.of(run).inputs("demand.csv", ["area", "hour", "value"], areas)
     if df is None: 
         return None
     
@@ -29,8 +33,8 @@ def chart_demand(run_dir, areas):
     return apply_theme(fig)
 
 
-def chart_vre_profiles(run_dir, areas):
-    df = load_inputs(run_dir, areas, "vre_profiles.csv", ["area", "tec", "hour", "value"])
+def chart_vre_profiles(run, areas):
+    df = RunData.of(run).inputs("vre_profiles.csv", ["area", "tec", "hour", "value"], areas)
     if df is None: 
         return None
     
@@ -74,8 +78,8 @@ def chart_vre_profiles(run_dir, areas):
     return apply_theme(fig, extra_top_margin=20)
 
 
-def chart_nmd(run_dir, areas):
-    df = load_inputs(run_dir, areas, "nmd.csv", ["area", "hour", "value"])
+def chart_nmd(run, areas):
+    df = RunData.of(run).inputs("nmd.csv", ["area", "hour", "value"], areas)
     if df is None:
         return None
 
@@ -95,8 +99,8 @@ def chart_nmd(run_dir, areas):
     return apply_theme(fig)
 
 
-def chart_exo_prices(run_dir, areas):
-    df = load_inputs(run_dir, areas, "exoPrices.csv", ["area", "hour", "value"])
+def chart_exo_prices(run, areas):
+    df = RunData.of(run).inputs("exoPrices.csv", ["area", "hour", "value"], areas)
     if df is None:
         return None
 
@@ -116,8 +120,8 @@ def chart_exo_prices(run_dir, areas):
     return apply_theme(fig)
 
 
-def chart_nuclear_availability(run_dir, areas):
-    df = load_inputs(run_dir, areas, "nucMaxAF.csv", ["area", "week", "value"])
+def chart_nuclear_availability(run, areas):
+    df = RunData.of(run).inputs("nucMaxAF.csv", ["area", "week", "value"], areas)
     if df is None:
         return None
     
@@ -143,8 +147,8 @@ def chart_nuclear_availability(run_dir, areas):
     return apply_theme(fig)
 
 
-def chart_lake_inflows(run_dir, areas):
-    df = load_inputs(run_dir, areas, "lake_inflows.csv", ["area", "month", "value"])
+def chart_lake_inflows(run, areas):
+    df = RunData.of(run).inputs("lake_inflows.csv", ["area", "month", "value"], areas)
     if df is None:
         return None
     
@@ -168,13 +172,13 @@ def chart_lake_inflows(run_dir, areas):
     return apply_theme(fig)
 
 
-def chart_capacity_mix(run_dir, areas):
-    df = load_inputs(run_dir, areas, "capa.csv", ["area", "tec", "value"])
+def chart_capacity_mix(run, areas):
+    df = RunData.of(run).inputs("capa.csv", ["area", "tec", "value"], areas)
     if df is None:
         return None
 
-    df["group"] = df["tec"].map(TEC_AGGREGATION).fillna(df["tec"])
-    agg = df.groupby(["area", "group"])["value"].sum().reset_index()
+    group = df["tec"].map(TEC_AGGREGATION).fillna(df["tec"])
+    agg = df.assign(group=group).groupby(["area", "group"])["value"].sum().reset_index()
 
     area_list = [a for a in areas if a in agg["area"].values]
     n = len(area_list)
@@ -251,8 +255,8 @@ def chart_capacity_mix(run_dir, areas):
     return apply_theme(fig, keep_legend=True)
 
 
-def chart_interconnections(run_dir, areas):
-    df = load_inputs(run_dir, areas, "links.csv", ["exporter", "importer", "value"])
+def chart_interconnections(run, areas):
+    df = RunData.of(run).inputs("links.csv", ["exporter", "importer", "value"], areas)
     if df is None:
         return None
 
@@ -1,4 +1,8 @@
-"""Output chart builders (post-solve data from outputs/ folder)."""
+"""Output chart builders (post-solve data from outputs/ folder).
+
+Builders take (run, areas): run is the report's RunData context
+(loaders.py), or a run directory for a standalone call.
+"""
 
 import io
 import logging
@@ -13,11 +17,8 @@ import plotly.graph_objects as go
 matplotlib.use("Agg")
 from plotly.subplots import make_subplots  # noqa: E402
 
-from ..utils import hour_to_cet_month, posix_hours_to_dt  # noqa: E402
-from .loaders import (  # noqa: E402
-    load_actual_prices,
-    load_actual_production,
-)
+from ..utils import hour_to_cet_month  # noqa: E402
+from .loaders import RunData  # noqa: E402
 from .theme import (  # noqa: E402
     AGG_COLORS,
     AGG_NEGATIVE,
@@ -34,7 +35,7 @@ logger = logging.getLogger(__name__)
 # ── Price overview ──
 
 
-def html_price_overview(run_dir, areas, *, validate=False):
+def html_price_overview(run, areas, *, validate=False):
     """Side-by-side: HTML stats table (left) + Plotly price duration curve (right).
 
     When validate=True, loads actual prices and adds Sim/Act columns, error metrics,
@@ -42,11 +43,11 @@ def html_price_overview(run_dir, areas, *, validate=False):
 
     Returns raw HTML string with embedded Plotly chart.
     """
-    path = run_dir / "outputs" / "prices.csv"
-    if not path.exists():
+    data = RunData.of(run)
+    df = data.output("prices")
+    if df is None:
         logger.warning("prices.csv: file not found in outputs/.")
         return None
-    df = pd.read_csv(path)
     cols = [c for c in areas if c in df.columns]
     if not cols:
         logger.warning("prices.csv: no data for requested areas.")
@@ -55,7 +56,7 @@ def html_price_overview(run_dir, areas, *, validate=False):
     actual_df = None
     actual_cols = []
     if validate:
-        actual_df = load_actual_prices(run_dir)
+        actual_df = data.actual_prices()
         actual_cols = [c for c in cols if actual_df is not None and c in actual_df.columns]
 
     table_html = _price_stats_table(df, cols, actual_df, actual_cols)
@@ -238,26 +239,25 @@ def _price_duration_curve(df, cols, actual_df=None, actual_cols=()):
 # ── Price full series ──
 
 
-def chart_prices(run_dir, areas, *, validate=False):
+def chart_prices(run, areas, *, validate=False):
     """Hourly price time series.
 
     When validate=True, overlays actual prices as dashed traces.
     """
-    path = run_dir / "outputs" / "prices.csv"
-    if not path.exists():
+    data = RunData.of(run)
+    df = data.output("prices")
+    if df is None:
         logger.warning("prices.csv: file not found in outputs/.")
         return None
-    df = pd.read_csv(path)
     if "hour" not in df.columns:
         logger.warning("prices.csv: missing 'hour' column.")
         return None
-    df["datetime"] = posix_hours_to_dt(df["hour"])
     cols = [c for c in areas if c in df.columns]
     if not cols:
         logger.warning("prices.csv: no data for requested areas.")
         return None
 
-    actual_df = load_actual_prices(run_dir) if validate else None
+    actual_df = data.actual_prices() if validate else None
     has_actual = actual_df is not None
 
     fig = go.Figure()
@@ -304,14 +304,14 @@ def chart_prices(run_dir, areas, *, validate=False):
     return apply_theme(fig)
 
 
-def chart_price_scatter(run_dir, areas):
+def chart_price_scatter(run, areas):
     """Scatter plot of simulated vs actual prices (when historical data is available)."""
-    path = run_dir / "outputs" / "prices.csv"
-    if not path.exists():
+    data = RunData.of(run)
+    df = data.output("prices")
+    if df is None:
         logger.warning("prices.csv: file not found in outputs/.")
         return None
-    df = pd.read_csv(path)
-    actual_df = load_actual_prices(run_dir)
+    actual_df = data.actual_prices()
     if actual_df is None:
         return None
 
@@ -409,7 +409,7 @@ _TABLE_EXCHANGES = [
 ]
 
 
-def _compute_energy_mix(run_dir, areas, validate=False):
+def _compute_energy_mix(run, areas, validate=False):
     """Load and aggregate energy mix data over the full simulation period.
 
     Returns (area_list, enermix_sim, enermix_act, demand_sim, demand_act) where:
@@ -418,13 +418,9 @@ def _compute_energy_mix(run_dir, areas, validate=False):
     - enermix_act / demand_act are None when validate=False or actual data is unavailable.
     Returns ([], None, None, None, None) on missing/invalid input data.
     """
-    path = run_dir / "outputs" / "production.csv"
-    if not path.exists():
-        logger.warning("production.csv: file not found in outputs/.")
-        return [], None, None, None, None
-    df = pd.read_csv(path)
-    if "hour" not in df.columns or "area" not in df.columns:
-        logger.warning("production.csv: missing 'hour' or 'area' column.")
+    data = RunData.of(run)
+    df = _read_production_rollup(data, "annual", areas)
+    if df is None:
         return [], None, None, None, None
 
     area_list, agg_data = _build_energy_agg(df, areas)
@@ -448,7 +444,7 @@ def _compute_energy_mix(run_dir, areas, validate=False):
     enermix_act = None
     demand_act = None
     if validate:
-        actual_df = load_actual_production(run_dir)
+        actual_df = data.actual_production()
         if actual_df is not None:
             _, agg_actual = _build_energy_agg(actual_df, area_list)
             if agg_actual is not None:
@@ -664,34 +660,34 @@ def _energy_mix_table(area_list, enermix_sim, enermix_act, demand_sim=None, dema
 </table>"""
 
 
-def chart_energy_mix(run_dir, areas, validate=False):
+def chart_energy_mix(run, areas, validate=False):
     """Energy mix over the full simulation period: stacked bar per area, as inline SVG HTML.
 
     Positive groups stack above the x-axis from zero; negative groups below from zero.
     If validate=True, interleaves simulated and actual bars per area (--validate mode).
     Falls back to validate=False if actual data is unavailable.
     """
-    area_list, enermix_sim, enermix_act, _, _ = _compute_energy_mix(run_dir, areas, validate)
+    area_list, enermix_sim, enermix_act, _, _ = _compute_energy_mix(run, areas, validate)
     if not area_list:
         return None
     return _energy_mix_fig(area_list, enermix_sim, enermix_act)
 
 
-def html_energy_mix(run_dir, areas, validate=False):
+def html_energy_mix(run, areas, validate=False):
     """Energy mix over the full simulation period as an HTML table (TWh, one row per technology group).
 
     In validate mode, each area gets Sim / Act sub-columns.
     Returns an HTML string, or None if data is unavailable.
     """
     area_list, enermix_sim, enermix_act, demand_sim, demand_act = _compute_energy_mix(
-        run_dir, areas, validate
+        run, areas, validate
     )
     if not area_list:
         return None
     return _energy_mix_table(area_list, enermix_sim, enermix_act, demand_sim, demand_act)
 
 
-def html_energy_mix_overview(run_dir, areas, validate=False):
+def html_energy_mix_overview(run, areas, validate=False):
     """Side-by-side: static SVG energy mix chart (left) + HTML summary table (right).
 
     When validate=True, the chart interleaves Sim/Act bars and the table adds Sim/Act columns.
@@ -700,7 +696,7 @@ def html_energy_mix_overview(run_dir, areas, validate=False):
     Returns a raw HTML string with embedded SVG chart.
     """
     area_list, enermix_sim, enermix_act, demand_sim, demand_act = _compute_energy_mix(
-        run_dir, areas, validate
+        run, areas, validate
     )
     if not area_list:
         return None
@@ -734,15 +730,11 @@ def html_energy_mix_overview(run_dir, areas, validate=False):
 </div>"""
 
 
-def chart_energy_mix_monthly(run_dir, areas):
+def chart_energy_mix_monthly(run, areas):
     """Monthly energy mix: stacked bar chart by month, one subplot per area."""
-    path = run_dir / "outputs" / "production.csv"
-    if not path.exists():
-        logger.warning("production.csv: file not found in outputs/.")
-        return None
-    df = pd.read_csv(path)
-    if "hour" not in df.columns or "area" not in df.columns:
-        logger.warning("production.csv: missing 'hour' or 'area' column.")
+    data = RunData.of(run)
+    df = _read_production_rollup(data, "monthly", areas)
+    if df is None:
         return None
 
     area_list, agg_data = _build_energy_agg(df, areas)
@@ -750,7 +742,7 @@ def chart_energy_mix_monthly(run_dir, areas):
         logger.warning("production.csv: no data for requested areas.")
         return None
 
-    agg_data["month"] = hour_to_cet_month(agg_data["hour"])  # "YYYYMM" in CET
+    agg_data = agg_data.rename(columns={"period": "month"})  # "YYYYMM" in CET
     tec_display_cols = [g for g in AGG_ORDER if g in agg_data.columns]
     n = len(area_list)
 
@@ -776,15 +768,11 @@ def chart_energy_mix_monthly(run_dir, areas):
     return fig
 
 
-def chart_energy_mix_monthly_validate(run_dir, areas):
+def chart_energy_mix_monthly_validate(run, areas):
     """Monthly energy mix: months interleaved (sim / act) per area (--validate mode)."""
-    path = run_dir / "outputs" / "production.csv"
-    if not path.exists():
-        logger.warning("production.csv: file not found in outputs/.")
-        return None
-    df = pd.read_csv(path)
-    if "hour" not in df.columns or "area" not in df.columns:
-        logger.warning("production.csv: missing 'hour' or 'area' column.")
+    data = RunData.of(run)
+    df = _read_production_rollup(data, "monthly", areas)
+    if df is None:
         return None
 
     area_list, agg_data = _build_energy_agg(df, areas)
@@ -792,16 +780,16 @@ def chart_energy_mix_monthly_validate(run_dir, areas):
         logger.warning("production.csv: no data for requested areas.")
         return None
 
-    agg_data["month"] = hour_to_cet_month(agg_data["hour"])  # "YYYYMM" in CET
+    agg_data = agg_data.rename(columns={"period": "month"})  # "YYYYMM" in CET
     tec_display_cols = [g for g in AGG_ORDER if g in agg_data.columns]
 
-    actual_df = load_actual_production(run_dir)
+    actual_df = data.actual_production()
     if actual_df is None:
-        return chart_energy_mix_monthly(run_dir, areas)
+        return chart_energy_mix_monthly(data, areas)
 
     _, agg_actual = _build_energy_agg(actual_df, area_list)
     if agg_actual is None:
-        return chart_energy_mix_monthly(run_dir, areas)
+        return chart_energy_mix_monthly(data, areas)
 
     agg_actual["month"] = hour_to_cet_month(agg_actual["hour"])  # "YYYYMM" in CET
     tec_display_cols_act = [g for g in AGG_ORDER if g in agg_actual.columns]
@@ -882,22 +870,19 @@ def chart_energy_mix_monthly_validate(run_dir, areas):
     return fig
 
 
-def chart_production(run_dir, areas):
+def chart_production(run, areas):
     """Stacked area production mix with aggregated technologies."""
-    path = run_dir / "outputs" / "production.csv"
-    if not path.exists():
+    df = RunData.of(run).output("production", areas=areas)
+    if df is None:
         logger.warning("production.csv: file not found in outputs/.")
         return None
-    df = pd.read_csv(path)
     if "hour" not in df.columns or "area" not in df.columns:
         logger.warning("production.csv: missing 'hour' or 'area' column.")
         return None
-    df = df[df["area"].isin(areas)]
     if df.empty:
         logger.warning("production.csv: no data for requested areas.")
         return None
 
-    df["datetime"] = posix_hours_to_dt(df["hour"])
     tec_cols = [c for c in df.columns if c not in ("hour", "area", "datetime", "demand")]
 
     # Aggregate technologies
@@ -999,18 +984,31 @@ def chart_production(run_dir, areas):
 # ── Energy mix helpers ──
 
 
+def _read_production_rollup(data, resolution, areas):
+    """Production rollup (GWh per CET period, run/rollups.py), or None with a warning."""
+    df = data.rollup("production", resolution, areas=areas)
+    if df is None:
+        logger.warning("production.csv: file not found in outputs/.")
+        return None
+    if "area" not in df.columns:
+        logger.warning("production.csv: missing 'area' column.")
+        return None
+    return df
+
+
 def _build_energy_agg(df, areas):
     """Return (area_list, agg_data) for energy mix charts.
 
-    agg_data has columns: area, hour, <display_label>...
-    Values are in GW (one row per simulation hour).
+    agg_data has columns: area, hour (or period), <display_label>...
+    Values are in GW for hourly tables (one row per simulation hour), in GWh
+    for production rollups (one row per period).
     """
-    df = df[df["area"].isin(areas)].copy()
+    df = df[df["area"].isin(areas)]
     if df.empty:
         return [], None
 
-    df["datetime"] = posix_hours_to_dt(df["hour"])
-    tec_cols = [c for c in df.columns if c not in ("hour", "area", "datetime", "demand")]
+    keys = [c for c in ("area", "hour", "period") if c in df.columns]
+    tec_cols = [c for c in df.columns if c not in keys and c not in ("datetime", "hours", "demand")]
 
     agg_groups = {}
     for tec in tec_cols:
@@ -1020,7 +1018,7 @@ def _build_energy_agg(df, areas):
         else:
             agg_groups[group] = agg_groups[group] + df[tec].values
 
-    agg_data = df[["area", "hour"]].copy()
+    agg_data = df[keys].copy()
     if "demand" in df.columns:
         agg_data["demand"] = df["demand"].values
     for group, vals in agg_groups.items():
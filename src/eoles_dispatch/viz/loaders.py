@@ -4,7 +4,11 @@ High-level entry point:
     prepare_validation_data  — called by generate_report when validate=True;
         ensures validation/ files exist (downloading source data if needed).
 
-Loaders (called by chart builders):
+Run data context (passed to chart builders by generate_report):
+    RunData                  — reads each table of a run once and shares the
+        parsed frames, datetime columns and per-area views between charts.
+
+Loaders (called by RunData, or directly):
     load_inputs              — load a formatted input CSV from inputs/.
     load_actual_prices       — load historical prices from validation/.
     load_actual_production   — load historical production from validation/.
@@ -16,12 +20,15 @@ Preparation helpers (private):
 """
 
 import logging
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import yaml
 
 from ..config import RAW_TO_AGG
+from ..run.output_io import read_output
+from ..run.rollups import read_rollup
 from ..utils import cet_period_bounds, posix_hours_to_dt, to_posix_hours
 
 logger = logging.getLogger(__name__)
@@ -64,7 +71,102 @@ def prepare_validation_data(run_dir, meta):
     _prepare_actual_production(data_dir, run_dir, year, areas, months)
 
 
-# ── Loaders (called by chart builders) ──
+# ── Run data context ──
+
+
+class RunData:
+    """Tables of one run, loaded on first use and shared by all report charts.
+
+    generate_report builds one RunData per run and passes it to every chart
+    builder, so each file is read and parsed once for all tabs (France,
+    neighbours) and validation variants. Hourly tables get their 'datetime'
+    column once; tables with an area column are filtered once per area list.
+
+    Chart builders also accept a plain run directory (RunData.of wraps it),
+    so they can be called on their own. Returned frames are shared between
+    charts and must not be modified in place.
+
+    Args:
+        run_dir: Path to the run directory.
+    """
+
+    def __init__(self, run_dir):
+        self.run_dir = Path(run_dir)
+        self._cache = {}
+
+    @classmethod
+    def of(cls, run):
+        """Return ``run`` if it is already a RunData, else a new one for that directory."""
+        return run if isinstance(run, cls) else cls(run)
+
+    def __repr__(self):
+        return f"RunData({str(self.run_dir)!r})"
+
+    @property
+    def metadata(self):
+        """run.yaml contents (raises FileNotFoundError if absent)."""
+        return self._memo(("metadata",), lambda: load_metadata(self.run_dir))
+
+    def output(self, name, areas=None):
+        """Output table (as read_output) with a 'datetime' column, or None if absent.
+
+        For tables with an 'area' column, ``areas`` keeps only those rows.
+        """
+
+        def build():
+            df = read_output(self.run_dir, name)
+            if df is not None and "hour" in df.columns:
+                df["datetime"] = posix_hours_to_dt(df["hour"])
+            return df
+
+        return self._view(("output", name), build, areas)
+
+    def rollup(self, table, resolution, areas=None):
+        """Base-block rollup of an output table (run/rollups.py), or None if absent."""
+        return self._view(
+            ("rollup", table, resolution),
+            lambda: read_rollup(self.run_dir, table, resolution),
+            areas,
+        )
+
+    def inputs(self, filename, col_names, areas):
+        """Formatted input table filtered by area, as load_inputs (None if absent or empty)."""
+        df = self._memo(
+            ("inputs", filename), lambda: _read_inputs(self.run_dir, filename, col_names)
+        )
+        if df is None:
+            return None
+        return self._memo(
+            ("inputs", filename, tuple(areas)),
+            lambda: _filter_inputs(df, filename, col_names, areas),
+        )
+
+    def actual_prices(self):
+        """Historical prices from validation/, as load_actual_prices."""
+        return self._memo(("actual_prices",), lambda: load_actual_prices(self.run_dir))
+
+    def actual_production(self):
+        """Historical production from validation/, as load_actual_production."""
+        return self._memo(("actual_production",), lambda: load_actual_production(self.run_dir))
+
+    # ── Helpers ──
+
+    def _memo(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def _view(self, key, build, areas):
+        df = self._memo(key, build)
+        if df is None or areas is None or "area" not in df.columns:
+            return df
+        return self._memo(
+            key + (tuple(areas),),
+            lambda: df[df["area"].isin(areas)].reset_index(drop=True),
+        )
+
+
+# ── Loaders ──
 
 
 def load_inputs(run_dir, areas, filename, col_names):
@@ -77,7 +179,15 @@ def load_inputs(run_dir, areas, filename, col_names):
     Returns a DataFrame, or None (with a warning) if the file is absent
     or contains no data for the requested areas.
     """
-    path = run_dir / "inputs" / filename
+    df = _read_inputs(run_dir, filename, col_names)
+    if df is None:
+        return None
+    return _filter_inputs(df, filename, col_names, areas)
+
+
+def _read_inputs(run_dir, filename, col_names):
+    """Parse an input CSV with its datetime columns (None with a warning if absent)."""
+    path = Path(run_dir) / "inputs" / filename
     if not path.exists():
         logger.warning(f"{filename}: file not found.")
         return None
@@ -94,7 +204,11 @@ def load_inputs(run_dir, areas, filename, col_names):
         )
     if "month" in col_names:
         df["date"] = pd.to_datetime(df["month"], format="%Y%m", errors="coerce")
+    return df
+
 
+def _filter_inputs(df, filename, col_names, areas):
+    """Rows of a parsed input table for the requested areas (None with a warning if empty)."""
     if "area" in col_names:
         df = df[df["area"].isin(areas)]
     if "importer" in col_names and "exporter" in col_names:
@@ -1,9 +1,17 @@
-"""Chart registries, renderer, and main HTML report generator."""
+"""Chart registries, renderer, and main HTML report generator.
+
+Charts are rendered one after another, or with jobs > 1 in worker processes
+(each holding its own RunData of the run); the report lists them in
+registry order either way. generate_reports spreads several runs over the
+workers instead.
+"""
 
 import functools
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from ..run.output_io import output_path
 from .charts_inputs import (
     chart_capacity_mix,
     chart_demand,
@@ -23,13 +31,13 @@ from .charts_outputs import (
     html_energy_mix_overview,
     html_price_overview,
 )
-from .loaders import load_metadata, prepare_validation_data
+from .loaders import RunData, load_metadata, prepare_validation_data
 from .theme import MONTH_LABELS
 
 # ── Main orchestrator ──
 
 
-def generate_report(run_dir, open_browser=True, validate=False):
+def generate_report(run_dir, open_browser=True, validate=False, jobs=1):
     """Generate an interactive HTML report for a run.
 
     Args:
@@ -37,11 +45,13 @@ def generate_report(run_dir, open_browser=True, validate=False):
         open_browser: Open the report in the default browser.
         validate: If True, overlay historical day-ahead prices on price charts
             and show error metrics (Bias, RMSE, MAE, R², Corr).
+        jobs: Number of worker processes rendering charts in parallel.
 
     Tabs: France Inputs | France Outputs | Neighbors Inputs | Neighbors Outputs
     """
     run_dir = Path(run_dir)
-    meta = load_metadata(run_dir)
+    data = RunData(run_dir)  # each table is read once for all tabs
+    meta = data.metadata
     all_areas = meta.get("areas", ["FR"])
     focus = "FR"
     other_areas = [a for a in all_areas if a != focus]
@@ -49,19 +59,19 @@ def generate_report(run_dir, open_browser=True, validate=False):
     if validate:
         prepare_validation_data(run_dir, meta)
 
-    has_outputs = (run_dir / "outputs").exists() and any((run_dir / "outputs").glob("*.csv"))
+    has_outputs = any(output_path(run_dir, name) for name in ("prices", "production"))
     output_charts = _OUTPUT_CHARTS_VALIDATE if validate else _OUTPUT_CHARTS
 
     # Build all chart HTML
-    fr_input_parts = _render_charts(run_dir, _INPUT_CHARTS_FR, [focus])
-    fr_output_parts = []
-    if has_outputs:
-        fr_output_parts = _render_charts(run_dir, output_charts, [focus])
-
-    other_input_parts = _render_charts(run_dir, _INPUT_CHARTS_OTHER, other_areas)
-    other_output_parts = []
-    if has_outputs:
-        other_output_parts = _render_charts(run_dir, output_charts, other_areas)
+    sections = [
+        (_INPUT_CHARTS_FR, [focus]),
+        (output_charts if has_outputs else [], [focus]),
+        (_INPUT_CHARTS_OTHER, other_areas),
+        (output_charts if has_outputs else [], other_areas),
+    ]
+    fr_input_parts, fr_output_parts, other_input_parts, other_output_parts = _render_sections(
+        data, sections, jobs
+    )
 
     fr_input_html = (
         "\n".join(fr_input_parts)
@@ -464,6 +474,34 @@ function switchTab(id) {{
     return out_path
 
 
+def generate_reports(run_dirs, open_browser=True, validate=False, jobs=1):
+    """Generate the reports of several runs, in parallel worker processes if jobs > 1.
+
+    A single run has its charts rendered in parallel (generate_report with
+    ``jobs``); several runs are spread over the workers, one report each.
+
+    Returns:
+        Paths of the reports, in the order of ``run_dirs``.
+    """
+    run_dirs = [Path(run_dir) for run_dir in run_dirs]
+    if jobs <= 1 or len(run_dirs) <= 1:
+        return [
+            generate_report(run_dir, open_browser=open_browser, validate=validate, jobs=jobs)
+            for run_dir in run_dirs
+        ]
+
+    if validate:
+        # Prepared here, one run at a time: runs of a year share data/<year>/ downloads
+        for run_dir in run_dirs:
+            prepare_validation_data(run_dir, load_metadata(run_dir))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        paths = list(pool.map(_report_task, [(run_dir, validate) for run_dir in run_dirs]))
+    if open_browser:
+        for path in paths:
+            webbrowser.open(f"file://{path.resolve()}")
+    return paths
+
+
 # ── Chart configuration and rendering ──
 
 _INPUT_CHARTS_FR = [
@@ -512,9 +550,10 @@ _OUTPUT_CHARTS_VALIDATE = [
 ]
 
 
-def _render_charts(run_dir, chart_list, areas):
+def _render_charts(data, chart_list, areas):
     """Render a list of charts to HTML divs.
 
+    Every chart_fn is called with the shared RunData context and the areas.
     Registry entries are (label, chart_fn) pairs.
     - If chart_fn is None: label is a section header → renders an <h2> divider.
     - Otherwise: label is an optional HTML chart title (shown if non-empty and
@@ -523,19 +562,64 @@ def _render_charts(run_dir, chart_list, areas):
     """
     parts = []
     for label, chart_fn in chart_list:
-        if chart_fn is None:
-            parts.append(f'<div class="output-section"><h2>{label}</h2></div>')
-            continue
-        result = chart_fn(run_dir, areas)
-        if result is None:
-            continue
-        title_html = (
-            f'<div class="chart-label">{label}</div>' if label and label[0].isupper() else ""
-        )
-        if isinstance(result, str):
-            parts.append(f'<div class="chart-raw">{title_html}{result}</div>')
-        else:
-            parts.append(
-                f'<div class="chart">{title_html}{result.to_html(full_html=False, include_plotlyjs=False)}</div>'
-            )
+        html = _render_chart(data, label, chart_fn, areas)
+        if html is not None:
+            parts.append(html)
     return parts
+
+
+def _render_chart(data, label, chart_fn, areas):
+    """HTML div of one registry entry, or None if the chart has no data."""
+    if chart_fn is None:
+        return f'<div class="output-section"><h2>{label}</h2></div>'
+    result = chart_fn(data, areas)
+    if result is None:
+        return None
+    title_html = f'<div class="chart-label">{label}</div>' if label and label[0].isupper() else ""
+    if isinstance(result, str):
+        return f'<div class="chart-raw">{title_html}{result}</div>'
+    return f'<div class="chart">{title_html}{result.to_html(full_html=False, include_plotlyjs=False)}</div>'
+
+
+def _render_sections(data, sections, jobs=1):
+    """Render (chart_list, areas) sections; returns one list of HTML divs per section.
+
+    With jobs > 1, charts are rendered in worker processes; pool.map keeps
+    them in registry order.
+    """
+    if jobs <= 1:
+        return [_render_charts(data, chart_list, areas) for chart_list, areas in sections]
+
+    tasks = [
+        (i, label, chart_fn, areas)
+        for i, (chart_list, areas) in enumerate(sections)
+        for label, chart_fn in chart_list
+    ]
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(str(data.run_dir),)
+    ) as pool:
+        results = list(pool.map(_render_task, tasks))
+    parts = [[] for _ in sections]
+    for (i, *_), html in zip(tasks, results):
+        if html is not None:
+            parts[i].append(html)
+    return parts
+
+
+# RunData of the run rendered by a worker process (set by _init_worker)
+_worker_data = None
+
+
+def _init_worker(run_dir):
+    global _worker_data
+    _worker_data = RunData(run_dir)
+
+
+def _render_task(task):
+    _, label, chart_fn, areas = task
+    return _render_chart(_worker_data, label, chart_fn, areas)
+
+
+def _report_task(task):
+    run_dir, validate = task
+    return generate_report(run_dir, open_browser=False, validate=validate)
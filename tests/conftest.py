@@ -400,3 +400,52 @@ def solved_run(tmp_path):
     assert results.solver.termination_condition == TerminationCondition.optimal
     (tmp_path / "outputs").mkdir(exist_ok=True)
     return (model, tmp_path)
+
+
+# ── Synthetic run outputs (results, rollups) ──
+
+# Monday 2021-01-04 00:00 CET to Wednesday 00:00 CET: two weekdays
+_RUN_START = 447143
+_RUN_HOURS = np.arange(_RUN_START, _RUN_START + 48)
+
+
+def _run_prices(fr_offset=0.0):
+    """Hourly prices of the synthetic run: FR ramps 0..47 (+ offset), DE flat at 30."""
+    return pd.DataFrame(
+        {"FR": np.arange(48.0) + fr_offset, "DE": np.full(48, 30.0)},
+        index=pd.Index(_RUN_HOURS, name="hour"),
+    )
+
+
+def _run_production():
+    """Hourly production of the synthetic run, indexed by area, hour as production.csv."""
+    return pd.DataFrame(
+        {
+            "area": np.repeat(_AREAS, 48),
+            "hour": np.tile(_RUN_HOURS, 2),
+            "nuclear": np.r_[np.full(48, 40.0), np.full(48, 10.0)],
+            "gas": np.r_[np.full(48, 1.0), np.full(48, 2.0)],
+            "demand": 50.0,
+        }
+    ).set_index(["area", "hour"])
+
+
+@pytest.fixture
+def make_run_outputs():
+    """Factory writing the synthetic prices and production to <run_dir>/outputs/.
+
+    make_run_outputs(run_dir, output_format="csv", fr_offset=0.0) returns
+    run_dir; columnar formats are skipped when pyarrow is not installed.
+    """
+    from eoles_dispatch.run.output_io import write_output
+
+    def make(run_dir, output_format="csv", fr_offset=0.0):
+        if output_format != "csv":
+            pytest.importorskip("pyarrow")
+        output_dir = Path(run_dir) / "outputs"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        write_output(_run_prices(fr_offset), output_dir, "prices", output_format)
+        write_output(_run_production(), output_dir, "production", output_format)
+        return Path(run_dir)
+
+    return make
@@ -37,6 +37,12 @@ def test_cli_collect_start_equals_end():
     assert "must be greater" in r.stderr
 
 
+def test_cli_import_entsoe_needs_both_bounds(tmp_path):
+    r = _run_cli("import-entsoe", str(tmp_path), "--start", "2021")
+    assert r.returncode != 0
+    assert "--start and --end" in r.stderr
+
+
 def test_cli_create_missing_scenario(tmp_path):
     r = _run_cli(
         "create",
@@ -50,3 +56,33 @@ def test_cli_create_missing_scenario(tmp_path):
         str(tmp_path),
     )
     assert r.returncode != 0
+
+
+def test_cli_create_rejects_reversed_months(tmp_path):
+    r = _run_cli(
+        "create",
+        "foo",
+        "--scenario",
+        "baseline",
+        "--year",
+        "2020",
+        "--months",
+        "3-1",
+        "--project-dir",
+        str(tmp_path),
+    )
+    assert r.returncode != 0
+    assert "Invalid --months" in r.stderr
+
+
+def test_cli_solve_rejects_unknown_output_format(tmp_path):
+    r = _run_cli("solve", "foo", "--output-format", "xlsx", "--project-dir", str(tmp_path))
+    assert r.returncode != 0
+    assert "invalid choice" in r.stderr
+
+
+def test_cli_compare_missing_run(tmp_path):
+    (tmp_path / "runs").mkdir()
+    r = _run_cli("compare", "nope", "--project-dir", str(tmp_path))
+    assert r.returncode != 0
+    assert "nope" in r.stderr
@@ -1,14 +1,27 @@
 """Tests for data collection utilities and pipeline functions."""
 
+import os
+import threading
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from eoles_dispatch.collect import elexon, entsoe, gap_filling, http_cache
 from eoles_dispatch.collect._main_collect import _is_production_usable
 from eoles_dispatch.collect.entsoe import ENTSOE_COL_NAMES, PRODUCTION_TYPES, col_matches, is_usable
-from eoles_dispatch.collect.gap_filling import Report, interpolate_gaps
+from eoles_dispatch.collect.gap_filling import (
+    Report,
+    _find_gaps,
+    interpolate_gaps,
+    interpolate_gaps_frame,
+)
+from eoles_dispatch.collect.http_cache import HttpCache, OfflineCacheMiss
+from eoles_dispatch.collect.rninja import STORE_DIR, build_ninja_store, read_ninja_store
 from eoles_dispatch.utils import (
     canonical_index,
+    cet_month_chunks,
     cet_year_bounds,
     expected_hours,
     resample_to_hourly,
@@ -75,6 +88,25 @@ def test_canonical_index_is_naive_utc():
     assert idx.tz is None
 
 
+# ── cet_month_chunks ──
+
+
+def test_cet_month_chunks_tile_the_year():
+    start, end = cet_year_bounds(2021)
+    chunks = cet_month_chunks(start, end)
+    assert [label for label, _, _ in chunks] == [f"2021{m:02d}" for m in range(1, 13)]
+    assert chunks[0][1] == start and chunks[-1][2] == end
+    assert all(a[2] == b[1] for a, b in zip(chunks, chunks[1:]))
+    assert chunks[3][1] == pd.Timestamp("2021-03-31 22:00")  # April starts in CEST
+
+
+def test_cet_month_chunks_truncates_last_chunk():
+    start, end = cet_year_bounds(2021)
+    chunks = cet_month_chunks(start, end, months=5)
+    assert [label for label, _, _ in chunks] == ["202101", "202106", "202111"]
+    assert chunks[-1][2] == end
+
+
 # ── resample_to_hourly ──
 
 
@@ -251,6 +283,43 @@ def test_interpolate_fills_all_nans(tmp_path):
     assert not_filled == 0
 
 
+def test_find_gaps_run_lengths():
+    s = pd.Series([np.nan, 1.0, np.nan, np.nan, 2.0, 3.0, np.nan])
+    assert _find_gaps(s) == [(0, 1), (2, 2), (6, 1)]
+
+
+def test_interpolate_gaps_frame_matches_per_column(tmp_path):
+    """Matrix filling gives the same values and report entries as column by column."""
+    idx = pd.date_range("2023-01-01", periods=24 * 7 * 6, freq="h")
+    rng = np.random.default_rng(1)
+    base = 10 + np.sin(np.arange(len(idx)) * 2 * np.pi / 24)
+    frame = pd.DataFrame({c: base + rng.random(len(idx)) for c in ("gas", "nuclear", "solar")}, idx)
+    frame.iloc[100:102, 0] = np.nan  # linear
+    frame.iloc[400:430, 1] = np.nan  # weekly analogue
+    frame.iloc[500:700, 2] = np.nan  # too long
+    frame.iloc[0:3, 2] = np.nan  # at start: analogue
+
+    by_column = Report(tmp_path / "a")
+    (tmp_path / "a").mkdir()
+    expected = pd.DataFrame(
+        {c: interpolate_gaps(frame[c], by_column, variable=c, area="FR")[0] for c in frame}
+    )
+    batched = Report(tmp_path / "b")
+    (tmp_path / "b").mkdir()
+    result, filled, not_filled = interpolate_gaps_frame(frame, batched, area="FR")
+
+    pd.testing.assert_frame_equal(result, expected)
+    strip = lambda entries: [{k: v for k, v in e.items() if k != "recorded_at"} for e in entries]  # noqa: E731
+    assert strip(batched.entries) == strip(by_column.entries)
+    assert [e["method"] for e in batched.entries] == [
+        "linear_interpolation",
+        "weekly_analogue_next_±1",
+        "weekly_analogue_next_±1",
+        "NOT FILLED: GAP TOO LONG",
+    ]
+    assert (filled, not_filled) == (2 + 30 + 3, 200)
+
+
 # ── _is_production_usable ──
 
 
@@ -294,3 +363,282 @@ def test_report_load_nonexistent(tmp_path):
     """Report.load on a missing file should return an empty report."""
     loaded = Report.load(tmp_path / "does_not_exist.csv")
     assert len(loaded.entries) == 0
+
+
+def test_report_buffers_until_flush(tmp_path):
+    csv_path = tmp_path / "_gap_fill_report.csv"
+    with Report(tmp_path) as report:
+        report.add("demand", "FR", pd.Timestamp("2023-01-01"), 3, "linear_interpolation")
+        assert not csv_path.exists()
+    assert len(pd.read_csv(csv_path)) == 1  # flushed on exit
+
+
+def test_report_flushes_every_n_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(Report, "FLUSH_ENTRIES", 10)
+    report = Report(tmp_path)
+    for i in range(25):
+        report.add("demand", "FR", pd.Timestamp("2023-01-01") + pd.Timedelta(hours=i), 1, "x")
+    assert len(pd.read_csv(tmp_path / "_gap_fill_report.csv")) == 20
+    report.flush()
+    assert len(Report.load(tmp_path / "_gap_fill_report.csv").entries) == 25
+
+
+def test_report_flush_completes_short_writes(tmp_path, monkeypatch):
+    """A flush keeps writing until every byte is in the file."""
+    real_write = os.write
+    monkeypatch.setattr(gap_filling.os, "write", lambda fd, data: real_write(fd, data[:16]))
+    report = Report(tmp_path)
+    for i in range(5):
+        report.add("demand", "FR", pd.Timestamp("2023-01-01") + pd.Timedelta(hours=i), 1, "x")
+    report.flush()
+    assert len(pd.read_csv(tmp_path / "_gap_fill_report.csv")) == 5
+
+
+def test_report_concurrent_writers(tmp_path, monkeypatch):
+    monkeypatch.setattr(Report, "FLUSH_ENTRIES", 7)
+    report = Report(tmp_path)
+
+    def write(area):
+        for i in range(100):
+            report.add("production", area, pd.Timestamp("2023-01-01"), i, "x")
+
+    threads = [threading.Thread(target=write, args=(a,)) for a in ("FR", "DE", "ES", "IT")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    report.save()
+    df = pd.read_csv(tmp_path / "_gap_fill_report.csv")
+    assert len(df) == 400
+    assert all(sorted(hours) == list(range(100)) for _, hours in df.groupby("area")["gap_hours"])
+
+
+# ── Ninja indexed store ──
+
+
+def _write_ninja_csv(ninja_dir, variable="solar", start="2018-12-31 20:00", periods=24 * 800):
+    ninja_dir.mkdir(parents=True, exist_ok=True)
+    idx = pd.date_range(start, periods=periods, freq="h")
+    df = pd.DataFrame({"hour": idx, "FR": np.arange(periods) / periods, "DE": 0.5})
+    df.to_csv(ninja_dir / f"{variable}.csv", index=False)
+    return df
+
+
+def _posix(ts):
+    return int((pd.Timestamp(ts) - pd.Timestamp("1970-01-01")) / pd.Timedelta(hours=1))
+
+
+def test_ninja_store_partitions_by_year(tmp_path):
+    _write_ninja_csv(tmp_path)
+    store_dir = build_ninja_store(tmp_path, "solar")
+    assert (store_dir / "2019.hours.npy").exists()
+    assert (store_dir / "2020.values.npy").exists()
+    assert (store_dir / "index.json").exists()
+
+
+def test_ninja_store_reads_hour_range(tmp_path):
+    src = _write_ninja_csv(tmp_path)
+    start, end = _posix("2019-12-31 22:00"), _posix("2020-01-01 03:00")
+    out = read_ninja_store(tmp_path, "solar", start, end)
+    assert out.index.tolist() == list(range(start, end + 1))
+    expected = src.set_index(src["hour"].map(_posix))["FR"]
+    np.testing.assert_allclose(out["FR"], expected.loc[start:end])
+
+
+def test_ninja_store_full_read_matches_csv(tmp_path):
+    src = _write_ninja_csv(tmp_path)
+    out = read_ninja_store(tmp_path, "solar")
+    assert len(out) == len(src)
+    assert list(out.columns) == ["FR", "DE"]
+
+
+def test_ninja_store_rebuilt_when_csv_changes(tmp_path):
+    _write_ninja_csv(tmp_path)
+    read_ninja_store(tmp_path, "solar")
+    _write_ninja_csv(tmp_path, periods=48)
+    assert len(read_ninja_store(tmp_path, "solar")) == 48
+
+
+def test_ninja_store_used_without_csv(tmp_path):
+    _write_ninja_csv(tmp_path, periods=48)
+    build_ninja_store(tmp_path, "solar")
+    (tmp_path / "solar.csv").unlink()
+    assert len(read_ninja_store(tmp_path, "solar")) == 48
+
+
+def test_ninja_store_missing_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_ninja_store(tmp_path, "solar")
+    assert not (tmp_path / STORE_DIR / "solar" / "index.json").exists()
+
+
+# ── ENTSO-E rate limiting and retry ──
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = type("R", (), {"status_code": status, "headers": headers or {}})()
+
+
+@pytest.fixture
+def fast_limiter(monkeypatch):
+    """Fast shared limiter and recorded (not slept) delays."""
+    sleeps = []
+    monkeypatch.setattr(entsoe, "_RATE_LIMITER", entsoe._TokenBucket(rate=1000.0, capacity=10))
+    monkeypatch.setattr(entsoe.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    bucket = entsoe._TokenBucket(rate=50.0, capacity=3)
+    t0 = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - t0 < 0.05
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - t0 >= 5 / 50.0 * 0.8
+
+
+def test_token_bucket_is_thread_safe():
+    bucket = entsoe._TokenBucket(rate=200.0, capacity=1)
+    t0 = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(21)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 1 token in the bucket + 20 refills at 200/s
+    assert time.monotonic() - t0 >= 20 / 200.0 * 0.8
+
+
+def test_call_with_retry_no_fixed_delay_on_success(fast_limiter):
+    assert entsoe._call_with_retry(lambda: 42) == 42
+    assert fast_limiter == []
+
+
+def test_call_with_retry_honours_retry_after(fast_limiter, monkeypatch):
+    calls = []
+    paused = []
+    monkeypatch.setattr(entsoe._RATE_LIMITER, "pause", paused.append)
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise _HTTPError(429, {"Retry-After": "90"})
+        return "ok"
+
+    assert entsoe._call_with_retry(flaky) == "ok"
+    assert paused and paused[0] >= 90
+
+
+def test_call_with_retry_backs_off_on_503(fast_limiter):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _HTTPError(503)
+        return "ok"
+
+    assert entsoe._call_with_retry(flaky) == "ok"
+    assert len(fast_limiter) == 2
+    assert fast_limiter[1] > fast_limiter[0]
+
+
+def test_call_with_retry_non_transient_raises(fast_limiter):
+    def bad():
+        raise _HTTPError(400)
+
+    with pytest.raises(_HTTPError):
+        entsoe._call_with_retry(bad)
+    assert fast_limiter == []
+
+
+# ── HTTP response cache ──
+
+
+class _Downloads:
+    """Counting download callable returning a fixed payload."""
+
+    def __init__(self, payload=b"payload"):
+        self.payload = payload
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.payload
+
+
+def test_http_cache_hit_skips_download(tmp_path):
+    cache = HttpCache(tmp_path)
+    download = _Downloads()
+    assert cache.fetch("elexon", "https://x/a", download) == b"payload"
+    assert cache.fetch("elexon", "https://x/a", download) == b"payload"
+    assert download.calls == 1
+
+
+def test_http_cache_key_includes_request(tmp_path):
+    cache = HttpCache(tmp_path)
+    download = _Downloads()
+    cache.fetch("elexon", "https://x/a", download)
+    cache.fetch("elexon", "https://x/b", download)
+    cache.fetch("ninja", "https://x/a", download)
+    assert download.calls == 3
+
+
+def test_http_cache_expired_entry_redownloaded(tmp_path):
+    cache = HttpCache(tmp_path, ttl_days=0)
+    download = _Downloads()
+    cache.fetch("elexon", "https://x/a", download)
+    time.sleep(0.01)
+    cache.fetch("elexon", "https://x/a", download)
+    assert download.calls == 2
+
+
+def test_http_cache_offline_replays_expired_and_raises_on_miss(tmp_path):
+    HttpCache(tmp_path).fetch("elexon", "https://x/a", _Downloads())
+    offline = HttpCache(tmp_path, ttl_days=0, offline=True)
+    download = _Downloads()
+    assert offline.fetch("elexon", "https://x/a", download) == b"payload"
+    with pytest.raises(OfflineCacheMiss):
+        offline.fetch("elexon", "https://x/b", download)
+    assert download.calls == 0
+
+
+def test_http_cache_evicts_least_recently_used(tmp_path):
+    cache = HttpCache(tmp_path, max_mb=2.5 / 1024)  # 2.5 kB budget
+    kb = _Downloads(b"x" * 1024)
+    cache.fetch("ninja", "a", kb)
+    time.sleep(0.01)
+    cache.fetch("ninja", "b", kb)
+    time.sleep(0.01)
+    cache.fetch("ninja", "a", kb)  # hit: "a" is now more recent than "b"
+    time.sleep(0.01)
+    cache.fetch("ninja", "c", kb)
+    assert cache.get("ninja", "a") is not None
+    assert cache.get("ninja", "b") is None
+    assert cache.get("ninja", "c") is not None
+
+
+def test_entsoe_query_replayed_offline_without_client(tmp_path, fast_limiter):
+    idx = pd.date_range("2020-01-01", periods=4, freq="h", tz="Europe/Brussels")
+    client = type("Client", (), {"query_load": lambda self, code, start, end: pd.Series(1.0, idx)})
+    start, end = pd.Timestamp("2020-01-01"), pd.Timestamp("2020-01-01 04:00")
+    with http_cache.activated(HttpCache(tmp_path)):
+        online = entsoe.fetch_demand(client(), "FR", start, end)
+    with http_cache.activated(HttpCache(tmp_path, offline=True)):
+        replayed = entsoe.fetch_demand(None, "FR", start, end)
+    pd.testing.assert_series_equal(online, replayed)
+
+
+def test_elexon_fetch_json_replayed_offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(elexon, "_download", lambda url: b'{"data": [1, 2]}')
+    with http_cache.activated(HttpCache(tmp_path)):
+        assert elexon._fetch_json("/demand/outturn", {"from": "2020-01-01"}) == {"data": [1, 2]}
+    monkeypatch.setattr(elexon, "_download", None)  # any download attempt would fail
+    with http_cache.activated(HttpCache(tmp_path, offline=True)):
+        assert elexon._fetch_json("/demand/outturn", {"from": "2020-01-01"}) == {"data": [1, 2]}
+        with pytest.raises(OfflineCacheMiss):
+            elexon._fetch_json("/demand/outturn", {"from": "2021-01-01"})
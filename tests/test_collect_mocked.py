@@ -115,6 +115,137 @@ class TestCollectHistoryMocked:
         assert not (year_dir / f"demand_{AREAS[0]}.csv").exists()
 
 
+# ---------------------------------------------------------------------------
+# TestCollectIncremental
+# ---------------------------------------------------------------------------
+
+
+class TestCollectIncremental:
+    """collect_history(incremental=True) on a year in progress."""
+
+    @pytest.fixture
+    def run(self, tmp_path, monkeypatch, canonical_series, canonical_production_df):
+        from eoles_dispatch.collect import _main_collect
+
+        m = MagicMock()
+        m.fetch_demand.return_value = canonical_series
+        m.fetch_generation.return_value = canonical_production_df
+        m.fetch_day_ahead_prices.return_value = canonical_series
+        m.is_usable.return_value = True
+        m.fetch_installed_capacity.return_value = {"nuclear": 10.0}
+
+        def _run(now):
+            monkeypatch.setattr(_main_collect, "_current_hour", lambda: pd.Timestamp(now))
+            with patch("eoles_dispatch.collect._main_collect.entsoe", m):
+                _main_collect.collect_history(
+                    tmp_path, MagicMock(), YEAR, AREAS, EXO_AREAS, incremental=True
+                )
+            return m
+
+        return _run
+
+    def test_in_progress_year_collected_up_to_now(self, tmp_path, run):
+        run("2021-03-10 12:00")
+        demand = pd.read_csv(tmp_path / "demand_FR.csv", parse_dates=["hour"])
+        assert demand["hour"].iloc[-1] == pd.Timestamp("2021-03-10 11:00")
+        assert not (tmp_path / ".staging").exists()
+
+    def test_only_new_hours_fetched_and_appended(self, tmp_path, run):
+        run("2021-03-10 12:00")
+        before = (tmp_path / "production_FR.csv").read_text()
+        mock = run("2021-03-12 00:00")
+        (_, area, start, end), _ = mock.fetch_generation.call_args
+        assert (start, end) == (pd.Timestamp("2021-03-10 12:00"), pd.Timestamp("2021-03-12"))
+        after = (tmp_path / "production_FR.csv").read_text()
+        assert after.startswith(before)
+        production = pd.read_csv(tmp_path / "production_FR.csv", parse_dates=["hour"])
+        assert production["hour"].diff().dropna().eq(pd.Timedelta(hours=1)).all()
+        assert len(production) == len(canonical_index(YEAR)[canonical_index(YEAR) < "2021-03-12"])
+
+    def test_unpublished_tail_left_for_next_run(self, tmp_path, run, canonical_series):
+        mock = run("2021-03-10 12:00")
+        lagging = canonical_series.copy()
+        lagging.loc["2021-03-11 20:00":] = np.nan
+        mock.fetch_demand.return_value = lagging
+        run("2021-03-12 00:00")
+        demand = pd.read_csv(tmp_path / "demand_FR.csv", parse_dates=["hour"])
+        assert demand["hour"].iloc[-1] == pd.Timestamp("2021-03-11 19:00")
+        assert demand["demand"].notna().all()
+
+    def test_gap_in_tail_filled_and_reported(self, tmp_path, run, canonical_series):
+        mock = run("2021-03-10 12:00")
+        holed = canonical_series.copy()
+        holed.loc["2021-03-11 03:00":"2021-03-11 04:00"] = np.nan
+        mock.fetch_demand.return_value = holed
+        run("2021-03-12 00:00")
+        demand = pd.read_csv(tmp_path / "demand_FR.csv")
+        assert demand["demand"].notna().all()
+        report = pd.read_csv(tmp_path / "_gap_fill_report.csv")
+        assert list(report["gap_start"]) == ["2021-03-11 03:00:00"]
+
+    def test_up_to_date_files_skipped(self, tmp_path, run):
+        run("2021-03-10 12:00")
+        mock = run("2021-03-10 12:00")
+        assert mock.fetch_demand.call_count == 3  # March chunks of the first run only
+
+
+# ---------------------------------------------------------------------------
+# TestFetchStaged
+# ---------------------------------------------------------------------------
+
+
+class TestFetchStaged:
+    @pytest.fixture
+    def bounds(self, canon_idx):
+        return canon_idx[0], canon_idx[-1] + pd.Timedelta(hours=1)
+
+    def test_one_call_per_month_and_staging_removed(self, tmp_path, bounds, canonical_series):
+        from eoles_dispatch.collect._main_collect import fetch_staged
+
+        fetch = MagicMock(return_value=canonical_series)
+        result = fetch_staged(fetch, "FR", *bounds, tmp_path / "demand_FR")
+        assert fetch.call_count == 12
+        pd.testing.assert_series_equal(result, canonical_series)
+        assert not (tmp_path / "demand_FR").exists()
+
+    def test_resumes_from_staged_chunks(self, tmp_path, bounds, canonical_production_df):
+        from eoles_dispatch.collect._main_collect import fetch_staged
+
+        calls = []
+
+        def flaky(area, start, end):
+            calls.append(start)
+            if len(calls) == 3:
+                raise TimeoutError("read timed out")
+            return canonical_production_df
+
+        staging = tmp_path / "production_FR"
+        with pytest.raises(RuntimeError, match="1/12 chunks failed \\(202103\\)"):
+            fetch_staged(flaky, "FR", *bounds, staging)
+        assert len(list(staging.glob("*.pkl"))) == 11
+
+        result = fetch_staged(flaky, "FR", *bounds, staging)
+        assert len(calls) == 13  # only the failed month is downloaded again
+        pd.testing.assert_frame_equal(result, canonical_production_df, check_freq=False)
+
+    def test_month_without_type_is_zero(self, tmp_path, bounds, canonical_production_df):
+        from eoles_dispatch.collect._main_collect import fetch_staged
+
+        def fetch(area, start, end):
+            if start == pd.Timestamp("2021-05-31 22:00"):  # June, CET
+                return canonical_production_df.drop(columns="gas")
+            return canonical_production_df
+
+        result = fetch_staged(fetch, "FR", *bounds, tmp_path / "production_FR")
+        assert result["gas"].notna().all()
+        assert (result.loc["2021-06-15", "gas"] == 0).all()
+
+    def test_no_data_returns_none(self, tmp_path, bounds):
+        from eoles_dispatch.collect._main_collect import fetch_staged
+
+        assert fetch_staged(lambda *args: None, "UK", *bounds, tmp_path / "demand_UK") is None
+
+
 # ---------------------------------------------------------------------------
 # TestCollectAllMocked
 # ---------------------------------------------------------------------------
@@ -164,6 +295,124 @@ class TestCollectAllMocked:
                 )
 
 
+# ---------------------------------------------------------------------------
+# TestImportEntsoeFiles (File Library exports, no network)
+# ---------------------------------------------------------------------------
+
+FR_EIC, NL_EIC, ES_EIC = "10YFR-RTE------C", "10YNL----------L", "10YES-REE------0"
+
+
+class TestImportEntsoeFiles:
+    @pytest.fixture
+    def exports(self, tmp_path, canon_idx):
+        """One year of load (15 min, duplicated as BZN and CTY), generation,
+        prices and capacity exports for FR/NL, plus rows of an unrequested area."""
+        d = tmp_path / "exports"
+        d.mkdir()
+        quarters = pd.date_range(canon_idx[0], periods=len(canon_idx) * 4, freq="15min")
+        load = np.tile([40000.0, 50000.0, 60000.0, 70000.0], len(canon_idx))
+        pd.concat(
+            pd.DataFrame(
+                {
+                    "DateTime (UTC)": quarters,
+                    "AreaCode": eic,
+                    "AreaTypeCode": kind,
+                    "TotalLoadValue": load,
+                }
+            )
+            for eic, kind in [(FR_EIC, "BZN"), (FR_EIC, "CTY"), (ES_EIC, "BZN")]
+        ).to_csv(d / "2021_ActualTotalLoad_6.1.A.csv", sep="\t", index=False)
+        pd.concat(
+            pd.DataFrame(
+                {
+                    "DateTime": canon_idx,
+                    "AreaCode": FR_EIC,
+                    "ProductionType": ptype,
+                    "ActualGenerationOutput": gen,
+                    "ActualConsumption": cons,
+                }
+            )
+            for ptype, gen, cons in [
+                ("Nuclear", 45000.0, np.nan),
+                ("Fossil Gas", 5000.0, np.nan),
+                ("Hydro Pumped Storage", 1000.0, 800.0),
+            ]
+        ).to_csv(d / "2021_AggregatedGenerationPerType_16.1.B_C.csv", sep="\t", index=False)
+        pd.concat(
+            pd.DataFrame({"DateTime": canon_idx, "AreaCode": eic, "Currency": cur, "Price": p})
+            for eic, cur, p in [(FR_EIC, "EUR", 50.0), (NL_EIC, "EUR", 60.0), (NL_EIC, "GBP", 1.0)]
+        ).to_csv(d / "2021_DayAheadPrices_12.1.D.csv", sep="\t", index=False)
+        pd.DataFrame(
+            {
+                "DateTime": canon_idx[0],
+                "AreaCode": FR_EIC,
+                "ProductionType": ["Nuclear", "Solar"],
+                "AggregatedInstalledCapacity": [61370.0, 13000.0],
+            }
+        ).to_csv(d / "2021_InstalledGenerationCapacityAggregated_14.1.A.csv", sep="\t", index=False)
+        (d / "2021_PhysicalFlows_12.1.G.csv").write_text("DateTime\tOutAreaCode\tFlowValue\n")
+        return d
+
+    def test_import_builds_validated_year(self, tmp_path, exports, monkeypatch):
+        from eoles_dispatch.collect import entsoe_files, manifest
+        from eoles_dispatch.collect._main_collect import import_entsoe_files
+
+        monkeypatch.setattr(entsoe_files, "ENTSOE_FILES_CHUNK_ROWS", 10_000)
+        data = tmp_path / "data"
+        years = import_entsoe_files(data, [exports], areas=AREAS, exo_areas=EXO_AREAS)
+        assert years == [YEAR]
+
+        year_dir = data / str(YEAR)
+        demand = pd.read_csv(year_dir / "demand_FR.csv")
+        assert len(demand) == 8760 and (demand["demand"] == 55.0).all()  # hourly mean, GW
+        production = pd.read_csv(year_dir / "production_FR.csv")
+        assert (production["nuclear"] == 45.0).all()
+        assert (production["phs"] == 1.0).all() and (production["phs_in"] == -0.8).all()
+        assert (pd.read_csv(year_dir / "prices_NL.csv")["prices"] == 60.0).all()
+        capacity = pd.read_csv(year_dir / "installed_capacity_FR.csv")
+        assert dict(zip(capacity["tec"], capacity["value"])) == {"nuclear": 61.37, "solar": 13.0}
+        assert not (year_dir / "demand_ES.csv").exists()
+        assert manifest.load(year_dir)["files"]["demand_FR.csv"]["source"] == "entsoe_files"
+        assert not list(year_dir.glob("*_corrupt*"))
+
+    def test_existing_files_kept_unless_forced(self, tmp_path, exports):
+        from eoles_dispatch.collect._main_collect import import_entsoe_files
+
+        data = tmp_path / "data"
+        (data / str(YEAR)).mkdir(parents=True)
+        path = data / str(YEAR) / "demand_FR.csv"
+        path.write_text("hour,demand\n")
+        import_entsoe_files(data, [exports], years=[YEAR], areas=AREAS, exo_areas=EXO_AREAS)
+        assert (data / str(YEAR) / "demand_FR_corrupt.csv").read_text() == "hour,demand\n"
+
+        import_entsoe_files(
+            data, [exports], years=[YEAR], areas=AREAS, exo_areas=EXO_AREAS, force=True
+        )
+        assert len(pd.read_csv(path)) == 8760
+
+    def test_december_export_does_not_add_next_year(self, tmp_path):
+        from eoles_dispatch.collect._main_collect import import_entsoe_files
+
+        d = tmp_path / "exports"
+        d.mkdir()
+        # UTC month: the last row is 1 Jan 00:00 CET of the next year
+        hours = pd.date_range("2021-12-01", "2021-12-31 23:00", freq="h")
+        pd.DataFrame(
+            {"DateTime": hours, "AreaCode": FR_EIC, "Currency": "EUR", "Price": 50.0}
+        ).to_csv(d / "2021_12_DayAheadPrices_12.1.D.csv", sep="\t", index=False)
+
+        data = tmp_path / "data"
+        years = import_entsoe_files(data, [d], areas=AREAS, exo_areas=EXO_AREAS)
+        assert years == [2021]
+        assert not (data / "2022").exists()
+
+    def test_no_export_files_raises(self, tmp_path):
+        from eoles_dispatch.collect._main_collect import import_entsoe_files
+
+        with pytest.raises(FileNotFoundError):
+            import_entsoe_files(tmp_path / "data", [tmp_path], areas=AREAS, exo_areas=EXO_AREAS)
+
+
 # ---------------------------------------------------------------------------
 # TestCollectNinjaMocked
 # ---------------------------------------------------------------------------
@@ -191,3 +440,50 @@ class TestCollectNinjaMocked:
 
         # No file if no area succeeded
         assert not (tmp_path / "ninja" / "solar.csv").exists()
+
+    def test_adding_an_area_downloads_only_its_profiles(self, tmp_path):
+        """Profiles are stored per area: a new area does not re-download the others."""
+        from eoles_dispatch.collect.rninja import NINJA_FILES, collect_ninja
+
+        idx = pd.date_range("2020-01-01", periods=48, freq="h")
+        mock = MagicMock(return_value=pd.Series(0.3, index=idx))
+        with patch("eoles_dispatch.collect.rninja._download_ninja_csv", mock):
+            collect_ninja(tmp_path / "ninja", areas=["FR"])
+            assert mock.call_count == len(NINJA_FILES)
+            mock.reset_mock()
+            collect_ninja(tmp_path / "ninja", areas=["FR", "CH"])
+
+        assert {c.args[0] for c in mock.call_args_list} == {"CH"}
+        assert mock.call_count == 3  # solar + onshore, no offshore for CH
+        offshore = pd.read_csv(tmp_path / "ninja" / "offshore_current.csv")
+        assert list(offshore.columns) == ["hour", "FR", "CH"]
+        assert (offshore["CH"] == 0).all()
+
+    def test_existing_combined_files_are_not_downloaded_again(self, tmp_path):
+        """Combined CSVs without per-area files are split instead of re-downloaded."""
+        from eoles_dispatch.collect.rninja import NINJA_FILES, collect_ninja
+
+        ninja_dir = tmp_path / "ninja"
+        ninja_dir.mkdir()
+        idx = pd.date_range("2020-01-01", periods=48, freq="h")
+        for variable in NINJA_FILES:
+            pd.DataFrame({"hour": idx, "FR": 0.2, "DE": 0.4}).to_csv(
+                ninja_dir / f"{variable}.csv", index=False
+            )
+        mock = MagicMock(return_value=None)
+        with patch("eoles_dispatch.collect.rninja._download_ninja_csv", mock):
+            collect_ninja(ninja_dir, areas=["FR", "DE"])
+        mock.assert_not_called()
+        assert (ninja_dir / ".areas" / "solar" / "DE.csv").exists()
+
+    def test_parse_national_skips_comment_header(self):
+        from eoles_dispatch.collect.rninja import _parse_national
+
+        payload = (
+            b'"# Renewables.ninja country download"\n# Units: capacity factor\n'
+            b"time,NATIONAL,FR10\n2020-01-01 00:00:00,0.1,0.2\n2020-01-01 01:00:00,0.3,0.4\n"
+        )
+        series = _parse_national(payload)
+        assert series.tolist() == [0.1, 0.3]
+        assert series.index[1] == pd.Timestamp("2020-01-01 01:00")
+        assert _parse_national(b"time,FR10\n2020-01-01 00:00:00,0.2\n") is None
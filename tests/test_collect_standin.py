@@ -0,0 +1,115 @@
+"""Tests for the local API stand-in server (collect/standin.py)."""
+
+import time
+import urllib.error
+import urllib.request
+
+import pandas as pd
+import pytest
+from entsoe import EntsoePandasClient
+from entsoe.exceptions import NoMatchingDataError
+
+from eoles_dispatch.collect import elexon, entsoe, rninja
+from eoles_dispatch.collect.standin import StandinServer, redirect_collectors
+
+START, END = pd.Timestamp("2021-03-01"), pd.Timestamp("2021-03-03")
+
+
+@pytest.fixture
+def fast_limiter(monkeypatch):
+    monkeypatch.setattr(entsoe, "_RATE_LIMITER", entsoe._TokenBucket(rate=1000.0, capacity=10))
+    monkeypatch.setattr(entsoe.time, "sleep", lambda s: None)
+
+
+@pytest.fixture
+def standin(fast_limiter):
+    """Yield (server, client) with the collectors pointed at a local server."""
+    with StandinServer() as server, redirect_collectors(server):
+        entsoe.entsoe_py.URL = entsoe.ENTSOE_ENDPOINT_URL
+        yield server, EntsoePandasClient(api_key="standin-api-key")
+
+
+# ---------------------------------------------------------------------------
+# ENTSO-E
+# ---------------------------------------------------------------------------
+
+
+class TestEntsoeStandin:
+    def test_quarter_hourly_load_resampled_to_hourly(self, standin):
+        server, client = standin
+        demand = entsoe.fetch_demand(client, "DE", START, END)
+        assert len(demand) == 48
+        assert demand.notna().all()
+        assert server.stats["requests_entsoe"] == 1
+
+    def test_generation_has_phs_split(self, standin):
+        _, client = standin
+        gen = entsoe.fetch_generation(client, "FR", START, END)
+        assert {"nuclear", "solar", "onshore", "phs", "phs_in"} <= set(gen.columns)
+        assert (gen["phs"] >= 0).all() and (gen["phs_in"] <= 0).all()
+
+    def test_gb_has_no_entsoe_data(self, standin):
+        _, client = standin
+        with pytest.raises(NoMatchingDataError):
+            entsoe.fetch_demand(client, "UK", START, END)
+
+    def test_injected_errors_are_retried(self, standin, monkeypatch):
+        server, client = standin
+        server.error_rate = 1.0
+        # The server recovers while the client waits before its first retry
+        monkeypatch.setattr(entsoe.time, "sleep", lambda s: setattr(server, "error_rate", 0.0))
+        prices = entsoe.fetch_day_ahead_prices(client, "NL", START, END)
+        assert len(prices) > 0
+        assert server.stats["injected_503"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Elexon and Renewables.ninja
+# ---------------------------------------------------------------------------
+
+
+class TestElexonNinjaStandin:
+    def test_elexon_demand_hourly(self, standin):
+        demand = elexon.fetch_demand(START, END)
+        assert demand.index.to_series().diff().dropna().eq(pd.Timedelta(hours=1)).all()
+        assert demand.between(10, 100).all()  # GW
+
+    def test_elexon_chunks_fetched_concurrently_in_order(self, standin):
+        server, _ = standin
+        server.latency = 0.2
+        t0 = time.perf_counter()
+        gen = elexon.fetch_generation(START, START + pd.Timedelta(days=28))  # 4 chunks
+        assert time.perf_counter() - t0 < 4 * 0.2
+        assert server.stats["requests_elexon"] == 4
+        assert gen["hour"].is_monotonic_increasing and len(gen) == 28 * 24
+
+    def test_elexon_failed_chunk_retried_alone(self, standin, monkeypatch):
+        server, _ = standin
+        server.error_rate = 1.0
+        monkeypatch.setattr(elexon.time, "sleep", lambda s: setattr(server, "error_rate", 0.0))
+        demand = elexon.fetch_demand(START, END)
+        assert len(demand) >= 48
+        assert server.stats["injected_503"] == 1
+        assert server.stats["requests_elexon"] == 2
+
+    def test_elexon_raises_after_retries(self, standin, monkeypatch):
+        server, _ = standin
+        server.error_rate = 1.0
+        monkeypatch.setattr(elexon.time, "sleep", lambda s: None)
+        with pytest.raises(RuntimeError, match="after 4 retries"):
+            elexon.fetch_demand(START, END)
+
+    def test_ninja_csv_national_column(self, standin):
+        server, _ = standin
+        series = rninja._download_ninja_csv("FR", rninja.NINJA_FILES["solar"])
+        first, last = server.ninja_years
+        assert len(series) == len(pd.date_range(str(first), str(last + 1), freq="h")) - 1
+        assert series.between(0, 1).all()
+
+    def test_throttled_response_has_retry_after(self, standin):
+        server, _ = standin
+        server.throttle_rate = 1.0
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            urllib.request.urlopen(server.url + "/elexon/datasets/IGCPU")
+        assert exc.value.code == 429
+        assert exc.value.headers["Retry-After"] == str(server.retry_after)
@@ -0,0 +1,106 @@
+"""Tests for eoles_dispatch.diagnostics (queries of exported diagnostics)."""
+
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from eoles_dispatch import diagnostics
+from eoles_dispatch.run.export_diagnostics import export_all_diagnostics
+from eoles_dispatch.utils import posix_hour_range
+
+AREAS = ["FR", "DE"]
+HOURS = [0, 1, 2]
+
+
+@pytest.fixture
+def exported_run(solved_run):
+    model, run_dir = solved_run
+    export_all_diagnostics(model, run_dir)
+    return run_dir
+
+
+# ---------------------------------------------------------------------------
+# posix_hour_range
+# ---------------------------------------------------------------------------
+
+
+class TestPosixHourRange:
+    def test_integers(self):
+        assert posix_hour_range(10, 20) == (10, 20)
+
+    def test_digit_strings(self):
+        assert posix_hour_range("10", "20") == (10, 20)
+
+    def test_dates_naive_utc(self):
+        assert posix_hour_range("2021-01-04", "2021-01-11") == (447144, 447312)
+
+    def test_aware_datetime(self):
+        start = datetime(2021, 1, 4, 1, tzinfo=timezone.utc)
+        assert posix_hour_range(start, 447146) == (447145, 447146)
+
+    def test_start_after_end_raises(self):
+        with pytest.raises(ValueError):
+            posix_hour_range(20, 10)
+
+
+# ---------------------------------------------------------------------------
+# families / query
+# ---------------------------------------------------------------------------
+
+
+class TestQuery:
+    def test_families(self, exported_run):
+        names = diagnostics.families(exported_run)
+        assert "gene" in names and "adequacy" in names
+
+    def test_query_whole_table(self, exported_run):
+        df = diagnostics.query(exported_run, "adequacy")
+        assert list(df.columns) == ["idx0", "idx1", "dual"]
+        assert len(df) == len(AREAS) * len(HOURS)
+
+    def test_query_by_run_name(self, exported_run):
+        project_dir = exported_run.parent / "project"
+        (project_dir / "runs").mkdir(parents=True)
+        (project_dir / "runs" / "my_run").symlink_to(exported_run)
+        df = diagnostics.query("my_run", "adequacy", project_dir=project_dir)
+        assert len(df) == len(AREAS) * len(HOURS)
+
+    def test_area_filter(self, exported_run):
+        df = diagnostics.query(exported_run, "gene", area="FR")
+        assert set(df["idx0"]) == {"FR"}
+
+    def test_hours_filter(self, exported_run):
+        df = diagnostics.query(exported_run, "gene", area=["FR", "DE"], hours=(1, 2))
+        assert set(df["idx2"]) == {1}
+
+    def test_nonzero_filter(self, exported_run):
+        df = diagnostics.query(exported_run, "gene", nonzero=True)
+        assert (df["value"] != 0).all()
+
+    def test_columns(self, exported_run):
+        df = diagnostics.query(exported_run, "adequacy", area="FR", columns=["idx1", "dual"])
+        assert list(df.columns) == ["idx1", "dual"]
+        assert len(df) == len(HOURS)
+
+    def test_matches_parquet(self, solved_run):
+        pytest.importorskip("pyarrow")
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir)
+        csv = diagnostics.query(run_dir, "gene", area="DE", hours=(0, 2))
+        export_all_diagnostics(model, run_dir, output_format="parquet")
+        parquet = diagnostics.query(run_dir, "gene", area="DE", hours=(0, 2))
+        sort = ["idx0", "idx1", "idx2"]
+        pd.testing.assert_frame_equal(
+            parquet.sort_values(sort).reset_index(drop=True),
+            csv.sort_values(sort).reset_index(drop=True),
+            check_dtype=False,
+        )
+
+    def test_missing_table_raises(self, exported_run):
+        with pytest.raises(FileNotFoundError, match="nope"):
+            diagnostics.query(exported_run, "nope")
+
+    def test_no_diagnostics_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="--fulldiag"):
+            diagnostics.query(tmp_path, "gene")
@@ -0,0 +1,224 @@
+"""Tests for eoles_dispatch.run.ensemble (sampling, patches, member solving)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from conftest import _build_input_dir, _make_scenario_dir
+
+from eoles_dispatch.run.ensemble import (
+    build_patches,
+    load_ensemble_spec,
+    price_distribution,
+    sample_parameters,
+    solve_members,
+    summarize_run,
+)
+from eoles_dispatch.run.scenario import extract_scenario
+
+AREAS = ["FR", "DE"]
+EXO_AREAS = ["NL"]
+
+PARAMS = {
+    "co2_price": {"table": "thr_specs", "column": "co2_price", "range": [20.0, 120.0]},
+    "gas_factor": {"table": "fuel_timeFactor", "column": "GAS", "scale": [0.5, 1.5]},
+}
+
+
+# ---------------------------------------------------------------------------
+# Spec
+# ---------------------------------------------------------------------------
+
+
+class TestLoadEnsembleSpec:
+    def test_defaults_filled(self):
+        spec = load_ensemble_spec({"scenario": "baseline", "year": 2019, "parameters": PARAMS})
+        assert spec["method"] == "lhs"
+        assert spec["months"] is None
+
+    def test_months_parsed(self):
+        spec = load_ensemble_spec(
+            {"scenario": "b", "year": 2019, "months": "2-4", "parameters": PARAMS}
+        )
+        assert spec["months"] == (2, 4)
+
+    @pytest.mark.parametrize("months", ["4-2", "0-3", 13, [1, 13], "jan"])
+    def test_invalid_months_raise(self, months):
+        with pytest.raises(ValueError, match="Invalid month range"):
+            load_ensemble_spec(
+                {"scenario": "b", "year": 2019, "months": months, "parameters": PARAMS}
+            )
+
+    def test_loads_yaml_file(self, tmp_path):
+        path = tmp_path / "spec.yaml"
+        path.write_text(yaml.dump({"scenario": "b", "year": 2019, "parameters": PARAMS}))
+        assert load_ensemble_spec(path)["scenario"] == "b"
+
+    def test_missing_key_raises(self):
+        with pytest.raises(ValueError, match="parameters"):
+            load_ensemble_spec({"scenario": "b", "year": 2019})
+
+    def test_range_and_scale_exclusive(self):
+        bad = {"x": {"table": "capa", "column": "FR", "range": [0, 1], "scale": [0, 1]}}
+        with pytest.raises(ValueError, match="exactly one"):
+            load_ensemble_spec({"scenario": "b", "year": 2019, "parameters": bad})
+
+    @pytest.mark.parametrize("bounds", [1.2, [2.0, 1.0], [1.0]])
+    def test_bad_bounds_raise(self, bounds):
+        bad = {"x": {"table": "capa", "column": "FR", "scale": bounds}}
+        with pytest.raises(ValueError, match=r"bounds must be \[low, high\]"):
+            load_ensemble_spec({"scenario": "b", "year": 2019, "parameters": bad})
+
+    def test_unknown_method_raises(self):
+        with pytest.raises(ValueError, match="sampling method"):
+            load_ensemble_spec(
+                {"scenario": "b", "year": 2019, "parameters": PARAMS, "method": "sobol"}
+            )
+
+
+# ---------------------------------------------------------------------------
+# Sampling
+# ---------------------------------------------------------------------------
+
+
+class TestSampleParameters:
+    def test_grid_is_full_factorial(self):
+        df = sample_parameters(PARAMS, 3, "grid")
+        assert len(df) == 9
+        assert sorted(df["co2_price"].unique()) == [20.0, 70.0, 120.0]
+
+    def test_random_within_bounds(self):
+        df = sample_parameters(PARAMS, 50, "random", seed=1)
+        assert len(df) == 50
+        assert df["co2_price"].between(20, 120).all()
+        assert df["gas_factor"].between(0.5, 1.5).all()
+
+    def test_lhs_one_sample_per_stratum(self):
+        n = 10
+        df = sample_parameters(PARAMS, n, "lhs", seed=3)
+        strata = np.floor((df["co2_price"] - 20.0) / 100.0 * n).astype(int)
+        assert sorted(strata) == list(range(n))
+
+    def test_seed_reproducible(self):
+        a = sample_parameters(PARAMS, 5, "lhs", seed=7)
+        b = sample_parameters(PARAMS, 5, "lhs", seed=7)
+        pd.testing.assert_frame_equal(a, b)
+
+
+# ---------------------------------------------------------------------------
+# Patches
+# ---------------------------------------------------------------------------
+
+
+class TestBuildPatches:
+    @pytest.fixture
+    def scenario(self, tmp_path):
+        return _make_scenario_dir(tmp_path / "base", areas=AREAS, exo_areas=EXO_AREAS)
+
+    @pytest.fixture
+    def hour_month(self):
+        return pd.DataFrame({"hour": [0, 1], "month": ["202003"] * 2})
+
+    def test_range_sets_all_rows(self, scenario, hour_month):
+        patches = build_patches(scenario, {"co2_price": PARAMS["co2_price"]}, {"co2_price": 99.0})
+        result = extract_scenario(scenario, AREAS, EXO_AREAS, hour_month, patches=patches)
+        assert (result["thr_params"]["co2_price"]["co2_price"] == 99.0).all()
+
+    def test_scale_multiplies_base(self, scenario, hour_month):
+        base = extract_scenario(scenario, AREAS, EXO_AREAS, hour_month)
+        patches = build_patches(scenario, {"g": PARAMS["gas_factor"]}, {"g": 2.0})
+        result = extract_scenario(scenario, AREAS, EXO_AREAS, hour_month, patches=patches)
+        gas = lambda d: d["fuel_timeFactor"].query("fuel == 'GAS'")["value"].to_numpy()  # noqa: E731
+        np.testing.assert_allclose(gas(result), 2.0 * gas(base))
+
+    def test_single_cell(self, scenario, hour_month):
+        param = {"table": "capa", "row": "nuclear", "column": "FR", "range": [0, 100]}
+        patches = build_patches(scenario, {"nuc": param}, {"nuc": 55.0})
+        capa = extract_scenario(scenario, AREAS, EXO_AREAS, hour_month, patches=patches)["capa"]
+        capa = capa.set_index(["area", "tec"])["value"]
+        assert capa[("FR", "nuclear")] == 55.0
+        assert capa[("DE", "nuclear")] == 10.0
+
+    def test_unknown_row_raises(self, scenario):
+        param = {"table": "capa", "row": "fusion", "column": "FR", "range": [0, 1]}
+        with pytest.raises(ValueError, match="fusion"):
+            build_patches(scenario, {"x": param}, {"x": 1.0})
+
+
+# ---------------------------------------------------------------------------
+# Member solving
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def member_project(tmp_path):
+    """Project with two ready-to-solve member runs."""
+    for run in ("ens_000", "ens_001"):
+        run_d = tmp_path / "runs" / run
+        _build_input_dir(run_d)
+        metadata = {"name": run, "scenario": "test", "year": 2020, "status": "created"}
+        (run_d / "run.yaml").write_text(yaml.dump(metadata))
+    return tmp_path
+
+
+class TestSolveMembers:
+    def test_summaries_in_order(self, member_project):
+        out = solve_members(
+            ["ens_000", "ens_001"], member_project, jobs=2, version="static_thermal"
+        )
+        assert [s["run"] for s in out] == ["ens_000", "ens_001"]
+        assert all(s["status"] == "solved" for s in out)
+
+    def test_summary_kpis(self, member_project):
+        (summary,) = solve_members(["ens_000"], member_project, version="static_thermal")
+        assert summary["total_cost"] > 0
+        for area in AREAS:
+            assert summary[f"price_p05_{area}"] <= summary[f"price_p95_{area}"]
+
+    def test_failed_member_reported(self, member_project):
+        (summary,) = solve_members(["missing"], member_project, version="static_thermal")
+        assert summary["status"] == "failed"
+
+
+class TestSummarizeRun:
+    def test_run_in_project(self, tmp_path):
+        run_dir = tmp_path / "runs" / "r0"
+        _write_solved_run(run_dir)
+        summary = summarize_run(run_dir)
+        assert summary["run"] == "r0" and summary["total_cost"] == 1.5
+        assert summary["price_mean_FR"] == pytest.approx(5.0)
+
+    def test_run_outside_project(self, tmp_path):
+        run_dir = tmp_path / "r0"
+        _write_solved_run(run_dir)
+        summary = summarize_run(run_dir)
+        assert summary["total_cost"] == 1.5
+        assert summary["price_mean_FR"] == pytest.approx(5.0)
+        assert summary["price_p05_FR"] <= summary["price_p95_FR"]
+
+
+def _write_solved_run(run_dir):
+    (run_dir / "outputs").mkdir(parents=True)
+    metadata = {"name": run_dir.name, "status": "solved", "total_cost": 1.5, "total_co2": 2.0}
+    (run_dir / "run.yaml").write_text(yaml.dump(metadata))
+    pd.DataFrame({"hour": [0, 1], "FR": [0.0, 10.0]}).to_csv(
+        run_dir / "outputs" / "prices.csv", index=False
+    )
+
+
+class TestPriceDistribution:
+    def test_pools_member_hours(self, tmp_path):
+        for i, offset in enumerate((0.0, 100.0)):
+            out = tmp_path / f"r{i}" / "outputs"
+            out.mkdir(parents=True)
+            pd.DataFrame({"hour": [0, 1], "FR": [offset, offset + 10.0]}).to_csv(
+                out / "prices.csv", index=False
+            )
+        dist = price_distribution([tmp_path / "r0", tmp_path / "r1"])
+        assert dist.loc["FR", "members"] == 2
+        assert dist.loc["FR", "mean"] == pytest.approx(55.0)
+        assert dist.loc["FR", "member_mean_min"] == pytest.approx(5.0)
+        assert dist.loc["FR", "member_mean_max"] == pytest.approx(105.0)
+
+    def test_no_members_returns_empty(self):
+        assert price_distribution([]).empty
@@ -1,68 +1,21 @@
 """Tests for eoles_dispatch.run.export_diagnostics."""
 
 import json
+import time
 
 import pandas as pd
-import pyomo.environ as pyo
 import pytest
 
-from eoles_dispatch.run.export_diagnostics import (
-    _dual_to_df,
-    _numeric_stats,
-    _var_to_df,
-    export_all_diagnostics,
-)
+from eoles_dispatch.diagnostics import query
+from eoles_dispatch.run import export_diagnostics
+from eoles_dispatch.run.export_diagnostics import _numeric_stats, export_all_diagnostics
+from eoles_dispatch.run.output_io import write_output
+from eoles_dispatch.run.solution import SolutionView
 
 AREAS = ["FR", "DE"]
 HOURS = [0, 1, 2]
 
 
-# ---------------------------------------------------------------------------
-# _var_to_df
-# ---------------------------------------------------------------------------
-
-
-class TestVarToDf:
-    @pytest.fixture
-    def simple_var(self):
-        m = pyo.ConcreteModel()
-        m.idx = pyo.Set(initialize=[0, 1, 2])
-        m.x = pyo.Var(m.idx, initialize=lambda m, i: float(i))
-        return m.x
-
-    @pytest.fixture
-    def multi_idx_var(self):
-        m = pyo.ConcreteModel()
-        m.a = pyo.Set(initialize=["FR", "DE"])
-        m.h = pyo.Set(initialize=[0, 1])
-        m.y = pyo.Var(m.a, m.h, initialize=1.0)
-        return m.y
-
-    def test_var_to_df_columns(self, simple_var):
-        df = _var_to_df(simple_var)
-        assert list(df.columns) == ["idx0", "value"]
-
-    def test_var_to_df_row_count(self, simple_var):
-        df = _var_to_df(simple_var)
-        assert len(df) == 3
-
-    def test_var_to_df_values(self, simple_var):
-        df = _var_to_df(simple_var)
-        assert sorted(df["value"].tolist()) == [0.0, 1.0, 2.0]
-
-    def test_var_to_df_multi_index_columns(self, multi_idx_var):
-        df = _var_to_df(multi_idx_var)
-        assert list(df.columns) == ["idx0", "idx1", "value"]
-        assert len(df) == 4
-
-    def test_var_to_df_empty_var_returns_empty_df(self):
-        m = pyo.ConcreteModel()
-        m.empty_set = pyo.Set(initialize=[])
-        m.z = pyo.Var(m.empty_set)
-        df = _var_to_df(m.z)
-        assert df.empty
-
-
 # ---------------------------------------------------------------------------
 # _numeric_stats
 # ---------------------------------------------------------------------------
@@ -90,29 +43,6 @@ class TestNumericStats:
         assert _numeric_stats(pd.Series([2.0, 3.0, 5.0]))["sum"] == pytest.approx(10.0)
 
 
-# ---------------------------------------------------------------------------
-# _dual_to_df (requires solved model with duals)
-# ---------------------------------------------------------------------------
-
-
-class TestDualToDf:
-    def test_dual_to_df_columns(self, solved_run):
-        model, _ = solved_run
-        df = _dual_to_df(model, model.adequacy_constraint)
-        assert "dual" in df.columns
-
-    def test_dual_to_df_row_count_matches_constraint(self, solved_run):
-        model, _ = solved_run
-        df = _dual_to_df(model, model.adequacy_constraint)
-        assert len(df) == len(AREAS) * len(HOURS)
-
-    def test_dual_to_df_dual_values_numeric(self, solved_run):
-        model, _ = solved_run
-        df = _dual_to_df(model, model.adequacy_constraint)
-        assert df["dual"].dtype.kind in ("f", "i")
-        assert df["dual"].notna().all()
-
-
 # ---------------------------------------------------------------------------
 # export_all_diagnostics (integration)
 # ---------------------------------------------------------------------------
@@ -179,3 +109,122 @@ class TestExportAllDiagnostics:
         assert summary["total_co2_tCO2"] is None or isinstance(
             summary["total_co2_tCO2"], (int, float)
         )
+
+    def test_nonzero_duals_only(self, solved_run):
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, nonzero_duals=True)
+        df = pd.read_csv(run_dir / "diagnostics" / "duals" / "adequacy.csv")
+        assert (df["dual"] != 0).all()
+        with open(run_dir / "diagnostics" / "_summary.json") as f:
+            summary = json.load(f)
+        assert summary["nonzero_duals_only"] is True
+        # Statistics still cover every dual
+        stats = summary["dual_stats"]["adequacy_constraint"]
+        assert stats["count"] == len(AREAS) * len(HOURS)
+
+    def test_families_not_kept_in_view(self, solved_run):
+        """Families read only for the diagnostics are released once written."""
+        model, run_dir = solved_run
+        view = SolutionView(model)
+        view.values("gene")  # read by a report
+        export_all_diagnostics(view, run_dir)
+        assert set(view._entries) == {"gene", "hcarb"}  # hcarb: CO2 total of the summary
+
+    def test_writes_in_flight_bounded(self, solved_run, monkeypatch):
+        """Extraction waits for the oldest write once max_workers tables are queued."""
+        model, run_dir = solved_run
+        extracted, written, backlog = [], [], []
+
+        def slow_write(*args, **kwargs):
+            time.sleep(0.01)
+            written.append(args[2])
+            return write_output(*args, **kwargs)
+
+        def frame(self, name, keep=True):
+            backlog.append(len(extracted) - len(written))
+            extracted.append(name)
+            return original(self, name, keep)
+
+        original = SolutionView.frame
+        monkeypatch.setattr(export_diagnostics, "write_output", slow_write)
+        monkeypatch.setattr(SolutionView, "frame", frame)
+        export_all_diagnostics(model, run_dir, max_workers=2)
+        assert len(extracted) > 2
+        assert max(backlog) <= 2
+
+    def test_parquet_tables(self, solved_run):
+        pytest.importorskip("pyarrow")
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, output_format="parquet")
+        gene = pd.read_parquet(run_dir / "diagnostics" / "vars" / "gene.parquet")
+        assert sorted(gene.columns) == ["idx0", "idx1", "idx2", "value"]
+        assert isinstance(gene["idx1"].dtype, pd.CategoricalDtype)
+        assert (run_dir / "diagnostics" / "duals" / "adequacy.parquet").exists()
+        assert not (run_dir / "diagnostics" / "vars" / "gene.csv").exists()
+
+    def test_parquet_partitioned_by_area(self, solved_run):
+        pytest.importorskip("pyarrow")
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, output_format="parquet")
+        path = run_dir / "diagnostics" / "vars" / "gene.parquet"
+        assert sorted(p.name for p in path.iterdir()) == ["idx0=DE", "idx0=FR"]
+        # Queries read the requested partitions, in the table's column order
+        df = query(run_dir, "gene", area="FR")
+        assert list(df.columns) == ["idx0", "idx1", "idx2", "value"]
+        assert set(df["idx0"]) == {"FR"}
+        assert len(df) == len(pd.read_parquet(path / "idx0=FR"))
+
+
+# ---------------------------------------------------------------------------
+# export_all_diagnostics filters
+# ---------------------------------------------------------------------------
+
+
+class TestExportFilters:
+    def test_families_filter(self, solved_run):
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, families=["gene", "adequacy_constraint"])
+        assert sorted(p.name for p in (run_dir / "diagnostics" / "vars").iterdir()) == ["gene.csv"]
+        assert sorted(p.name for p in (run_dir / "diagnostics" / "duals").iterdir()) == [
+            "adequacy.csv"
+        ]
+
+    def test_unknown_family_raises(self, solved_run):
+        model, run_dir = solved_run
+        with pytest.raises(ValueError, match="Unknown diagnostics families"):
+            export_all_diagnostics(model, run_dir, families=["gene", "nope"])
+
+    def test_areas_filter(self, solved_run):
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, areas=["FR"])
+        gene = pd.read_csv(run_dir / "diagnostics" / "vars" / "gene.csv")
+        assert set(gene["idx0"]) == {"FR"}
+        dual = pd.read_csv(run_dir / "diagnostics" / "duals" / "adequacy.csv")
+        assert set(dual["idx0"]) == {"FR"}
+
+    def test_hours_filter(self, solved_run):
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, hours=(1, 3))
+        gene = pd.read_csv(run_dir / "diagnostics" / "vars" / "gene.csv")
+        assert set(gene["idx2"]) == {1, 2}
+        dual = pd.read_csv(run_dir / "diagnostics" / "duals" / "adequacy.csv")
+        assert len(dual) == len(AREAS) * 2
+
+    def test_summary_tables(self, solved_run):
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir, areas=["DE"])
+        with open(run_dir / "diagnostics" / "_summary.json") as f:
+            summary = json.load(f)
+        assert summary["filters"] == {"families": None, "areas": ["DE"], "hours": None}
+        entry = summary["tables"]["adequacy"]
+        assert entry["family"] == "adequacy_constraint"
+        assert entry["path"] == "duals/adequacy.csv"
+        assert entry["value_column"] == "dual"
+        assert (entry["area_column"], entry["hour_column"]) == ("idx0", "idx1")
+        assert entry["rows"] == len(HOURS)
+
+    def test_previous_tables_removed(self, solved_run):
+        model, run_dir = solved_run
+        export_all_diagnostics(model, run_dir)
+        export_all_diagnostics(model, run_dir, families=["gene"])
+        assert not (run_dir / "diagnostics" / "duals" / "adequacy.csv").exists()
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from eoles_dispatch.collect import manifest
 from eoles_dispatch.collect._main_collect import sanitize_year
 from eoles_dispatch.run._main_run import check_requirements
 from eoles_dispatch.run.compute import (
@@ -16,11 +17,18 @@ from eoles_dispatch.run.compute import (
     compute_nuclear_max_af,
     compute_vre_capacity_factors,
 )
+from eoles_dispatch.run.format_inputs import (
+    _load_ninja_var,
+    load_ninja_frames,
+    with_weather_year,
+)
 from eoles_dispatch.utils import (
     CET,
+    canonical_index,
     cet_to_utc,
     compute_hour_mappings,
     expected_hours,
+    shift_hours_to_year,
     to_posix_hours,
 )
 from eoles_dispatch.viz.loaders import _prepare_actual_prices
@@ -415,6 +423,68 @@ class TestSanitizeYear:
         issues = sanitize_year(tmp_path / "does_not_exist", 2021)
         assert issues == []
 
+    def test_partial_year_prefix_accepted(self, tmp_path):
+        """partial=True accepts a file covering the first hours of the year."""
+        hours = canonical_index(2021)[:100]
+        pd.DataFrame({"hour": hours, "demand": 1.0}).to_csv(tmp_path / "demand_FR.csv", index=False)
+        assert sanitize_year(tmp_path, 2021, partial=True) == []
+        assert sanitize_year(tmp_path, 2021) != []
+
+    def test_partial_year_with_hole_renamed_to_corrupt(self, tmp_path):
+        """partial=True still requires contiguous hours from the start of the year."""
+        hours = canonical_index(2021)[:100].delete(50)
+        pd.DataFrame({"hour": hours, "demand": 1.0}).to_csv(tmp_path / "demand_FR.csv", index=False)
+        issues = sanitize_year(tmp_path, 2021, partial=True)
+        assert any("contiguous" in i for i in issues)
+        assert (tmp_path / "demand_FR_corrupt.csv").exists()
+
+    def test_unchanged_files_not_parsed_again(self, tmp_path, monkeypatch):
+        """A second check trusts the manifest for files whose size/mtime are unchanged."""
+        _make_year_dir(tmp_path, 2021, ["FR"], ["CH"])
+        assert sanitize_year(tmp_path, 2021) == []
+        described = []
+        original = manifest.describe
+        monkeypatch.setattr(
+            manifest, "describe", lambda path, *a: described.append(path.name) or original(path, *a)
+        )
+        assert sanitize_year(tmp_path, 2021) == []
+        assert described == []
+
+        n = expected_hours(2021) - 1
+        pd.DataFrame({"hour": list(range(n)), "demand": 1.0}).to_csv(
+            tmp_path / "demand_FR.csv", index=False
+        )
+        issues = sanitize_year(tmp_path, 2021)
+        assert described == ["demand_FR.csv"]
+        assert any("demand_FR.csv" in i for i in issues)
+        assert "demand_FR.csv" not in manifest.load(tmp_path)["files"]
+
+    def test_fingerprint_follows_content(self, tmp_path):
+        """The data fingerprint is stable until one of the files changes."""
+        _make_year_dir(tmp_path, 2021, ["FR"], ["CH"])
+        names = ["demand_FR.csv", "prices_CH.csv"]
+        first = manifest.fingerprint(tmp_path, names)
+        assert manifest.fingerprint(tmp_path, names) == first
+        assert manifest.fingerprint(tmp_path, ["demand_FR.csv"]) != first
+
+        df = pd.read_csv(tmp_path / "prices_CH.csv")
+        df.loc[0, "price"] += 1
+        df.to_csv(tmp_path / "prices_CH.csv", index=False)
+        assert manifest.fingerprint(tmp_path, names) != first
+
+    def test_fingerprint_on_read_only_directory(self, tmp_path, monkeypatch):
+        """A manifest that cannot be written does not prevent the fingerprint."""
+        _make_year_dir(tmp_path, 2021, ["FR"], ["CH"])
+        expected = manifest.fingerprint(tmp_path, ["demand_FR.csv"])
+        (tmp_path / manifest.MANIFEST_NAME).unlink()
+
+        def read_only(*args, **kwargs):
+            raise PermissionError("read-only file system")
+
+        monkeypatch.setattr(manifest.tempfile, "mkstemp", read_only)
+        assert manifest.fingerprint(tmp_path, ["demand_FR.csv"]) == expected
+        assert not (tmp_path / manifest.MANIFEST_NAME).exists()
+
 
 # ---------------------------------------------------------------------------
 # check_requirements (run._main_run)
@@ -593,3 +663,85 @@ class TestPrepareActualPrices:
         _prepare_actual_prices(data_dir, run_dir, year, areas, months=(1, 3))
         out = pd.read_csv(run_dir / "validation" / "actual_prices.csv")
         assert len(out) < expected_hours(year)
+
+
+# ---------------------------------------------------------------------------
+# Renewables.ninja weather years
+# ---------------------------------------------------------------------------
+
+
+def _make_ninja_dir(data_dir, years, areas=("FR", "DE")):
+    """Write ninja CSVs where every value encodes its UTC year (e.g. 0.2019)."""
+    ninja_dir = data_dir / "renewable_ninja"
+    ninja_dir.mkdir(parents=True)
+    idx = pd.date_range(f"{min(years) - 1}-12-31", f"{max(years) + 1}-01-01", freq="h")
+    for name in ("solar", "onshore_current", "offshore_current"):
+        df = pd.DataFrame({"hour": idx})
+        for area in areas:
+            df[area] = idx.year / 10000
+        df.to_csv(ninja_dir / f"{name}.csv", index=False)
+    return data_dir
+
+
+class TestShiftHoursToYear:
+    def test_same_calendar_hour(self):
+        h = to_posix_hours(pd.Series([pd.Timestamp("2019-07-14 12:00")]))
+        out = shift_hours_to_year(h, 2019, 2003)
+        assert pd.Timestamp(out[0] * 3600, unit="s") == pd.Timestamp("2003-07-14 12:00")
+
+    def test_feb29_maps_to_feb28(self):
+        h = to_posix_hours(pd.Series([pd.Timestamp("2020-02-29 06:00")]))
+        out = shift_hours_to_year(h, 2020, 2019)
+        assert pd.Timestamp(out[0] * 3600, unit="s") == pd.Timestamp("2019-02-28 06:00")
+
+
+class TestNinjaWeatherYear:
+    def test_profiles_read_from_weather_year(self, tmp_path):
+        data_dir = _make_ninja_dir(tmp_path, [2003, 2019])
+        hour_month, _ = compute_hour_mappings(2019, months=(3, 3))
+        valid = set(hour_month["hour"])
+        out = _load_ninja_var(data_dir, "solar", ["FR"], valid, simul_year=2019, weather_year=2003)
+        assert set(out["hour"]) == valid
+        assert np.allclose(out["value"], 0.2003)
+
+    def test_default_reads_simulation_year(self, tmp_path):
+        data_dir = _make_ninja_dir(tmp_path, [2003, 2019])
+        hour_month, _ = compute_hour_mappings(2019, months=(3, 3))
+        out = _load_ninja_var(data_dir, "solar", ["FR"], set(hour_month["hour"]))
+        assert np.allclose(out["value"], 0.2019)
+
+    def test_uncovered_weather_year_raises(self, tmp_path):
+        data_dir = _make_ninja_dir(tmp_path, [2019])
+        hour_month, _ = compute_hour_mappings(2019, months=(3, 3))
+        with pytest.raises(ValueError, match="not fully covered"):
+            _load_ninja_var(
+                data_dir,
+                "solar",
+                ["FR"],
+                set(hour_month["hour"]),
+                simul_year=2019,
+                weather_year=1985,
+            )
+
+    def test_with_weather_year_swaps_only_ninja_profiles(self, tmp_path):
+        data_dir = _make_ninja_dir(tmp_path, [2003, 2019])
+        hour_month, _ = compute_hour_mappings(2019, months=(3, 3))
+        hours = sorted(hour_month["hour"])
+        river = pd.DataFrame({"area": "FR", "tec": "river", "hour": hours, "value": 0.5})
+        ninja = load_ninja_frames(data_dir)
+        base = {
+            "hours": hours,
+            "demand": pd.DataFrame(),
+            "vre_profiles": pd.concat(
+                [
+                    pd.DataFrame({"area": "FR", "tec": "solar", "hour": hours, "value": 0.2019}),
+                    river,
+                ]
+            ),
+        }
+        out = with_weather_year(base, data_dir, ["FR"], 2019, 2003, "current", ninja=ninja)
+        vre = out["vre_profiles"]
+        assert np.allclose(vre.loc[vre["tec"] == "solar", "value"], 0.2003)
+        assert np.allclose(vre.loc[vre["tec"] == "river", "value"], 0.5)
+        assert set(vre["tec"]) == {"solar", "onshore", "offshore", "river"}
+        assert out["demand"] is base["demand"]
@@ -0,0 +1,105 @@
+"""Tests for eoles_dispatch.run.output_io."""
+
+import pandas as pd
+import pytest
+
+from eoles_dispatch.run.format_outputs import report_prices, report_production
+from eoles_dispatch.run.output_io import output_path, read_output, write_output
+
+
+def _production():
+    """Small production table indexed (area, hour), as written by report_production."""
+    df = pd.DataFrame(
+        {
+            "area": ["FR", "FR", "BE", "BE"],
+            "hour": [446000, 446001, 446000, 446001],
+            "nuclear": [40.0, 41.5, 4.0, 4.25],
+            "gas": [1.0, 0.0, 2.5, 3.0],
+        }
+    )
+    return df.set_index(["area", "hour"])
+
+
+@pytest.fixture
+def columnar():
+    pytest.importorskip("pyarrow")
+
+
+# ---------------------------------------------------------------------------
+# CSV
+# ---------------------------------------------------------------------------
+
+
+class TestCsvOutput:
+    def test_csv_layout_unchanged(self, tmp_path):
+        (tmp_path / "outputs").mkdir()
+        path = write_output(_production(), tmp_path / "outputs", "production")
+        assert path == tmp_path / "outputs" / "production.csv"
+        assert path.read_text().splitlines()[0] == "area,hour,nuclear,gas"
+
+    def test_read_output_matches_read_csv(self, tmp_path):
+        (tmp_path / "outputs").mkdir()
+        write_output(_production(), tmp_path / "outputs", "production")
+        expected = pd.read_csv(tmp_path / "outputs" / "production.csv")
+        pd.testing.assert_frame_equal(read_output(tmp_path, "production"), expected)
+
+    def test_read_output_filters_areas(self, tmp_path):
+        (tmp_path / "outputs").mkdir()
+        write_output(_production(), tmp_path / "outputs", "production")
+        df = read_output(tmp_path, "production", areas=["BE"])
+        assert df["area"].tolist() == ["BE", "BE"]
+
+    def test_missing_output_is_none(self, tmp_path):
+        assert read_output(tmp_path, "prices") is None
+        assert output_path(tmp_path, "prices") is None
+
+    def test_unknown_format_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown output format"):
+            write_output(_production(), tmp_path, "production", "xlsx")
+
+
+# ---------------------------------------------------------------------------
+# Parquet / Arrow
+# ---------------------------------------------------------------------------
+
+
+class TestColumnarOutput:
+    @pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+    def test_round_trip_matches_csv(self, tmp_path, columnar, output_format):
+        (tmp_path / "outputs").mkdir()
+        write_output(_production(), tmp_path / "outputs", "production", output_format)
+        df = read_output(tmp_path, "production").sort_values(["area", "hour"], ignore_index=True)
+        expected = _production().reset_index().sort_values(["area", "hour"], ignore_index=True)
+        assert list(df.columns) == list(expected.columns)
+        assert df["hour"].dtype == "int64"
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+    def test_parquet_partitioned_by_area(self, tmp_path, columnar):
+        (tmp_path / "outputs").mkdir()
+        path = write_output(_production(), tmp_path / "outputs", "production", "parquet")
+        assert sorted(p.name for p in path.iterdir()) == ["area=BE", "area=FR"]
+        df = read_output(tmp_path, "production", areas=["FR"])
+        assert df["area"].tolist() == ["FR", "FR"]
+        assert df["nuclear"].tolist() == [40.0, 41.5]
+
+    def test_arrow_keeps_area_categorical(self, tmp_path, columnar):
+        (tmp_path / "outputs").mkdir()
+        path = write_output(_production(), tmp_path / "outputs", "production", "arrow")
+        assert isinstance(pd.read_feather(path)["area"].dtype, pd.CategoricalDtype)
+
+    def test_rewrite_replaces_other_formats(self, tmp_path, columnar):
+        (tmp_path / "outputs").mkdir()
+        write_output(_production(), tmp_path / "outputs", "production", "csv")
+        write_output(_production(), tmp_path / "outputs", "production", "parquet")
+        assert not (tmp_path / "outputs" / "production.csv").exists()
+        assert output_path(tmp_path, "production").name == "production.parquet"
+
+    def test_reports_write_parquet(self, solved_run, columnar):
+        model, run_dir = solved_run
+        report_prices(model, run_dir, "parquet")
+        report_production(model, run_dir, "parquet")
+        prices = read_output(run_dir, "prices")
+        assert (run_dir / "outputs" / "prices.parquet").is_file()
+        assert list(prices.columns)[0] == "hour"
+        production = read_output(run_dir, "production")
+        assert {"area", "hour", "demand"} <= set(production.columns)
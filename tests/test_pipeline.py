@@ -6,6 +6,9 @@ minimal inputs/ directory (3 areas, 3 hours, static_thermal variant).
 TestCreateRun checks error-path behaviour of create_run() without
 touching the data-loading pipeline (those paths are exercised by
 test_format_inputs.py and test_scenario.py).
+
+TestCreateRunIncremental creates a run from the partial files of a year in
+progress, collected with --incremental (ENTSO-E client mocked).
 """
 
 import pytest
@@ -199,3 +202,65 @@ class TestCreateRun:
                 project_dir=tmp_path,
                 auto_download=False,
             )
+
+
+# ---------------------------------------------------------------------------
+# TestCreateRunIncremental
+# ---------------------------------------------------------------------------
+
+
+class TestCreateRunIncremental:
+    @pytest.fixture
+    def project_dir(self, tmp_path, monkeypatch):
+        """Project whose data/2021/ was collected incrementally up to 2021-03-10 12:00."""
+        from unittest.mock import MagicMock, patch
+
+        import pandas as pd
+
+        from eoles_dispatch.collect import _main_collect
+        from eoles_dispatch.utils import canonical_index
+
+        idx = canonical_index(2021)
+        client = MagicMock()
+        client.fetch_demand.return_value = pd.Series(50.0, index=idx)
+        client.fetch_generation.return_value = pd.DataFrame(
+            {"nuclear": 40.0, "gas": 5.0, "solar": 2.0, "onshore": 3.0, "river": 1.0}, index=idx
+        )
+        client.fetch_day_ahead_prices.return_value = pd.Series(60.0, index=idx)
+        client.is_usable.return_value = True
+        client.fetch_installed_capacity.return_value = {"nuclear": 60.0, "gas": 10.0, "river": 5.0}
+
+        monkeypatch.setattr(
+            _main_collect, "_current_hour", lambda: pd.Timestamp("2021-03-10 12:00")
+        )
+        year_dir = tmp_path / "data" / "2021"
+        year_dir.mkdir(parents=True)
+        with patch("eoles_dispatch.collect._main_collect.entsoe", client):
+            _main_collect.collect_history(
+                year_dir, MagicMock(), 2021, AREAS, EXO_AREAS, incremental=True
+            )
+        _make_scenario_dir(
+            tmp_path / "scenarios" / "test_scenario", areas=AREAS, exo_areas=EXO_AREAS
+        )
+        return tmp_path
+
+    def test_partial_files_kept(self, project_dir, monkeypatch):
+        """create_run uses the partial files as they are, without re-collecting the year."""
+        from eoles_dispatch.run import _main_run
+
+        def collect_all(*args, **kwargs):
+            raise AssertionError("create_run re-collected incrementally collected data")
+
+        monkeypatch.setattr(_main_run, "collect_all", collect_all)
+        run_dir = _main_run.create_run(
+            "partial",
+            scenario="test_scenario",
+            year=2021,
+            project_dir=project_dir,
+            areas=AREAS,
+            exo_areas=EXO_AREAS,
+            actCF=True,
+            months=(1, 2),
+        )
+        assert not list((project_dir / "data" / "2021").glob("*_corrupt*"))
+        assert (run_dir / "inputs" / "demand.csv").exists()
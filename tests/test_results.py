@@ -0,0 +1,170 @@
+"""Tests for eoles_dispatch.run.results (RunResult, LabeledArray, load_run)."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from conftest import _AREAS, _RUN_HOURS, _RUN_START
+
+import eoles_dispatch
+from eoles_dispatch.run.output_io import write_output
+from eoles_dispatch.run.results import LabeledArray, load_run, stack_runs
+
+TECS = ["nuclear", "gas", "demand"]
+
+
+@pytest.fixture
+def make_run(tmp_path, make_run_outputs):
+    """Factory writing run.yaml, outputs and demand of a small run under tmp_path/runs/."""
+
+    def make(name, output_format="csv", fr_offset=0.0):
+        run_dir = tmp_path / "runs" / name
+        (run_dir / "inputs").mkdir(parents=True)
+        with open(run_dir / "run.yaml", "w") as f:
+            yaml.dump({"name": name, "year": 2021, "status": "solved"}, f)
+        make_run_outputs(run_dir, output_format, fr_offset)
+        demand = pd.DataFrame(
+            {"area": np.repeat(_AREAS, 48), "hour": np.tile(_RUN_HOURS, 2), "d": 50.0}
+        )
+        demand.to_csv(run_dir / "inputs" / "demand.csv", index=False, header=False)
+        return run_dir
+
+    return make
+
+
+@pytest.fixture
+def run_dir(make_run):
+    return make_run("run_a")
+
+
+# ---------------------------------------------------------------------------
+# RunResult
+# ---------------------------------------------------------------------------
+
+
+class TestRunResult:
+    def test_load_by_name(self, run_dir, tmp_path):
+        result = eoles_dispatch.load_run("run_a", project_dir=tmp_path)
+        assert result.run_dir == run_dir
+        assert result.metadata["year"] == 2021
+
+    def test_missing_run_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="nope"):
+            load_run("nope", project_dir=tmp_path)
+
+    def test_prices_layout(self, run_dir):
+        prices = load_run(run_dir).prices
+        assert prices.dims == ("area", "hour")
+        assert prices.coords["area"].tolist() == _AREAS
+        assert prices.coords["hour"].tolist() == _RUN_HOURS.tolist()
+        assert prices.sel(area="FR", hour=_RUN_START + 3).values == 3.0
+
+    def test_production_layout(self, run_dir):
+        production = load_run(run_dir).production
+        assert production.dims == ("area", "tec", "hour")
+        assert production.shape == (2, 3, 48)
+        assert production.sel(area="DE", tec="gas").values.tolist() == [2.0] * 48
+
+    def test_absent_output_is_none(self, run_dir):
+        assert load_run(run_dir).capa_on is None
+
+    def test_inputs(self, run_dir):
+        demand = load_run(run_dir).inputs("demand")
+        assert demand.dims == ("area", "hour")
+        assert demand.shape == (2, 48)
+        assert load_run(run_dir).inputs("nmd") is None
+
+    def test_memory_mapped_cache(self, run_dir):
+        load_run(run_dir).prices
+        assert (run_dir / ".cache" / "prices.npy").exists()
+        prices = load_run(run_dir).prices
+        assert isinstance(prices.values, np.memmap)
+        fr = prices.sel(area="FR").values
+        assert np.shares_memory(fr, prices.values)
+
+    def test_cache_rebuilt_when_output_changes(self, run_dir):
+        assert load_run(run_dir).prices.sel(area="DE").values[0] == 30.0
+        prices = pd.DataFrame(
+            {"FR": np.zeros(48), "DE": np.full(48, 99.0)}, index=pd.Index(_RUN_HOURS, name="hour")
+        )
+        write_output(prices, run_dir / "outputs", "prices")
+        stat = (run_dir / "outputs" / "prices.csv").stat()
+        os.utime(run_dir / "outputs" / "prices.csv", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert load_run(run_dir).prices.sel(area="DE").values[0] == 99.0
+
+    def test_to_pandas_matches_output(self, run_dir):
+        production = load_run(run_dir).production.to_pandas()
+        expected = pd.read_csv(run_dir / "outputs" / "production.csv").set_index(["area", "hour"])
+        np.testing.assert_array_equal(production.to_numpy(), expected.to_numpy())
+        assert production.index.names == ["area", "hour"]
+        assert production.columns.tolist() == TECS
+
+    def test_parquet_output(self, make_run):
+        run_dir = make_run("run_p", output_format="parquet")
+        production = load_run(run_dir).production
+        assert production.coords["area"].tolist() == sorted(_AREAS)
+        assert production.sel(area="FR", tec="nuclear").values.tolist() == [40.0] * 48
+
+
+# ---------------------------------------------------------------------------
+# LabeledArray
+# ---------------------------------------------------------------------------
+
+
+class TestLabeledArray:
+    def test_sel_list_keeps_dimension(self, run_dir):
+        prices = load_run(run_dir).prices.sel(area=["DE"])
+        assert prices.dims == ("area", "hour")
+        assert prices.shape == (1, 48)
+
+    def test_sel_unknown_label_raises(self, run_dir):
+        with pytest.raises(KeyError, match="XX"):
+            load_run(run_dir).prices.sel(area="XX")
+
+    def test_daily_mean(self, run_dir):
+        daily = load_run(run_dir).prices.sel(area="FR").daily()
+        assert daily.dims == ("day",)
+        assert daily.coords["day"].astype(str).tolist() == ["2021-01-04", "2021-01-05"]
+        np.testing.assert_allclose(daily.values, [11.5, 35.5])
+
+    def test_monthly_sum(self, run_dir):
+        monthly = load_run(run_dir).production.monthly(how="sum")
+        assert monthly.dims == ("area", "tec", "month")
+        assert monthly.sel(area="FR", tec="nuclear").values.tolist() == [40.0 * 48]
+
+    def test_peak_offpeak_split(self, run_dir):
+        prices = load_run(run_dir).prices
+        peak, offpeak = prices.peak(), prices.offpeak()
+        assert peak.shape == (2, 24) and offpeak.shape == (2, 24)
+        # 08:00-20:00 CET on Monday = hours 8..19 from the start
+        assert peak.sel(area="FR").values[:12].tolist() == list(np.arange(8.0, 20.0))
+
+    def test_unknown_aggregation_raises(self, run_dir):
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            load_run(run_dir).prices.daily(how="median")
+
+    def test_aggregation_needs_hours(self):
+        array = LabeledArray(np.ones(2), ["area"], {"area": _AREAS})
+        with pytest.raises(ValueError, match="hour dimension"):
+            array.daily()
+
+
+# ---------------------------------------------------------------------------
+# stack_runs
+# ---------------------------------------------------------------------------
+
+
+class TestStackRuns:
+    def test_stack_one_area(self, tmp_path, make_run):
+        for i in range(3):
+            make_run(f"run_{i}", fr_offset=100.0 * i)
+        stacked = stack_runs(["run_0", "run_1", "run_2"], "prices", tmp_path, area="FR")
+        assert stacked.dims == ("run", "hour")
+        assert stacked.shape == (3, 48)
+        assert stacked.values[:, 0].tolist() == [0.0, 100.0, 200.0]
+
+    def test_missing_table_raises(self, run_dir, tmp_path):
+        with pytest.raises(FileNotFoundError, match="capa_on"):
+            stack_runs(["run_a"], "capa_on", tmp_path)
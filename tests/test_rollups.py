@@ -0,0 +1,123 @@
+"""Tests for eoles_dispatch.run.rollups (daily to annual output rollups)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import _AREAS, _run_prices, _run_production
+
+from eoles_dispatch.run.output_io import output_path, write_output
+from eoles_dispatch.run.rollups import (
+    RESOLUTIONS,
+    compute_rollup,
+    read_rollup,
+    write_rollups,
+)
+
+# ---------------------------------------------------------------------------
+# compute_rollup
+# ---------------------------------------------------------------------------
+
+
+class TestComputeRollup:
+    def test_daily_prices(self):
+        rollup = compute_rollup(_run_prices(), "prices", "daily")
+        assert rollup.index.names == ["period", "block"]
+        base = rollup.xs("base", level="block")
+        assert base.index.tolist() == ["2021-01-04", "2021-01-05"]
+        assert base["hours"].tolist() == [24, 24]
+        np.testing.assert_allclose(base["FR"], [11.5, 35.5])
+
+    def test_peak_offpeak_split(self):
+        rollup = compute_rollup(_run_prices(), "prices", "daily").loc["2021-01-04"]
+        # 08:00-20:00 CET = hours 8..19 from the start
+        assert rollup.loc["peak", "hours"] == 12
+        assert rollup.loc["peak", "FR"] == pytest.approx(np.arange(8.0, 20.0).mean())
+        assert rollup.loc["offpeak", "hours"] == 12
+
+    def test_production_energy(self):
+        rollup = compute_rollup(_run_production(), "production", "monthly")
+        assert rollup.index.names == ["area", "period", "block"]
+        assert rollup.columns.tolist() == ["hours", "nuclear", "gas", "demand"]
+        # Areas keep the order of the hourly table
+        assert rollup.index.get_level_values("area").unique().tolist() == _AREAS
+        assert rollup.loc[("FR", "202101", "base"), "nuclear"] == 40.0 * 48
+        assert rollup.loc[("DE", "202101", "peak"), "gas"] == 2.0 * 24
+
+    def test_labels_per_resolution(self):
+        labels = {r: compute_rollup(_run_prices(), "prices", r).index[0][0] for r in RESOLUTIONS}
+        assert labels == {
+            "daily": "2021-01-04",
+            "weekly": "202101",
+            "monthly": "202101",
+            "annual": "2021",
+        }
+
+    def test_unknown_resolution_raises(self):
+        with pytest.raises(ValueError, match="Unknown resolution"):
+            compute_rollup(_run_prices(), "prices", "hourly")
+
+    def test_unknown_table_raises(self):
+        with pytest.raises(ValueError, match="No rollup"):
+            compute_rollup(_run_prices(), "capa_on", "daily")
+
+
+# ---------------------------------------------------------------------------
+# write_rollups / read_rollup
+# ---------------------------------------------------------------------------
+
+
+class TestWriteReadRollups:
+    def test_writes_every_resolution(self, tmp_path, make_run_outputs):
+        run_dir = make_run_outputs(tmp_path)
+        written = write_rollups(run_dir)
+        assert len(written) == 2 * len(RESOLUTIONS)
+        for name in written:
+            assert output_path(run_dir, name) is not None
+
+    def test_skips_absent_tables(self, tmp_path):
+        (tmp_path / "outputs").mkdir()
+        write_output(_run_prices(), tmp_path / "outputs", "prices")
+        assert write_rollups(tmp_path) == [f"prices_{r}" for r in RESOLUTIONS]
+
+    def test_read_flat_with_text_periods(self, tmp_path, make_run_outputs):
+        run_dir = make_run_outputs(tmp_path)
+        write_rollups(run_dir)
+        monthly = read_rollup(run_dir, "production", "monthly", areas=["DE"])
+        assert monthly.columns.tolist() == ["area", "period", "hours", "nuclear", "gas", "demand"]
+        assert monthly["period"].tolist() == ["202101"]
+        assert monthly["nuclear"].tolist() == [10.0 * 48]
+
+    def test_read_all_blocks(self, tmp_path, make_run_outputs):
+        run_dir = make_run_outputs(tmp_path)
+        write_rollups(run_dir)
+        annual = read_rollup(run_dir, "prices", "annual", block=None)
+        assert annual["block"].tolist() == ["base", "offpeak", "peak"]
+
+    def test_fallback_matches_written(self, tmp_path, make_run_outputs):
+        run_dir = make_run_outputs(tmp_path)
+        computed = read_rollup(run_dir, "production", "weekly")
+        write_rollups(run_dir)
+        pd.testing.assert_frame_equal(
+            read_rollup(run_dir, "production", "weekly"), computed, check_dtype=False
+        )
+
+    def test_absent_table_is_none(self, tmp_path):
+        assert read_rollup(tmp_path, "prices", "daily") is None
+
+    def test_parquet(self, tmp_path, make_run_outputs):
+        run_dir = make_run_outputs(tmp_path, output_format="parquet")
+        write_rollups(run_dir, "parquet")
+        daily = read_rollup(run_dir, "production", "daily", areas=["FR"])
+        assert daily["period"].tolist() == ["2021-01-04", "2021-01-05"]
+        assert daily["gas"].tolist() == [24.0, 24.0]
+
+    def test_energy_mix_reads_rollup(self, tmp_path, make_run_outputs):
+        from eoles_dispatch.viz.charts_outputs import _compute_energy_mix
+
+        run_dir = make_run_outputs(tmp_path)
+        write_rollups(run_dir)
+        (run_dir / "outputs" / "production.csv").unlink()
+        area_list, enermix, _, demand, _ = _compute_energy_mix(run_dir, _AREAS)
+        assert area_list == _AREAS
+        assert enermix.loc["FR"].sum() == pytest.approx(41.0 * 48 / 1000)
+        assert demand.loc["DE"] == pytest.approx(50.0 * 48 / 1000)
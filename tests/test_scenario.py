@@ -1,10 +1,16 @@
-"""Tests for eoles_dispatch.run.scenario.extract_scenario."""
+"""Tests for eoles_dispatch.run.scenario (extract_scenario and layered scenarios)."""
 
 import pandas as pd
 import pytest
 from conftest import _make_scenario_dir
 
-from eoles_dispatch.run.scenario import extract_scenario
+from eoles_dispatch.run.scenario import (
+    apply_delta,
+    export_resolved_scenario,
+    extract_scenario,
+    layer_name,
+    scenario_layers,
+)
 
 AREAS = ["FR", "DE"]
 EXO_AREAS = ["NL"]
@@ -174,3 +180,119 @@ class TestExtractScenarioEdgeCases:
         """Only FR in areas → capa should contain only FR."""
         result = extract_scenario(scenario_csv_dir, ["FR"], EXO_AREAS, hour_month)
         assert list(result["capa"]["area"].unique()) == ["FR"]
+
+
+# ---------------------------------------------------------------------------
+# Layered (delta) scenarios
+# ---------------------------------------------------------------------------
+
+
+def _make_delta(path, base, tables=None):
+    path.mkdir(parents=True)
+    (path / "scenario.yaml").write_text(f"base: {base}\n")
+    for name, df in (tables or {}).items():
+        df.to_csv(path / f"{name}.csv", index=False)
+    return path
+
+
+class TestApplyDelta:
+    def test_overrides_only_given_cells(self):
+        base = pd.DataFrame({"tec": ["a", "b"], "FR": [1.0, 2.0], "DE": [3.0, 4.0]})
+        delta = pd.DataFrame({"tec": ["b"], "FR": [20.0]})
+        out = apply_delta(base, delta)
+        assert out["FR"].tolist() == [1.0, 20.0]
+        assert out["DE"].tolist() == [3.0, 4.0]
+
+    def test_nan_cells_inherit_base(self):
+        base = pd.DataFrame({"tec": ["a", "b"], "FR": [1.0, 2.0], "DE": [3.0, 4.0]})
+        delta = pd.DataFrame({"tec": ["a"], "FR": [float("nan")], "DE": [30.0]})
+        out = apply_delta(base, delta)
+        assert out["FR"].tolist() == [1.0, 2.0]
+        assert out["DE"].tolist() == [30.0, 4.0]
+
+    def test_new_rows_and_columns_appended(self):
+        base = pd.DataFrame({"tec": ["a"], "FR": [1.0]})
+        delta = pd.DataFrame({"tec": ["z"], "BE": [5.0]})
+        out = apply_delta(base, delta)
+        assert out["tec"].tolist() == ["a", "z"]
+        assert list(out.columns) == ["tec", "FR", "BE"]
+
+    def test_preserves_dtypes(self):
+        base = pd.DataFrame({"tec": ["a", "b"], "frr": [True, True], "x": [1.0, 2.0]})
+        delta = pd.DataFrame({"tec": ["b"], "frr": [False]})
+        out = apply_delta(base, delta)
+        assert out["frr"].dtype == bool
+        assert out["frr"].tolist() == [True, False]
+
+    def test_key_mismatch_raises(self):
+        base = pd.DataFrame({"tec": ["a"], "FR": [1.0]})
+        with pytest.raises(ValueError, match="keyed by"):
+            apply_delta(base, pd.DataFrame({"exporter": ["a"], "FR": [1.0]}))
+
+
+class TestLayeredScenario:
+    def test_plain_scenario_is_single_layer(self, scenario_csv_dir):
+        assert scenario_layers(scenario_csv_dir) == [scenario_csv_dir]
+
+    def test_delta_overrides_capa(self, tmp_path, hour_month):
+        _make_scenario_dir(tmp_path / "base", areas=AREAS, exo_areas=EXO_AREAS)
+        delta = _make_delta(
+            tmp_path / "more_nuc",
+            "base",
+            {"capa": pd.DataFrame({"tec": ["nuclear"], "FR": [63.0]})},
+        )
+        result = extract_scenario(delta, AREAS, EXO_AREAS, hour_month)
+        capa = result["capa"].set_index(["area", "tec"])["value"]
+        assert capa[("FR", "nuclear")] == 63.0
+        assert capa[("DE", "nuclear")] == 10.0
+        assert capa[("FR", "solar")] == 10.0
+
+    def test_stacked_layers(self, tmp_path, hour_month):
+        _make_scenario_dir(tmp_path / "base", areas=AREAS, exo_areas=EXO_AREAS)
+        _make_delta(
+            tmp_path / "mid",
+            "base",
+            {"thr_specs": pd.DataFrame({"tec": ["gas_ccgt1G"], "co2_price": [80.0]})},
+        )
+        top = _make_delta(
+            tmp_path / "top",
+            "mid",
+            {"thr_specs": pd.DataFrame({"tec": ["nuclear"], "co2_price": [90.0]})},
+        )
+        assert [p.name for p in scenario_layers(top)] == ["base", "mid", "top"]
+        result = extract_scenario(top, AREAS, EXO_AREAS, hour_month)
+        co2 = result["thr_params"]["co2_price"].set_index("tec")["co2_price"]
+        assert co2["gas_ccgt1G"] == 80.0
+        assert co2["nuclear"] == 90.0
+
+    def test_layer_name(self, tmp_path):
+        (tmp_path / "base").mkdir()
+        assert layer_name(tmp_path / "base") == "base"
+        assert layer_name(tmp_path / "legacy.xlsx") == "legacy"
+
+    def test_circular_layers_raise(self, tmp_path):
+        _make_delta(tmp_path / "a", "b")
+        _make_delta(tmp_path / "b", "a")
+        with pytest.raises(ValueError, match="Circular"):
+            scenario_layers(tmp_path / "a")
+
+    def test_missing_base_raises(self, tmp_path):
+        delta = _make_delta(tmp_path / "orphan", "nope")
+        with pytest.raises(FileNotFoundError):
+            scenario_layers(delta)
+
+    def test_export_resolved_scenario(self, tmp_path, hour_month):
+        _make_scenario_dir(tmp_path / "base", areas=AREAS, exo_areas=EXO_AREAS)
+        delta = _make_delta(
+            tmp_path / "d",
+            "base",
+            {"links": pd.DataFrame({"exporter": ["FR"], "DE": [9.9]})},
+        )
+        out = export_resolved_scenario(delta, tmp_path / "resolved")
+        assert not (out / "scenario.yaml").exists()
+        links = pd.read_csv(out / "links.csv").set_index("exporter")
+        assert links.loc["FR", "DE"] == 9.9
+        # The resolved copy is a standalone scenario giving the same result
+        a = extract_scenario(delta, AREAS, EXO_AREAS, hour_month)
+        b = extract_scenario(out, AREAS, EXO_AREAS, hour_month)
+        pd.testing.assert_frame_equal(a["links"], b["links"])
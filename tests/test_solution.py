@@ -0,0 +1,153 @@
+"""Tests for eoles_dispatch.run.solution."""
+
+import numpy as np
+import pyomo.environ as pyo
+import pytest
+
+from eoles_dispatch.run.format_outputs import report_FRtrade, report_production
+from eoles_dispatch.run.solution import SolutionView
+
+AREAS = ["FR", "DE"]
+HOURS = [0, 1, 2]
+
+
+def _view(values):
+    """SolutionView of a model with one Var 'v' holding {key: value} (None = unset)."""
+    model = pyo.ConcreteModel()
+    model.v = pyo.Var(list(values), initialize=values)
+    return SolutionView(model)
+
+
+# ---------------------------------------------------------------------------
+# array
+# ---------------------------------------------------------------------------
+
+
+class TestArray:
+    def test_shape_follows_axes(self):
+        """Values are placed at (area, tec, hour) positions of the axes."""
+        view = _view({("FR", "nuclear", 0): 10.0, ("FR", "nuclear", 1): 20.0})
+        result = view.array("v", ["FR"], ["nuclear"], [0, 1])
+        np.testing.assert_array_equal(result, [[[10.0, 20.0]]])
+
+    def test_missing_tec_is_zero(self):
+        """Labels absent from the variable give zeros."""
+        view = _view({("FR", "nuclear", 0): 10.0})
+        result = view.array("v", ["FR"], ["nuclear", "solar"], [0])
+        np.testing.assert_array_equal(result[0, :, 0], [10.0, 0.0])
+
+    def test_none_replaced_by_zero(self):
+        """Variables without a value count as 0.0."""
+        view = _view({("FR", "wind", 0): None, ("FR", "wind", 1): 5.0})
+        result = view.array("v", ["FR"], ["wind"], [0, 1])
+        np.testing.assert_array_equal(result[0, 0], [0.0, 5.0])
+
+    def test_order_follows_axes_not_keys(self):
+        """Rows follow the requested axis order; extra labels are ignored."""
+        view = _view({("DE", "nuc", 0): 30.0, ("BE", "nuc", 0): 10.0, ("CH", "nuc", 0): 5.0})
+        result = view.array("v", ["BE", "DE"], ["nuc"], [0])
+        np.testing.assert_array_equal(result[:, 0, 0], [10.0, 30.0])
+
+    def test_single_index(self):
+        """Variables indexed by a single set give a 1-D array."""
+        view = _view({0: 1.0, 1: 2.0, 2: 3.0})
+        np.testing.assert_array_equal(view.array("v", [2, 0]), [3.0, 1.0])
+
+
+# ---------------------------------------------------------------------------
+# frame
+# ---------------------------------------------------------------------------
+
+
+class TestFrame:
+    @pytest.fixture
+    def simple_view(self):
+        return _view({0: 0.0, 1: 1.0, 2: 2.0})
+
+    def test_frame_columns(self, simple_view):
+        assert list(simple_view.frame("v").columns) == ["idx0", "value"]
+
+    def test_frame_values(self, simple_view):
+        assert sorted(simple_view.frame("v")["value"].tolist()) == [0.0, 1.0, 2.0]
+
+    def test_frame_multi_index_columns(self):
+        view = _view({(a, h): 1.0 for a in AREAS for h in [0, 1]})
+        df = view.frame("v")
+        assert list(df.columns) == ["idx0", "idx1", "value"]
+        assert len(df) == 4
+        assert df["idx1"].dtype.kind == "i"
+
+    def test_frame_unset_values_are_nan(self):
+        df = _view({0: None, 1: 1.0}).frame("v")
+        assert df["value"].isna().tolist() == [True, False]
+
+    def test_frame_not_kept(self, simple_view):
+        """keep=False reads a component for one frame without keeping it in the view."""
+        assert len(simple_view.frame("v", keep=False)) == 3
+        assert "v" not in simple_view._entries
+        simple_view.frame("v")
+        assert "v" in simple_view._entries
+
+    def test_frame_empty_var_returns_empty_df(self):
+        m = pyo.ConcreteModel()
+        m.empty_set = pyo.Set(initialize=[])
+        m.z = pyo.Var(m.empty_set)
+        assert SolutionView(m).frame("z").empty
+
+    def test_dual_frame_columns(self, solved_run):
+        model, _ = solved_run
+        df = SolutionView(model).frame("adequacy_constraint")
+        assert list(df.columns) == ["idx0", "idx1", "dual"]
+
+    def test_dual_frame_row_count_matches_constraint(self, solved_run):
+        model, _ = solved_run
+        df = SolutionView(model).frame("adequacy_constraint")
+        assert len(df) == len(AREAS) * len(HOURS)
+
+    def test_dual_values_numeric(self, solved_run):
+        model, _ = solved_run
+        df = SolutionView(model).frame("adequacy_constraint")
+        assert df["dual"].dtype.kind == "f"
+        assert df["dual"].notna().all()
+
+
+# ---------------------------------------------------------------------------
+# Shared extraction
+# ---------------------------------------------------------------------------
+
+
+class TestSharedExtraction:
+    def test_has(self, solved_run):
+        view = SolutionView(solved_run[0])
+        assert view.has("gene") and view.has("adequacy_constraint")
+        assert not view.has("missing") and not view.has("a")
+
+    def test_of_returns_existing_view(self, solved_run):
+        view = SolutionView(solved_run[0])
+        assert SolutionView.of(view) is view
+        assert SolutionView.of(solved_run[0]).model is solved_run[0]
+
+    def test_reports_read_each_variable_once(self, solved_run, monkeypatch):
+        """Variables used by several reports (im, ex) are read from Pyomo once."""
+        model, run_dir = solved_run
+        view = SolutionView(model)
+        reads = []
+        original = SolutionView._entry
+
+        def counting_entry(self, name, *args):
+            if name not in self._entries:
+                reads.append(name)
+            return original(self, name, *args)
+
+        monkeypatch.setattr(SolutionView, "_entry", counting_entry)
+        report_production(view, run_dir)
+        report_FRtrade(view, run_dir)
+        assert reads.count("im") == 1 and reads.count("ex") == 1
+
+    def test_duals_map_built_once(self, solved_run):
+        """All constraints share one dual map instead of rebuilding dict(model.dual)."""
+        view = SolutionView(solved_run[0])
+        view.values("adequacy_constraint")
+        dual_map = view._dual_map
+        view.values("gene_nmd_constraint")
+        assert view._dual_map is dual_map
@@ -1,19 +1,24 @@
 """Tests for eoles_dispatch.viz (loaders and report generation)."""
 
+import re
+import shutil
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
 import yaml
 
+from eoles_dispatch.run.output_io import read_output
+from eoles_dispatch.viz.charts_inputs import chart_demand
 from eoles_dispatch.viz.loaders import (
+    RunData,
     _parse_months,
     load_actual_prices,
     load_actual_production,
     load_metadata,
     prepare_validation_data,
 )
-from eoles_dispatch.viz.report import generate_report
+from eoles_dispatch.viz.report import generate_report, generate_reports
 
 AREAS = ["FR", "DE"]
 RUN_NAME = "test_run"
@@ -106,6 +111,49 @@ class TestLoadActualProduction:
         assert "nuclear" in result.columns
 
 
+# ---------------------------------------------------------------------------
+# TestRunData
+# ---------------------------------------------------------------------------
+
+
+class TestRunData:
+    def test_output_read_once_with_datetime(self, viz_run_dir):
+        data = RunData(viz_run_dir)
+        with patch("eoles_dispatch.viz.loaders.read_output", wraps=read_output) as mock_read:
+            prices = data.output("prices")
+            assert data.output("prices") is prices
+            mock_read.assert_called_once()
+        assert "datetime" in prices.columns
+
+    def test_area_views_are_cached(self, viz_run_dir):
+        data = RunData(viz_run_dir)
+        fr = data.output("production", areas=["FR"])
+        assert set(fr["area"]) == {"FR"}
+        assert data.output("production", areas=["FR"]) is fr
+        assert set(data.output("production", areas=["DE"])["area"]) == {"DE"}
+
+    def test_inputs_parsed_once_for_all_areas(self, viz_run_dir):
+        data = RunData(viz_run_dir)
+        with patch("eoles_dispatch.viz.loaders.pd.read_csv", wraps=pd.read_csv) as mock_read:
+            fr = data.inputs("demand.csv", ["area", "hour", "value"], ["FR"])
+            de = data.inputs("demand.csv", ["area", "hour", "value"], ["DE"])
+            mock_read.assert_called_once()
+        assert set(fr["area"]) == {"FR"} and set(de["area"]) == {"DE"}
+
+    def test_missing_table_is_none(self, viz_run_dir):
+        data = RunData(viz_run_dir)
+        assert data.output("capa_on") is None
+        assert data.actual_prices() is None
+
+    def test_of_returns_context(self, viz_run_dir):
+        data = RunData(viz_run_dir)
+        assert RunData.of(data) is data
+        assert RunData.of(viz_run_dir).run_dir == viz_run_dir
+
+    def test_chart_accepts_run_dir(self, viz_run_dir):
+        assert chart_demand(viz_run_dir, ["FR"]) is not None
+
+
 # ---------------------------------------------------------------------------
 # TestParseMonths
 # ---------------------------------------------------------------------------
@@ -188,3 +236,34 @@ class TestGenerateReport:
         with patch("eoles_dispatch.viz.report.prepare_validation_data") as mock_prep:
             generate_report(viz_run_dir, open_browser=False, validate=True)
             mock_prep.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# TestParallelRendering
+# ---------------------------------------------------------------------------
+
+
+def _report_layout(path):
+    """Sections, chart titles and chart kinds of a report, in page order."""
+    html = path.read_text(encoding="utf-8")
+    return re.findall(r'<h2>[^<]*</h2>|class="chart(?:-raw|-label)?">[^<]*', html)
+
+
+class TestParallelRendering:
+    def test_parallel_report_matches_sequential(self, viz_run_dir):
+        sequential = _report_layout(generate_report(viz_run_dir, open_browser=False))
+        parallel = _report_layout(generate_report(viz_run_dir, open_browser=False, jobs=2))
+        assert len(sequential) > 10
+        assert parallel == sequential
+
+    def test_generate_reports_keeps_run_order(self, viz_run_dir, tmp_path_factory):
+        other = tmp_path_factory.mktemp("other") / "run_b"
+        shutil.copytree(viz_run_dir, other)
+        paths = generate_reports([other, viz_run_dir], open_browser=False, jobs=2)
+        assert paths == [other / "viz.html", viz_run_dir / "viz.html"]
+        assert all(path.exists() for path in paths)
+
+    def test_generate_reports_opens_each_report(self, viz_run_dir):
+        with patch("eoles_dispatch.viz.report.webbrowser.open") as mock_open:
+            generate_reports([viz_run_dir], open_browser=True)
+            mock_open.assert_called_once()
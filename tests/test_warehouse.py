@@ -0,0 +1,169 @@
+"""Tests for eoles_dispatch.run.warehouse (cross-run results index)."""
+
+import os
+import shutil
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from eoles_dispatch.config import WAREHOUSE_FILE
+from eoles_dispatch.run import warehouse
+
+HOURS = [446000, 446001, 446002, 446003]
+
+
+def _write_run(project_dir, name, status="solved", solved="2026-01-01T00:00:00", offset=0.0):
+    """Write a run with run.yaml, prices and production outputs and a scenario copy."""
+    run_dir = project_dir / "runs" / name
+    (run_dir / "outputs").mkdir(parents=True, exist_ok=True)
+    (run_dir / "scenario").mkdir(exist_ok=True)
+    (run_dir / "scenario" / "capa.csv").write_text("tec,FR\nnuclear,60\n")
+    metadata = {
+        "name": name,
+        "scenario": "baseline",
+        "year": 2020,
+        "status": status,
+        "created": "2025-12-31T00:00:00",
+        "total_cost": 1.5,
+        "total_co2": 2.5,
+    }
+    if status == "solved":
+        metadata["solved"] = solved
+    (run_dir / "run.yaml").write_text(yaml.dump(metadata))
+    pd.DataFrame(
+        {"hour": HOURS, "FR": np.array([10.0, 20.0, 30.0, 40.0]) + offset, "DE": 50.0}
+    ).to_csv(run_dir / "outputs" / "prices.csv", index=False)
+    pd.DataFrame(
+        {
+            "area": ["FR"] * 4 + ["DE"] * 4,
+            "hour": HOURS * 2,
+            "nuclear": [40.0] * 4 + [5.0] * 4,
+            "gas": [1.0] * 8,
+        }
+    ).to_csv(run_dir / "outputs" / "production.csv", index=False)
+    return run_dir
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write_run(tmp_path, "run_a")
+    _write_run(tmp_path, "run_b", offset=100.0)
+    _write_run(tmp_path, "run_c", status="created")
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# Ingestion
+# ---------------------------------------------------------------------------
+
+
+class TestSync:
+    def test_first_sync_ingests_all(self, project):
+        assert warehouse.sync(project) == 3
+        assert (project / "runs" / WAREHOUSE_FILE).exists()
+
+    def test_second_sync_reads_nothing(self, project):
+        warehouse.sync(project)
+        assert warehouse.sync(project) == 0
+
+    def test_no_runs_dir(self, tmp_path):
+        assert warehouse.sync(tmp_path) == 0
+        assert warehouse.list_runs(tmp_path) == []
+
+    def test_same_solve_keeps_outputs(self, project):
+        warehouse.sync(project)
+        run_dir = project / "runs" / "run_a"
+        pd.DataFrame({"hour": HOURS, "FR": 0.0, "DE": 0.0}).to_csv(
+            run_dir / "outputs" / "prices.csv", index=False
+        )
+        _touch(run_dir / "run.yaml")
+        assert warehouse.sync(project) == 1
+        (summary,) = warehouse.summaries(["run_a"], project)
+        assert summary["price_mean_FR"] == pytest.approx(25.0)
+
+    def test_new_solve_reingests_outputs(self, project):
+        warehouse.sync(project)
+        _write_run(project, "run_a", solved="2026-02-01T00:00:00", offset=1.0)
+        _touch(project / "runs" / "run_a" / "run.yaml")
+        (summary,) = warehouse.summaries(["run_a"], project)
+        assert summary["price_mean_FR"] == pytest.approx(26.0)
+
+    def test_changed_inputs_reingest_outputs(self, project):
+        warehouse.sync(project)
+        run_dir = _write_run(project, "run_a", offset=1.0)
+        (run_dir / "scenario" / "capa.csv").write_text("tec,FR\nnuclear,50\n")
+        _touch(run_dir / "run.yaml")
+        (summary,) = warehouse.summaries(["run_a"], project)
+        assert summary["price_mean_FR"] == pytest.approx(26.0)
+
+    def test_deleted_run_dropped(self, project):
+        warehouse.sync(project)
+        shutil.rmtree(project / "runs" / "run_b")
+        assert [r["name"] for r in warehouse.list_runs(project)] == ["run_a", "run_c"]
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+
+class TestQueries:
+    def test_list_runs_metadata(self, project):
+        runs = warehouse.list_runs(project)
+        assert [r["name"] for r in runs] == ["run_a", "run_b", "run_c"]
+        assert runs[2]["status"] == "created"
+
+    def test_list_runs_keeps_yaml_values(self, project):
+        meta_path = project / "runs" / "run_a" / "run.yaml"
+        meta_path.write_text(meta_path.read_text() + "solved_on: 2026-01-01\n")
+        (run_a, *_) = warehouse.list_runs(project)
+        assert run_a["solved_on"] == yaml.safe_load("d: 2026-01-01")["d"]
+
+    def test_list_runs_without_warehouse(self, project, monkeypatch):
+        def unavailable(runs_dir):
+            raise sqlite3.OperationalError("attempt to write a readonly database")
+
+        monkeypatch.setattr(warehouse, "_connect", unavailable)
+        runs = warehouse.list_runs(project)
+        assert [r["name"] for r in runs] == ["run_a", "run_b", "run_c"]
+        assert not (project / "runs" / WAREHOUSE_FILE).exists()
+
+    def test_summaries(self, project):
+        a, c = warehouse.summaries(["run_a", "run_c"], project)
+        assert a["status"] == "solved" and a["total_cost"] == 1.5
+        assert a["price_mean_FR"] == pytest.approx(25.0)
+        assert a["price_p05_FR"] <= a["price_p50_FR"] <= a["price_p95_FR"]
+        assert a["price_p50_DE"] == pytest.approx(50.0)
+        assert "price_mean_FR" not in c
+
+    def test_missing_run_raises(self, project):
+        with pytest.raises(FileNotFoundError, match="nope"):
+            warehouse.summaries(["run_a", "nope"], project)
+
+    def test_price_series(self, project):
+        series = warehouse.price_series(["run_b", "run_c"], project)
+        assert list(series) == ["run_b"]
+        frame = series["run_b"]
+        assert frame.index.tolist() == HOURS
+        assert frame.columns.tolist() == ["FR", "DE"]
+        assert frame["FR"].tolist() == [110.0, 120.0, 130.0, 140.0]
+
+    def test_compare(self, project):
+        table = warehouse.compare(["run_b", "run_a"], project)
+        assert table.index.tolist() == ["run_b", "run_a"]
+        assert table.loc["run_a", "energy_nuclear_FR"] == pytest.approx(160.0)
+        assert table.loc["run_a", "scenario"] == "baseline"
+
+    def test_compare_areas(self, project):
+        table = warehouse.compare(["run_a"], project, areas=["DE"])
+        assert "price_mean_DE" in table.columns and "energy_gas_DE" in table.columns
+        assert not any(c.endswith("_FR") for c in table.columns)
+        assert "total_cost" in table.columns